@@ -5,10 +5,12 @@ Ported from attrition.py helpers/categorization sections (~170 lines).
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 from loguru import logger
 
 from ars_analysis.analytics.base import AnalysisResult
+from ars_analysis.analytics.breakdown import Bins
 from ars_analysis.pipeline.context import PipelineContext
 
 # ---------------------------------------------------------------------------
@@ -47,6 +49,28 @@ BALANCE_ORDER = [
 ]
 
 
+# Bin tables mirroring the categorize_* functions below. Duration and tenure
+# buckets are "<= N months/years" rules, so they close on the right; the
+# "$0" balance tier is the single point [0, smallest positive float).
+_MONTH, _YEAR = 30.44, 365.25
+DURATION_BINS = Bins(
+    (0, _MONTH, 3 * _MONTH, 6 * _MONTH, 12 * _MONTH, 2 * _YEAR, 5 * _YEAR, 10 * _YEAR, np.inf),
+    tuple(DURATION_ORDER),
+    right=True,
+    include_lowest=True,
+)
+TENURE_BINS = Bins(
+    (0, 6 * _MONTH, 12 * _MONTH, 2 * _YEAR, 5 * _YEAR, 10 * _YEAR, np.inf),
+    tuple(TENURE_ORDER),
+    right=True,
+    include_lowest=True,
+)
+BALANCE_BINS = Bins(
+    (-np.inf, 0, np.nextafter(0, 1), 500, 1000, 2500, 5000, 10000, np.inf),
+    tuple(BALANCE_ORDER),
+)
+
+
 # ---------------------------------------------------------------------------
 # Categorization functions
 # ---------------------------------------------------------------------------
@@ -154,7 +178,8 @@ def prepare_attrition_data(
         closed_accts["_duration_days"] = (
             closed_accts["Date Closed"] - closed_accts["Date Opened"]
         ).dt.days
-        closed_accts["_duration_cat"] = closed_accts["_duration_days"].apply(categorize_duration)
+        duration = DURATION_BINS.cut(closed_accts["_duration_days"])
+        closed_accts["_duration_cat"] = duration.astype(object)
 
     result = (data, open_accts, closed_accts)
     ctx.results["_attrition_data"] = result
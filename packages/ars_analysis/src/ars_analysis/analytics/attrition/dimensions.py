@@ -15,15 +15,14 @@ import pandas as pd
 from loguru import logger
 
 from ars_analysis.analytics.attrition._helpers import (
-    BALANCE_ORDER,
-    TENURE_ORDER,
+    BALANCE_BINS,
+    TENURE_BINS,
     _safe,
-    categorize_balance,
-    categorize_tenure,
     prepare_attrition_data,
     product_col,
 )
 from ars_analysis.analytics.base import AnalysisModule, AnalysisResult
+from ars_analysis.analytics.breakdown import rate_breakdown
 from ars_analysis.analytics.registry import register
 from ars_analysis.charts.guards import chart_figure
 from ars_analysis.charts.style import (
@@ -349,34 +348,16 @@ def _by_tenure(ctx: PipelineContext) -> list[AnalysisResult]:
             )
         ]
 
+    # Open tenure runs to today; a closed account's tenure stops at closing.
     now = pd.Timestamp.now()
-    all_copy = all_data.copy()
-    all_copy["_tenure_days"] = (now - all_copy["Date Opened"]).dt.days
-    all_copy["_tenure_cat"] = all_copy["_tenure_days"].apply(categorize_tenure)
-
-    closed_copy = closed.copy()
-    closed_copy["_tenure_days"] = (closed_copy["Date Closed"] - closed_copy["Date Opened"]).dt.days
-    closed_copy["_tenure_cat"] = closed_copy["_tenure_days"].apply(
-        categorize_tenure,
-    )
+    total_by = TENURE_BINS.cut((now - all_data["Date Opened"]).dt.days).value_counts(sort=False)
+    closed_by = TENURE_BINS.cut((closed["Date Closed"] - closed["Date Opened"]).dt.days)
+    closed_by = closed_by.value_counts(sort=False)
 
-    total_by = all_copy.groupby("_tenure_cat").size()
-    closed_by = closed_copy.groupby("_tenure_cat").size()
-    tenure_df = (
-        pd.DataFrame(
-            {"Total": total_by, "Closed": closed_by},
-        )
-        .fillna(0)
-        .astype(int)
-    )
+    tenure_df = pd.DataFrame({"Total": total_by, "Closed": closed_by})
     tenure_df["Attrition Rate"] = tenure_df["Closed"] / tenure_df["Total"]
-    tenure_df.index = pd.CategoricalIndex(
-        tenure_df.index,
-        categories=TENURE_ORDER,
-        ordered=True,
-    )
-    tenure_df = tenure_df.sort_index().reset_index()
-    tenure_df.columns = ["Tenure", "Total", "Closed", "Attrition Rate"]
+    tenure_df = tenure_df[(tenure_df["Total"] > 0) | (tenure_df["Closed"] > 0)]
+    tenure_df = tenure_df.rename_axis("Tenure").reset_index()
 
     save_to = ctx.paths.charts_dir / "a9_7_tenure_attrition.png"
     ctx.paths.charts_dir.mkdir(parents=True, exist_ok=True)
@@ -453,28 +434,16 @@ def _by_balance(ctx: PipelineContext) -> list[AnalysisResult]:
             )
         ]
 
-    all_copy = all_data.copy()
-    all_copy["_bal_cat"] = all_copy["Avg Bal"].apply(categorize_balance)
-    closed_copy = closed.copy()
-    closed_copy["_bal_cat"] = closed_copy["Avg Bal"].apply(categorize_balance)
-
-    total_by = all_copy.groupby("_bal_cat").size()
-    closed_by = closed_copy.groupby("_bal_cat").size()
-    bal_df = (
-        pd.DataFrame(
-            {"Total": total_by, "Closed": closed_by},
-        )
-        .fillna(0)
-        .astype(int)
-    )
-    bal_df["Attrition Rate"] = bal_df["Closed"] / bal_df["Total"]
-    bal_df.index = pd.CategoricalIndex(
-        bal_df.index,
-        categories=BALANCE_ORDER,
-        ordered=True,
+    # Closed accounts are the rows of all_data with a close date
+    table = rate_breakdown(BALANCE_BINS.cut(all_data["Avg Bal"]), all_data["Date Closed"].notna())
+    bal_df = pd.DataFrame(
+        {
+            "Balance Tier": table.index,
+            "Total": table["Total"].to_numpy(),
+            "Closed": table["Hits"].to_numpy(),
+            "Attrition Rate": table["Rate"].to_numpy(),
+        }
     )
-    bal_df = bal_df.sort_index().reset_index()
-    bal_df.columns = ["Balance Tier", "Total", "Closed", "Attrition Rate"]
 
     save_to = ctx.paths.charts_dir / "a9_8_balance_attrition.png"
     ctx.paths.charts_dir.mkdir(parents=True, exist_ok=True)
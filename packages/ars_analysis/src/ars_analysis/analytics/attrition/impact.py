@@ -39,6 +39,7 @@ from ars_analysis.charts.style import (
     TTM,
 )
 from ars_analysis.pipeline.context import PipelineContext
+from shared.timeseries import family_block
 
 # ---------------------------------------------------------------------------
 # A9.9 -- Debit Card Retention Effect
@@ -143,6 +144,13 @@ def _debit_retention(ctx: PipelineContext) -> list[AnalysisResult]:
 # ---------------------------------------------------------------------------
 
 
+def _any_present(ctx: PipelineContext, data: pd.DataFrame, cols: list[str]) -> pd.Series:
+    """Rows with a value in any of ``cols``; read from the ODD store when spilled."""
+    if ctx.store is not None and data is ctx.data:
+        return ctx.store.any_present(cols).reindex(data.index, fill_value=False)
+    return data[cols].notna().any(axis=1)
+
+
 def _mailer_retention(ctx: PipelineContext) -> list[AnalysisResult]:
     """Do mailed/responding accounts close less often?"""
     all_data, _, closed = prepare_attrition_data(ctx)
@@ -169,10 +177,11 @@ def _mailer_retention(ctx: PipelineContext) -> list[AnalysisResult]:
             )
         ]
 
-    all_copy = all_data.copy()
-    all_copy["_ever_mailed"] = all_copy[mail_cols].notna().any(axis=1)
+    # Only the closure date and mail group are needed -- no full-width copy.
+    all_copy = all_data[["Date Closed"]]
+    all_copy["_ever_mailed"] = _any_present(ctx, all_data, mail_cols)
     if resp_cols:
-        all_copy["_ever_responded"] = all_copy[resp_cols].notna().any(axis=1)
+        all_copy["_ever_responded"] = _any_present(ctx, all_data, resp_cols)
     else:
         all_copy["_ever_responded"] = False
 
@@ -280,17 +289,10 @@ def _revenue_impact(ctx: PipelineContext) -> list[AnalysisResult]:
 
     ic_rate = ctx.client.ic_rate or 0.007
 
-    spend_cols = sorted(
-        [c for c in closed.columns if c.endswith(" Spend")],
-    )
-
     closed_copy = closed.copy()
-    if spend_cols:
-        closed_copy["_last_spend"] = (
-            closed_copy[spend_cols].replace(0, np.nan).ffill(axis=1).iloc[:, -1].fillna(0)
-        )
-    else:
-        closed_copy["_last_spend"] = 0
+    # Most recent non-zero monthly spend, months in calendar order
+    spend = family_block(closed, "spend", ctx.timeseries, dtype=np.float64)
+    closed_copy["_last_spend"] = spend.latest(skip_zero=True).fillna(0)
 
     closed_copy["_est_annual_revenue"] = closed_copy["_last_spend"] * ic_rate * 12
 
@@ -632,6 +634,7 @@ class AttritionImpact(AnalysisModule):
     display_name = "Attrition Impact & Retention"
     section = "attrition"
     required_columns = ("Date Opened", "Date Closed")
+    client_fields = ("ic_rate",)
 
     def run(self, ctx: PipelineContext) -> list[AnalysisResult]:
         logger.info(
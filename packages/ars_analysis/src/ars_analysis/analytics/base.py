@@ -3,12 +3,15 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
 import pandas as pd
 
 from ars_analysis.pipeline.context import PipelineContext
 
+if TYPE_CHECKING:
+    from ars_analysis.pipeline.module_cache import ColumnHasher
+
 SectionName = Literal[
     "overview",
     "dctr",
@@ -57,6 +60,14 @@ class AnalysisModule(ABC):
     required_columns: tuple[str, ...] = ()
     required_ctx_keys: tuple[str, ...] = ()
 
+    # Fingerprint inputs (see pipeline.module_cache). input_columns=None means
+    # the module may read any ODD column; client_fields lists ClientInfo fields
+    # read beyond the subset-shaping ones; depends_on lists modules whose
+    # ctx.results entries this module reads.
+    input_columns: tuple[str, ...] | None = None
+    client_fields: tuple[str, ...] = ()
+    depends_on: tuple[str, ...] = ()
+
     @abstractmethod
     def run(self, ctx: PipelineContext) -> list[AnalysisResult]:
         """Execute all analyses. Return ordered results."""
@@ -82,3 +93,11 @@ class AnalysisModule(ABC):
                 continue
             errors.append(f"Missing column: {req_col}")
         return errors
+
+    def fingerprint(
+        self, ctx: PipelineContext, hasher: "ColumnHasher", upstream: dict[str, str]
+    ) -> str:
+        """Hash of the data columns, ClientInfo fields and upstream results this module reads."""
+        from ars_analysis.pipeline.module_cache import module_fingerprint
+
+        return module_fingerprint(self, ctx, hasher, upstream)
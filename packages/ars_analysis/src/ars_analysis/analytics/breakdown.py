@@ -0,0 +1,108 @@
+"""Vectorized dimensional breakdowns shared by DCTR, Reg E and attrition.
+
+Numeric dimensions (account age, holder age, balance, tenure) are bucketed
+with ``pd.cut`` from declarative ``Bins`` tables, and each breakdown is one
+groupby over the bucket(s):
+
+    cats = ACCOUNT_AGE_BINS.cut(days)
+    table = rate_breakdown(cats, has_debit, business=df["Business?"])
+
+The scalar ``categorize_*`` helpers in each family's ``_helpers`` remain the
+reference definition of every bucket; the bin tables mirror them exactly.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import pandas as pd
+
+from shared.profiling import profiled
+
+
+@dataclass(frozen=True)
+class Bins:
+    """Ordered numeric buckets: ``labels[i]`` spans ``edges[i]`` to ``edges[i + 1]``.
+
+    Parameters
+    ----------
+    edges : tuple of float
+        Monotonic bucket boundaries, ``len(labels) + 1`` of them. Use
+        ``-np.inf`` / ``np.inf`` for open-ended first/last buckets.
+    labels : tuple of str
+        Bucket names, in display order.
+    right : bool
+        False for ``[lo, hi)`` buckets (``value < edge`` rules), True for
+        ``(lo, hi]`` (``value <= edge`` rules).
+    include_lowest : bool
+        With ``right=True``, also include ``edges[0]`` in the first bucket.
+    """
+
+    edges: tuple[float, ...]
+    labels: tuple[str, ...]
+    right: bool = False
+    include_lowest: bool = False
+
+    def __post_init__(self) -> None:
+        if len(self.edges) != len(self.labels) + 1:
+            raise ValueError("Bins needs exactly one more edge than labels")
+
+    @property
+    def order(self) -> list[str]:
+        return list(self.labels)
+
+    def cut(self, values: pd.Series) -> pd.Series:
+        """Bucket ``values`` into an ordered categorical; missing/out of range -> NaN."""
+        return pd.cut(
+            pd.to_numeric(values, errors="coerce"),
+            bins=list(self.edges),
+            labels=list(self.labels),
+            right=self.right,
+            include_lowest=self.include_lowest,
+            ordered=True,
+        )
+
+
+@profiled
+def rate_breakdown(
+    keys: pd.Series | Sequence[pd.Series],
+    hits: pd.Series,
+    business: pd.Series | None = None,
+) -> pd.DataFrame:
+    """Count rows and ``hits`` per category in a single groupby.
+
+    Parameters
+    ----------
+    keys : Series or sequence of Series
+        Category per row (typically ``Bins.cut`` output), aligned with
+        ``hits``. Rows whose key is missing are excluded.
+    hits : Series of bool
+        Per-row flag being rated (has debit, opted in, closed, ...).
+    business : Series, optional
+        ``Business?`` column; adds ``Personal Hits`` / ``Business Hits``
+        (rows coded "No" / "Yes"). A boolean series (the feature frame's
+        ``is_business``) splits on False / True; NA rows count in neither.
+
+    Returns
+    -------
+    DataFrame
+        Indexed by the observed categories in category order, with columns
+        ``Total``, ``Hits``, ``Rate`` and, with ``business``, the two splits.
+    """
+    key_list = [keys] if isinstance(keys, pd.Series) else list(keys)
+    flag = hits.to_numpy(dtype=bool)
+    frame = pd.DataFrame({"Hits": flag}, index=hits.index)
+    if business is not None:
+        if pd.api.types.is_bool_dtype(business):
+            personal, biz = business == False, business == True  # noqa: E712 (NA-aware)
+        else:
+            personal, biz = business == "No", business == "Yes"
+        frame["Personal Hits"] = flag & personal.to_numpy(dtype=bool, na_value=False)
+        frame["Business Hits"] = flag & biz.to_numpy(dtype=bool, na_value=False)
+
+    grouped = frame.groupby(key_list, observed=True, sort=True, dropna=True)
+    table = grouped.sum().astype(int)
+    table.insert(0, "Total", grouped.size().astype(int))
+    table.insert(2, "Rate", table["Hits"] / table["Total"])
+    return table
@@ -12,6 +12,8 @@ import numpy as np
 import pandas as pd
 from dateutil.relativedelta import relativedelta
 
+from ars_analysis.analytics.breakdown import Bins, rate_breakdown
+
 # -- Category orders (used by by_dimension / crosstab) -----------------------
 
 AGE_ORDER = [
@@ -22,6 +24,7 @@ AGE_ORDER = [
     "5-10 years",
     "10+ years",
 ]
+SIMPLE_AGE_ORDER = ["New (0-1 year)", "Recent (1-5 years)", "Mature (5+ years)"]
 HOLDER_AGE_ORDER = ["18-24", "25-34", "35-44", "45-54", "55-64", "65+"]
 BALANCE_ORDER = [
     "Negative",
@@ -36,6 +39,16 @@ BALANCE_ORDER = [
     "$100K+",
 ]
 
+# Bin tables mirroring categorize_account_age (+ simplify_account_age) /
+# _holder_age / _balance below.
+ACCOUNT_AGE_BINS = Bins((-np.inf, 180, 365, 730, 1825, 3650, np.inf), tuple(AGE_ORDER))
+SIMPLE_AGE_BINS = Bins((-np.inf, 365, 1825, np.inf), tuple(SIMPLE_AGE_ORDER))
+HOLDER_AGE_BINS = Bins((-np.inf, 25, 35, 45, 55, 65, np.inf), tuple(HOLDER_AGE_ORDER))
+BALANCE_BINS = Bins(
+    (-np.inf, 0, 500, 1000, 2500, 5000, 10000, 25000, 50000, 100000, np.inf),
+    tuple(BALANCE_ORDER),
+)
+
 # -- Debit column detection (shared by DCTR, Reg E, Value) -------------------
 
 _DEBIT_CANDIDATES = ("Debit?", "Debit", "DC Indicator", "DC_Indicator")
@@ -378,90 +391,123 @@ def branch_dctr(
 def by_dimension(
     dataset: pd.DataFrame,
     col: str,
-    cat_fn,
-    order: list[str],
+    bins: Bins,
     label: str,
 ) -> tuple[pd.DataFrame, dict]:
-    """Generic dimensional DCTR breakdown with P/B split."""
+    """Generic dimensional DCTR breakdown with P/B split (one groupby)."""
     if dataset.empty:
         return pd.DataFrame(), {}
-    dc = dataset.copy()
-    dc[label] = dc[col].apply(cat_fn)
-    valid = dc[dc[label] != "Unknown"]
+    return _dimension_table(
+        bins.cut(dataset[col]), debit_mask(dataset), dataset["Business?"], label, len(dataset)
+    )
 
-    _dc = detect_debit_col(valid) if not valid.empty else None
-    rows = []
-    for cat in order:
-        seg = valid[valid[label] == cat]
-        if len(seg) == 0:
-            continue
-        t, w, d = dctr(seg, _dc)
-        p = seg[seg["Business?"] == "No"]
-        b = seg[seg["Business?"] == "Yes"]
-        rows.append(
-            {
-                label: cat,
-                "Total Accounts": t,
-                "With Debit": w,
-                "Without Debit": t - w,
-                "DCTR %": d,
-                "Personal w/Debit": int(debit_mask(p, _dc).sum()),
-                "Business w/Debit": int(debit_mask(b, _dc).sum()),
-            }
-        )
-    df = pd.DataFrame(rows)
-    if not df.empty:
-        df = total_row(df, label)
 
-    dr = df[df[label] != "TOTAL"]
-    ins: dict = {}
-    if not dr.empty:
-        hi = dr.loc[dr["DCTR %"].idxmax()]
-        lo = dr.loc[dr["DCTR %"].idxmin()]
-        ins = {
-            "highest": hi[label],
-            "highest_dctr": hi["DCTR %"],
-            "lowest": lo[label],
-            "lowest_dctr": lo["DCTR %"],
-            "spread": hi["DCTR %"] - lo["DCTR %"],
-            "total_with_data": len(valid),
-            "coverage": len(valid) / len(dataset) if len(dataset) else 0,
+def by_feature(features: pd.DataFrame, col: str, label: str) -> tuple[pd.DataFrame, dict]:
+    """``by_dimension`` over a bucketed column of the pipeline feature frame."""
+    if features.empty:
+        return pd.DataFrame(), {}
+    return _dimension_table(
+        features[col], features["has_debit"], features["is_business"], label, len(features)
+    )
+
+
+def _dimension_table(
+    cats: pd.Series,
+    has_debit: pd.Series,
+    business: pd.Series,
+    label: str,
+    n_rows: int,
+) -> tuple[pd.DataFrame, dict]:
+    n_valid = int(cats.notna().sum())
+    table = rate_breakdown(cats, has_debit, business=business)
+    df = pd.DataFrame(
+        {
+            label: table.index.astype(str),
+            "Total Accounts": table["Total"].to_numpy(),
+            "With Debit": table["Hits"].to_numpy(),
+            "Without Debit": (table["Total"] - table["Hits"]).to_numpy(),
+            "DCTR %": table["Rate"].to_numpy(),
+            "Personal w/Debit": table["Personal Hits"].to_numpy(),
+            "Business w/Debit": table["Business Hits"].to_numpy(),
         }
+    )
+    if df.empty:
+        return pd.DataFrame(), {}
+    df = total_row(df, label)
+
+    dr = df[df[label] != "TOTAL"]
+    hi = dr.loc[dr["DCTR %"].idxmax()]
+    lo = dr.loc[dr["DCTR %"].idxmin()]
+    ins = {
+        "highest": hi[label],
+        "highest_dctr": hi["DCTR %"],
+        "lowest": lo[label],
+        "lowest_dctr": lo["DCTR %"],
+        "spread": hi["DCTR %"] - lo["DCTR %"],
+        "total_with_data": n_valid,
+        "coverage": n_valid / n_rows if n_rows else 0,
+    }
     return df, ins
 
 
 def crosstab_dctr(
     dataset: pd.DataFrame,
     row_col: str,
-    row_fn,
-    row_order: list[str],
+    row_bins: Bins,
     row_label: str,
     col_col: str,
-    col_fn,
-    col_order: list[str],
+    col_bins: Bins,
     col_label: str,
 ) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, dict]:
     """Cross-tab DCTR: detail, DCTR pivot, count pivot, insights."""
     if dataset.empty:
         return pd.DataFrame(), pd.DataFrame(), pd.DataFrame(), {}
-    dc = dataset.copy()
-    dc[row_label] = dc[row_col].apply(row_fn)
-    dc[col_label] = dc[col_col].apply(col_fn)
-    valid = dc[(dc[row_label] != "Unknown") & (dc[col_label] != "Unknown")]
+    return _crosstab_table(
+        row_bins.cut(dataset[row_col]).rename(row_label),
+        col_bins.cut(dataset[col_col]).rename(col_label),
+        debit_mask(dataset),
+    )
 
-    rows = []
-    for r in row_order:
-        for c in col_order:
-            seg = valid[(valid[row_label] == r) & (valid[col_label] == c)]
-            if len(seg) > 0:
-                t, w, d = dctr(seg)
-                rows.append(
-                    {row_label: r, col_label: c, "Total Accounts": t, "With Debit": w, "DCTR %": d}
-                )
-    detail = pd.DataFrame(rows)
-    if detail.empty:
-        return detail, pd.DataFrame(), pd.DataFrame(), {}
 
+def crosstab_features(
+    features: pd.DataFrame,
+    row_col: str,
+    row_label: str,
+    col_col: str,
+    col_label: str,
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, dict]:
+    """``crosstab_dctr`` over two bucketed columns of the pipeline feature frame."""
+    if features.empty:
+        return pd.DataFrame(), pd.DataFrame(), pd.DataFrame(), {}
+    return _crosstab_table(
+        features[row_col].rename(row_label),
+        features[col_col].rename(col_label),
+        features["has_debit"],
+    )
+
+
+def _crosstab_table(
+    row_cats: pd.Series,
+    col_cats: pd.Series,
+    has_debit: pd.Series,
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, dict]:
+    row_label, col_label = row_cats.name, col_cats.name
+    table = rate_breakdown([row_cats, col_cats], has_debit)
+    if table.empty:
+        return pd.DataFrame(), pd.DataFrame(), pd.DataFrame(), {}
+
+    detail = pd.DataFrame(
+        {
+            row_label: table.index.get_level_values(row_label).astype(str),
+            col_label: table.index.get_level_values(col_label).astype(str),
+            "Total Accounts": table["Total"].to_numpy(),
+            "With Debit": table["Hits"].to_numpy(),
+            "DCTR %": table["Rate"].to_numpy(),
+        }
+    )
+
+    row_order = list(row_cats.cat.categories)
+    col_order = list(col_cats.cat.categories)
     dp = detail.pivot_table(index=row_label, columns=col_label, values="DCTR %")
     cp = detail.pivot_table(index=row_label, columns=col_label, values="Total Accounts")
     dp = dp.reindex(
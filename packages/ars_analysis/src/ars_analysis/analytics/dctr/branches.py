@@ -13,18 +13,18 @@ from matplotlib.ticker import FuncFormatter
 
 from ars_analysis.analytics.base import AnalysisModule, AnalysisResult
 from ars_analysis.analytics.dctr._helpers import (
+    SIMPLE_AGE_BINS,
     branch_dctr,
-    categorize_account_age,
     dctr,
     debit_mask,
     filter_l12m,
     l12m_month_labels,
-    simplify_account_age,
 )
 from ars_analysis.analytics.registry import register
 from ars_analysis.charts.guards import chart_figure
 from ars_analysis.charts.style import NEGATIVE, POSITIVE, TEAL
 from ars_analysis.pipeline.context import PipelineContext
+from ars_analysis.pipeline.features import features_for
 
 
 def _safe(fn, label: str, ctx: PipelineContext) -> list[AnalysisResult]:
@@ -130,8 +130,7 @@ class DCTRBranches(AnalysisModule):
 
         bm = getattr(ctx.settings, "branch_mapping", None) if ctx.settings else None
         dc = ed.copy()
-        dc["Date Opened"] = pd.to_datetime(dc["Date Opened"], errors="coerce", format="mixed")
-        dc["Account Age Days"] = (pd.Timestamp.now() - dc["Date Opened"]).dt.days
+        dc["Account Age Days"] = features_for(ctx, ed)["account_age_days"]
         if bm:
             str_bm = {str(k): v for k, v in bm.items()}
             mapped = dc["Branch"].astype(str).map(str_bm)
@@ -139,11 +138,9 @@ class DCTRBranches(AnalysisModule):
         else:
             dc["Branch Name"] = dc["Branch"]
         valid = dc[dc["Account Age Days"].notna()].copy()
-        valid["Simple Age"] = (
-            valid["Account Age Days"].apply(categorize_account_age).apply(simplify_account_age)
-        )
+        valid["Simple Age"] = SIMPLE_AGE_BINS.cut(valid["Account Age Days"])
 
-        simple_order = ["New (0-1 year)", "Recent (1-5 years)", "Mature (5+ years)"]
+        simple_order = SIMPLE_AGE_BINS.order
         rows = []
         for branch in sorted(valid["Branch Name"].unique()):
             bd = valid[valid["Branch Name"] == branch]
@@ -6,25 +6,16 @@ Slide IDs: DCTR-10, DCTR-11, DCTR-12, DCTR-13, DCTR-14, A7.11, A7.12.
 from __future__ import annotations
 
 import numpy as np
-import pandas as pd
 from loguru import logger
 from matplotlib.ticker import FuncFormatter
 
 from ars_analysis.analytics.base import AnalysisModule, AnalysisResult
-from ars_analysis.analytics.dctr._helpers import (
-    AGE_ORDER,
-    BALANCE_ORDER,
-    HOLDER_AGE_ORDER,
-    by_dimension,
-    categorize_account_age,
-    categorize_balance,
-    categorize_holder_age,
-    crosstab_dctr,
-)
+from ars_analysis.analytics.dctr._helpers import by_feature, crosstab_features
 from ars_analysis.analytics.registry import register
 from ars_analysis.charts.guards import chart_figure
 from ars_analysis.charts.style import SILVER, TEAL
 from ars_analysis.pipeline.context import PipelineContext
+from ars_analysis.pipeline.features import features_for
 
 
 def _safe(fn, label: str, ctx: PipelineContext) -> list[AnalysisResult]:
@@ -61,12 +52,7 @@ class DCTROverlays(AnalysisModule):
         if ed is None or ed.empty:
             return []
 
-        dc = ed.copy()
-        dc["Date Opened"] = pd.to_datetime(dc["Date Opened"], errors="coerce", format="mixed")
-        dc["Account Age Days"] = (pd.Timestamp.now() - dc["Date Opened"]).dt.days
-        df, ins = by_dimension(
-            dc, "Account Age Days", categorize_account_age, AGE_ORDER, "Account Age"
-        )
+        df, ins = by_feature(features_for(ctx, ed), "account_age", "Account Age")
         if df.empty:
             return []
 
@@ -157,12 +143,9 @@ class DCTROverlays(AnalysisModule):
         if "Account Holder Age" not in ed.columns:
             return []
 
-        edc = ed.copy()
-        edc["Account Holder Age"] = pd.to_numeric(edc["Account Holder Age"], errors="coerce")
-        valid = edc[(edc["Account Holder Age"] >= 18) & (edc["Account Holder Age"] <= 120)].copy()
-        df, ins = by_dimension(
-            valid, "Account Holder Age", categorize_holder_age, HOLDER_AGE_ORDER, "Age Group"
-        )
+        feats = features_for(ctx, ed)
+        valid = feats[feats["holder_age"].between(18, 120)]
+        df, ins = by_feature(valid, "holder_age_group", "Age Group")
         if df.empty:
             return []
 
@@ -273,10 +256,9 @@ class DCTROverlays(AnalysisModule):
         if "Avg Bal" not in ed.columns:
             return []
 
-        edc = ed.copy()
-        edc["Avg Bal"] = pd.to_numeric(edc["Avg Bal"], errors="coerce")
-        valid = edc[edc["Avg Bal"].notna()].copy()
-        df, ins = by_dimension(valid, "Avg Bal", categorize_balance, BALANCE_ORDER, "Balance Range")
+        feats = features_for(ctx, ed)
+        valid = feats[feats["avg_bal"].notna()]
+        df, ins = by_feature(valid, "balance_range", "Balance Range")
         if df.empty:
             return []
 
@@ -302,25 +284,11 @@ class DCTROverlays(AnalysisModule):
         if "Account Holder Age" not in ed.columns or "Avg Bal" not in ed.columns:
             return []
 
-        dc = ed.copy()
-        dc["Account Holder Age"] = pd.to_numeric(dc["Account Holder Age"], errors="coerce")
-        dc["Avg Bal"] = pd.to_numeric(dc["Avg Bal"], errors="coerce")
-        valid = dc[
-            (dc["Account Holder Age"] >= 18)
-            & (dc["Account Holder Age"] <= 120)
-            & dc["Avg Bal"].notna()
-        ].copy()
-
-        detail, dpiv, cpiv, ins = crosstab_dctr(
-            valid,
-            "Account Holder Age",
-            categorize_holder_age,
-            HOLDER_AGE_ORDER,
-            "Age Group",
-            "Avg Bal",
-            categorize_balance,
-            BALANCE_ORDER,
-            "Balance Range",
+        feats = features_for(ctx, ed)
+        valid = feats[feats["holder_age"].between(18, 120) & feats["avg_bal"].notna()]
+
+        detail, dpiv, cpiv, ins = crosstab_features(
+            valid, "holder_age_group", "Age Group", "balance_range", "Balance Range"
         )
         if detail.empty:
             return []
@@ -348,22 +316,11 @@ class DCTROverlays(AnalysisModule):
         if "Avg Bal" not in ed.columns:
             return []
 
-        dc = ed.copy()
-        dc["Date Opened"] = pd.to_datetime(dc["Date Opened"], errors="coerce", format="mixed")
-        dc["Account Age Days"] = (pd.Timestamp.now() - dc["Date Opened"]).dt.days
-        dc["Avg Bal"] = pd.to_numeric(dc["Avg Bal"], errors="coerce")
-        valid = dc[dc["Account Age Days"].notna() & dc["Avg Bal"].notna()].copy()
-
-        detail, dpiv, cpiv, ins = crosstab_dctr(
-            valid,
-            "Account Age Days",
-            categorize_account_age,
-            AGE_ORDER,
-            "Account Age",
-            "Avg Bal",
-            categorize_balance,
-            BALANCE_ORDER,
-            "Balance Range",
+        feats = features_for(ctx, ed)
+        valid = feats[feats["account_age_days"].notna() & feats["avg_bal"].notna()]
+
+        detail, dpiv, cpiv, ins = crosstab_features(
+            valid, "account_age", "Account Age", "balance_range", "Balance Range"
         )
         if detail.empty:
             return []
@@ -22,7 +22,7 @@ from ars_analysis.analytics.dctr._helpers import (
     l12m_monthly,
 )
 from ars_analysis.analytics.registry import register
-from ars_analysis.charts.guards import chart_figure
+from ars_analysis.charts.guards import chart_figure, pyplot_lock, save_figure
 from ars_analysis.charts.style import (
     BUSINESS,
     ELIGIBLE,
@@ -103,7 +103,7 @@ def _render_dctr_narrative(
     style_path = str(Path(__file__).parent.parent.parent / "charts" / "ars.mplstyle")
     fig = None
     try:
-        with plt.style.context(style_path):
+        with pyplot_lock, plt.style.context(style_path):
             fig = plt.figure(figsize=(18, 9), dpi=150)
             gs = fig.add_gridspec(
                 1,
@@ -201,7 +201,10 @@ def _render_dctr_narrative(
                 fontweight="bold",
                 y=0.96,
             )
-            fig.savefig(save_path, dpi=150, bbox_inches="tight", facecolor="white")
+        # Outside the style block: save_figure takes pyplot_lock itself
+        save_figure(
+            fig, save_path, style=style_path, dpi=150, bbox_inches="tight", facecolor="white"
+        )
         fig = None
         return save_path
     finally:
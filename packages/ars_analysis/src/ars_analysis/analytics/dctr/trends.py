@@ -20,6 +20,7 @@ from ars_analysis.analytics.registry import register
 from ars_analysis.charts.guards import chart_figure
 from ars_analysis.charts.style import BUSINESS, HISTORICAL, PERSONAL, TEAL, TTM
 from ars_analysis.pipeline.context import PipelineContext
+from ars_analysis.pipeline.features import features_for
 
 
 def _safe(fn, label: str, ctx: PipelineContext) -> list[AnalysisResult]:
@@ -38,6 +39,7 @@ class DCTRTrends(AnalysisModule):
     display_name = "DCTR Trends"
     section = "dctr"
     required_columns = ("Date Opened", "Debit?", "Business?")
+    depends_on = ("dctr.penetration",)
 
     def run(self, ctx: PipelineContext) -> list[AnalysisResult]:
         logger.info("DCTR Trends for {client}", client=ctx.client.client_id)
@@ -665,14 +667,17 @@ class DCTRTrends(AnalysisModule):
         if ed is None or ed.empty:
             return []
 
-        valid = ed.copy()
-        valid["Date Opened"] = pd.to_datetime(valid["Date Opened"], errors="coerce", format="mixed")
-        valid = valid[valid["Date Opened"].notna()]
-        if valid.empty:
+        feats = features_for(ctx, ed)
+        opened = feats["date_opened"].notna()
+        if not opened.any():
             return []
 
-        valid["Account Age Days"] = (pd.Timestamp.now() - valid["Date Opened"]).dt.days
-        valid["Year"] = valid["Date Opened"].dt.year
+        valid = ed[opened].assign(
+            **{
+                "Account Age Days": feats["account_age_days"][opened],
+                "Year": feats["date_opened"][opened].dt.year,
+            }
+        )
 
         vintage_buckets = [
             ("0-30 days", 0, 30),
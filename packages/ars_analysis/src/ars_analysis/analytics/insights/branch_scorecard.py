@@ -266,6 +266,7 @@ class BranchScorecard(AnalysisModule):
     display_name = "Branch Performance Scorecard"
     section = "insights"
     required_columns = ()
+    client_fields = ("ic_rate",)
 
     def run(self, ctx: PipelineContext) -> list[AnalysisResult]:
         logger.info("Branch Scorecard for {client}", client=ctx.client.client_id)
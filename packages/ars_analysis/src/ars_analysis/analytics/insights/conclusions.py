@@ -466,6 +466,15 @@ class InsightsConclusions(AnalysisModule):
     display_name = "Impact Story: Conclusions"
     section = "insights"
     required_columns = ()
+    input_columns = ()
+    depends_on = (
+        "dctr.penetration",
+        "dctr.branches",
+        "rege.status",
+        "attrition.impact",
+        "value.analysis",
+        "mailer.impact",
+    )
 
     def validate(self, ctx: PipelineContext) -> list[str]:
         """No column requirements -- reads ctx.results from upstream modules."""
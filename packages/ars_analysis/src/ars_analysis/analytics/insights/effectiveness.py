@@ -307,6 +307,8 @@ class EffectivenessProof(AnalysisModule):
     display_name = "Effectiveness Proof"
     section = "insights"
     required_columns = ()
+    client_fields = ("ic_rate",)
+    depends_on = ("dctr.penetration", "rege.status")
 
     def run(self, ctx: PipelineContext) -> list[AnalysisResult]:
         logger.info("Effectiveness proof for {client}", client=ctx.client.client_id)
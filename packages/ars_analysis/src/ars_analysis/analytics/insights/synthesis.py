@@ -683,6 +683,17 @@ class InsightsSynthesis(AnalysisModule):
     display_name = "Impact Story: Synthesis"
     section = "insights"
     required_columns = ()  # Reads ctx.results, not ctx.data columns
+    input_columns = ()
+    depends_on = (
+        "overview.eligibility",
+        "dctr.penetration",
+        "dctr.branches",
+        "rege.status",
+        "attrition.rates",
+        "attrition.impact",
+        "value.analysis",
+        "mailer.impact",
+    )
 
     def validate(self, ctx: PipelineContext) -> list[str]:
         """No column requirements -- reads ctx.results from upstream modules."""
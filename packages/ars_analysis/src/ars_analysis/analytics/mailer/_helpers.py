@@ -7,11 +7,13 @@ from __future__ import annotations
 
 import re
 
+import numpy as np
 import pandas as pd
 from loguru import logger
 
 from ars_analysis.analytics.base import AnalysisResult
 from ars_analysis.pipeline.context import PipelineContext
+from shared.timeseries import TimeSeriesBlock
 
 # ---------------------------------------------------------------------------
 # Segment constants
@@ -140,52 +142,33 @@ def analyze_ladder(
     if month_idx < 1:
         return None
 
-    _, resp_col, _ = pairs[month_idx]
-    prior_resp_cols = [rc for _, rc, _ in pairs[:month_idx]]
-
-    result = {
-        "first_count": 0,
-        "repeat_count": 0,
-        "movement_up": 0,
-        "movement_same": 0,
-        "movement_down": 0,
-        "total_successful": 0,
-        "distribution": {t: 0 for t in SUCCESSFUL_TIERS},
+    # Score every (account, month) cell once, then compare the current month
+    # against the most recent successful prior month -- classify_responder
+    # applied to all accounts at once.
+    resp = response_block(data, pairs[: month_idx + 1])
+    lookup = np.array([SCORE_MAP.get(str(label).strip(), 0) for label in resp.categories] + [0])
+    scores = lookup[resp.values]  # code -1 (missing) -> trailing 0
+    current, prior = scores[:, -1], scores[:, :-1]
+
+    success = prior >= 2
+    has_prior = success.any(axis=1)
+    last = prior.shape[1] - 1 - success[:, ::-1].argmax(axis=1)
+    prior_score = prior[np.arange(len(prior)), last]
+
+    included = current >= 2
+    first = included & ~has_prior
+    repeat = included & has_prior
+
+    return {
+        "first_count": int(first.sum()),
+        "repeat_count": int(repeat.sum()),
+        "movement_up": int((repeat & (current > prior_score)).sum()),
+        "movement_same": int((repeat & (current == prior_score)).sum()),
+        "movement_down": int((repeat & (current < prior_score)).sum()),
+        "total_successful": int(included.sum()),
+        "distribution": {t: int((current == SCORE_MAP[t]).sum()) for t in SUCCESSFUL_TIERS},
     }
 
-    for _, row in data.iterrows():
-        current = row.get(resp_col)
-        if pd.isna(current):
-            continue
-        current = str(current).strip()
-
-        priors = [
-            str(row.get(c)).strip() if pd.notna(row.get(c)) else None
-            for c in prior_resp_cols
-        ]
-
-        cls = classify_responder(current, priors)
-        if not cls["include"]:
-            continue
-
-        result["total_successful"] += 1
-        if current in result["distribution"]:
-            result["distribution"][current] += 1
-
-        if cls["type"] == "First":
-            result["first_count"] += 1
-        else:
-            result["repeat_count"] += 1
-            mv = cls["movement"]
-            if mv == "Up":
-                result["movement_up"] += 1
-            elif mv == "Same":
-                result["movement_same"] += 1
-            elif mv == "Down":
-                result["movement_down"] += 1
-
-    return result
-
 
 # ---------------------------------------------------------------------------
 # Parsing helpers
@@ -327,20 +310,30 @@ def discover_metric_cols(
 # ---------------------------------------------------------------------------
 
 
+def response_block(data: pd.DataFrame, pairs: list[tuple[str, str, str]]) -> TimeSeriesBlock:
+    """The pairs' Resp columns as one accounts x months block, in pair order."""
+    return TimeSeriesBlock.from_frame(
+        data, "resp", columns=[rc for _, rc, _ in pairs], categorical=True
+    )
+
+
+def mail_block(data: pd.DataFrame, pairs: list[tuple[str, str, str]]) -> TimeSeriesBlock:
+    """The pairs' Mail columns as one accounts x months block, in pair order."""
+    return TimeSeriesBlock.from_frame(
+        data, "mail", columns=[mc for _, _, mc in pairs], categorical=True
+    )
+
+
 def build_responder_mask(data: pd.DataFrame, pairs: list[tuple[str, str, str]]) -> pd.Series:
     """Boolean Series: True for any account that responded in any month."""
-    mask = pd.Series(False, index=data.index)
-    for _, resp_col, _ in pairs:
-        mask |= data[resp_col].isin(RESPONSE_SEGMENTS)
-    return mask
+    resp = response_block(data, pairs)
+    return resp.any(resp.isin(RESPONSE_SEGMENTS))
 
 
 def build_mailed_mask(data: pd.DataFrame, pairs: list[tuple[str, str, str]]) -> pd.Series:
     """Boolean Series: True for any account mailed in any month."""
-    mask = pd.Series(False, index=data.index)
-    for _, _, mail_col in pairs:
-        mask |= data[mail_col].isin(MAILED_SEGMENTS)
-    return mask
+    mail = mail_block(data, pairs)
+    return mail.any(mail.isin(MAILED_SEGMENTS))
 
 
 # ---------------------------------------------------------------------------
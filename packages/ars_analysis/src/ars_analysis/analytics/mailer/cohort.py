@@ -14,15 +14,16 @@ from ars_analysis.analytics.base import AnalysisModule, AnalysisResult
 from ars_analysis.analytics.mailer._helpers import (
     RESPONSE_SEGMENTS,
     SEGMENT_COLORS,
-    build_responder_mask,
     discover_metric_cols,
     discover_pairs,
     parse_month,
+    response_block,
 )
 from ars_analysis.analytics.registry import register
 from ars_analysis.charts.guards import chart_figure
 from ars_analysis.charts.style import NEGATIVE, POSITIVE, SILVER
 from ars_analysis.pipeline.context import PipelineContext
+from shared.timeseries import TimeSeriesBlock
 
 NON_RESP_COLOR = "#404040"
 
@@ -32,33 +33,9 @@ NON_RESP_COLOR = "#404040"
 # ---------------------------------------------------------------------------
 
 
-def _find_first_response_month(
-    row: pd.Series,
-    pairs: list[tuple[str, str, str]],
-) -> str | None:
-    """Return the first month string where this account responded, or None."""
-    for month, resp_col, _mail_col in pairs:
-        val = row.get(resp_col)
-        if pd.notna(val) and val in RESPONSE_SEGMENTS:
-            return month
-    return None
-
-
-def _find_first_response_segment(
-    row: pd.Series,
-    pairs: list[tuple[str, str, str]],
-) -> str | None:
-    """Return the response segment from the first response month, or None."""
-    for _month, resp_col, _mail_col in pairs:
-        val = row.get(resp_col)
-        if pd.notna(val) and val in RESPONSE_SEGMENTS:
-            return val
-    return None
-
-
-def _month_offset(metric_ts: pd.Timestamp, anchor_ts: pd.Timestamp) -> int:
-    """Compute month offset between two timestamps."""
-    return (metric_ts.year - anchor_ts.year) * 12 + (metric_ts.month - anchor_ts.month)
+def _month_number(ts: pd.Timestamp) -> int:
+    """Months since year 0, so offsets between months are plain subtraction."""
+    return ts.year * 12 + ts.month
 
 
 def build_cohort_trajectory(
@@ -77,50 +54,47 @@ def build_cohort_trajectory(
     if not pairs or not metric_cols:
         return pd.DataFrame(columns=["offset", "group", "avg_value", "n_accounts"])
 
-    # Map metric columns to timestamps
-    metric_ts_map = {col: parse_month(col) for col in metric_cols}
-    metric_ts_map = {k: v for k, v in metric_ts_map.items() if pd.notna(v)}
-
-    if not metric_ts_map:
+    metric_cols = [col for col in metric_cols if pd.notna(parse_month(col))]
+    if not metric_cols:
         return pd.DataFrame(columns=["offset", "group", "avg_value", "n_accounts"])
 
     data = ctx.data
-    resp_mask = build_responder_mask(data, pairs)
+    resp = response_block(data, pairs)
+    responded = resp.isin(RESPONSE_SEGMENTS)
+    first = resp.first(responded).to_numpy()
+    resp_mask = first >= 0
 
-    # Find anchor month per account
-    earliest_mail_ts = parse_month(pairs[0][0])
-    anchors = data.apply(lambda row: _find_first_response_month(row, pairs), axis=1)
-    anchor_timestamps = anchors.map(lambda m: parse_month(m) if m else earliest_mail_ts)
+    # Anchor month per account: first response month, else the earliest mail month
+    pair_months = np.array([_month_number(parse_month(month)) for month, _, _ in pairs])
+    anchors = np.where(resp_mask, pair_months[np.maximum(first, 0)], pair_months[0])
 
     # Segment labels
     if by_segment:
-        segments = data.apply(lambda row: _find_first_response_segment(row, pairs), axis=1)
-        groups = segments.where(resp_mask, "Non-Responders")
+        codes = resp.values[np.arange(len(first)), np.maximum(first, 0)]
+        labels = np.append(np.asarray(resp.categories, dtype=object), None)[codes]
+        groups = np.where(resp_mask, labels, "Non-Responders")
     else:
-        groups = pd.Series("Responders", index=data.index)
-        groups = groups.where(resp_mask, "Non-Responders")
-
-    # Build long-form records
-    records = []
-    for col, ts in metric_ts_map.items():
-        for idx in data.index:
-            offset = _month_offset(ts, anchor_timestamps[idx])
-            val = data.at[idx, col]
-            if pd.notna(val):
-                records.append(
-                    {
-                        "offset": offset,
-                        "group": groups[idx],
-                        "value": float(val),
-                    }
-                )
+        groups = np.where(resp_mask, "Responders", "Non-Responders")
+
+    # Long-form records: one per (account, month) with a value
+    metric = TimeSeriesBlock.from_frame(
+        data, metric_type, columns=metric_cols, categorical=False, dtype=np.float64
+    )
+    offsets = np.array([_month_number(m) for m in metric.months])[None, :] - anchors[:, None]
+    present = metric.present()
+    records = pd.DataFrame(
+        {
+            "offset": offsets[present],
+            "group": np.broadcast_to(groups[:, None], present.shape)[present],
+            "value": metric.values[present],
+        }
+    )
 
-    if not records:
+    if records.empty:
         return pd.DataFrame(columns=["offset", "group", "avg_value", "n_accounts"])
 
-    long_df = pd.DataFrame(records)
     result = (
-        long_df.groupby(["group", "offset"])
+        records.groupby(["group", "offset"])
         .agg(avg_value=("value", "mean"), n_accounts=("value", "count"))
         .reset_index()
     )
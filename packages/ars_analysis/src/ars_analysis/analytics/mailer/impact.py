@@ -817,6 +817,7 @@ class MailerImpact(AnalysisModule):
     display_name = "Market Impact Analysis"
     section = "mailer"
     required_columns = ()  # Dynamic -- depends on mailer columns
+    client_fields = ("ic_rate",)
 
     def run(self, ctx: PipelineContext) -> list[AnalysisResult]:
         logger.info("Mailer Impact for {client}", client=ctx.client.client_id)
@@ -965,6 +965,7 @@ class MailerResponse(AnalysisModule):
     display_name = "Mailer Response Analysis"
     section = "mailer"
     required_columns = ("Date Opened",)
+    client_fields = ("reg_e_opt_in", "reg_e_column")
 
     def run(self, ctx: PipelineContext) -> list[AnalysisResult]:
         logger.info("Mailer Response for {client}", client=ctx.client.client_id)
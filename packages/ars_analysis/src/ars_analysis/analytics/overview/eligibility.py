@@ -20,6 +20,7 @@ class EligibilityFunnel(AnalysisModule):
     display_name = "Eligibility Funnel"
     section = "overview"
     required_columns = ("Stat Code", "Product Code", "Business?")
+    client_fields = ("eligible_mailable",)
 
     def run(self, ctx: PipelineContext) -> list[AnalysisResult]:
         logger.info("A3: Eligibility Funnel for {client}", client=ctx.client.client_id)
@@ -16,6 +16,7 @@ from matplotlib.ticker import FuncFormatter
 
 from ars_analysis.analytics.base import AnalysisModule, AnalysisResult
 from ars_analysis.analytics.registry import register
+from ars_analysis.charts.guards import pyplot_lock, save_figure
 from ars_analysis.charts.style import ELIGIBLE, SILVER
 from ars_analysis.pipeline.context import PipelineContext
 
@@ -226,7 +227,7 @@ def _render_combined(
     fig_h = 10
     fig = None
     try:
-        with plt.style.context(style_path):
+        with pyplot_lock, plt.style.context(style_path):
             fig = plt.figure(figsize=(fig_w, fig_h), dpi=150)
 
             if has_product:
@@ -279,7 +280,10 @@ def _render_combined(
                     ax_prod, prod_summary, eligible_prods, "Product Code Distribution", top_n=8
                 )
 
-            fig.savefig(save_path, dpi=150, bbox_inches="tight", facecolor="white")
+        # Outside the style block: save_figure takes pyplot_lock itself
+        save_figure(
+            fig, save_path, style=style_path, dpi=150, bbox_inches="tight", facecolor="white"
+        )
         fig = None
         return save_path
     finally:
@@ -6,6 +6,7 @@ import numpy as np
 import pandas as pd
 from loguru import logger
 
+from ars_analysis.analytics.breakdown import Bins, rate_breakdown
 from ars_analysis.analytics.dctr._helpers import debit_mask, detect_debit_col, filter_l12m
 from ars_analysis.pipeline.context import PipelineContext
 
@@ -32,6 +33,11 @@ HOLDER_AGE_ORDER = [
 ]
 
 
+# Bin tables mirroring categorize_account_age / categorize_holder_age below.
+ACCT_AGE_BINS = Bins((-np.inf, 180, 365, 730, 1825, 3650, 7300, np.inf), tuple(ACCT_AGE_ORDER))
+HOLDER_AGE_BINS = Bins((-np.inf, 25, 35, 45, 55, 65, 75, np.inf), tuple(HOLDER_AGE_ORDER))
+
+
 def categorize_account_age(days: float) -> str:
     """Assign account age bucket (7 buckets for Reg E)."""
     if pd.isna(days):
@@ -104,6 +110,29 @@ def rege(df: pd.DataFrame, col: str, opt_list: list[str]) -> tuple[int, int, flo
     return t, oi, oi / t
 
 
+def rege_by_dimension(
+    df: pd.DataFrame,
+    keys: pd.Series,
+    col: str,
+    opt_list: list[str],
+    label: str,
+) -> pd.DataFrame:
+    """Opt-in table per category of ``keys`` (one groupby, no TOTAL row).
+
+    Categories with no accounts are omitted; missing keys are dropped.
+    """
+    table = rate_breakdown(keys, df[col].isin(opt_list))
+    return pd.DataFrame(
+        {
+            label: table.index.astype(str) if table.index.dtype == "category" else table.index,
+            "Total Accounts": table["Total"].to_numpy(),
+            "Opted In": table["Hits"].to_numpy(),
+            "Opted Out": (table["Total"] - table["Hits"]).to_numpy(),
+            "Opt-In Rate": table["Rate"].to_numpy(),
+        }
+    )
+
+
 def _parse_reg_e_date(col_name: str) -> pd.Timestamp:
     """Extract date from a Reg E column name like 'Reg E Code Jan26'."""
     # Strip "Reg E Code" prefix, then parse remaining date part
@@ -77,6 +77,7 @@ class RegEBranches(AnalysisModule):
     display_name = "Reg E Branch Analysis"
     section = "rege"
     required_columns = ("Date Opened", "Debit?", "Business?", "Branch")
+    client_fields = ("reg_e_opt_in", "reg_e_column")
 
     def run(self, ctx: PipelineContext) -> list[AnalysisResult]:
         logger.info("Reg E Branches for {client}", client=ctx.client.client_id)
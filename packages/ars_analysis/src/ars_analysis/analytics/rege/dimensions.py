@@ -14,18 +14,17 @@ from matplotlib.ticker import FuncFormatter
 from ars_analysis.analytics.base import AnalysisModule, AnalysisResult
 from ars_analysis.analytics.dctr._helpers import debit_mask, filter_l12m
 from ars_analysis.analytics.rege._helpers import (
-    ACCT_AGE_ORDER,
-    HOLDER_AGE_ORDER,
-    categorize_account_age,
-    categorize_holder_age,
+    ACCT_AGE_BINS,
+    HOLDER_AGE_BINS,
     reg_e_base,
-    rege,
+    rege_by_dimension,
     total_row,
 )
 from ars_analysis.analytics.registry import register
 from ars_analysis.charts.guards import chart_figure
 from ars_analysis.charts.style import ELIGIBLE, HISTORICAL, NEGATIVE, POSITIVE, TEAL
 from ars_analysis.pipeline.context import PipelineContext
+from ars_analysis.pipeline.features import features_for
 
 
 def _safe(fn, label: str, ctx: PipelineContext) -> list[AnalysisResult]:
@@ -182,6 +181,7 @@ class RegEDimensions(AnalysisModule):
     display_name = "Reg E Dimensional Analysis"
     section = "rege"
     required_columns = ("Date Opened", "Debit?", "Business?")
+    client_fields = ("reg_e_opt_in", "reg_e_column")
 
     def run(self, ctx: PipelineContext) -> list[AnalysisResult]:
         logger.info("Reg E Dimensions for {client}", client=ctx.client.client_id)
@@ -199,26 +199,8 @@ class RegEDimensions(AnalysisModule):
         logger.info("A8.5: Reg E by Account Age")
         base, _, col, opts = reg_e_base(ctx)
 
-        df = base.copy()
-        df["Date Opened"] = pd.to_datetime(df["Date Opened"], errors="coerce", format="mixed")
-        df["Age Days"] = (pd.Timestamp.now() - df["Date Opened"]).dt.days
-        df["Age Range"] = df["Age Days"].apply(categorize_account_age)
-
-        rows = []
-        for age in ACCT_AGE_ORDER:
-            ad = df[df["Age Range"] == age]
-            if len(ad) > 0:
-                t, oi, r = rege(ad, col, opts)
-                rows.append(
-                    {
-                        "Account Age": age,
-                        "Total Accounts": t,
-                        "Opted In": oi,
-                        "Opted Out": t - oi,
-                        "Opt-In Rate": r,
-                    }
-                )
-        result = pd.DataFrame(rows)
+        age_days = features_for(ctx, base)["account_age_days"]
+        result = rege_by_dimension(base, ACCT_AGE_BINS.cut(age_days), col, opts, "Account Age")
         result = total_row(result, "Account Age")
 
         # Chart
@@ -288,34 +270,12 @@ class RegEDimensions(AnalysisModule):
         def by_holder_age(df: pd.DataFrame) -> pd.DataFrame:
             if df is None or df.empty:
                 return pd.DataFrame()
-            d = df.copy()
-            if "Account Holder Age" in d.columns:
-                d["Holder Age"] = pd.to_numeric(d["Account Holder Age"], errors="coerce")
-            elif "Birth Date" in d.columns:
-                d["Birth Date"] = pd.to_datetime(d["Birth Date"], errors="coerce", format="mixed")
-                d["Holder Age"] = (pd.Timestamp.now() - d["Birth Date"]).dt.days / 365.25
-            elif "Age" in d.columns:
-                d["Holder Age"] = pd.to_numeric(d["Age"], errors="coerce")
-            else:
+            if not {"Account Holder Age", "Birth Date", "Age"} & set(df.columns):
                 return pd.DataFrame()
 
-            d["Age Group"] = d["Holder Age"].apply(categorize_holder_age)
-            age_rows = []
-            for ag in HOLDER_AGE_ORDER:
-                seg = d[d["Age Group"] == ag]
-                if len(seg) > 0:
-                    t, oi, r = rege(seg, col, opts)
-                    age_rows.append(
-                        {
-                            "Age Group": ag,
-                            "Total Accounts": t,
-                            "Opted In": oi,
-                            "Opted Out": t - oi,
-                            "Opt-In Rate": r,
-                        }
-                    )
-            res = pd.DataFrame(age_rows)
-            return total_row(res, "Age Group") if not res.empty else res
+            holder_age = features_for(ctx, df)["holder_age"]
+            res = rege_by_dimension(df, HOLDER_AGE_BINS.cut(holder_age), col, opts, "Age Group")
+            return total_row(res, "Age Group") if not res.empty else pd.DataFrame()
 
         hist = by_holder_age(base)
         l12m_df = by_holder_age(base_l12m)
@@ -455,20 +415,8 @@ class RegEDimensions(AnalysisModule):
                 )
             ]
 
-        rows = []
-        for pc in sorted(base[pc_col].dropna().unique()):
-            seg = base[base[pc_col] == pc]
-            t, oi, r = rege(seg, col, opts)
-            rows.append(
-                {
-                    "Product Code": pc,
-                    "Total Accounts": t,
-                    "Opted In": oi,
-                    "Opted Out": t - oi,
-                    "Opt-In Rate": r,
-                }
-            )
-        result = pd.DataFrame(rows)
+        result = rege_by_dimension(base, base[pc_col], col, opts, "Product Code")
+        n_products = len(result)
         if not result.empty:
             result = result.sort_values("Total Accounts", ascending=False)
             result = total_row(result, "Product Code")
@@ -509,7 +457,7 @@ class RegEDimensions(AnalysisModule):
             )
         chart_path = save_to
 
-        notes = f"{len(rows)} products. Overall: {overall:.1f}%"
+        notes = f"{n_products} products. Overall: {overall:.1f}%"
         ctx.results["reg_e_7"] = {"data": result}
 
         return [
@@ -44,6 +44,7 @@ class RegEStatus(AnalysisModule):
     display_name = "Reg E Opt-In Status"
     section = "rege"
     required_columns = ("Date Opened", "Debit?", "Business?")
+    client_fields = ("reg_e_opt_in", "reg_e_column")
 
     def run(self, ctx: PipelineContext) -> list[AnalysisResult]:
         logger.info("Reg E Status for {client}", client=ctx.client.client_id)
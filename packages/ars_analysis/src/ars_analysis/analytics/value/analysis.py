@@ -235,6 +235,8 @@ class ValueAnalysis(AnalysisModule):
     display_name = "Value Analysis"
     section = "value"
     required_columns = ("Date Opened",)
+    client_fields = ("nsf_od_fee", "ic_rate", "reg_e_opt_in", "reg_e_column")
+    depends_on = ("dctr.penetration", "rege.status")
 
     def validate(self, ctx: PipelineContext) -> list[str]:
         errors = super().validate(ctx)
@@ -1,5 +1,6 @@
 """Figure lifecycle management -- guaranteed cleanup + style isolation."""
 
+import threading
 from collections.abc import Generator
 from contextlib import contextmanager
 from pathlib import Path
@@ -9,10 +10,17 @@ import matplotlib
 matplotlib.use("Agg")
 import matplotlib.pyplot as plt  # noqa: E402
 from matplotlib.axes import Axes  # noqa: E402
+from matplotlib.backends.backend_agg import FigureCanvasAgg  # noqa: E402
 from matplotlib.figure import Figure  # noqa: E402
 
+from ars_analysis.charts.render_queue import active_render_queue  # noqa: E402
+
 _ARS_STYLE = Path(__file__).parent / "ars.mplstyle"
 
+# pyplot's figure registry and plt.style.context (global rcParams) are not
+# thread-safe. Hold this while building a figure when modules run in parallel.
+pyplot_lock = threading.RLock()
+
 
 @contextmanager
 def chart_figure(
@@ -27,14 +35,88 @@ def chart_figure(
         with chart_figure(save_path=out / "chart.png") as (fig, ax):
             ax.bar(x, y)
             ax.set_title("My Chart")
-        # Figure is saved and closed automatically
+        # Figure is saved and closed automatically (in the background
+        # while a render queue is active -- see charts.render_queue)
     """
     style_path = style or str(_ARS_STYLE)
-    with plt.style.context(style_path):
+    with pyplot_lock, plt.style.context(style_path):
         fig, ax = plt.subplots(figsize=figsize, dpi=dpi)
         try:
             yield fig, ax
-            if save_path is not None:
-                fig.savefig(save_path, dpi=dpi, bbox_inches="tight")
-        finally:
+        except BaseException:
+            plt.close(fig)
+            raise
+    if save_path is None:
+        with pyplot_lock:
+            plt.close(fig)
+    else:
+        save_figure(fig, save_path, style=style_path, dpi=dpi, bbox_inches="tight")
+
+
+def save_figure(
+    fig: Figure,
+    save_path: Path,
+    style: str | None = None,
+    **savefig_kwargs: object,
+) -> None:
+    """Save and close ``fig``, rendering under ``style`` (ticks are laid out at draw time).
+
+    Deferred to the active render queue if there is one. Call without
+    holding ``pyplot_lock`` -- queued renders need it.
+    """
+    style_path = style or str(_ARS_STYLE)
+    queue = active_render_queue()
+    if queue is not None:
+        with pyplot_lock:
+            plt.close(fig)
+        queue.submit(fig, save_path, style_path, **savefig_kwargs)
+        return
+    try:
+        render_with_style(fig, save_path, style_path, **savefig_kwargs)
+    finally:
+        with pyplot_lock:
             plt.close(fig)
+
+
+def render_with_style(fig: Figure, save_path: Path, style: str, **savefig_kwargs: object) -> None:
+    """``fig.savefig`` as if ``style`` were active, drawing outside ``pyplot_lock``.
+
+    rcParams are global, so the lock is held only while the style's
+    draw-time settings are pinned onto ``fig``; the render itself runs on
+    the figure's own Agg canvas.
+    """
+    with pyplot_lock, plt.style.context(style):
+        kwargs = _pin_style(fig, savefig_kwargs)
+    FigureCanvasAgg(fig)  # detach from pyplot; savefig draws on this canvas
+    fig.savefig(save_path, **kwargs)
+
+
+# savefig keyword -> rcParam it falls back to
+_SAVEFIG_RC = {
+    "dpi": "savefig.dpi",
+    "facecolor": "savefig.facecolor",
+    "edgecolor": "savefig.edgecolor",
+    "transparent": "savefig.transparent",
+    "bbox_inches": "savefig.bbox",
+    "pad_inches": "savefig.pad_inches",
+}
+
+
+def _pin_style(fig: Figure, savefig_kwargs: dict) -> dict:
+    """Fix onto ``fig`` what drawing would otherwise read from the current rcParams.
+
+    The tick label size that locators use to space ticks is set explicitly
+    (the first tick's, so per-chart ``tick_params`` survive), then every
+    tick is created now -- ticks are built lazily from rcParams. Returns
+    the save keywords with the ``savefig.*`` defaults filled in.
+    """
+    for ax in fig.axes:
+        for name, axis in (("x", ax.xaxis), ("y", ax.yaxis)):
+            labelsize = axis.get_major_ticks(1)[0].label1.get_size()
+            ax.tick_params(axis=name, which="major", labelsize=labelsize)
+            axis.get_major_ticks(len(axis.get_majorticklocs()))
+            axis.get_minor_ticks(len(axis.get_minorticklocs()))
+    kwargs = dict(savefig_kwargs)
+    for key, rc in _SAVEFIG_RC.items():
+        kwargs.setdefault(key, plt.rcParams[rc])
+    return kwargs
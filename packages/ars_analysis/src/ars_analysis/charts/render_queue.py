@@ -0,0 +1,106 @@
+"""Deferred chart rendering -- rasterize and write PNGs off the module's critical path.
+
+While a ``RenderQueue`` is active (``deferred_rendering``), figures built with
+``chart_figure(save_path=...)`` / ``save_figure`` are detached from pyplot and
+handed to background threads for ``savefig``; the module moves on to its next
+analysis. Figure creation stays under ``pyplot_lock`` -- only the finished,
+closed figure leaves the calling thread.
+
+Callers must ``wait()`` before anything reads the PNGs (run report, deck
+build); ``step_generate`` and ``run_pipeline`` do. With no active queue
+charts are saved inline exactly as before.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Generator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from loguru import logger
+
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
+# Render threads for interactive single-client runs (`ars run`, platform runner).
+DEFAULT_RENDER_WORKERS = 2
+
+_ACTIVE: ContextVar[RenderQueue | None] = ContextVar("ars_render_queue", default=None)
+
+
+class RenderQueue:
+    """Bounded pool of threads that save submitted figures to disk.
+
+    ``max_pending`` caps how many rendered-but-unsaved figures are held in
+    memory; ``submit`` blocks once the cap is reached.
+    """
+
+    def __init__(self, workers: int = 2, max_pending: int | None = None) -> None:
+        self.workers = max(1, workers)
+        self._slots = threading.BoundedSemaphore(max_pending or self.workers * 4)
+        self._lock = threading.Lock()
+        self._pool: ThreadPoolExecutor | None = None
+        self._futures: list[Future] = []
+        self.rendered = 0
+        self.failed: list[Path] = []
+
+    def submit(self, fig: Figure, save_path: Path, style: str, **savefig_kwargs: object) -> None:
+        """Queue ``fig`` to be saved to ``save_path`` under ``style``. ``fig`` must be closed."""
+        self._slots.acquire()
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="ars-render"
+                )
+            self._futures.append(
+                self._pool.submit(self._render, fig, save_path, style, savefig_kwargs)
+            )
+
+    def _render(self, fig: Figure, save_path: Path, style: str, savefig_kwargs: dict) -> None:
+        # Deferred import: the queue itself must not pull in pyplot.
+        from ars_analysis.charts.guards import render_with_style
+
+        try:
+            render_with_style(fig, save_path, style, **savefig_kwargs)
+            with self._lock:
+                self.rendered += 1
+        except Exception as exc:
+            with self._lock:
+                self.failed.append(Path(save_path))
+            logger.error("Chart render failed for {p}: {err}", p=save_path, err=exc)
+        finally:
+            self._slots.release()
+
+    def wait(self) -> int:
+        """Block until every queued chart is written. Returns the number that failed.
+
+        The worker threads are shut down; a later ``submit`` starts new ones.
+        """
+        with self._lock:
+            pool, self._pool = self._pool, None
+            pending = len(self._futures)
+            self._futures = []
+        if pool is None:
+            return len(self.failed)
+        logger.debug("Waiting for {n} queued chart(s)", n=pending)
+        pool.shutdown(wait=True)
+        return len(self.failed)
+
+
+def active_render_queue() -> RenderQueue | None:
+    """The queue charts are deferred to in this context, or None (render inline)."""
+    return _ACTIVE.get()
+
+
+@contextmanager
+def deferred_rendering(queue: RenderQueue | None) -> Generator[None, None, None]:
+    """Route chart saves in this context (and contexts copied from it) to ``queue``."""
+    token = _ACTIVE.set(queue)
+    try:
+        yield
+    finally:
+        _ACTIVE.reset(token)
@@ -1,9 +1,16 @@
-"""ARS Pipeline CLI -- Typer application with Rich output."""
+"""ARS Pipeline CLI -- Typer application with Rich output.
+
+Only light modules are imported at startup so ``--help``, ``scan``,
+``retrieve`` and ``check`` don't pay for pandas, matplotlib and the analytics
+modules; commands import what they need when they run
+(``tests/ars/test_startup.py`` holds the import-time budget).
+"""
 
 from __future__ import annotations
 
 import json
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
 from loguru import logger
@@ -11,15 +18,15 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
+from ars_analysis.charts.render_queue import DEFAULT_RENDER_WORKERS
 from ars_analysis.exceptions import ARSError, ConfigError, DataError
 from ars_analysis.logging_setup import setup_logging
-from ars_analysis.pipeline.context import ClientInfo, OutputPaths, PipelineContext
 from ars_analysis.pipeline.error_guidance import get_error_guidance
-from ars_analysis.pipeline.runner import PipelineStep, StepResult, run_pipeline
-from ars_analysis.pipeline.steps.analyze import step_analyze, step_analyze_selected
-from ars_analysis.pipeline.steps.generate import step_archive, step_generate
-from ars_analysis.pipeline.steps.load import step_load_file
-from ars_analysis.pipeline.steps.subsets import step_subsets
+from ars_analysis.pipeline.steps import DEFAULT_MODULE_WORKERS
+
+if TYPE_CHECKING:
+    from ars_analysis.pipeline.context import ClientInfo
+    from ars_analysis.pipeline.runner import StepResult
 
 console = Console()
 app = typer.Typer(
@@ -345,6 +352,30 @@ def run(
     config: str | None = typer.Option(None, help="Path to client config JSON"),
     output_dir: str | None = typer.Option(None, "--output-dir", help="Output directory override"),
     skip_pptx: bool = typer.Option(False, help="Skip PowerPoint generation"),
+    cache: bool = typer.Option(
+        True, "--cache/--no-cache", help="Reuse results of modules whose inputs are unchanged"
+    ),
+    module_workers: int = typer.Option(
+        DEFAULT_MODULE_WORKERS,
+        "--module-workers",
+        min=1,
+        help="Threads for independent analytics modules (1=sequential)",
+    ),
+    render_workers: int = typer.Option(
+        DEFAULT_RENDER_WORKERS,
+        "--render-workers",
+        min=0,
+        help="Background threads saving chart PNGs (0=inline)",
+    ),
+    profile: str | None = typer.Option(
+        None,
+        "--profile",
+        help="cProfile a step, module or function by name (glob ok, e.g. 'dctr.*'); "
+        "modules then run sequentially. Combine with --no-cache to profile cached modules",
+    ),
+    profile_dir: str | None = typer.Option(
+        None, "--profile-dir", help="Where --profile writes .prof/.txt (default: <output>/profiles)"
+    ),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose logging"),
     json_output: bool = typer.Option(False, "--json", help="Output structured JSON"),
 ) -> None:
@@ -356,9 +387,18 @@ def run(
         _display_error(FileNotFoundError(f"File not found: {file_path}"))
         raise typer.Exit(1)
 
-    # Load analytics modules
     from ars_analysis.analytics.registry import load_all_modules
+    from ars_analysis.charts.render_queue import RenderQueue
+    from ars_analysis.pipeline.context import OutputPaths, PipelineContext
+    from ars_analysis.pipeline.module_cache import CACHE_DIRNAME
+    from ars_analysis.pipeline.runner import PipelineStep, run_pipeline
+    from ars_analysis.pipeline.steps.analyze import step_analyze, step_analyze_selected
+    from ars_analysis.pipeline.steps.generate import step_archive, step_generate
+    from ars_analysis.pipeline.steps.load import step_load_file
+    from ars_analysis.pipeline.steps.subsets import step_subsets
+    from shared.profiling import Profiler
 
+    # Load analytics modules
     try:
         load_all_modules()
     except ConfigError as exc:
@@ -369,7 +409,19 @@ def run(
     out_base = Path(output_dir) if output_dir else file_path.parent
     paths = OutputPaths.from_base(out_base, client_info.client_id, client_info.month)
 
-    ctx = PipelineContext(client=client_info, paths=paths)
+    ctx = PipelineContext(
+        client=client_info,
+        paths=paths,
+        # cProfile output is only readable when one module runs at a time
+        module_workers=1 if profile else module_workers,
+        render_queue=RenderQueue(render_workers) if render_workers else None,
+        profiler=Profiler(
+            target=profile,
+            profile_dir=Path(profile_dir) if profile_dir else paths.base_dir / "profiles",
+        ),
+    )
+    if cache:
+        ctx.module_cache_dir = paths.base_dir / CACHE_DIRNAME
 
     # Build step list based on --modules flag
     module_ids = _parse_modules(modules)
@@ -421,6 +473,24 @@ def batch(
         "--local-temp",
         help="Copy to local temp before processing (faster on network drives)",
     ),
+    memory_budget: int | None = typer.Option(
+        None,
+        "--memory-budget",
+        help="Max projected MB of in-flight clients (0 = unlimited, default: config)",
+    ),
+    resume: bool = typer.Option(
+        False,
+        "--resume",
+        help="Skip clients completed by a previous run and resume failed ones from checkpoint",
+    ),
+    queue: str | None = typer.Option(
+        None,
+        "--queue",
+        help="Shared work-queue folder -- 'ars worker' on other machines join the batch",
+    ),
+    lease_seconds: float = typer.Option(
+        120.0, "--lease-seconds", help="Requeue a client if its worker is silent this long"
+    ),
     config: str | None = typer.Option(None, help="Path to config override"),
     json_output: bool = typer.Option(False, "--json", help="Output structured JSON"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose logging"),
@@ -452,6 +522,8 @@ def batch(
         if csm:
             console.print(f"CSM filter: [bold]{csm}[/bold]")
         console.print(f"Workers: [bold]{max_w}[/bold]  |  Local temp: [bold]{use_temp}[/bold]")
+        if queue:
+            console.print(f"Work queue: [bold]{queue}[/bold]")
         if modules:
             console.print(f"Modules: [bold]{modules}[/bold]")
         console.print()
@@ -491,6 +563,10 @@ def batch(
             module_ids=module_ids,
             max_workers=max_w,
             use_local_temp=use_temp,
+            memory_budget_mb=memory_budget,
+            resume=resume,
+            queue_dir=Path(queue) if queue else None,
+            lease_seconds=lease_seconds,
         )
     except Exception as exc:
         _display_error(exc)
@@ -504,7 +580,9 @@ def batch(
                 "client_name": r.client_name,
                 "success": r.success,
                 "elapsed": round(r.elapsed, 1),
+                "predicted": round(r.predicted_seconds, 1),
                 "slides": r.slide_count,
+                "resumed": r.resumed,
                 "error": r.error,
             }
             for r in results
@@ -518,16 +596,20 @@ def batch(
         table.add_column("Status", justify="center")
         table.add_column("Slides", justify="right")
         table.add_column("Time", justify="right")
+        table.add_column("Predicted", justify="right")
         table.add_column("Error")
 
         for r in results:
             status = "[green]OK[/green]" if r.success else "[red]FAILED[/red]"
+            if r.success and r.resumed:
+                status = "[green]OK[/green] (resumed)"
             table.add_row(
                 r.client_id,
                 r.client_name,
                 status,
                 str(r.slide_count),
                 f"{r.elapsed:.1f}s",
+                f"{r.predicted_seconds:.1f}s",
                 r.error[:50] if r.error else "",
             )
         console.print(table)
@@ -544,6 +626,59 @@ def batch(
         raise typer.Exit(1)
 
 
+# ---------------------------------------------------------------------------
+# worker
+# ---------------------------------------------------------------------------
+
+
+@app.command()
+def worker(
+    queue: str = typer.Argument(..., help="Work-queue folder given to 'ars batch --queue'"),
+    lease_seconds: float = typer.Option(
+        120.0, "--lease-seconds", help="Must match the coordinator's --lease-seconds"
+    ),
+    poll: float = typer.Option(5.0, "--poll", help="Seconds between queue checks"),
+    idle: float = typer.Option(
+        0.0, "--idle", help="Keep waiting this many seconds for new work once the queue is empty"
+    ),
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose logging"),
+) -> None:
+    """Join a batch: process clients from a shared work queue until it is empty."""
+    _setup(verbose=verbose)
+
+    from ars_analysis.analytics.registry import load_all_modules
+    from ars_analysis.pipeline.batch import run_worker
+
+    try:
+        load_all_modules()
+    except ConfigError as exc:
+        logger.warning("Some modules failed to load: {err}", err=exc)
+
+    try:
+        settings = _load_settings()
+    except Exception as exc:
+        _display_error(exc)
+        raise typer.Exit(1)
+
+    queue_dir = Path(queue)
+    if not queue_dir.is_dir():
+        console.print(f"[red]Work queue not found: {queue_dir}[/red]")
+        raise typer.Exit(1)
+
+    console.print(f"Working queue [bold]{queue_dir}[/bold] (Ctrl+C to stop)")
+    results = run_worker(
+        queue_dir,
+        settings,
+        lease_seconds=lease_seconds,
+        poll_seconds=poll,
+        idle_seconds=idle,
+    )
+    ok = sum(1 for r in results if r.success)
+    console.print(f"Worker done: {ok}/{len(results)} client(s) succeeded")
+    if not all(r.success for r in results):
+        raise typer.Exit(1)
+
+
 # ---------------------------------------------------------------------------
 # check
 # ---------------------------------------------------------------------------
@@ -758,6 +893,8 @@ def _load_client_info(config_path: str | None, file_path: Path) -> ClientInfo:
     Supports both single-client flat dicts and multi-client master format
     (top-level keys are client IDs). Auto-resolves config when not provided.
     """
+    from ars_analysis.pipeline.context import ClientInfo
+
     # Infer client_id and month from filename first (needed for master lookup)
     stem = file_path.stem
     parts = stem.split("_", maxsplit=2)
@@ -825,6 +962,8 @@ def _client_info_from_master_entry(
     entry: dict, client_id: str, client_name: str, month: str
 ) -> ClientInfo:
     """Build ClientInfo from a master config entry (PascalCase keys)."""
+    from ars_analysis.pipeline.context import ClientInfo
+
     return ClientInfo(
         client_id=client_id,
         client_name=entry.get("ClientName", client_name),
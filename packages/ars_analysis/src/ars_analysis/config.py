@@ -72,6 +72,20 @@ class PipelineConfig(BaseModel):
     chart_dpi: int = Field(default=150, ge=72, le=600)
     max_workers: int = Field(default=1, ge=1, le=16)
     use_local_temp: bool = False
+    # Reuse results of modules whose inputs are unchanged since the last run
+    module_cache: bool = True
+    # Threads per client for independent analytics modules. Batches already
+    # run clients in parallel, so this stays 1 unless max_workers is 1.
+    module_workers: int = Field(default=1, ge=1, le=16)
+    # Background threads that save chart PNGs while modules keep running (0 = inline)
+    chart_render_workers: int = Field(default=2, ge=0, le=8)
+    # Batch scheduling: 0 = no memory cap. Projected memory per client is
+    # file size (MB) x memory_per_file_mb (xlsx expands heavily in pandas).
+    memory_budget_mb: int = Field(default=0, ge=0)
+    memory_per_file_mb: float = Field(default=12.0, gt=0)
+    # Clients whose loaded ODD exceeds this many MB are spilled to Parquet and
+    # get narrow subsets without monthly history (pipeline.odd_store). 0 = never.
+    out_of_core_mb: int = Field(default=0, ge=0)
 
 
 class LoggingConfig(BaseModel):
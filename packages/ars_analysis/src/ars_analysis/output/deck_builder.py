@@ -4,7 +4,7 @@ Full production-quality PPTX generation with:
 - 11 slide types (title, section, screenshot, screenshot_kpi, multi_screenshot, etc.)
 - Named layout constants (LAYOUT_CUSTOM, LAYOUT_SECTION, etc.)
 - Product-specific title slides (RPE, ARS, ICS)
-- Aspect-ratio preserving image scaling via PIL
+- Aspect-ratio preserving, slide-resolution images (shared.images)
 - Preamble slides (13 intro/section/placeholder slides)
 - Consolidation logic (merge paired slides, separate appendix)
 - SCR narrative arc (Situation -> Complication -> Resolution)
@@ -17,13 +17,14 @@ from dataclasses import dataclass
 from pathlib import Path
 
 from loguru import logger
-from pptx import Presentation
 from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN
 from pptx.oxml.ns import qn
 from pptx.util import Inches, Pt
 
 from ars_analysis.pipeline.context import PipelineContext
+from shared.deck.template_cache import prepared_template
+from shared.images import ImagePipeline
 
 # Embedded fallback template (ships with the package)
 _FALLBACK_TEMPLATE = Path(__file__).parent / "template" / "2025-CSI-PPT-Template.pptx"
@@ -53,6 +54,23 @@ LAYOUT_TITLE_RPE = 17         # 1_Title Slide_RPE -- master title (slide 1)
 LAYOUT_TITLE_ARS = 18         # 4_Title Slide_ARS -- ARS section title
 LAYOUT_TITLE_ICS = 19         # 5_Title Slide_ICS -- ICS section title
 
+# (left, top, width) for single-chart slides, by layout
+_SINGLE_DEFAULT = (Inches(0.86), Inches(1.8), Inches(11.6))  # centered with margin
+_SINGLE_POSITIONS = {
+    LAYOUT_CUSTOM: (Inches(0.86), Inches(2.0), Inches(11.6)),  # open canvas below title
+    LAYOUT_CONTENT: (Inches(1.38), Inches(1.8), Inches(10.5)),  # centered content area
+    LAYOUT_CONTENT_ALT: (Inches(1.38), Inches(1.8), Inches(10.5)),
+    LAYOUT_SECTION: (Inches(0.86), Inches(2.2), Inches(11.6)),  # title + body area
+    LAYOUT_PICTURE: (Inches(0.5), Inches(1.55), Inches(12.0)),  # image fills right side
+    LAYOUT_BLANK: (Inches(0.86), Inches(0.5), Inches(11.6)),  # full canvas
+}
+
+# (top, left_pos, right_pos, width) for multi-chart slides, by layout
+_MULTI_DEFAULT = (Inches(1.6), Inches(0.86), Inches(6.81), Inches(5.67))  # even split
+_MULTI_POSITIONS = {
+    LAYOUT_TWO_CONTENT: (Inches(1.82), Inches(0.86), Inches(6.81), Inches(5.67)),
+}
+
 
 # =============================================================================
 # SLIDE CONTENT DEFINITION
@@ -144,18 +162,15 @@ class DeckBuilder:
     def __init__(self, template_path: str):
         self.template_path = template_path
         self.prs = None
+        self.images = ImagePipeline()
 
     def build(self, slides: list[SlideContent], output_path: str) -> str:
         """Build complete PowerPoint deck from slide definitions."""
-        self.prs = Presentation(self.template_path)
-
-        # Remove sample slides that ship with the 2025 template (18 slides)
-        while len(self.prs.slides) > 0:
-            rId = self.prs.slides._sldIdLst[0].get(qn("r:id"))
-            self.prs.part.drop_rel(rId)
-            self.prs.slides._sldIdLst.remove(self.prs.slides._sldIdLst[0])
-
-        n_layouts = len(self.prs.slide_layouts)
+        # The 2025 template's 18 sample slides are removed once per process
+        template = prepared_template(self.template_path)
+        self.prs = template.open()
+        self.images = ImagePipeline()
+        n_layouts = template.n_layouts
 
         for i, slide_content in enumerate(slides):
             if slide_content.layout_index >= n_layouts:
@@ -181,6 +196,7 @@ class DeckBuilder:
 
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
         self.prs.save(output_path)
+        logger.info("Deck images: {summary}", summary=self.images.summary())
         return output_path
 
     def _add_slide(self, content: SlideContent) -> None:
@@ -254,52 +270,17 @@ class DeckBuilder:
 
     def _get_single_positioning(self, layout_index: int) -> tuple:
         """Get (left, top, width) positioning for single-chart slides."""
-        if layout_index == LAYOUT_CUSTOM:
-            # Custom Layout: wide open canvas below title
-            return (Inches(0.86), Inches(2.0), Inches(11.6))
-        if layout_index == LAYOUT_CONTENT or layout_index == LAYOUT_CONTENT_ALT:
-            # Title and Content: centered content area
-            return (Inches(1.38), Inches(1.8), Inches(10.5))
-        if layout_index == LAYOUT_SECTION:
-            # Section Header: title + body area
-            return (Inches(0.86), Inches(2.2), Inches(11.6))
-        if layout_index == LAYOUT_PICTURE:
-            # Picture with Content: image fills right side
-            return (Inches(0.5), Inches(1.55), Inches(12.0))
-        if layout_index == LAYOUT_BLANK:
-            # Blank: full canvas
-            return (Inches(0.86), Inches(0.5), Inches(11.6))
-        # Default: centered with margin
-        return (Inches(0.86), Inches(1.8), Inches(11.6))
+        return _SINGLE_POSITIONS.get(layout_index, _SINGLE_DEFAULT)
 
     def _get_multi_positioning(self, layout_index: int) -> tuple:
         """Get (top, left_pos, right_pos, width) for multi-chart slides."""
-        if layout_index == LAYOUT_TWO_CONTENT:
-            # Two Content: left/right content areas
-            return (Inches(1.82), Inches(0.86), Inches(6.81), Inches(5.67))
-        # Default: evenly split the slide
-        return (Inches(1.6), Inches(0.86), Inches(6.81), Inches(5.67))
+        return _MULTI_POSITIONS.get(layout_index, _MULTI_DEFAULT)
 
     def _add_fitted_picture(self, slide, img_path, left, top, max_width, max_height=None):
         """Add image scaled to fit within max_width and max_height."""
-        effective_max_h = max_height or self.MAX_CHART_HEIGHT
-        try:
-            import warnings
-
-            from PIL import Image
-
-            with warnings.catch_warnings():
-                warnings.filterwarnings("ignore", category=Image.DecompressionBombWarning)
-                with Image.open(img_path) as img:
-                    native_w, native_h = img.size
-            aspect = native_h / native_w
-            height_at_width = int(max_width * aspect)
-            if height_at_width > effective_max_h:
-                slide.shapes.add_picture(img_path, left, top, height=effective_max_h)
-            else:
-                slide.shapes.add_picture(img_path, left, top, width=max_width)
-        except ImportError:
-            slide.shapes.add_picture(img_path, left, top, width=max_width)
+        self.images.add_picture(
+            slide, img_path, left, top, max_width, max_height or self.MAX_CHART_HEIGHT
+        )
 
     # -------------------------------------------------------------------------
     # Individual slide builders
@@ -713,11 +694,11 @@ class DeckBuilder:
 
         # Donut chart (column 1)
         if content.images and len(content.images) > 0 and Path(content.images[0]).exists():
-            slide.shapes.add_picture(content.images[0], COL1_L, CHART_TOP, width=COL_W)
+            self.images.add_picture(slide, content.images[0], COL1_L, CHART_TOP, COL_W)
 
         # Horizontal bar chart (column 2)
         if content.images and len(content.images) > 1 and Path(content.images[1]).exists():
-            slide.shapes.add_picture(content.images[1], COL2_L, CHART_TOP, width=COL_W)
+            self.images.add_picture(slide, content.images[1], COL2_L, CHART_TOP, COL_W)
 
         # Inside the Numbers (column 3)
         if inside_numbers:
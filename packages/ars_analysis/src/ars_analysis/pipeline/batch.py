@@ -5,22 +5,48 @@ from __future__ import annotations
 import shutil
 import tempfile
 import time
-from concurrent.futures import ProcessPoolExecutor, as_completed
-from dataclasses import dataclass
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import asdict, dataclass
 from pathlib import Path
 
 from loguru import logger
 from rich.console import Console
 
+from ars_analysis.charts.render_queue import RenderQueue
 from ars_analysis.config import ARSSettings
 from ars_analysis.logging_setup import get_username
+from ars_analysis.pipeline.checkpoint import (
+    STATE_STEP,
+    BatchManifest,
+    ClientCheckpoint,
+    file_hash,
+    file_identity,
+    run_key,
+)
 from ars_analysis.pipeline.context import ClientInfo, OutputPaths, PipelineContext
+from ars_analysis.pipeline.module_cache import CACHE_DIRNAME
 from ars_analysis.pipeline.runner import PipelineStep, run_pipeline
+from ars_analysis.pipeline.scheduling import (
+    ClientCost,
+    RunHistory,
+    estimate_costs,
+    next_admissible,
+    order_longest_first,
+)
 from ars_analysis.pipeline.steps.analyze import step_analyze, step_analyze_selected
 from ars_analysis.pipeline.steps.generate import step_archive, step_generate
 from ars_analysis.pipeline.steps.load import step_load_file
 from ars_analysis.pipeline.steps.scan import ScannedFile
 from ars_analysis.pipeline.steps.subsets import step_subsets
+from ars_analysis.pipeline.work_queue import (
+    DEFAULT_LEASE_SECONDS,
+    DEFAULT_POLL_SECONDS,
+    Heartbeat,
+    WorkQueue,
+    default_worker_id,
+    iter_jobs,
+)
 
 
 def _safe_float(value: object, default: float = 0.0) -> float:
@@ -46,6 +72,10 @@ class BatchResult:
     elapsed: float
     slide_count: int
     error: str = ""
+    row_count: int = 0
+    predicted_seconds: float = 0.0
+    file_hash: str = ""
+    resumed: bool = False  # True = skipped via manifest, or output steps only
 
 
 def _build_client_info(
@@ -90,14 +120,32 @@ def _build_steps(
     ]
 
 
+def _checkpointed(steps: list[PipelineStep], checkpoint: ClientCheckpoint) -> list[PipelineStep]:
+    """Wrap steps so each records its completion in the client checkpoint."""
+
+    def wrap(step: PipelineStep) -> PipelineStep:
+        def execute(ctx: PipelineContext) -> None:
+            step.execute(ctx)
+            checkpoint.mark_step(step.name, ctx)
+
+        return PipelineStep(step.name, execute, critical=step.critical)
+
+    return [wrap(s) for s in steps]
+
+
 def _run_one_client(
     scanned: ScannedFile,
     settings: ARSSettings,
     module_ids: list[str] | None,
     output_base: Path | None,
     use_local_temp: bool,
+    resume: bool = False,
 ) -> BatchResult:
-    """Process a single client. Designed to be called from a worker process."""
+    """Process a single client. Designed to be called from a worker process.
+
+    With ``resume``, a checkpoint left by an earlier failed run of the same
+    input + modules restores the analysis state and runs only the output steps.
+    """
     t0 = time.perf_counter()
     temp_dir = None
 
@@ -120,15 +168,50 @@ def _run_one_client(
         paths = OutputPaths.from_base(work_base, scanned.client_id, scanned.month)
         ctx = PipelineContext(client=client_info, paths=paths, settings=settings)
 
+        # Checkpoints live next to the final outputs so they survive temp cleanup.
+        # They are keyed on the source file's size + mtime; the full content
+        # hash (recorded in the batch manifest) is only worth reading on a resume.
+        content_hash = file_hash(work_file) if resume else ""
+        final_paths = OutputPaths.from_base(final_base, scanned.client_id, scanned.month)
+        key = run_key(file_identity(scanned.file_path), module_ids, client_info)
+        checkpoint = ClientCheckpoint(final_paths.base_dir, key)
+
+        # Module cache also lives next to the final outputs; with local temp the
+        # previous charts are copied in so cached results can point at them.
+        pipeline_cfg = getattr(settings, "pipeline", None)
+        ctx.module_workers = getattr(pipeline_cfg, "module_workers", 1)
+        render_workers = getattr(pipeline_cfg, "chart_render_workers", 0)
+        if render_workers:
+            ctx.render_queue = RenderQueue(render_workers)
+        if getattr(pipeline_cfg, "module_cache", False):
+            ctx.module_cache_dir = final_paths.base_dir / CACHE_DIRNAME
+        has_prior_charts = final_paths.charts_dir.exists()
+        if use_local_temp and has_prior_charts and (resume or ctx.module_cache_dir):
+            shutil.copytree(final_paths.charts_dir, paths.charts_dir, dirs_exist_ok=True)
+
         steps = _build_steps(work_file, module_ids)
-        step_results = run_pipeline(ctx, steps)
+        resumed = False
+        if resume and STATE_STEP in checkpoint.completed_steps():
+            if checkpoint.restore_state(ctx):
+                resumed = True
+                done = {"load_data", "create_subsets", STATE_STEP}
+                steps = [s for s in steps if s.name not in done]
+                logger.info(
+                    "{cid}: resuming from checkpoint -- skipping load/subsets/analysis",
+                    cid=scanned.client_id,
+                )
+        step_results = run_pipeline(ctx, _checkpointed(steps, checkpoint))
 
         success = all(r.success for r in step_results)
         elapsed = time.perf_counter() - t0
+        analyzed = resumed or any(r.name == STATE_STEP and r.success for r in step_results)
 
-        # Copy results back from temp to final location
-        if use_local_temp and temp_dir and success:
+        # Copy results back from temp to final location. Partial outputs are
+        # copied too once analysis finished, so a resumed run can reuse the charts.
+        if use_local_temp and temp_dir and (success or analyzed):
             _copy_results_back(paths, final_base, scanned.client_id, scanned.month)
+        if success:
+            checkpoint.clear()
 
         return BatchResult(
             client_id=scanned.client_id,
@@ -136,6 +219,9 @@ def _run_one_client(
             success=success,
             elapsed=elapsed,
             slide_count=len(ctx.all_slides),
+            row_count=len(ctx.data) if ctx.data is not None else 0,
+            file_hash=content_hash,
+            resumed=resumed,
         )
 
     except Exception as exc:
@@ -175,6 +261,49 @@ def _copy_results_back(
                     shutil.copy2(src_file, dst_dir / src_file.name)
 
 
+def _manifest_path(
+    settings: ARSSettings,
+    output_base: Path | None,
+    files: list[ScannedFile],
+) -> Path | None:
+    """Batch manifest location: output_base, else next to the run tracker."""
+    if not files:
+        return None
+    tracker = getattr(getattr(settings, "paths", None), "tracker_path", None)
+    base = output_base or (Path(tracker).parent if tracker else None)
+    if base is None:
+        return None
+    return Path(base) / f"batch_manifest_{files[0].month}.json"
+
+
+def _skip_completed(
+    files: list[ScannedFile],
+    settings: ARSSettings,
+    module_ids: list[str] | None,
+    manifest: BatchManifest,
+) -> tuple[list[ScannedFile], list[BatchResult]]:
+    """Split files into (still to run, results for clients already complete)."""
+    todo: list[ScannedFile] = []
+    skipped: list[BatchResult] = []
+    for scanned in files:
+        if not manifest.is_complete(scanned, module_ids):
+            todo.append(scanned)
+            continue
+        entry = manifest.clients[scanned.client_id]
+        skipped.append(
+            BatchResult(
+                client_id=scanned.client_id,
+                client_name=_build_client_info(scanned, settings).client_name,
+                success=True,
+                elapsed=0.0,
+                slide_count=entry.get("slides", 0),
+                file_hash=entry.get("file_hash", ""),
+                resumed=True,
+            )
+        )
+    return todo, skipped
+
+
 def run_batch(
     files: list[ScannedFile],
     settings: ARSSettings,
@@ -182,9 +311,22 @@ def run_batch(
     output_base: Path | None = None,
     max_workers: int = 1,
     use_local_temp: bool = False,
+    memory_budget_mb: int | None = None,
+    resume: bool = False,
+    queue_dir: Path | None = None,
+    lease_seconds: float = DEFAULT_LEASE_SECONDS,
 ) -> list[BatchResult]:
     """Process multiple clients, optionally in parallel.
 
+    In parallel mode clients are scheduled longest-first using runtimes
+    learned from prior batches, and admitted only while projected memory
+    stays under the budget (see ``pipeline.scheduling``).
+
+    With ``queue_dir`` the clients are published to a shared-drive work
+    queue instead (see ``pipeline.work_queue``); this process works the
+    queue with ``max_workers`` local workers while ``ars worker`` processes
+    on other machines join in, and returns once every client has a result.
+
     Parameters
     ----------
     files : list[ScannedFile]
@@ -199,6 +341,18 @@ def run_batch(
         Number of parallel workers (1 = sequential, >1 = parallel).
     use_local_temp : bool
         Copy files to local temp before processing (faster on network drives).
+    memory_budget_mb : int or None
+        Cap on projected memory of in-flight clients (0 = unlimited).
+        None uses ``settings.pipeline.memory_budget_mb``.
+    resume : bool
+        Skip clients already recorded as complete in the batch manifest and
+        restart failed clients from their last checkpoint (see
+        ``pipeline.checkpoint``).
+    queue_dir : Path or None
+        Shared work-queue directory for a multi-machine batch.
+    lease_seconds : float
+        Heartbeat age after which a queued client's worker is presumed dead
+        and the client is handed to another worker.
 
     Returns
     -------
@@ -215,14 +369,53 @@ def run_batch(
         w=max_workers,
     )
 
-    if max_workers > 1 and len(files) > 1:
+    pipeline_cfg = getattr(settings, "pipeline", None)
+    budget_mb = (
+        memory_budget_mb
+        if memory_budget_mb is not None
+        else getattr(pipeline_cfg, "memory_budget_mb", 0)
+    )
+    memory_per_mb = getattr(pipeline_cfg, "memory_per_file_mb", 12.0)
+    history = RunHistory.load(getattr(getattr(settings, "paths", None), "tracker_path", None))
+    costs = estimate_costs(files, history, memory_per_mb)
+
+    manifest = BatchManifest.load(_manifest_path(settings, output_base, files))
+    skipped: list[BatchResult] = []
+    if resume:
+        files, skipped = _skip_completed(files, settings, module_ids, manifest)
+        if skipped:
+            console.print(f"\n  Resume: skipping {len(skipped)} already-completed client(s)")
+            logger.info("Resume: {n} client(s) already complete", n=len(skipped))
+
+    def _on_result(scanned: ScannedFile, result: BatchResult) -> None:
+        if result.success:
+            manifest.mark_complete(scanned, module_ids, result)
+
+    if queue_dir is not None and files:
+        batch_results = _run_queued(
+            order_longest_first(files, costs),
+            settings,
+            module_ids,
+            output_base,
+            max_workers,
+            use_local_temp,
+            Path(queue_dir),
+            lease_seconds,
+            resume=resume,
+            on_result=_on_result,
+        )
+    elif max_workers > 1 and len(files) > 1:
         batch_results = _run_parallel(
-            files,
+            order_longest_first(files, costs),
             settings,
             module_ids,
             output_base,
             max_workers,
             use_local_temp,
+            costs,
+            budget_mb,
+            resume=resume,
+            on_result=_on_result,
         )
     else:
         batch_results = _run_sequential(
@@ -231,7 +424,17 @@ def run_batch(
             module_ids,
             output_base,
             use_local_temp,
+            resume=resume,
+            on_result=_on_result,
         )
+    batch_results = skipped + batch_results
+
+    for r in batch_results:
+        if r.client_id in costs:
+            r.predicted_seconds = costs[r.client_id].predicted_seconds
+
+    history.record(files, batch_results)
+    history.save()
 
     # Summary
     ok = sum(1 for r in batch_results if r.success)
@@ -250,6 +453,9 @@ def run_batch(
         console.print(
             f"  [bold green]Done:[/bold green] {ok}/{len(batch_results)} succeeded ({total_time:.1f}s)"
         )
+    predicted = sum(r.predicted_seconds for r in batch_results)
+    if batch_results:
+        console.print(f"  Predicted {predicted:.1f}s vs actual {total_time:.1f}s (client time)")
     console.print()
 
     logger.info(
@@ -276,6 +482,8 @@ def _run_sequential(
     module_ids: list[str] | None,
     output_base: Path | None,
     use_local_temp: bool,
+    resume: bool = False,
+    on_result: Callable[[ScannedFile, BatchResult], None] | None = None,
 ) -> list[BatchResult]:
     """Process clients one at a time."""
     results = []
@@ -289,8 +497,10 @@ def _run_sequential(
             cid=scanned.client_id,
             file=scanned.filename,
         )
-        result = _run_one_client(scanned, settings, module_ids, output_base, use_local_temp)
+        result = _run_one_client(scanned, settings, module_ids, output_base, use_local_temp, resume)
         results.append(result)
+        if on_result:
+            on_result(scanned, result)
 
         if result.success:
             console.print(
@@ -317,50 +527,210 @@ def _run_parallel(
     output_base: Path | None,
     max_workers: int,
     use_local_temp: bool,
+    costs: dict[str, ClientCost],
+    budget_mb: float = 0,
+    resume: bool = False,
+    on_result: Callable[[ScannedFile, BatchResult], None] | None = None,
 ) -> list[BatchResult]:
-    """Process clients in parallel using ProcessPoolExecutor."""
+    """Process clients in parallel using ProcessPoolExecutor.
+
+    Files are submitted in the given order, but a new client is only started
+    while the projected memory of in-flight clients stays under ``budget_mb``.
+    """
     results: list[BatchResult] = []
     workers = min(max_workers, len(files))
 
-    logger.info("Starting parallel processing with {w} workers", w=workers)
+    logger.info(
+        "Starting parallel processing with {w} workers (memory budget: {b})",
+        w=workers,
+        b=f"{budget_mb:.0f} MB" if budget_mb else "unlimited",
+    )
+
+    pending = list(files)
+    in_flight: dict[Future, ScannedFile] = {}
+    in_use_mb = 0.0
 
     with ProcessPoolExecutor(max_workers=workers) as executor:
-        future_to_client = {
-            executor.submit(
-                _run_one_client,
-                scanned,
-                settings,
-                module_ids,
-                output_base,
-                use_local_temp,
-            ): scanned.client_id
-            for scanned in files
-        }
-
-        for future in as_completed(future_to_client):
-            client_id = future_to_client[future]
-            try:
-                result = future.result()
-                results.append(result)
-                status = "OK" if result.success else "FAILED"
-                logger.info(
-                    "{cid}: {status} -- {slides} slides in {t:.1f}s",
-                    cid=result.client_id,
-                    status=status,
-                    slides=result.slide_count,
-                    t=result.elapsed,
+        while pending or in_flight:
+            while pending and len(in_flight) < workers:
+                scanned = next_admissible(pending, costs, in_use_mb, budget_mb, idle=not in_flight)
+                if scanned is None:
+                    break
+                pending.remove(scanned)
+                in_use_mb += costs[scanned.client_id].predicted_memory_mb
+                future = executor.submit(
+                    _run_one_client,
+                    scanned,
+                    settings,
+                    module_ids,
+                    output_base,
+                    use_local_temp,
+                    resume,
                 )
-            except Exception as exc:
-                results.append(
-                    BatchResult(
-                        client_id=client_id,
-                        client_name=client_id,
-                        success=False,
-                        elapsed=0,
-                        slide_count=0,
-                        error=f"Worker error: {type(exc).__name__}: {exc}",
+                in_flight[future] = scanned
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                scanned = in_flight.pop(future)
+                in_use_mb -= costs[scanned.client_id].predicted_memory_mb
+                client_id = scanned.client_id
+                try:
+                    result = future.result()
+                    results.append(result)
+                    if on_result:
+                        on_result(scanned, result)
+                    status = "OK" if result.success else "FAILED"
+                    logger.info(
+                        "{cid}: {status} -- {slides} slides in {t:.1f}s",
+                        cid=result.client_id,
+                        status=status,
+                        slides=result.slide_count,
+                        t=result.elapsed,
                     )
+                except Exception as exc:
+                    results.append(
+                        BatchResult(
+                            client_id=client_id,
+                            client_name=client_id,
+                            success=False,
+                            elapsed=0,
+                            slide_count=0,
+                            error=f"Worker error: {type(exc).__name__}: {exc}",
+                        )
+                    )
+                    logger.error("{cid}: Worker error: {err}", cid=client_id, err=exc)
+
+    return results
+
+
+def _run_queued(
+    files: list[ScannedFile],
+    settings: ARSSettings,
+    module_ids: list[str] | None,
+    output_base: Path | None,
+    max_workers: int,
+    use_local_temp: bool,
+    queue_dir: Path,
+    lease_seconds: float,
+    resume: bool = False,
+    on_result: Callable[[ScannedFile, BatchResult], None] | None = None,
+) -> list[BatchResult]:
+    """Publish clients to a work queue, help work it, and collect every result."""
+    queue = WorkQueue(queue_dir, lease_seconds)
+    spec = queue.publish(files, module_ids, output_base, use_local_temp, resume)
+    console.print(
+        f"\n  Queued {len(files)} client(s) in {queue_dir} -- "
+        f"start more workers with: ars worker {queue_dir}\n"
+    )
+
+    workers = max(1, min(max_workers, len(files)))
+    if workers == 1:
+        run_worker(queue_dir, settings, lease_seconds=lease_seconds)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    run_worker,
+                    queue_dir,
+                    settings,
+                    f"{default_worker_id()}-{i}",
+                    lease_seconds,
                 )
-                logger.error("{cid}: Worker error: {err}", cid=client_id, err=exc)
+                for i in range(workers)
+            ]
+            for future in futures:
+                future.result()
+
+    collected = queue.results(spec.batch_id)
+    results: list[BatchResult] = []
+    for scanned in files:
+        data = collected.get(scanned.client_id)
+        if data is None:
+            result = BatchResult(
+                client_id=scanned.client_id,
+                client_name=scanned.client_id,
+                success=False,
+                elapsed=0,
+                slide_count=0,
+                error="No result recorded in work queue",
+            )
+        else:
+            result = BatchResult(**data)
+        results.append(result)
+        if on_result:
+            on_result(scanned, result)
+    return results
+
+
+def run_worker(
+    queue_dir: Path,
+    settings: ARSSettings,
+    worker_id: str | None = None,
+    lease_seconds: float = DEFAULT_LEASE_SECONDS,
+    poll_seconds: float = DEFAULT_POLL_SECONDS,
+    idle_seconds: float = 0.0,
+) -> list[BatchResult]:
+    """Process clients from a shared work queue until it is drained.
+
+    Parameters
+    ----------
+    queue_dir : Path
+        Queue directory published by ``ars batch --queue``.
+    settings : ARSSettings
+        Pipeline configuration (client configs are looked up here).
+    worker_id : str or None
+        Name recorded on leases and results (default: ``host-pid``).
+    lease_seconds : float
+        Must match the coordinator's; the lease is renewed every quarter of it.
+    poll_seconds : float
+        Wait between checks while other workers hold the remaining clients.
+    idle_seconds : float
+        Keep waiting this long for a new batch once the queue is empty.
+
+    Returns
+    -------
+    list[BatchResult]
+        Results of the clients this worker processed.
+    """
+    worker = worker_id or default_worker_id()
+    queue = WorkQueue(Path(queue_dir), lease_seconds)
+    results: list[BatchResult] = []
+    logger.info("Worker {w} joined queue {q}", w=worker, q=queue_dir)
+
+    for job in iter_jobs(queue, worker, poll_seconds, idle_seconds):
+        spec = queue.spec()
+        if spec is None or spec.batch_id != job.batch_id:
+            logger.warning("Dropping {job}: not part of the published batch", job=job.name)
+            queue.release(job)
+            continue
+        logger.info("{w}: processing {cid}", w=worker, cid=job.scanned.client_id)
+        with Heartbeat(queue, job) as heartbeat:
+            result = _run_one_client(
+                job.scanned,
+                settings,
+                spec.module_ids,
+                spec.output_base,
+                spec.use_local_temp,
+                spec.resume,
+            )
+        if heartbeat.lost:
+            # Requeued meanwhile -- whoever holds the lease now records the result.
+            logger.warning(
+                "{w}: lease on {cid} lost mid-run; result discarded",
+                w=worker,
+                cid=job.scanned.client_id,
+            )
+            continue
+        queue.complete(job, asdict(result))
+        results.append(result)
+        logger.info(
+            "{w}: {cid} {status} -- {slides} slides in {t:.1f}s",
+            w=worker,
+            cid=result.client_id,
+            status="OK" if result.success else "FAILED",
+            slides=result.slide_count,
+            t=result.elapsed,
+        )
 
+    logger.info("Worker {w} done: {n} client(s)", w=worker, n=len(results))
     return results
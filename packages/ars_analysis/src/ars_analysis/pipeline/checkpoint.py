@@ -0,0 +1,250 @@
+"""Resumable batches -- on-disk manifest of completed clients + per-step checkpoints.
+
+Two levels of resume:
+
+- ``BatchManifest`` (one JSON per batch month) records every client that
+  finished, keyed by input file size/mtime (plus its hash when the run was
+  a resume) and module set. ``ars batch --resume`` skips those clients
+  entirely.
+- ``ClientCheckpoint`` (``<run_dir>/.checkpoint/``) records which steps of
+  one client completed and pickles the analysis state after
+  ``run_analyses``, so a failure in ``generate_output`` retries only the
+  output steps instead of reloading and reanalyzing the ODD.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+import shutil
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from loguru import logger
+
+from ars_analysis.pipeline.context import ClientInfo, PipelineContext
+from ars_analysis.pipeline.utils import atomic_write_text
+
+if TYPE_CHECKING:
+    from ars_analysis.pipeline.batch import BatchResult
+    from ars_analysis.pipeline.steps.scan import ScannedFile
+
+CHECKPOINT_DIRNAME = ".checkpoint"
+
+# Step whose completion makes the analysis state worth persisting.
+STATE_STEP = "run_analyses"
+
+# Context fields needed by the output steps (everything except the raw data).
+_STATE_FIELDS = ("results", "all_slides", "export_log", "start_date", "end_date", "debit_column")
+
+_HASH_CHUNK = 1024 * 1024
+
+
+def file_hash(path: Path) -> str:
+    """SHA-256 of a file's contents, read in 1 MB chunks."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(_HASH_CHUNK):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def module_signature(module_ids: list[str] | None) -> str:
+    """Stable label for a module selection (``all`` = every registered module)."""
+    return ",".join(sorted(module_ids)) if module_ids else "all"
+
+
+def file_identity(path: Path) -> str:
+    """Size and mtime of a file -- one ``stat``, unlike ``file_hash``."""
+    st = path.stat()
+    return f"{st.st_size}:{st.st_mtime_ns}"
+
+
+def client_digest(client: ClientInfo) -> str:
+    """SHA-256 of a client's configuration (eligible codes, rates, ...)."""
+    return hashlib.sha256(json.dumps(asdict(client), sort_keys=True).encode()).hexdigest()
+
+
+def run_key(source: str, module_ids: list[str] | None, client: ClientInfo) -> str:
+    """Key identifying one client run: same input + modules + client config = same key.
+
+    ``source`` identifies the input file, usually ``file_identity``.
+    """
+    parts = (source, module_signature(module_ids), client_digest(client))
+    return hashlib.sha256("|".join(parts).encode()).hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Batch-level manifest
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class BatchManifest:
+    """Completed clients for one batch, persisted as JSON.
+
+    ``clients`` maps client_id -> {"file_hash", "modules", "size", "mtime",
+    "slides", "elapsed", "completed_at"}.
+    """
+
+    path: Path | None = None
+    clients: dict[str, dict] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: Path | None) -> BatchManifest:
+        """Load a manifest. Missing or corrupt files yield an empty manifest."""
+        if path is None:
+            return cls()
+        try:
+            data = json.loads(Path(path).read_text(encoding="utf-8"))
+            clients = data.get("clients", {})
+            if not isinstance(clients, dict):
+                clients = {}
+        except (OSError, ValueError):
+            clients = {}
+        return cls(path=Path(path), clients=clients)
+
+    def is_complete(self, scanned: ScannedFile, module_ids: list[str] | None) -> bool:
+        """True if this exact input + module set already finished.
+
+        Size and mtime matching the recorded entry is trusted without
+        re-reading the file; if only the size matches the file is re-hashed
+        against the recorded hash, when there is one.
+        """
+        entry = self.clients.get(scanned.client_id)
+        if not entry or entry.get("modules") != module_signature(module_ids):
+            return False
+        try:
+            stat = scanned.file_path.stat()
+        except OSError:
+            return False
+        if stat.st_size != entry.get("size"):
+            return False
+        if stat.st_mtime == entry.get("mtime"):
+            return True
+        if not entry.get("file_hash"):
+            return False
+        try:
+            return file_hash(scanned.file_path) == entry.get("file_hash")
+        except OSError:
+            return False
+
+    def mark_complete(
+        self,
+        scanned: ScannedFile,
+        module_ids: list[str] | None,
+        result: BatchResult,
+    ) -> None:
+        """Record a successful client and persist the manifest immediately."""
+        try:
+            stat = scanned.file_path.stat()
+        except OSError:
+            return
+        self.clients[scanned.client_id] = {
+            "file_hash": result.file_hash,
+            "modules": module_signature(module_ids),
+            "size": stat.st_size,
+            "mtime": stat.st_mtime,
+            "slides": result.slide_count,
+            "elapsed": round(result.elapsed, 2),
+            "completed_at": datetime.now().isoformat(timespec="seconds"),
+        }
+        self.save()
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        try:
+            atomic_write_text(self.path, json.dumps({"clients": self.clients}, indent=2))
+        except OSError as exc:
+            logger.warning("Could not save batch manifest {p}: {err}", p=self.path, err=exc)
+
+
+# ---------------------------------------------------------------------------
+# Per-client step checkpoints
+# ---------------------------------------------------------------------------
+
+
+class ClientCheckpoint:
+    """Step completion + pickled analysis state for one client run."""
+
+    def __init__(self, run_dir: Path, key: str) -> None:
+        self.dir = run_dir / CHECKPOINT_DIRNAME
+        self.key = key
+        self._steps_path = self.dir / "steps.json"
+        self._state_path = self.dir / "state.pkl"
+
+    def completed_steps(self) -> list[str]:
+        """Steps completed by a previous run with the same key."""
+        try:
+            data = json.loads(self._steps_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return []
+        if data.get("key") != self.key:
+            return []
+        return list(data.get("steps", []))
+
+    def mark_step(self, name: str, ctx: PipelineContext) -> None:
+        """Record a completed step; persist analysis state after run_analyses."""
+        try:
+            if name == STATE_STEP:
+                # The saved state points at chart files -- make sure they exist
+                if ctx.render_queue is not None:
+                    ctx.render_queue.wait()
+                self.dir.mkdir(parents=True, exist_ok=True)
+                state = {f: getattr(ctx, f) for f in _STATE_FIELDS}
+                state["charts_dir"] = ctx.paths.charts_dir
+                tmp = self._state_path.with_name("state.pkl.tmp")
+                with open(tmp, "wb") as fh:
+                    pickle.dump(state, fh, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp, self._state_path)
+            steps = self.completed_steps()
+            if name not in steps:
+                steps.append(name)
+            atomic_write_text(self._steps_path, json.dumps({"key": self.key, "steps": steps}))
+        except Exception as exc:
+            # A checkpoint is an optimization -- never fail the run over it.
+            logger.warning("Checkpoint write failed for step {s}: {err}", s=name, err=exc)
+
+    def restore_state(self, ctx: PipelineContext) -> bool:
+        """Load pickled analysis state into ctx. Returns False if unavailable."""
+        if STATE_STEP not in self.completed_steps():
+            return False
+        try:
+            with open(self._state_path, "rb") as fh:
+                state = pickle.load(fh)
+        except Exception as exc:
+            logger.warning("Checkpoint state unreadable, rerunning analysis: {err}", err=exc)
+            return False
+        for f in _STATE_FIELDS:
+            if f in state:
+                setattr(ctx, f, state[f])
+        old_charts = state.get("charts_dir")
+        if old_charts is not None and old_charts != ctx.paths.charts_dir:
+            _rebase_chart_paths(ctx, old_charts)
+        return True
+
+    def clear(self) -> None:
+        """Remove the checkpoint once the client has fully completed."""
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+
+def _rebase_chart_paths(ctx: PipelineContext, old_charts_dir: Path) -> None:
+    """Point restored chart paths at this run's charts dir (e.g. a new local temp)."""
+
+    def rebase(path: Path | None) -> Path | None:
+        if path is None:
+            return None
+        try:
+            return ctx.paths.charts_dir / Path(path).relative_to(old_charts_dir)
+        except ValueError:
+            return path
+
+    for result in ctx.all_slides:
+        result.chart_path = rebase(result.chart_path)
+        if result.extra_charts:
+            result.extra_charts = [rebase(p) for p in result.extra_charts]
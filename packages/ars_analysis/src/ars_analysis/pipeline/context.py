@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
-from dataclasses import dataclass, field
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field, fields, replace
 from datetime import date
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import pandas as pd
 
+if TYPE_CHECKING:
+    from ars_analysis.charts.render_queue import RenderQueue
+    from ars_analysis.pipeline.odd_store import OddStore
+    from shared.profiling import Profiler
+    from shared.timeseries import TimeSeriesBlocks
+
 
 @dataclass
 class ClientInfo:
@@ -90,6 +97,8 @@ class PipelineContext:
     data: pd.DataFrame | None = None
     data_original: pd.DataFrame | None = None
     subsets: DataSubsets = field(default_factory=DataSubsets)
+    features: pd.DataFrame | None = None  # Derived per-account columns (pipeline.features)
+    store: OddStore | None = None  # Spilled ODD for out-of-core clients (pipeline.odd_store)
     results: dict[str, list] = field(default_factory=dict)  # module_id -> [AnalysisResult]
     all_slides: list = field(default_factory=list)
     export_log: list[str] = field(default_factory=list)
@@ -98,4 +107,39 @@ class PipelineContext:
     txn_file_path: Path | None = None  # Transaction CSV for TXN module
     ics_dir: Path | None = None  # ICS data directory for ICS module
     debit_column: str = ""  # Auto-detected debit column name (set by step_subsets)
+    module_cache_dir: Path | None = None  # Reuse unchanged module results (pipeline.module_cache)
+    module_workers: int = 1  # Threads for independent analytics modules (steps.analyze)
+    render_queue: RenderQueue | None = None  # Background chart saving (charts.render_queue)
+    profiler: Profiler | None = None  # Step/module timings (shared.profiling), set by the runner
     progress_callback: Callable[[str], None] | None = None
+
+    @property
+    def timeseries(self) -> TimeSeriesBlocks:
+        """Monthly families of ``data`` as accounts x months arrays (shared.timeseries).
+
+        Each family is parsed on first use and kept until ``data`` is replaced.
+        """
+        blocks = self.__dict__.get("_timeseries")
+        if blocks is None or blocks.data is not self.data:
+            from shared.timeseries import TimeSeriesBlocks
+
+            blocks = TimeSeriesBlocks(self.data if self.data is not None else pd.DataFrame())
+            self.__dict__["_timeseries"] = blocks
+        return blocks
+
+    def with_results(self, results: Mapping[str, list]) -> PipelineContext:
+        """Shallow copy whose ``results`` is ``results`` (steps.analyze overlays).
+
+        Memoized state kept outside the dataclass fields (``timeseries``) is
+        built here and shared with the copy, so work done through it is not lost.
+        """
+        self.timeseries  # noqa: B018 -- build the memo before sharing it
+        view = replace(self, results=results)
+        names = {f.name for f in fields(self)}
+        view.__dict__.update({k: v for k, v in self.__dict__.items() if k not in names})
+        return view
+
+    @property
+    def run_report_path(self) -> Path:
+        """Diagnostic run report written by step_generate."""
+        return self.paths.base_dir / f"{self.client.client_id}_{self.client.month}_run_report.json"
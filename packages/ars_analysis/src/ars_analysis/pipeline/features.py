@@ -0,0 +1,117 @@
+"""Per-account derived features, computed once per run by ``step_subsets``.
+
+Modules used to re-derive the same fields from the raw ODD on every call --
+``to_datetime`` on ``Date Opened``, account age in days, holder age, debit and
+business flags, bucketed ages and balances -- each on a fresh ``.copy()`` of
+their subset. The feature frame holds those columns typed and bucketed,
+indexed like ``ctx.data``, so a module slices it with ``features_for``:
+
+    feats = features_for(ctx, ctx.subsets.eligible_data)
+    table = rate_breakdown(feats["account_age"], feats["has_debit"])
+
+Columns (missing inputs give NaN/NaT buckets, or False flags):
+
+    date_opened                 datetime64
+    account_age_days            float, days from Date Opened to build time
+    account_age                 category, DCTR account-age buckets
+    holder_age                  float, Account Holder Age / Birth Date / Age
+    holder_age_group            category, DCTR holder-age buckets
+    avg_bal                     float
+    balance_range               category, DCTR balance buckets
+    has_debit                   bool
+    is_business                 boolean (nullable; NA when Business? is blank)
+"""
+
+from __future__ import annotations
+
+import pandas as pd
+
+from ars_analysis.analytics.dctr._helpers import (
+    ACCOUNT_AGE_BINS,
+    BALANCE_BINS,
+    HOLDER_AGE_BINS,
+    debit_mask,
+)
+from ars_analysis.pipeline.context import PipelineContext
+from shared.profiling import profiled
+
+
+def _dates(df: pd.DataFrame, col: str) -> pd.Series:
+    if col not in df.columns:
+        return pd.Series(pd.NaT, index=df.index, dtype="datetime64[ns]")
+    if pd.api.types.is_datetime64_any_dtype(df[col]):
+        return df[col]
+    return pd.to_datetime(df[col], errors="coerce", format="mixed")
+
+
+def _numbers(df: pd.DataFrame, col: str) -> pd.Series:
+    if col not in df.columns:
+        return pd.Series(float("nan"), index=df.index)
+    return pd.to_numeric(df[col], errors="coerce").astype(float)
+
+
+def _holder_age(df: pd.DataFrame, now: pd.Timestamp) -> pd.Series:
+    if "Account Holder Age" in df.columns:
+        return _numbers(df, "Account Holder Age")
+    if "Birth Date" in df.columns:
+        return (now - _dates(df, "Birth Date")).dt.days / 365.25
+    return _numbers(df, "Age")
+
+
+def _is_business(df: pd.DataFrame) -> pd.Series:
+    if "Business?" not in df.columns:
+        return pd.Series(pd.NA, index=df.index, dtype="boolean")
+    codes = df["Business?"].astype(str).str.strip().str.upper()
+    flag = pd.Series(pd.NA, index=df.index, dtype="boolean")
+    flag[codes.isin(("YES", "Y"))] = True
+    flag[codes.isin(("NO", "N"))] = False
+    return flag
+
+
+@profiled
+def build_feature_frame(
+    df: pd.DataFrame,
+    now: pd.Timestamp | None = None,
+) -> pd.DataFrame:
+    """Derive the feature columns for every row of ``df`` (same index).
+
+    Parameters
+    ----------
+    df : DataFrame
+        Raw ODD rows, typically ``ctx.data``.
+    now : Timestamp, optional
+        Reference time for ages; defaults to the current time.
+    """
+    now = pd.Timestamp.now() if now is None else now
+    date_opened = _dates(df, "Date Opened")
+    account_age_days = (now - date_opened).dt.days.astype(float)
+    holder_age = _holder_age(df, now)
+    avg_bal = _numbers(df, "Avg Bal")
+
+    return pd.DataFrame(
+        {
+            "date_opened": date_opened,
+            "account_age_days": account_age_days,
+            "account_age": ACCOUNT_AGE_BINS.cut(account_age_days),
+            "holder_age": holder_age,
+            "holder_age_group": HOLDER_AGE_BINS.cut(holder_age),
+            "avg_bal": avg_bal,
+            "balance_range": BALANCE_BINS.cut(avg_bal),
+            "has_debit": debit_mask(df),
+            "is_business": _is_business(df),
+        },
+        index=df.index,
+    )
+
+
+def features_for(ctx: PipelineContext, df: pd.DataFrame) -> pd.DataFrame:
+    """Feature rows for ``df`` (a subset of ``ctx.data``), aligned to its index.
+
+    Slices ``ctx.features`` when it covers ``df``; otherwise (no frame built
+    yet, or ``df`` was not derived from ``ctx.data``) derives the features
+    for ``df`` directly.
+    """
+    feats = ctx.features
+    if feats is not None and feats.index.is_unique and df.index.isin(feats.index).all():
+        return feats.loc[df.index]
+    return build_feature_frame(df)
@@ -0,0 +1,203 @@
+"""Incremental re-runs -- skip analytics modules whose inputs are unchanged.
+
+Each module's fingerprint covers what it reads:
+
+- the ODD columns it declares in ``input_columns`` (None = every column),
+- the ``ClientInfo`` fields every module sees through subsets
+  (``BASE_CLIENT_FIELDS``) plus its own ``client_fields``,
+- the analysis window and chart DPI,
+- the fingerprints of the modules in ``depends_on`` (ctx.results readers),
+- the source code of the ``ars_analysis`` and ``shared`` packages, so any
+  code change -- including shared helpers such as ``charts/`` or
+  ``analytics/breakdown.py`` -- invalidates.
+
+Results are pickled to ``ctx.module_cache_dir/<module_id>.pkl`` (normally
+``<run_dir>/.module_cache``) together with any side-channel keys the module
+wrote into ``ctx.results`` (e.g. ``dctr_1``), so a cached upstream module
+still feeds modules that rerun. Caching is off while ``module_cache_dir``
+is None.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import os
+import pickle
+from collections.abc import Mapping
+from dataclasses import replace
+from functools import cache
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pandas as pd
+from loguru import logger
+
+import ars_analysis
+import shared
+from ars_analysis.pipeline.context import PipelineContext
+
+if TYPE_CHECKING:
+    from ars_analysis.analytics.base import AnalysisModule, AnalysisResult
+
+CACHE_DIRNAME = ".module_cache"
+
+# ClientInfo fields that shape ctx.data / ctx.subsets, and so every module.
+BASE_CLIENT_FIELDS: tuple[str, ...] = (
+    "client_id",
+    "client_name",
+    "month",
+    "eligible_stat_codes",
+    "eligible_prod_codes",
+    "dc_indicator",
+    "data_start_date",
+)
+
+
+class ColumnHasher:
+    """Per-column content hashes of ctx.data, computed lazily once per run."""
+
+    def __init__(self, df: pd.DataFrame | None) -> None:
+        self._df = df
+        self._hashes: dict[str, str] = {}
+
+    def _column(self, col: str) -> str:
+        if col not in self._hashes:
+            if self._df is None or col not in self._df.columns:
+                self._hashes[col] = "missing"
+            else:
+                values = pd.util.hash_pandas_object(self._df[col], index=False).to_numpy()
+                self._hashes[col] = hashlib.sha256(values.tobytes()).hexdigest()
+        return self._hashes[col]
+
+    def digest(self, columns: tuple[str, ...] | None) -> str:
+        """Combined hash of the given columns (None = all columns, in frame order)."""
+        if columns is None:
+            columns = tuple(str(c) for c in self._df.columns) if self._df is not None else ()
+        h = hashlib.sha256()
+        for col in columns:
+            h.update(f"{col}={self._column(col)};".encode())
+        return h.hexdigest()
+
+
+@cache
+def _package_code_hash() -> str:
+    """Hash of every .py file in the ars_analysis and shared packages.
+
+    Modules import helpers from all over both packages (charts, breakdown
+    engine, feature frame, ...), so the whole source tree is the code key.
+    """
+    h = hashlib.sha256()
+    for pkg in (ars_analysis, shared):
+        root = Path(inspect.getfile(pkg)).parent
+        for path in sorted(root.rglob("*.py")):
+            h.update(path.relative_to(root.parent).as_posix().encode())
+            h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+def module_fingerprint(
+    mod: AnalysisModule,
+    ctx: PipelineContext,
+    hasher: ColumnHasher,
+    upstream: dict[str, str],
+) -> str:
+    """Fingerprint of everything ``mod`` reads. Same fingerprint = same results."""
+    h = hashlib.sha256()
+    h.update(mod.module_id.encode())
+    h.update(_package_code_hash().encode())
+
+    for name in sorted(set(BASE_CLIENT_FIELDS) | set(mod.client_fields)):
+        h.update(f"{name}={getattr(ctx.client, name, None)!r};".encode())
+    pipeline_cfg = getattr(ctx.settings, "pipeline", None)
+    h.update(f"dpi={getattr(pipeline_cfg, 'chart_dpi', None)};".encode())
+    h.update(f"window={ctx.start_date}..{ctx.end_date};".encode())
+
+    h.update(hasher.digest(mod.input_columns).encode())
+    for dep in sorted(mod.depends_on):
+        h.update(f"{dep}={upstream.get(dep, '')};".encode())
+    return h.hexdigest()
+
+
+class ModuleCache:
+    """On-disk store of module results keyed by fingerprint."""
+
+    def __init__(self, ctx: PipelineContext, cache_dir: Path) -> None:
+        self.dir = cache_dir
+        self._ctx = ctx
+
+    def _path(self, module_id: str) -> Path:
+        return self.dir / f"{module_id}.pkl"
+
+    def load(self, module_id: str, fingerprint: str) -> list[AnalysisResult] | None:
+        """Restore a module's results into ctx.results if the fingerprint matches.
+
+        Returns the restored results (the caller places them in
+        ctx.all_slides), or None -- and the module reruns -- if there is no
+        entry, the fingerprint differs, the entry is unreadable, or a chart
+        is missing.
+        """
+        try:
+            with open(self._path(module_id), "rb") as fh:
+                entry = pickle.load(fh)
+        except FileNotFoundError:
+            return None
+        except Exception as exc:
+            logger.debug("Module cache entry for {id} unreadable: {err}", id=module_id, err=exc)
+            return None
+        if entry.get("fingerprint") != fingerprint:
+            return None
+
+        results: list[AnalysisResult] = entry["results"]
+        charts_dir = self._ctx.paths.charts_dir
+        for r in results:
+            if r.chart_path is not None:
+                r.chart_path = charts_dir / r.chart_path
+            if r.extra_charts:
+                r.extra_charts = [charts_dir / p for p in r.extra_charts]
+            for p in [r.chart_path, *(r.extra_charts or [])]:
+                if p is not None and not p.exists():
+                    return None
+
+        self._ctx.results[module_id] = results
+        self._ctx.results.update(entry.get("side_results", {}))
+        return results
+
+    def store(
+        self,
+        module_id: str,
+        fingerprint: str,
+        results: list[AnalysisResult],
+        side_results: dict,
+    ) -> None:
+        """Persist a module's results. Chart paths are stored relative to charts_dir."""
+        charts_dir = self._ctx.paths.charts_dir
+        stored = [_relative_charts(r, charts_dir) for r in results]
+        if any(s is None for s in stored):
+            logger.debug("Module {id} not cached: chart outside charts_dir", id=module_id)
+            return
+        entry = {"fingerprint": fingerprint, "results": stored, "side_results": side_results}
+        try:
+            self.dir.mkdir(parents=True, exist_ok=True)
+            tmp = self._path(module_id).with_suffix(".tmp")
+            with open(tmp, "wb") as fh:
+                pickle.dump(entry, fh, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self._path(module_id))
+        except Exception as exc:
+            # Caching is an optimization -- never fail the module over it.
+            logger.warning("Could not cache results for {id}: {err}", id=module_id, err=exc)
+
+
+def _relative_charts(result: AnalysisResult, charts_dir: Path) -> AnalysisResult | None:
+    """Copy of ``result`` with chart paths relative to charts_dir (None if outside)."""
+    try:
+        chart = result.chart_path.relative_to(charts_dir) if result.chart_path else None
+        extra = [p.relative_to(charts_dir) for p in result.extra_charts or []]
+    except ValueError:
+        return None
+    return replace(result, chart_path=chart, extra_charts=extra or result.extra_charts)
+
+
+def side_results(written: Mapping[str, object], module_id: str) -> dict:
+    """ctx.results keys a module wrote, minus its own entry and private memo caches (``_*``)."""
+    return {k: v for k, v in written.items() if k != module_id and not k.startswith("_")}
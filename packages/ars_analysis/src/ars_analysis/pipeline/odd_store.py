@@ -0,0 +1,234 @@
+"""Out-of-core ODD storage for the largest clients -- Arrow on disk, narrow subsets.
+
+A wide ODD (hundreds of thousands of accounts x several hundred ``MmmYY``
+monthly columns) is held once in ``ctx.data``, but each view in
+``DataSubsets`` is a row filter and so a full-width copy -- five more
+copies of every monthly column. For clients whose loaded ODD exceeds
+``pipeline.out_of_core_mb``, ``step_subsets`` instead:
+
+- spills the whole ODD to a Parquet file in local temp (``OddStore``), and
+- builds the subsets from the *current* columns only: everything except
+  monthly history, keeping the latest month of each family (``Jan26
+  Spend`` but not ``Dec25 Spend``) -- the only monthly columns subset
+  users read.
+
+Queries against the store read just the columns they name and return only
+the small result to pandas. Filtering and aggregation run in Arrow, or in
+DuckDB for SQL when it is installed (``pip install duckdb``)::
+
+    ever_mailed = ctx.store.any_present(mail_cols)
+    ctx.store.aggregate(["Branch"], {"Jan26 Spend": "sum"}, subset="eligible_data")
+    ctx.store.sql("SELECT Branch, count(*) AS n FROM eligible_data GROUP BY 1")
+"""
+
+from __future__ import annotations
+
+import re
+import shutil
+import tempfile
+import weakref
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+# "Jan26 Spend", "Jan26 Reg E Code" -> (month, family)
+_MONTHLY_COLUMN = re.compile(r"^([A-Z][a-z]{2}\d{2}) (.+)$")
+
+# Row position of each account in ctx.data, stored alongside the columns.
+_ROW = "__row__"
+
+_ROW_GROUP = 100_000
+
+
+def _column_month(name: object) -> tuple[datetime, str] | None:
+    m = _MONTHLY_COLUMN.match(str(name))
+    if not m:
+        return None
+    try:
+        return datetime.strptime(m.group(1), "%b%y"), m.group(2)
+    except ValueError:
+        return None
+
+
+def current_columns(columns: pd.Index | list) -> list:
+    """Columns without monthly history: non-monthly ones plus each family's latest month."""
+    latest: dict[str, tuple[datetime, object]] = {}
+    for col in columns:
+        parsed = _column_month(col)
+        if parsed is None:
+            continue
+        month, family = parsed
+        if family not in latest or month > latest[family][0]:
+            latest[family] = (month, col)
+    keep = {col for _, col in latest.values()}
+    return [c for c in columns if _column_month(c) is None or c in keep]
+
+
+def frame_memory_mb(df: pd.DataFrame) -> float:
+    """In-memory size of ``df`` in MB, counting string contents."""
+    return df.memory_usage(deep=True).sum() / (1024 * 1024)
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow as pa
+    except ImportError as e:
+        raise ImportError(
+            "Out-of-core processing requires the 'pyarrow' package. "
+            "Install it with: pip install pyarrow"
+        ) from e
+    return pa
+
+
+class OddStore:
+    """The loaded ODD as a Parquet file, queried column-by-column.
+
+    Results are indexed like ``ctx.data``. ``subset`` arguments name a view
+    registered with ``add_subset`` (step_subsets registers every
+    ``DataSubsets`` field).
+    """
+
+    def __init__(self, path: Path, index: pd.Index, columns: list) -> None:
+        self.path = path
+        self.index = index
+        self.columns = columns
+        self._names = {c: str(c) for c in columns}
+        self._subsets: dict[str, np.ndarray] = {}
+        self._duckdb = None
+
+    @classmethod
+    def spill(cls, df: pd.DataFrame, directory: Path | None = None) -> OddStore:
+        """Write ``df`` to Parquet; the file is deleted with the store.
+
+        Written in row groups so the Arrow copy never holds more than one
+        group at a time. Object columns Arrow cannot type (mixed numbers and
+        text) are stored as strings.
+        """
+        pa = _require_pyarrow()
+        import pyarrow.parquet as pq
+
+        fields, as_string = [], set()
+        for col in df.columns:
+            try:
+                typ = pa.Array.from_pandas(df[col]).type
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                typ = pa.string()
+                as_string.add(col)
+            fields.append(pa.field(str(col), typ))
+        fields.append(pa.field(_ROW, pa.int64()))
+        schema = pa.schema(fields)
+
+        tmp_dir = Path(tempfile.mkdtemp(prefix="ars_odd_", dir=directory))
+        path = tmp_dir / "odd.parquet"
+        with pq.ParquetWriter(path, schema, compression="zstd") as writer:
+            for start in range(0, len(df), _ROW_GROUP):
+                chunk = df.iloc[start : start + _ROW_GROUP]
+                arrays = [
+                    pa.Array.from_pandas(
+                        chunk[col].astype("string") if col in as_string else chunk[col],
+                        type=field.type,
+                    )
+                    for col, field in zip(df.columns, schema)
+                ]
+                arrays.append(pa.array(np.arange(start, start + len(chunk), dtype=np.int64)))
+                writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+
+        store = cls(path, df.index, list(df.columns))
+        weakref.finalize(store, shutil.rmtree, tmp_dir, True)
+        logger.info(
+            "ODD spilled to {path} ({mb:.0f} MB on disk)",
+            path=path,
+            mb=path.stat().st_size / (1024 * 1024),
+        )
+        return store
+
+    def add_subset(self, name: str, frame: pd.DataFrame | None) -> None:
+        """Register the rows of ``frame`` (a row filter of ctx.data) as ``name``."""
+        if frame is None:
+            return
+        positions = self.index.get_indexer(frame.index)
+        self._subsets[name] = positions[positions >= 0]
+        self._duckdb = None
+
+    @property
+    def subsets(self) -> list[str]:
+        return list(self._subsets)
+
+    # -- queries ----------------------------------------------------------------
+
+    def _table(self, columns: list, subset: str | None):
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(self.path, columns=[self._names[c] for c in columns] + [_ROW])
+        if subset is not None:
+            table = table.take(self._subsets[subset])
+        return table
+
+    def _to_frame(self, table, columns: list) -> pd.DataFrame:
+        rows = table.column(_ROW).to_numpy()
+        df = table.drop_columns([_ROW]).to_pandas()
+        df.columns = columns
+        df.index = self.index[rows]
+        return df
+
+    def frame(self, columns: list, subset: str | None = None) -> pd.DataFrame:
+        """``columns`` for all rows, or for the rows of ``subset``."""
+        return self._to_frame(self._table(columns, subset), list(columns))
+
+    def any_present(self, columns: list, subset: str | None = None) -> pd.Series:
+        """Per row: is any of ``columns`` non-null (``df[cols].notna().any(axis=1)``)."""
+        import pyarrow.compute as pc
+
+        table = self._table(columns, subset)
+        present = np.zeros(table.num_rows, dtype=bool)
+        for name in (self._names[c] for c in columns):
+            present |= pc.is_valid(table.column(name)).to_numpy(zero_copy_only=False)
+        return pd.Series(present, index=self.index[table.column(_ROW).to_numpy()])
+
+    def aggregate(
+        self,
+        by: list,
+        aggregations: dict[object, str],
+        subset: str | None = None,
+    ) -> pd.DataFrame:
+        """Group by ``by`` and aggregate, e.g. ``{"Jan26 Spend": "sum"}``.
+
+        Functions are Arrow hash aggregates (sum, mean, count, min, max, ...).
+        Result columns are named ``"<column>_<function>"``.
+        """
+        cols = list(dict.fromkeys([*by, *aggregations]))
+        table = self._table(cols, subset).drop_columns([_ROW])
+        grouped = table.group_by([self._names[c] for c in by]).aggregate(
+            [(self._names[c], fn) for c, fn in aggregations.items()]
+        )
+        return grouped.to_pandas()
+
+    def sql(self, query: str) -> pd.DataFrame:
+        """Run DuckDB SQL over ``odd`` (every row) and each registered subset view."""
+        return self._connection().execute(query).fetchdf()
+
+    def _connection(self):
+        if self._duckdb is not None:
+            return self._duckdb
+        try:
+            import duckdb
+        except ImportError as e:
+            raise ImportError(
+                "SQL queries on the ODD store require the 'duckdb' package. "
+                "Install it with: pip install duckdb"
+            ) from e
+        pa = _require_pyarrow()
+        con = duckdb.connect()
+        path = str(self.path).replace("'", "''")
+        con.execute(f"CREATE VIEW odd AS SELECT * FROM read_parquet('{path}')")
+        for name, positions in self._subsets.items():
+            con.register(f"_{name}_rows", pa.table({_ROW: pa.array(positions, pa.int64())}))
+            con.execute(
+                f'CREATE VIEW "{name}" AS SELECT odd.* FROM odd '
+                f'JOIN "_{name}_rows" USING ("{_ROW}")'
+            )
+        self._duckdb = con
+        return con
@@ -10,6 +10,7 @@ from loguru import logger
 
 from ars_analysis.logging_setup import get_username
 from ars_analysis.pipeline.context import PipelineContext
+from shared.profiling import Profiler, use_profiler
 
 
 @dataclass(frozen=True)
@@ -44,6 +45,10 @@ def run_pipeline(
 
     Returns list of StepResults for every step attempted.
     Stops on first critical failure.
+
+    Steps, modules and profiled analysis functions are timed into
+    ``ctx.profiler`` (created if unset); the profile is added to the run
+    report when step_generate wrote one.
     """
     results: list[StepResult] = []
     client_label = f"{ctx.client.client_id} ({ctx.client.client_name})"
@@ -62,6 +67,9 @@ def run_pipeline(
     )
 
     _notify = ctx.progress_callback
+    if ctx.profiler is None:
+        ctx.profiler = Profiler()
+    profiler = ctx.profiler
 
     for step in steps:
         if _notify:
@@ -70,7 +78,9 @@ def run_pipeline(
         t0 = time.perf_counter()
 
         try:
-            step.execute(ctx)
+            with use_profiler(profiler), profiler.track(step.name, kind="step") as span:
+                step.execute(ctx)
+                span.rows = len(ctx.data) if ctx.data is not None else None
             elapsed = time.perf_counter() - t0
             results.append(StepResult(name=step.name, success=True, elapsed_seconds=elapsed))
             if _notify:
@@ -109,6 +119,12 @@ def run_pipeline(
                     err=error_msg,
                 )
 
+    # Never leave background chart rendering running past the pipeline
+    if ctx.render_queue is not None:
+        ctx.render_queue.wait()
+
+    _report_profile(ctx, profiler)
+
     success_count = sum(1 for r in results if r.success)
     total_time = sum(r.elapsed_seconds for r in results)
     logger.info(
@@ -128,3 +144,20 @@ def run_pipeline(
     )
 
     return results
+
+
+def _report_profile(ctx: PipelineContext, profiler: Profiler) -> None:
+    """Log the slowest modules and add the profile to the run report."""
+    for span in profiler.slowest(5, kind="module"):
+        logger.info(
+            "Module {name}: {wall:.1f}s wall, {cpu:.1f}s CPU, +{mem:.0f} MB peak RSS",
+            name=span.name,
+            wall=span.wall_seconds,
+            cpu=span.cpu_seconds,
+            mem=span.peak_rss_delta_mb,
+        )
+    if ctx.run_report_path.exists():
+        try:
+            profiler.merge_into(ctx.run_report_path)
+        except (OSError, ValueError) as exc:
+            logger.warning("Could not add profile to run report: {err}", err=exc)
@@ -0,0 +1,175 @@
+"""Cost-aware batch scheduling -- estimate per-client runtime and memory.
+
+Clients are ordered longest-first so the biggest ODDs never become the
+tail of a parallel batch, and admitted only while the projected memory of
+everything in flight stays under ``pipeline.memory_budget_mb``.
+
+Runtime estimates are learned from prior batches: each run records
+(file size, rows, elapsed) per client in the run tracker JSON, and the
+next batch predicts from that client's own seconds-per-MB rate, falling
+back to the fleet median for clients never seen before.
+"""
+
+from __future__ import annotations
+
+import json
+import statistics
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from loguru import logger
+
+if TYPE_CHECKING:
+    from ars_analysis.pipeline.batch import BatchResult
+    from ars_analysis.pipeline.steps.scan import ScannedFile
+
+# Used when there is no history at all (first batch on a machine).
+DEFAULT_SECONDS_PER_MB = 6.0
+
+# Floor for file sizes so tiny test files still get a non-zero cost.
+_MIN_SIZE_MB = 0.01
+
+# Max runs kept per client -- enough to smooth noise, small enough to stay cheap.
+_HISTORY_DEPTH = 5
+
+
+@dataclass(frozen=True)
+class ClientCost:
+    """Predicted cost of processing one client."""
+
+    client_id: str
+    predicted_seconds: float
+    predicted_memory_mb: float
+
+
+@dataclass
+class RunHistory:
+    """Per-client runtime history persisted between batches.
+
+    ``runs`` maps client_id -> list of {"file_size_mb", "rows", "elapsed"}
+    dicts, newest last.
+    """
+
+    path: Path | None = None
+    runs: dict[str, list[dict]] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: Path | None) -> RunHistory:
+        """Load history from the tracker file. Missing/corrupt files yield empty history."""
+        if path is None:
+            return cls()
+        try:
+            data = json.loads(Path(path).read_text(encoding="utf-8"))
+            runs = data.get("batch_runs", {})
+            if not isinstance(runs, dict):
+                runs = {}
+        except (OSError, ValueError):
+            runs = {}
+        return cls(path=Path(path), runs=runs)
+
+    def seconds_per_mb(self, client_id: str) -> float | None:
+        """Median seconds-per-MB from this client's prior runs, or None."""
+        rates = [_rate(r) for r in self.runs.get(client_id, [])]
+        rates = [r for r in rates if r is not None]
+        return statistics.median(rates) if rates else None
+
+    def fleet_seconds_per_mb(self) -> float:
+        """Median seconds-per-MB across every recorded run."""
+        rates = [_rate(r) for runs in self.runs.values() for r in runs]
+        rates = [r for r in rates if r is not None]
+        return statistics.median(rates) if rates else DEFAULT_SECONDS_PER_MB
+
+    def record(self, files: list[ScannedFile], results: list[BatchResult]) -> None:
+        """Append fresh successful results (failures and resumes would skew rates)."""
+        by_id = {f.client_id: f for f in files}
+        for r in results:
+            scanned = by_id.get(r.client_id)
+            if scanned is None or not r.success or r.resumed:
+                continue
+            entries = self.runs.setdefault(r.client_id, [])
+            entries.append(
+                {
+                    "file_size_mb": scanned.file_size_mb,
+                    "rows": r.row_count,
+                    "elapsed": round(r.elapsed, 2),
+                }
+            )
+            del entries[:-_HISTORY_DEPTH]
+
+    def save(self) -> None:
+        """Write history back into the tracker file, preserving any other keys."""
+        if self.path is None:
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if not isinstance(data, dict):
+                data = {}
+        except (OSError, ValueError):
+            data = {}
+        data["batch_runs"] = self.runs
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        except OSError as exc:
+            logger.warning("Could not save batch history to {p}: {err}", p=self.path, err=exc)
+
+
+def _rate(run: dict) -> float | None:
+    size = run.get("file_size_mb") or 0
+    elapsed = run.get("elapsed") or 0
+    if size <= 0 or elapsed <= 0:
+        return None
+    return elapsed / max(size, _MIN_SIZE_MB)
+
+
+def estimate_costs(
+    files: list[ScannedFile],
+    history: RunHistory,
+    memory_per_mb: float,
+) -> dict[str, ClientCost]:
+    """Predict runtime and peak memory for each scanned file."""
+    fleet_rate = history.fleet_seconds_per_mb()
+    costs: dict[str, ClientCost] = {}
+    for f in files:
+        size = max(f.file_size_mb, _MIN_SIZE_MB)
+        rate = history.seconds_per_mb(f.client_id) or fleet_rate
+        costs[f.client_id] = ClientCost(
+            client_id=f.client_id,
+            predicted_seconds=round(size * rate, 1),
+            predicted_memory_mb=round(size * memory_per_mb, 1),
+        )
+    return costs
+
+
+def order_longest_first(
+    files: list[ScannedFile],
+    costs: dict[str, ClientCost],
+) -> list[ScannedFile]:
+    """Sort files by predicted runtime, longest first (stable for ties)."""
+    return sorted(files, key=lambda f: -costs[f.client_id].predicted_seconds)
+
+
+def next_admissible(
+    pending: list[ScannedFile],
+    costs: dict[str, ClientCost],
+    in_use_mb: float,
+    budget_mb: float,
+    idle: bool,
+) -> ScannedFile | None:
+    """Pick the next file to start without exceeding the memory budget.
+
+    Walks ``pending`` in order and returns the first file whose projected
+    memory fits in what is left of the budget. A budget of 0 disables the
+    check. When nothing is running (``idle``) the head of the queue is
+    always admitted so an oversized client still runs -- alone.
+    """
+    if not pending:
+        return None
+    if budget_mb <= 0 or idle:
+        return pending[0]
+    remaining = budget_mb - in_use_mb
+    for f in pending:
+        if costs[f.client_id].predicted_memory_mb <= remaining:
+            return f
+    return None
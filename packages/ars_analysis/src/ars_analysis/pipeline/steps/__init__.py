@@ -1 +1,5 @@
 """Pipeline steps -- format, analyze, generate."""
+
+# Worker count for interactive single-client runs (`ars run`, platform runner).
+# Kept here, not in analyze.py, so the CLI can show it without importing modules.
+DEFAULT_MODULE_WORKERS = 4
@@ -1,11 +1,36 @@
-"""Step: Dispatch analysis to registered modules via the registry."""
+"""Step: Dispatch analysis to registered modules via the registry.
+
+With ``ctx.module_workers > 1`` independent modules run concurrently on a
+thread pool. A module starts once
+
+- every module named in its ``depends_on`` has finished, and
+- the previous module of its own family (``dctr.*``, ``attrition.*``, ...)
+  has finished -- families share private memo caches (``_attrition_data``,
+  ``_mailer_pairs``) and read each other's side-channel results.
+
+Each module writes into its own overlay of ``ctx.results`` that is merged
+back when it finishes, and ``ctx.all_slides`` is always assembled in
+MODULE_ORDER, so the deck is identical whatever the worker count.
+
+If ``ctx.render_queue`` is set, chart PNGs are saved in the background while
+modules run (see charts.render_queue); step_generate waits for them.
+"""
 
 from __future__ import annotations
 
+from collections import ChainMap
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextvars import copy_context
+
 from loguru import logger
 
+from ars_analysis.analytics.base import AnalysisModule, AnalysisResult
 from ars_analysis.analytics.registry import get_module, ordered_modules
+from ars_analysis.charts.render_queue import deferred_rendering
 from ars_analysis.pipeline.context import PipelineContext
+from ars_analysis.pipeline.module_cache import ColumnHasher, ModuleCache, side_results
+from ars_analysis.pipeline.steps import DEFAULT_MODULE_WORKERS  # noqa: F401 (re-export)
+from shared.profiling import track
 
 
 def step_analyze(ctx: PipelineContext) -> None:
@@ -19,101 +44,180 @@ def step_analyze(ctx: PipelineContext) -> None:
         logger.warning("No analytics modules registered -- skipping analysis step")
         return
 
-    logger.info("Running {n} analytics modules", n=len(modules))
-    _notify = ctx.progress_callback
-    total = len(modules)
-    success_count = 0
-    skip_count = 0
-    fail_count = 0
-
-    for idx, mod_cls in enumerate(modules, 1):
-        mod = mod_cls()
-        mid = mod.module_id
-
-        if _notify:
-            _notify(f"Module {idx}/{total}: {mid}")
-
-        # Validate prerequisites
-        errors = mod.validate(ctx)
-        if errors:
-            logger.warning(
-                "Module {id} skipped -- validation errors: {errs}",
-                id=mid,
-                errs="; ".join(errors),
-            )
-            skip_count += 1
-            continue
-
-        # Execute with isolation
-        try:
-            results = mod.run(ctx)
-            ctx.results[mid] = results
-            ctx.all_slides.extend(results)
-            success_count += 1
-            logger.info(
-                "Module {id} produced {n} result(s)",
-                id=mid,
-                n=len(results),
-            )
-        except Exception as exc:
-            fail_count += 1
-            logger.error(
-                "Module {id} failed: {err}",
-                id=mid,
-                err=f"{type(exc).__name__}: {exc}",
-            )
+    logger.info(
+        "Running {n} analytics modules ({w} worker(s))",
+        n=len(modules),
+        w=max(1, ctx.module_workers),
+    )
+    counts = _run_modules(ctx, [mod_cls() for mod_cls in modules])
 
     logger.info(
-        "Analysis complete: {ok} succeeded, {skip} skipped, {fail} failed",
-        ok=success_count,
-        skip=skip_count,
-        fail=fail_count,
+        "Analysis complete: {ok} succeeded ({cached} cached), {skip} skipped, {fail} failed",
+        **counts,
     )
 
 
 def step_analyze_selected(ctx: PipelineContext, module_ids: list[str]) -> None:
     """Run only the specified modules (used by CLI --modules flag)."""
     logger.info("Running {n} selected modules: {ids}", n=len(module_ids), ids=module_ids)
-    _notify = ctx.progress_callback
-    total = len(module_ids)
-    success_count = 0
-    skip_count = 0
-    fail_count = 0
-
-    for idx, mid in enumerate(module_ids, 1):
-        if _notify:
-            _notify(f"Module {idx}/{total}: {mid}")
-
-        mod_cls = get_module(mid)
-        mod = mod_cls()
-
-        errors = mod.validate(ctx)
-        if errors:
-            logger.warning(
-                "Module {id} skipped -- validation errors: {errs}",
-                id=mid,
-                errs="; ".join(errors),
-            )
-            skip_count += 1
-            continue
-
-        try:
-            results = mod.run(ctx)
-            ctx.results[mid] = results
-            ctx.all_slides.extend(results)
-            success_count += 1
-            logger.info("Module {id} produced {n} result(s)", id=mid, n=len(results))
-        except Exception as exc:
-            fail_count += 1
-            logger.error(
-                "Module {id} failed: {err}",
-                id=mid,
-                err=f"{type(exc).__name__}: {exc}",
-            )
+    counts = _run_modules(ctx, [get_module(mid)() for mid in module_ids])
 
     logger.info(
-        "Selected analysis complete: {ok} succeeded, {skip} skipped, {fail} failed",
-        ok=success_count,
-        skip=skip_count,
-        fail=fail_count,
+        "Selected analysis complete: {ok} succeeded ({cached} cached), "
+        "{skip} skipped, {fail} failed",
+        **counts,
     )
+
+
+def module_prerequisites(modules: list[AnalysisModule]) -> dict[str, set[str]]:
+    """Modules each module must wait for: declared deps + previous family member.
+
+    Only earlier modules in the list count, so a dependency on a module that
+    runs later (or not at all) never blocks.
+    """
+    prereqs: dict[str, set[str]] = {}
+    seen: set[str] = set()
+    last_in_family: dict[str, str] = {}
+    for mod in modules:
+        mid = mod.module_id
+        family = mid.split(".", 1)[0]
+        waits = {dep for dep in mod.depends_on if dep in seen}
+        if family in last_in_family:
+            waits.add(last_in_family[family])
+        prereqs[mid] = waits
+        seen.add(mid)
+        last_in_family[family] = mid
+    return prereqs
+
+
+def _execute(ctx: PipelineContext, mod: AnalysisModule, written: dict) -> list[AnalysisResult]:
+    """Run one module; its ctx.results writes land in ``written``, reads fall through."""
+    rows = len(ctx.data) if ctx.data is not None else None
+    with track(mod.module_id, kind="module", rows=rows):
+        return mod.run(ctx.with_results(ChainMap(written, ctx.results)))
+
+
+def _run_inline(ctx: PipelineContext, mod: AnalysisModule, written: dict) -> Future:
+    """Run a module on the calling thread, wrapped in a completed Future."""
+    fut: Future = Future()
+    try:
+        fut.set_result(_execute(ctx, mod, written))
+    except Exception as exc:
+        fut.set_exception(exc)
+    return fut
+
+
+def _run_modules(ctx: PipelineContext, modules: list[AnalysisModule]) -> dict[str, int]:
+    """Validate and run modules, reusing cached results where inputs are unchanged."""
+    _notify = ctx.progress_callback
+    total = len(modules)
+    workers = max(1, ctx.module_workers)
+    counts = {"ok": 0, "cached": 0, "skip": 0, "fail": 0}
+
+    cache = ModuleCache(ctx, ctx.module_cache_dir) if ctx.module_cache_dir else None
+    hasher = ColumnHasher(ctx.data)
+    fingerprints: dict[str, str] = {}
+    prereqs = module_prerequisites(modules)
+
+    outputs: dict[str, list[AnalysisResult]] = {}
+    done: set[str] = set()
+    pending = list(modules)
+    running: dict[Future, tuple[AnalysisModule, str, dict]] = {}
+    started = 0
+
+    pool = None
+    if workers > 1:
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ars-module")
+    try:
+        with deferred_rendering(ctx.render_queue):
+            while pending or running:
+                # Validation, fingerprinting and cache hits happen here on the
+                # calling thread; only module.run() is handed to the pool.
+                for mod in list(pending):
+                    if len(running) >= workers:
+                        break
+                    mid = mod.module_id
+                    if not prereqs[mid] <= done:
+                        continue
+                    pending.remove(mod)
+                    started += 1
+                    if _notify:
+                        _notify(f"Module {started}/{total}: {mid}")
+
+                    errors = mod.validate(ctx)
+                    if errors:
+                        logger.warning(
+                            "Module {id} skipped -- validation errors: {errs}",
+                            id=mid,
+                            errs="; ".join(errors),
+                        )
+                        counts["skip"] += 1
+                        done.add(mid)
+                        continue
+
+                    fingerprint = ""
+                    if cache is not None:
+                        fingerprint = mod.fingerprint(ctx, hasher, fingerprints)
+                        fingerprints[mid] = fingerprint
+                        restored = cache.load(mid, fingerprint)
+                        if restored is not None:
+                            outputs[mid] = restored
+                            counts["ok"] += 1
+                            counts["cached"] += 1
+                            done.add(mid)
+                            logger.info("Module {id} unchanged -- reused cached results", id=mid)
+                            continue
+
+                    written: dict = {}
+                    if pool is not None:
+                        # copy_context carries the active render queue into the worker
+                        fut = pool.submit(copy_context().run, _execute, ctx, mod, written)
+                    else:
+                        fut = _run_inline(ctx, mod, written)
+                    running[fut] = (mod, fingerprint, written)
+
+                if not running:
+                    continue
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for fut in finished:
+                    mod, fingerprint, written = running.pop(fut)
+                    mid = mod.module_id
+                    done.add(mid)
+                    # Keys written before a failure stay visible, as in a serial run
+                    ctx.results.update(written)
+                    try:
+                        results = fut.result()
+                    except Exception as exc:
+                        # Downstream modules must not reuse results built on this module's output
+                        fingerprints[mid] = "failed"
+                        counts["fail"] += 1
+                        logger.error(
+                            "Module {id} failed: {err}",
+                            id=mid,
+                            err=f"{type(exc).__name__}: {exc}",
+                        )
+                        continue
+                    ctx.results[mid] = results
+                    outputs[mid] = results
+                    counts["ok"] += 1
+                    logger.info(
+                        "Module {id} produced {n} result(s)",
+                        id=mid,
+                        n=len(results),
+                    )
+                    if cache is not None:
+                        cache.store(mid, fingerprint, results, side_results(written, mid))
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+    # Slide order (and ctx.results module entries) follow module order,
+    # never completion order.
+    for mod in modules:
+        mid = mod.module_id
+        if mid in outputs:
+            ctx.results[mid] = ctx.results.pop(mid)
+            ctx.all_slides.extend(outputs[mid])
+
+    return counts
@@ -56,7 +56,7 @@ def _build_run_report(ctx: PipelineContext) -> list[SlideStatus]:
 
 def _save_run_report(ctx: PipelineContext, report: list[SlideStatus]) -> None:
     """Save run report as JSON next to output files."""
-    report_path = ctx.paths.base_dir / f"{ctx.client.client_id}_{ctx.client.month}_run_report.json"
+    report_path = ctx.run_report_path
     ctx.paths.base_dir.mkdir(parents=True, exist_ok=True)
 
     ok = sum(1 for s in report if s.success and s.has_chart)
@@ -90,7 +90,13 @@ def step_generate(ctx: PipelineContext) -> None:
 
     Order: run report -> Excel workbook -> PowerPoint deck -> archive copy.
     Uses single-write pattern: build Excel once, then shutil.copy2 for master.
+    Charts still queued for background rendering are finished first.
     """
+    if ctx.render_queue is not None:
+        failed = ctx.render_queue.wait()
+        if failed:
+            logger.warning("{n} chart(s) failed to render", n=failed)
+
     if not ctx.all_slides:
         logger.warning("No analysis results to generate deliverables from")
         return
@@ -2,17 +2,20 @@
 
 Supports CLI `ars scan` and wizard Step 1 auto-detection.
 Prefers *-formatted.xlsx over raw files when both exist.
+Folder listings come from the shared directory index (shared.dir_index).
 """
 
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
 from ars_analysis.config import ARSSettings
 from ars_analysis.pipeline.utils import resolve_target_month
+from shared.dir_index import FileEntry, get_directory_index
 
 logger = logging.getLogger(__name__)
 
@@ -57,52 +60,50 @@ def scan_ready_files(
     """
     full_month, _, _ = resolve_target_month(target_month)
     root = settings.paths.watch_root
+    index = get_directory_index()
 
-    try:
-        if not root.exists():
-            return []
-    except OSError:
-        return []
+    csm_names = [csm_filter] if csm_filter else index.subdirs(root)
+    month_paths = [root / csm / full_month for csm in csm_names]
 
-    found: list[ScannedFile] = []
-
-    if csm_filter:
-        csm_dirs = [root / csm_filter]
-    else:
-        csm_dirs = sorted(d for d in root.iterdir() if d.is_dir())
-
-    for csm_dir in csm_dirs:
-        if not csm_dir.is_dir():
+    # Every CSM's month folder, then every client folder, checked in parallel;
+    # unchanged folders are answered from the index with a single stat.
+    clients: list[tuple[str, Path]] = []
+    for csm, month_listing in zip(csm_names, index.listings(month_paths)):
+        if month_listing is None:
             continue
-        csm_name = csm_dir.name
-        month_path = csm_dir / full_month
-        if not month_path.exists():
-            continue
-
-        for client_dir in sorted(month_path.iterdir()):
-            if not client_dir.is_dir():
-                continue
-            if client_filter and client_dir.name != client_filter:
+        for client_id in month_listing.subdirs:
+            if client_filter and client_id != client_filter:
                 continue
+            clients.append((csm, month_listing.path / client_id))
 
-            best = _pick_best_file(client_dir)
-            if best is None:
-                continue
+    found: list[ScannedFile] = []
+    for (csm_name, client_dir), listing in zip(
+        clients, index.listings(path for _, path in clients)
+    ):
+        if listing is None:
+            continue
+        best = _pick_best_entry(listing.files)
+        if best is None:
+            continue
 
-            file_path, is_formatted = best
-            stat = file_path.stat()
-            found.append(
-                ScannedFile(
-                    client_id=client_dir.name,
-                    csm_name=csm_name,
-                    filename=file_path.name,
-                    file_path=file_path,
-                    month=full_month,
-                    file_size_mb=round(stat.st_size / (1024 * 1024), 2),
-                    is_formatted=is_formatted,
-                    modified_time=datetime.fromtimestamp(stat.st_mtime),
-                )
+        entry, is_formatted = best
+        # The index only notices added/removed files; report current size and date.
+        try:
+            stat = entry.path.stat()
+        except OSError:
+            continue
+        found.append(
+            ScannedFile(
+                client_id=client_dir.name,
+                csm_name=csm_name,
+                filename=entry.name,
+                file_path=entry.path,
+                month=full_month,
+                file_size_mb=round(stat.st_size / (1024 * 1024), 2),
+                is_formatted=is_formatted,
+                modified_time=datetime.fromtimestamp(stat.st_mtime),
             )
+        )
 
     return found
 
@@ -113,13 +114,22 @@ def _pick_best_file(client_dir: Path) -> tuple[Path, bool] | None:
     Prefers *-formatted.xlsx, then falls back to any xlsx/csv.
     Skips lock files (~$) and output files (ars-analysis, presentation).
     """
+    listing = get_directory_index().listing(client_dir)
+    best = _pick_best_entry(listing.files) if listing else None
+    if best is None:
+        return None
+    return best[0].path, best[1]
+
+
+def _pick_best_entry(files: Iterable[FileEntry]) -> tuple[FileEntry, bool] | None:
+    """``_pick_best_file`` over an indexed listing (files sorted by name)."""
     formatted = None
     raw = None
 
-    for f in client_dir.iterdir():
-        if not f.is_file() or f.name.startswith("~$"):
+    for f in files:
+        if f.name.startswith("~$"):
             continue
-        if f.suffix.lower() not in (".xlsx", ".csv"):
+        if f.path.suffix.lower() not in (".xlsx", ".csv"):
             continue
         name_lower = f.name.lower()
         if "ars-analysis" in name_lower or "presentation" in name_lower:
@@ -139,21 +149,11 @@ def _pick_best_file(client_dir: Path) -> tuple[Path, bool] | None:
 
 def available_months(settings: ARSSettings) -> list[str]:
     """List all month folders across all CSMs, newest first."""
-    root = settings.paths.watch_root
-    try:
-        if not root.exists():
-            return []
-    except OSError:
-        return []
-
     months: set[str] = set()
-    for csm_dir in root.iterdir():
-        if not csm_dir.is_dir():
+    for path, listing in get_directory_index().walk(settings.paths.watch_root, 1).items():
+        if path == settings.paths.watch_root:
             continue
-        for month_dir in csm_dir.iterdir():
-            if not month_dir.is_dir():
-                continue
-            name = month_dir.name
+        for name in listing.subdirs:
             parts = name.split(".")
             if len(parts) == 2 and parts[0].isdigit() and parts[1].isdigit():
                 months.add(name)
@@ -163,10 +163,4 @@ def available_months(settings: ARSSettings) -> list[str]:
 
 def available_csms(settings: ARSSettings) -> list[str]:
     """Return sorted list of CSM folder names in watch_root."""
-    root = settings.paths.watch_root
-    try:
-        if not root.exists():
-            return []
-    except OSError:
-        return []
-    return sorted(d.name for d in root.iterdir() if d.is_dir())
+    return get_directory_index().subdirs(settings.paths.watch_root)
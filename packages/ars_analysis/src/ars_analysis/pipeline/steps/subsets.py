@@ -7,6 +7,8 @@ from loguru import logger
 
 from ars_analysis.exceptions import DataError
 from ars_analysis.pipeline.context import DataSubsets, PipelineContext
+from ars_analysis.pipeline.features import build_feature_frame
+from ars_analysis.pipeline.odd_store import OddStore, current_columns, frame_memory_mb
 
 
 def step_subsets(ctx: PipelineContext) -> None:
@@ -14,12 +16,18 @@ def step_subsets(ctx: PipelineContext) -> None:
 
     With Copy-on-Write enabled, these are zero-copy views until mutated.
     No .copy() calls needed.
+
+    Clients larger than ``pipeline.out_of_core_mb`` are spilled to
+    ``ctx.store`` and their subsets carry no monthly history columns
+    (see ``pipeline.odd_store``).
     """
     if ctx.data is None:
         raise DataError("Cannot create subsets: no data loaded")
 
     df = ctx.data
     subs = DataSubsets()
+    # Row filters below select from `rows`: all of df, or its current columns only.
+    rows = _spill_if_large(ctx, df)
 
     # Auto-compute date range using TODAY as reference (enables L12M everywhere).
     # Snap to LAST 12 COMPLETED calendar months relative to the current date.
@@ -69,7 +77,7 @@ def step_subsets(ctx: PipelineContext) -> None:
             _dc_parsed = pd.to_datetime(df["Date Closed"], errors="coerce", format="mixed")
         _open_mask = _open_mask | _dc_parsed.isna()
 
-    subs.open_accounts = df[_open_mask]
+    subs.open_accounts = rows[_open_mask]
     logger.info("Open accounts: {n:,} rows", n=len(subs.open_accounts))
 
     if not _stat_col and "Date Closed" not in df.columns:
@@ -109,7 +117,7 @@ def step_subsets(ctx: PipelineContext) -> None:
                 n=mask.sum(),
             )
 
-        subs.eligible_data = df[mask]
+        subs.eligible_data = rows[mask]
         logger.info("Eligible data: {n:,} rows", n=len(subs.eligible_data))
 
         # Personal/Business splits
@@ -158,7 +166,7 @@ def step_subsets(ctx: PipelineContext) -> None:
             _do_parsed = df["Date Opened"]
         else:
             _do_parsed = pd.to_datetime(df["Date Opened"], errors="coerce", format="mixed")
-        subs.last_12_months = df[_do_parsed >= cutoff]
+        subs.last_12_months = rows[_do_parsed >= cutoff]
         logger.info(
             "Last 12 months: {n:,} rows (cutoff={cutoff})",
             n=len(subs.last_12_months),
@@ -166,4 +174,36 @@ def step_subsets(ctx: PipelineContext) -> None:
         )
 
     ctx.subsets = subs
+    if ctx.store is not None:
+        for name, frame in vars(subs).items():
+            ctx.store.add_subset(name, frame)
+
+    # Derived per-account columns shared by every module (pipeline.features).
+    ctx.features = build_feature_frame(df)
+    logger.info(
+        "Feature frame: {n:,} rows x {c} columns",
+        n=len(ctx.features),
+        c=ctx.features.shape[1],
+    )
     logger.info("Subsets created for {client}", client=ctx.client.client_id)
+
+
+def _spill_if_large(ctx: PipelineContext, df: pd.DataFrame) -> pd.DataFrame:
+    """Spill an oversized ODD to ctx.store; return the frame subsets are cut from."""
+    limit_mb = getattr(getattr(ctx.settings, "pipeline", None), "out_of_core_mb", 0)
+    if not limit_mb:
+        return df
+    size_mb = frame_memory_mb(df)
+    if size_mb < limit_mb:
+        return df
+    ctx.store = OddStore.spill(df)
+    keep = current_columns(df.columns)
+    logger.info(
+        "Out-of-core: ODD is {mb:,.0f} MB (limit {limit:,} MB) -- subsets keep "
+        "{keep} of {total} columns",
+        mb=size_mb,
+        limit=limit_mb,
+        keep=len(keep),
+        total=len(df.columns),
+    )
+    return df[keep]
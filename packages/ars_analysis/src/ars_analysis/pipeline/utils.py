@@ -1,7 +1,8 @@
-"""Shared utilities for ODD file parsing and month resolution."""
+"""Shared utilities for ODD file parsing, month resolution and state files."""
 
 from __future__ import annotations
 
+import os
 import re
 from datetime import datetime
 from pathlib import Path
@@ -114,3 +115,11 @@ def resolve_target_month(month: str | None = None) -> tuple[str, str, str]:
         raise ValueError(msg)
     year, mm = month.split(".")
     return month, year, mm
+
+
+def atomic_write_text(path: Path, text: str) -> None:
+    """Write via a temp file + rename so an interrupted write never corrupts the file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
@@ -0,0 +1,429 @@
+"""Shared-drive work queue -- spread one batch across several machines.
+
+``ars batch --queue DIR`` publishes one job per client into ``DIR`` (any
+folder every machine can reach, e.g. on the M: drive) and ``ars worker DIR``
+processes on any host pull jobs from it. No broker is involved; the queue is
+plain files and every state change is a single rename::
+
+    DIR/
+        queue.json              batch id + run options (modules, output dir, ...)
+        jobs/0003_1234.json     pending, named by priority so workers take
+                                the longest clients first
+        leases/0003_1234.json   claimed; the worker bumps its ``beat`` counter
+                                as a heartbeat
+        results/1234.json       BatchResult written by whoever ran the client
+
+Claiming renames ``jobs/X`` to ``leases/X``; when two workers race for the
+same job exactly one rename succeeds. Every claim gets a fresh ``claim`` id.
+A lease whose ``claim``/``beat`` has not changed for ``lease_seconds`` --
+timed by the observing process's own monotonic clock, never by file
+timestamps -- belongs to a crashed or disconnected worker and is renamed
+back into ``jobs/`` by the next worker or coordinator that notices. Host
+clocks are never compared, so clock skew between machines does not matter;
+the price is that a process must watch a lease for ``lease_seconds`` before
+it can reclaim it. A client whose lease expires ``MAX_ATTEMPTS`` times is
+recorded as failed instead of requeued.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from loguru import logger
+
+from ars_analysis.pipeline.steps.scan import ScannedFile
+from ars_analysis.pipeline.utils import atomic_write_text
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+DEFAULT_LEASE_SECONDS = 120.0
+DEFAULT_POLL_SECONDS = 5.0
+
+# A client whose worker died this many times is failed rather than retried.
+MAX_ATTEMPTS = 3
+
+_SPEC = "queue.json"
+
+
+def default_worker_id() -> str:
+    """``host-pid``, unique across the machines sharing a queue."""
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+def _scanned_to_dict(scanned: ScannedFile) -> dict:
+    return {
+        "client_id": scanned.client_id,
+        "csm_name": scanned.csm_name,
+        "filename": scanned.filename,
+        "file_path": str(scanned.file_path),
+        "month": scanned.month,
+        "file_size_mb": scanned.file_size_mb,
+        "is_formatted": scanned.is_formatted,
+        "modified_time": scanned.modified_time.isoformat(),
+    }
+
+
+def _scanned_from_dict(data: dict) -> ScannedFile:
+    return ScannedFile(
+        client_id=data["client_id"],
+        csm_name=data["csm_name"],
+        filename=data["filename"],
+        file_path=Path(data["file_path"]),
+        month=data["month"],
+        file_size_mb=data["file_size_mb"],
+        is_formatted=data["is_formatted"],
+        modified_time=datetime.fromisoformat(data["modified_time"]),
+    )
+
+
+@dataclass(frozen=True)
+class QueueSpec:
+    """Run options shared by every job of one published batch."""
+
+    batch_id: str
+    module_ids: list[str] | None = None
+    output_base: Path | None = None
+    use_local_temp: bool = False
+    resume: bool = False
+
+
+@dataclass
+class Job:
+    """One client claimed from the queue."""
+
+    name: str
+    scanned: ScannedFile
+    batch_id: str
+    attempts: int = 0
+    worker: str = ""
+    claim: str = ""
+    lease_path: Path | None = field(default=None, repr=False)
+
+
+class WorkQueue:
+    """File-backed job queue in a directory on a shared drive.
+
+    Parameters
+    ----------
+    root : Path
+        Queue directory; created if missing.
+    lease_seconds : float
+        Heartbeat age after which a claimed job is considered abandoned.
+    """
+
+    def __init__(self, root: Path, lease_seconds: float = DEFAULT_LEASE_SECONDS) -> None:
+        self.root = Path(root)
+        self.lease_seconds = lease_seconds
+        self.jobs_dir = self.root / "jobs"
+        self.leases_dir = self.root / "leases"
+        self.results_dir = self.root / "results"
+        for d in (self.jobs_dir, self.leases_dir, self.results_dir):
+            d.mkdir(parents=True, exist_ok=True)
+        # Lease name -> (claim/beat token, monotonic time it was first seen).
+        self._observed: dict[str, tuple[str, float]] = {}
+
+    # -- coordinator ------------------------------------------------------------
+
+    def publish(
+        self,
+        files: list[ScannedFile],
+        module_ids: list[str] | None = None,
+        output_base: Path | None = None,
+        use_local_temp: bool = False,
+        resume: bool = False,
+    ) -> QueueSpec:
+        """Replace the queue's contents with one job per file, in the given order.
+
+        Leftover jobs, leases and results from an earlier batch are removed;
+        a worker still running an old job writes a result the new batch ignores.
+        """
+        for d in (self.jobs_dir, self.leases_dir, self.results_dir):
+            for path in d.glob("*.json"):
+                path.unlink(missing_ok=True)
+
+        spec = QueueSpec(
+            batch_id=uuid.uuid4().hex,
+            module_ids=module_ids,
+            output_base=output_base,
+            use_local_temp=use_local_temp,
+            resume=resume,
+        )
+        atomic_write_text(
+            self.root / _SPEC,
+            json.dumps(
+                {
+                    "batch_id": spec.batch_id,
+                    "module_ids": module_ids,
+                    "output_base": str(output_base) if output_base else None,
+                    "use_local_temp": use_local_temp,
+                    "resume": resume,
+                    "created_at": datetime.now().isoformat(timespec="seconds"),
+                },
+                indent=2,
+            ),
+        )
+        width = len(str(len(files)))
+        for i, scanned in enumerate(files):
+            name = f"{i:0{width}d}_{scanned.client_id}.json"
+            atomic_write_text(
+                self.jobs_dir / name,
+                json.dumps(
+                    {"batch_id": spec.batch_id, "attempts": 0, "file": _scanned_to_dict(scanned)}
+                ),
+            )
+        logger.info("Published {n} job(s) to {q}", n=len(files), q=self.root)
+        return spec
+
+    def spec(self) -> QueueSpec | None:
+        """The published batch's options, or None if nothing was published."""
+        try:
+            data = json.loads((self.root / _SPEC).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        output_base = data.get("output_base")
+        return QueueSpec(
+            batch_id=data["batch_id"],
+            module_ids=data.get("module_ids"),
+            output_base=Path(output_base) if output_base else None,
+            use_local_temp=bool(data.get("use_local_temp")),
+            resume=bool(data.get("resume")),
+        )
+
+    def results(self, batch_id: str) -> dict[str, dict]:
+        """Result dicts (``BatchResult`` fields) written for ``batch_id``, by client."""
+        found: dict[str, dict] = {}
+        for path in self.results_dir.glob("*.json"):
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue  # being written
+            if data.get("batch_id") == batch_id:
+                found[path.stem] = data["result"]
+        return found
+
+    def counts(self) -> tuple[int, int]:
+        """(pending jobs, leased jobs)."""
+        return len(list(self.jobs_dir.glob("*.json"))), len(list(self.leases_dir.glob("*.json")))
+
+    # -- workers ----------------------------------------------------------------
+
+    def claim(self, worker: str) -> Job | None:
+        """Lease the highest-priority pending job, or None if there is none."""
+        for path in sorted(self.jobs_dir.glob("*.json")):
+            lease = self.leases_dir / path.name
+            try:
+                os.rename(path, lease)
+            except OSError:
+                continue  # another worker got it
+            try:
+                data = json.loads(lease.read_text(encoding="utf-8"))
+            except (OSError, ValueError) as exc:
+                logger.warning("Dropping unreadable job {j}: {err}", j=path.name, err=exc)
+                lease.unlink(missing_ok=True)
+                continue
+            data.update(worker=worker, claim=uuid.uuid4().hex, beat=0)
+            atomic_write_text(lease, json.dumps(data))
+            return Job(
+                name=path.name,
+                scanned=_scanned_from_dict(data["file"]),
+                batch_id=data["batch_id"],
+                attempts=data.get("attempts", 0),
+                worker=worker,
+                claim=data["claim"],
+                lease_path=lease,
+            )
+        return None
+
+    def _holds(self, job: Job, data: dict) -> bool:
+        return data.get("worker") == job.worker and data.get("claim") == job.claim
+
+    def heartbeat(self, job: Job) -> bool:
+        """Renew a lease by bumping its beat counter.
+
+        False if it was lost: expired and taken back, or re-claimed (possibly
+        under the same file name) by another worker. The lease is rewritten
+        in place rather than replaced, so a lease already moved away by a
+        reclaimer is never resurrected.
+        """
+        if job.lease_path is None:
+            return False
+        try:
+            with open(job.lease_path, "r+", encoding="utf-8") as fh:
+                data = json.loads(fh.read())
+                if not self._holds(job, data):
+                    return False
+                data["beat"] = data.get("beat", 0) + 1
+                fh.seek(0)
+                fh.write(json.dumps(data))
+                fh.truncate()
+            return True
+        except (OSError, ValueError):
+            return False
+
+    def complete(self, job: Job, result: dict) -> None:
+        """Record a job's result and release its lease.
+
+        If the lease expired meanwhile the result is still recorded, but a
+        lease re-claimed by another worker is left alone.
+        """
+        atomic_write_text(
+            self.results_dir / f"{job.scanned.client_id}.json",
+            json.dumps(
+                {
+                    "batch_id": job.batch_id,
+                    "worker": job.worker,
+                    "completed_at": datetime.now().isoformat(timespec="seconds"),
+                    "result": result,
+                },
+                indent=2,
+            ),
+        )
+        self.release(job)
+
+    def release(self, job: Job) -> None:
+        """Drop a job's lease unless another worker has re-claimed it."""
+        if job.lease_path is None:
+            return
+        try:
+            holder = json.loads(job.lease_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if self._holds(job, holder):
+            job.lease_path.unlink(missing_ok=True)
+
+    def _expired(self, lease: Path, data: dict, now: float) -> bool:
+        """True once ``lease`` has shown no new claim/beat for ``lease_seconds``."""
+        token = f"{data.get('claim')}:{data.get('beat')}"
+        seen = self._observed.get(lease.name)
+        if seen is None or seen[0] != token:
+            self._observed[lease.name] = (token, now)
+            return False
+        return now - seen[1] >= self.lease_seconds
+
+    def reclaim_expired(self) -> int:
+        """Return abandoned leases to the queue (or fail them). Returns the count."""
+        leases = list(self.leases_dir.glob("*.json"))
+        live = {lease.name for lease in leases}
+        for name in list(self._observed):
+            if name not in live:
+                del self._observed[name]
+        now = time.monotonic()
+        reclaimed = 0
+        for lease in leases:
+            try:
+                data = json.loads(lease.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue  # released, or a heartbeat is mid-write
+            if not self._expired(lease, data, now):
+                continue
+            self._observed.pop(lease.name, None)
+            data["attempts"] = data.get("attempts", 0) + 1
+            client_id = data["file"]["client_id"]
+            try:
+                # Rename out of leases/ first so only one reclaimer handles it.
+                staged = lease.with_name(lease.name + ".expired")
+                os.rename(lease, staged)
+            except OSError:
+                continue
+            logger.warning(
+                "Lease on {cid} held by {w} expired (attempt {a})",
+                cid=client_id,
+                w=data.get("worker", "?"),
+                a=data["attempts"],
+            )
+            if data["attempts"] >= MAX_ATTEMPTS:
+                job = Job(
+                    name=lease.name,
+                    scanned=_scanned_from_dict(data["file"]),
+                    batch_id=data["batch_id"],
+                    attempts=data["attempts"],
+                    worker=data.get("worker", ""),
+                )
+                self.complete(
+                    job,
+                    _failed_result(
+                        client_id, f"Worker lost {data['attempts']} times (last: {job.worker})"
+                    ),
+                )
+            else:
+                for key in ("worker", "claim", "beat"):
+                    data.pop(key, None)
+                atomic_write_text(self.jobs_dir / lease.name, json.dumps(data))
+            staged.unlink(missing_ok=True)
+            reclaimed += 1
+        return reclaimed
+
+
+def _failed_result(client_id: str, error: str) -> dict:
+    return {
+        "client_id": client_id,
+        "client_name": client_id,
+        "success": False,
+        "elapsed": 0.0,
+        "slide_count": 0,
+        "error": error,
+    }
+
+
+class Heartbeat:
+    """Context manager renewing a job's lease from a background thread."""
+
+    def __init__(self, queue: WorkQueue, job: Job) -> None:
+        self.queue = queue
+        self.job = job
+        self.lost = False
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self) -> None:
+        interval = max(self.queue.lease_seconds / 4, 0.05)
+        while not self._stop.wait(interval):
+            if not self.queue.heartbeat(self.job):
+                self.lost = True
+                logger.warning("Lost lease on {cid}", cid=self.job.scanned.client_id)
+                return
+
+    def __enter__(self) -> Heartbeat:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self._stop.set()
+        self._thread.join()
+
+
+def iter_jobs(
+    queue: WorkQueue,
+    worker: str,
+    poll_seconds: float = DEFAULT_POLL_SECONDS,
+    idle_seconds: float = 0.0,
+) -> Iterator[Job]:
+    """Claim jobs until the queue is drained.
+
+    Waits while other workers hold leases (one of them may expire and come
+    back), then for ``idle_seconds`` more in case a new batch is published.
+    """
+    idle_since: float | None = None
+    while True:
+        queue.reclaim_expired()
+        job = queue.claim(worker)
+        if job is not None:
+            idle_since = None
+            yield job
+            continue
+        pending, leased = queue.counts()
+        if not pending and not leased:
+            idle_since = idle_since or time.monotonic()
+            if time.monotonic() - idle_since >= idle_seconds:
+                return
+        time.sleep(poll_seconds)
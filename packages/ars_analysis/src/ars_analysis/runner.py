@@ -166,6 +166,7 @@ def run_ars(ctx: SharedContext) -> dict[str, SharedResult]:
     then converts ARS AnalysisResult objects back to shared AnalysisResult objects.
     """
     from ars_analysis.analytics.registry import load_all_modules
+    from ars_analysis.charts.render_queue import DEFAULT_RENDER_WORKERS, RenderQueue
     from ars_analysis.pipeline.context import (
         ClientInfo,
         OutputPaths,
@@ -173,8 +174,13 @@ def run_ars(ctx: SharedContext) -> dict[str, SharedResult]:
     from ars_analysis.pipeline.context import (
         PipelineContext as ARSContext,
     )
+    from ars_analysis.pipeline.module_cache import CACHE_DIRNAME
     from ars_analysis.pipeline.runner import PipelineStep, run_pipeline
-    from ars_analysis.pipeline.steps.analyze import step_analyze, step_analyze_selected
+    from ars_analysis.pipeline.steps.analyze import (
+        DEFAULT_MODULE_WORKERS,
+        step_analyze,
+        step_analyze_selected,
+    )
     from ars_analysis.pipeline.steps.generate import step_generate
     from ars_analysis.pipeline.steps.load import step_load_file
     from ars_analysis.pipeline.steps.subsets import step_subsets
@@ -222,11 +228,14 @@ def run_ars(ctx: SharedContext) -> dict[str, SharedResult]:
     # 2. Build OutputPaths -- use output_dir directly (caller already scoped it)
     paths = OutputPaths.from_dir(ctx.output_dir)
 
-    # 3. Build ARS PipelineContext
+    # 3. Build ARS PipelineContext (module cache lets re-runs skip unchanged modules)
     ars_ctx = ARSContext(
         client=client_info,
         paths=paths,
         progress_callback=ctx.progress_callback,
+        module_cache_dir=paths.base_dir / CACHE_DIRNAME,
+        module_workers=DEFAULT_MODULE_WORKERS,
+        render_queue=RenderQueue(DEFAULT_RENDER_WORKERS),
     )
 
     # 3b. Resolve PPTX template (M: drive > config > embedded fallback)
@@ -84,6 +84,7 @@ from ics_toolkit.analysis.analyses.ref_source import (
     analyze_ref_monthly_trends,
     analyze_ref_overview,
 )
+from ics_toolkit.analysis.analyses.run_context import analysis_run
 from ics_toolkit.analysis.analyses.source import (
     analyze_account_type,
     analyze_source_acquisition_mix,
@@ -111,6 +112,7 @@ from ics_toolkit.analysis.analyses.summary import (
     analyze_total_ics,
 )
 from ics_toolkit.settings import AnalysisSettings as Settings
+from shared.profiling import track
 
 logger = logging.getLogger(__name__)
 
@@ -222,20 +224,52 @@ def run_all_analyses(
     settings: Settings,
     on_progress: Callable | None = None,
 ) -> list[AnalysisResult]:
-    """Run all registered analyses and return results."""
-    results = []
-    total = len(ANALYSIS_REGISTRY)
+    """Run all registered analyses and return results.
 
-    for i, (name, func) in enumerate(ANALYSIS_REGISTRY):
-        if on_progress:
-            on_progress(i, total, name)
+    Analyses share one ``AnalysisRunContext`` so derived frames (persona
+    classification) are computed once for the whole run.
+    """
+    with analysis_run():
+        results = []
+        total = len(ANALYSIS_REGISTRY)
+
+        for i, (name, func) in enumerate(ANALYSIS_REGISTRY):
+            if on_progress:
+                on_progress(i, total, name)
+
+            try:
+                with track(name, kind="module", rows=len(df)):
+                    result = func(df, ics_all, ics_stat_o, ics_stat_o_debit, settings)
+                results.append(result)
+                logger.info("  [%d/%d] %s", i + 1, total, name)
+            except Exception as e:
+                logger.warning("  [%d/%d] %s FAILED: %s", i + 1, total, name, e)
+                results.append(
+                    AnalysisResult.from_df(
+                        name,
+                        name,
+                        pd.DataFrame(),
+                        error=str(e),
+                    )
+                )
 
+        # Run executive summary last with prior results
+        name, func = EXECUTIVE_SUMMARY
+        if on_progress:
+            on_progress(total, total + 1, name)
         try:
-            result = func(df, ics_all, ics_stat_o, ics_stat_o_debit, settings)
+            result = func(
+                df,
+                ics_all,
+                ics_stat_o,
+                ics_stat_o_debit,
+                settings,
+                prior_results=results,
+            )
             results.append(result)
-            logger.info("  [%d/%d] %s", i + 1, total, name)
+            logger.info("  [%d/%d] %s", total + 1, total + 1, name)
         except Exception as e:
-            logger.warning("  [%d/%d] %s FAILED: %s", i + 1, total, name, e)
+            logger.warning("  [%d/%d] %s FAILED: %s", total + 1, total + 1, name, e)
             results.append(
                 AnalysisResult.from_df(
                     name,
@@ -245,30 +279,4 @@ def run_all_analyses(
                 )
             )
 
-    # Run executive summary last with prior results
-    name, func = EXECUTIVE_SUMMARY
-    if on_progress:
-        on_progress(total, total + 1, name)
-    try:
-        result = func(
-            df,
-            ics_all,
-            ics_stat_o,
-            ics_stat_o_debit,
-            settings,
-            prior_results=results,
-        )
-        results.append(result)
-        logger.info("  [%d/%d] %s", total + 1, total + 1, name)
-    except Exception as e:
-        logger.warning("  [%d/%d] %s FAILED: %s", total + 1, total + 1, name, e)
-        results.append(
-            AnalysisResult.from_df(
-                name,
-                name,
-                pd.DataFrame(),
-                error=str(e),
-            )
-        )
-
     return results
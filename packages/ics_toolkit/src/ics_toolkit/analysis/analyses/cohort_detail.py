@@ -8,6 +8,7 @@ from ics_toolkit.analysis.analyses.cohort import (
     _cohort_month_offset,
     _prepare_cohort_data,
 )
+from ics_toolkit.analysis.analyses.persona import _classify_accounts
 from ics_toolkit.analysis.analyses.templates import (
     append_grand_total_row,
     kpi_summary,
@@ -252,8 +253,11 @@ def analyze_activation_personas(
     ics_stat_o_debit: pd.DataFrame,
     settings: Settings,
 ) -> AnalysisResult:
-    """ax34: Categorize accounts into activation personas based on M1 and M3 behaviour."""
-    data = _prepare_cohort_data(ics_stat_o_debit, settings)
+    """ax34: Categorize accounts into activation personas based on M1 and M3 behaviour.
+
+    Uses the persona classification shared with the ax55-ax62 analyses.
+    """
+    classified = _classify_accounts(ics_stat_o_debit, settings)
 
     persona_cols = [
         "Category",
@@ -263,60 +267,7 @@ def analyze_activation_personas(
         "% of Total",
     ]
 
-    if data.empty:
-        return AnalysisResult.from_df(
-            "Activation Personas",
-            "ICS Stat O Debit - Activation Personas",
-            pd.DataFrame(columns=persona_cols),
-            sheet_name="34_Personas",
-        )
-
-    cohorts = sorted(data["Opening Month"].unique())
-    categorized = []
-
-    for cohort in cohorts:
-        m1_tag = _cohort_month_offset(cohort, MILESTONE_OFFSETS["M1"])
-        m3_tag = _cohort_month_offset(cohort, MILESTONE_OFFSETS["M3"])
-
-        m1_col = f"{m1_tag} Swipes"
-        m3_col = f"{m3_tag} Swipes"
-
-        if m3_tag not in settings.last_12_months:
-            continue
-        if m3_col not in data.columns:
-            continue
-
-        cohort_data = data[data["Opening Month"] == cohort].copy()
-
-        if m1_col not in cohort_data.columns:
-            cohort_data["_m1"] = 0
-        else:
-            cohort_data["_m1"] = cohort_data[m1_col].fillna(0).astype(int)
-
-        cohort_data["_m3"] = cohort_data[m3_col].fillna(0).astype(int)
-
-        for _, acct in cohort_data.iterrows():
-            m1_val = acct["_m1"]
-            m3_val = acct["_m3"]
-
-            if m1_val > 0 and m3_val > 0:
-                category = "Fast Activator"
-            elif m1_val == 0 and m3_val > 0:
-                category = "Slow Burner"
-            elif m1_val > 0 and m3_val == 0:
-                category = "One and Done"
-            else:
-                category = "Never Activator"
-
-            categorized.append(
-                {
-                    "Category": category,
-                    "M1 Swipes": m1_val,
-                    "M3 Swipes": m3_val,
-                }
-            )
-
-    if not categorized:
+    if classified.empty:
         return AnalysisResult.from_df(
             "Activation Personas",
             "ICS Stat O Debit - Activation Personas",
@@ -324,7 +275,9 @@ def analyze_activation_personas(
             sheet_name="34_Personas",
         )
 
-    cat_df = pd.DataFrame(categorized)
+    cat_df = classified[["Persona", "M1 Swipes", "M3 Swipes"]].rename(
+        columns={"Persona": "Category"}
+    )
     total_accounts = len(cat_df)
 
     summary = (
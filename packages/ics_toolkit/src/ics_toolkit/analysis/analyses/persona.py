@@ -2,6 +2,7 @@
 
 from datetime import datetime
 
+import numpy as np
 import pandas as pd
 
 from ics_toolkit.analysis.analyses.base import AnalysisResult, safe_percentage, safe_ratio
@@ -10,12 +11,24 @@ from ics_toolkit.analysis.analyses.cohort import (
     _cohort_month_offset,
     _prepare_cohort_data,
 )
+from ics_toolkit.analysis.analyses.run_context import memoized
 from ics_toolkit.analysis.analyses.templates import append_grand_total_row, kpi_summary
 from ics_toolkit.analysis.utils import add_balance_tier
 from ics_toolkit.settings import AnalysisSettings as Settings
 
 PERSONA_ORDER = ["Fast Activator", "Slow Burner", "One and Done", "Never Activator"]
 
+# Account columns carried onto the classified frame when present.
+_ENRICHMENT_COLUMNS = (
+    "Branch",
+    "Source",
+    "Curr Bal",
+    "Date Opened",
+    "Total L12M Swipes",
+    "Total L12M Spend",
+    "Active in L12M",
+)
+
 
 # ---------------------------------------------------------------------------
 # Shared classifier
@@ -30,15 +43,26 @@ def _classify_accounts(
 
     Reuses cohort infrastructure. Adds: Persona, M1 Swipes, M3 Swipes,
     plus all original columns (Branch, Source, Curr Bal, L12M activity).
+
+    Computed once per analysis run and shared by every persona and
+    cohort-detail analysis -- treat the result as read-only.
     """
+    key = ("personas", settings.cohort_start, tuple(settings.last_12_months))
+    return memoized(key, ics_stat_o_debit, lambda: _classify(ics_stat_o_debit, settings))
+
+
+def _classify(ics_stat_o_debit: pd.DataFrame, settings: Settings) -> pd.DataFrame:
+    """Vectorized classification: resolve M1/M3 swipe columns per cohort, then np.select."""
     data = _prepare_cohort_data(ics_stat_o_debit, settings)
     if data.empty:
         return pd.DataFrame()
 
-    cohorts = sorted(data["Opening Month"].unique())
-    rows = []
+    positions = data.groupby("Opening Month", sort=True).indices
+    order: list[np.ndarray] = []
+    m1_parts: list[np.ndarray] = []
+    m3_parts: list[np.ndarray] = []
 
-    for cohort in cohorts:
+    for cohort, idx in positions.items():
         m1_tag = _cohort_month_offset(cohort, MILESTONE_OFFSETS["M1"])
         m3_tag = _cohort_month_offset(cohort, MILESTONE_OFFSETS["M3"])
 
@@ -50,49 +74,38 @@ def _classify_accounts(
         if m3_col not in data.columns:
             continue
 
-        cohort_data = data[data["Opening Month"] == cohort].copy()
-
-        if m1_col in cohort_data.columns:
-            cohort_data["_m1"] = cohort_data[m1_col].fillna(0).astype(int)
+        order.append(idx)
+        m3_parts.append(data[m3_col].iloc[idx].fillna(0).astype(int).to_numpy())
+        if m1_col in data.columns:
+            m1_parts.append(data[m1_col].iloc[idx].fillna(0).astype(int).to_numpy())
         else:
-            cohort_data["_m1"] = 0
-
-        cohort_data["_m3"] = cohort_data[m3_col].fillna(0).astype(int)
-
-        for _, acct in cohort_data.iterrows():
-            m1_val = acct["_m1"]
-            m3_val = acct["_m3"]
-
-            if m1_val > 0 and m3_val > 0:
-                persona = "Fast Activator"
-            elif m1_val == 0 and m3_val > 0:
-                persona = "Slow Burner"
-            elif m1_val > 0 and m3_val == 0:
-                persona = "One and Done"
-            else:
-                persona = "Never Activator"
-
-            row = {
-                "Persona": persona,
-                "M1 Swipes": m1_val,
-                "M3 Swipes": m3_val,
-                "Opening Month": cohort,
-            }
-
-            for col in ("Branch", "Source", "Curr Bal", "Date Opened"):
-                if col in acct.index:
-                    row[col] = acct[col]
-
-            for col in ("Total L12M Swipes", "Total L12M Spend", "Active in L12M"):
-                if col in acct.index:
-                    row[col] = acct[col]
+            m1_parts.append(np.zeros(len(idx), dtype=int))
 
-            rows.append(row)
-
-    if not rows:
+    if not order:
         return pd.DataFrame()
 
-    return pd.DataFrame(rows)
+    rows = np.concatenate(order)
+    m1 = np.concatenate(m1_parts)
+    m3 = np.concatenate(m3_parts)
+    persona = np.select(
+        [(m1 > 0) & (m3 > 0), (m1 == 0) & (m3 > 0), (m1 > 0) & (m3 == 0)],
+        PERSONA_ORDER[:3],
+        default=PERSONA_ORDER[3],
+    )
+
+    cohort_rows = data.iloc[rows]
+    result = pd.DataFrame(
+        {
+            "Persona": persona,
+            "M1 Swipes": m1,
+            "M3 Swipes": m3,
+            "Opening Month": cohort_rows["Opening Month"].to_numpy(),
+        }
+    )
+    for col in _ENRICHMENT_COLUMNS:
+        if col in cohort_rows.columns:
+            result[col] = cohort_rows[col].to_numpy()
+    return result
 
 
 def _persona_pivot(classified: pd.DataFrame, group_col: str) -> pd.DataFrame:
@@ -433,7 +446,8 @@ def analyze_persona_by_balance(
             sheet_name="60_Persona_Balance",
         )
 
-    classified = add_balance_tier(classified, settings)
+    # Copy: the classified frame is shared across analyses in this run
+    classified = add_balance_tier(classified.copy(), settings)
 
     if "Balance Tier" not in classified.columns:
         return AnalysisResult.from_df(
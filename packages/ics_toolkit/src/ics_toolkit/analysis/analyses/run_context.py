@@ -0,0 +1,68 @@
+"""Per-run memo shared by analyses.
+
+Analyses keep their ``(df, ics_all, ics_stat_o, ics_stat_o_debit, settings)``
+signature. ``run_all_analyses`` opens an ``analysis_run()`` so expensive
+derived frames (e.g. persona classification) are computed once per run and
+sliced by every analysis that needs them. Outside a run -- an analysis
+called directly from a notebook or test -- ``memoized`` simply computes.
+"""
+
+from collections.abc import Callable, Generator, Hashable
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class AnalysisRunContext:
+    """Derived data cached for the duration of one analysis run."""
+
+    memo: dict[Hashable, tuple[Any, Any]] = field(default_factory=dict)
+    hits: int = 0
+
+    def get_or_compute(self, key: Hashable, source: Any, compute: Callable[[], T]) -> T:
+        """Return the cached value for ``key``, computing it on first use.
+
+        ``source`` is the input object the value was derived from. The entry
+        is only reused while the same object is passed, so a different frame
+        that happens to share an ``id()`` never reads a stale value.
+        """
+        entry = self.memo.get(key)
+        if entry is not None and entry[0] is source:
+            self.hits += 1
+            return entry[1]
+        value = compute()
+        self.memo[key] = (source, value)
+        return value
+
+
+_CURRENT: ContextVar[AnalysisRunContext | None] = ContextVar("ics_analysis_run", default=None)
+
+
+def current_run_context() -> AnalysisRunContext | None:
+    """The active run context, or None outside ``analysis_run()``."""
+    return _CURRENT.get()
+
+
+@contextmanager
+def analysis_run(
+    context: AnalysisRunContext | None = None,
+) -> Generator[AnalysisRunContext, None, None]:
+    """Activate a run context for the analyses executed inside the block."""
+    context = context or AnalysisRunContext()
+    token = _CURRENT.set(context)
+    try:
+        yield context
+    finally:
+        _CURRENT.reset(token)
+
+
+def memoized(key: Hashable, source: Any, compute: Callable[[], T]) -> T:
+    """``compute()`` once per run for (key, source); uncached outside a run."""
+    context = _CURRENT.get()
+    if context is None:
+        return compute()
+    return context.get_or_compute(key, source, compute)
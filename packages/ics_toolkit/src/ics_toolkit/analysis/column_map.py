@@ -6,6 +6,7 @@ import re
 import pandas as pd
 
 from ics_toolkit.exceptions import DataError
+from shared.headers import HeaderResolver
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +59,9 @@ COLUMN_ALIASES: dict[str, str] = {
     "Debit Card": "Debit?",
 }
 
+# Aliases are matched case-sensitively after stripping; other padded headers are stripped.
+HEADERS = HeaderResolver(COLUMN_ALIASES, normalize=lambda c: str(c).strip(), strip=True)
+
 # Pattern for L12M monthly columns: e.g., "Feb24 Swipes", "Mar25 Spend"
 L12M_SWIPE_PATTERN = re.compile(r"^([A-Z][a-z]{2}\d{2})\s+Swipes$")
 L12M_SPEND_PATTERN = re.compile(r"^([A-Z][a-z]{2}\d{2})\s+Spend$")
@@ -68,17 +72,10 @@ def resolve_columns(df: pd.DataFrame) -> pd.DataFrame:
 
     Returns a new DataFrame with resolved column names.
     """
-    rename_map = {}
-    for col in df.columns:
-        col_stripped = str(col).strip()
-        if col_stripped in COLUMN_ALIASES:
-            rename_map[col] = COLUMN_ALIASES[col_stripped]
-        elif col_stripped != col:
-            rename_map[col] = col_stripped
-
-    if rename_map:
-        logger.info("Resolved column aliases: %s", rename_map)
-        df = df.rename(columns=rename_map)
+    resolution = HEADERS.resolve(df.columns)
+    if resolution.renames:
+        logger.info("Resolved column aliases: %s", resolution.describe())
+        df = resolution.apply(df)
 
     return df
 
@@ -14,6 +14,7 @@ from ics_toolkit.analysis.charts import create_charts
 from ics_toolkit.analysis.data_loader import load_data
 from ics_toolkit.analysis.utils import get_ics_accounts, get_ics_stat_o, get_ics_stat_o_debit
 from ics_toolkit.settings import AnalysisSettings as Settings
+from shared.profiling import Profiler, track, use_profiler
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +27,7 @@ class AnalysisPipelineResult:
     df: pd.DataFrame
     analyses: list[AnalysisResult] = field(default_factory=list)
     chart_pngs: dict[str, bytes] = field(default_factory=dict)
+    profile: Profiler | None = None
 
 
 def run_pipeline(
@@ -39,12 +41,32 @@ def run_pipeline(
         settings: Application configuration.
         on_progress: Optional callback(step, total, message) for UI progress.
         skip_charts: If True, skip Plotly chart creation entirely.
+
+    Step and per-analysis timings are collected in ``result.profile``.
     """
+    profiler = Profiler()
+    with use_profiler(profiler):
+        result = _run_steps(settings, on_progress, skip_charts)
+    result.profile = profiler
+    for span in profiler.slowest(5, kind="module"):
+        logger.info(
+            "Analysis %s: %.1fs wall, %.1fs CPU", span.name, span.wall_seconds, span.cpu_seconds
+        )
+    return result
+
+
+def _run_steps(
+    settings: Settings,
+    on_progress: Callable[[int, int, str], None] | None,
+    skip_charts: bool,
+) -> AnalysisPipelineResult:
     # Step 1: Load data
     logger.info("[1/5] Loading data...")
     if on_progress:
         on_progress(0, 5, "Loading data...")
-    df = load_data(settings)
+    with track("load_data", kind="step") as span:
+        df = load_data(settings)
+        span.rows = len(df)
 
     # Filter out records before data_start_date (e.g. test data)
     if settings.data_start_date:
@@ -94,10 +116,11 @@ def run_pipeline(
     logger.info("[2/5] Filtering data...")
     if on_progress:
         on_progress(1, 5, "Filtering data...")
-    ics_all = get_ics_accounts(df)
-    open_codes = settings.open_stat_codes
-    ics_stat_o = get_ics_stat_o(df, open_codes=open_codes)
-    ics_stat_o_debit = get_ics_stat_o_debit(df, open_codes=open_codes)
+    with track("filter", kind="step", rows=len(df)):
+        ics_all = get_ics_accounts(df)
+        open_codes = settings.open_stat_codes
+        ics_stat_o = get_ics_stat_o(df, open_codes=open_codes)
+        ics_stat_o_debit = get_ics_stat_o_debit(df, open_codes=open_codes)
     logger.info(
         "Filters: %d ICS total, %d stat O, %d stat O + debit",
         len(ics_all),
@@ -118,14 +141,15 @@ def run_pipeline(
         if on_progress:
             on_progress(2, 5, f"Analysis {i + 1}/{total}: {name}")
 
-    analyses = run_all_analyses(
-        df,
-        ics_all,
-        ics_stat_o,
-        ics_stat_o_debit,
-        settings,
-        on_progress=_analysis_progress,
-    )
+    with track("analyses", kind="step", rows=len(df)):
+        analyses = run_all_analyses(
+            df,
+            ics_all,
+            ics_stat_o,
+            ics_stat_o_debit,
+            settings,
+            on_progress=_analysis_progress,
+        )
     successful = [a for a in analyses if a.error is None]
     failed = [a for a in analyses if a.error is not None]
     if failed:
@@ -141,13 +165,14 @@ def run_pipeline(
         logger.info("[4/5] Rendering charts...")
         if on_progress:
             on_progress(3, 5, "Rendering charts...")
-        try:
-            chart_pngs = create_charts(
-                analyses, settings, on_progress=on_progress,
-            )
-            logger.info("Rendered %d chart PNGs", len(chart_pngs))
-        except Exception as e:
-            logger.error("Chart rendering failed: %s", e, exc_info=True)
+        with track("charts", kind="step"):
+            try:
+                chart_pngs = create_charts(
+                    analyses, settings, on_progress=on_progress,
+                )
+                logger.info("Rendered %d chart PNGs", len(chart_pngs))
+            except Exception as e:
+                logger.error("Chart rendering failed: %s", e, exc_info=True)
 
     return AnalysisPipelineResult(
         settings=settings,
@@ -224,4 +249,10 @@ def export_outputs(
         except Exception as e:
             logger.error("PowerPoint report failed: %s", e, exc_info=True)
 
+    if result.profile is not None:
+        try:
+            result.profile.merge_into(settings.output_dir / f"{client_id}_ICS_run_report.json")
+        except OSError as e:
+            logger.warning("Run report failed: %s", e)
+
     return generated
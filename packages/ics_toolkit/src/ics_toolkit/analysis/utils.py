@@ -3,9 +3,11 @@
 import logging
 from datetime import datetime
 
+import numpy as np
 import pandas as pd
 
 from ics_toolkit.settings import AnalysisSettings as Settings
+from shared.timeseries import TimeSeriesBlock
 
 logger = logging.getLogger(__name__)
 
@@ -47,16 +49,16 @@ def get_open_accounts(df: pd.DataFrame, open_codes: list[str] | None = None) ->
 
 def add_l12m_activity(df: pd.DataFrame, last_12_months: list[str]) -> pd.DataFrame:
     """Add Total L12M Swipes, Total L12M Spend, and Active in L12M columns."""
-    swipe_cols = [f"{tag} Swipes" for tag in last_12_months if f"{tag} Swipes" in df.columns]
-    spend_cols = [f"{tag} Spend" for tag in last_12_months if f"{tag} Spend" in df.columns]
+    swipes = TimeSeriesBlock.from_frame(df, "swipes", dtype=np.float64).select(last_12_months)
+    spend = TimeSeriesBlock.from_frame(df, "spend", dtype=np.float64).select(last_12_months)
 
-    if swipe_cols:
-        df["Total L12M Swipes"] = df[swipe_cols].sum(axis=1).astype(int)
+    if swipes.n_months:
+        df["Total L12M Swipes"] = swipes.sum().astype(int)
     else:
         df["Total L12M Swipes"] = 0
 
-    if spend_cols:
-        df["Total L12M Spend"] = df[spend_cols].sum(axis=1)
+    if spend.n_months:
+        df["Total L12M Spend"] = spend.sum()
     else:
         df["Total L12M Spend"] = 0.0
 
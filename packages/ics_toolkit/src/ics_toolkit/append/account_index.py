@@ -0,0 +1,171 @@
+"""Persistent per-client ICS account index.
+
+Each client folder keeps one table of every ICS account seen so far, keyed by
+normalized hash, with REF/DM source flags and the month the account first
+appeared. ``run_merge`` folds the rows of each month's merge that the index
+does not reflect yet into it, so ``run_match`` can join a month's ODD
+against the accounts known by that month directly instead of re-reading and
+re-normalizing merged workbooks.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from ics_toolkit.append.normalizer import normalize_series
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = "ics_account_index.csv"
+INDEX_COLUMNS = ["Norm Hash", "Acct Hash", "REF", "DM", "First Seen"]
+
+
+def index_path(client_dir: Path) -> Path:
+    """Location of a client's account index."""
+    return client_dir / INDEX_FILENAME
+
+
+def load_index(path: Path) -> pd.DataFrame | None:
+    """Read an index written by ``save_index``; None if it does not exist."""
+    if not path.exists():
+        return None
+    df = pd.read_csv(path, dtype=str, keep_default_na=False)
+    missing = [c for c in INDEX_COLUMNS if c not in df.columns]
+    if missing:
+        raise ValueError(f"{path.name} is not an ICS account index (missing {missing})")
+    df["REF"] = df["REF"] == "True"
+    df["DM"] = df["DM"] == "True"
+    return df[INDEX_COLUMNS]
+
+
+def save_index(index: pd.DataFrame, path: Path) -> None:
+    """Write the index atomically next to the client's merged files."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    index[INDEX_COLUMNS].to_csv(tmp_path, index=False)
+    os.replace(tmp_path, path)
+
+
+def _incoming(merged_df: pd.DataFrame, month: str) -> pd.DataFrame:
+    """One month's merged accounts (``Acct Hash``/``Source``) in index layout."""
+    incoming = pd.DataFrame(
+        {
+            "Norm Hash": normalize_series(merged_df["Acct Hash"]),
+            "Acct Hash": merged_df["Acct Hash"].astype(str),
+            "REF": merged_df["Source"].isin(["REF", "Both"]).to_numpy(),
+            "DM": merged_df["Source"].isin(["DM", "Both"]).to_numpy(),
+            "First Seen": month,
+        }
+    )
+    incoming = incoming[incoming["Norm Hash"] != ""]
+    return incoming.drop_duplicates("Norm Hash").reset_index(drop=True)
+
+
+def new_rows(index: pd.DataFrame | None, merged_df: pd.DataFrame, month: str) -> pd.DataFrame:
+    """Rows of ``merged_df`` (in index layout) that ``index`` does not reflect yet.
+
+    A row is new if its hash is unknown, it adds a REF/DM flag, or ``month``
+    is earlier than the hash's First Seen (a backfilled month).
+    """
+    incoming = _incoming(merged_df, month)
+    if index is None:
+        return incoming
+    pos = pd.Index(index["Norm Hash"]).get_indexer(incoming["Norm Hash"])
+    known = pos >= 0
+    kpos = pos[known]
+    changed = np.ones(len(incoming), dtype=bool)
+    changed[known] = (
+        (incoming["REF"].to_numpy()[known] & ~index["REF"].to_numpy()[kpos])
+        | (incoming["DM"].to_numpy()[known] & ~index["DM"].to_numpy()[kpos])
+        | (month < index["First Seen"].to_numpy()[kpos])
+    )
+    return incoming[changed].reset_index(drop=True)
+
+
+def update_index(
+    index: pd.DataFrame | None,
+    merged_df: pd.DataFrame,
+    month: str,
+) -> pd.DataFrame:
+    """Fold one month's merged accounts (``Acct Hash``/``Source``) into ``index``.
+
+    New hashes are appended with ``First Seen = month``; known hashes gain
+    any new source flag and keep the earliest month. Re-applying the same
+    month is a no-op, so re-running a merge never double counts.
+    """
+    return _apply(index, new_rows(index, merged_df, month))
+
+
+def _apply(index: pd.DataFrame | None, fresh: pd.DataFrame) -> pd.DataFrame:
+    """Apply ``new_rows`` output to ``index`` without regrouping the whole table."""
+    if index is None:
+        return fresh[INDEX_COLUMNS]
+    if fresh.empty:
+        return index
+
+    pos = pd.Index(index["Norm Hash"]).get_indexer(fresh["Norm Hash"])
+    known = pos >= 0
+    kpos = pos[known]
+    ref = index["REF"].to_numpy(copy=True)
+    dm = index["DM"].to_numpy(copy=True)
+    first_seen = index["First Seen"].to_numpy(dtype=object, copy=True)
+    ref[kpos] |= fresh["REF"].to_numpy()[known]
+    dm[kpos] |= fresh["DM"].to_numpy()[known]
+    months = fresh["First Seen"].to_numpy(dtype=object)[known]
+    first_seen[kpos] = np.where(months < first_seen[kpos], months, first_seen[kpos])
+
+    updated = index.assign(REF=ref, DM=dm, **{"First Seen": first_seen})
+    added = fresh[~known]
+    if not added.empty:
+        updated = pd.concat([updated, added[INDEX_COLUMNS]], ignore_index=True)
+    return updated[INDEX_COLUMNS]
+
+
+def index_as_of(index: pd.DataFrame, month: str) -> pd.DataFrame:
+    """Accounts already known in ``month`` (``First Seen`` <= month).
+
+    Re-matching a past month must not count accounts that only appeared in
+    later months' REF/DM files.
+    """
+    return index[index["First Seen"] <= month]
+
+
+def index_sources(index: pd.DataFrame) -> pd.Series:
+    """Source label per indexed account: "REF", "DM" or "Both"."""
+    return pd.Series(
+        np.select(
+            [index["REF"] & index["DM"], index["REF"], index["DM"]],
+            ["Both", "REF", "DM"],
+            default="",
+        ),
+        index=index.index,
+    )
+
+
+def record_month(client_dir: Path, merged_df: pd.DataFrame, month: str) -> pd.DataFrame:
+    """Fold the rows of ``merged_df`` the client's index lacks into it.
+
+    ``merged_df`` is the full re-merge of the client's REF/DM files; only
+    its ``new_rows`` are applied, and the file is rewritten only when there
+    are any.
+    """
+    path = index_path(client_dir)
+    index = load_index(path)
+    fresh = new_rows(index, merged_df, month)
+    if index is not None and fresh.empty:
+        logger.info("%s: account index up to date (%d accounts)", client_dir.name, len(index))
+        return index
+    index = _apply(index, fresh)
+    save_index(index, path)
+    logger.info(
+        "%s: account index folded %d new rows, now holds %d accounts",
+        client_dir.name,
+        len(fresh),
+        len(index),
+    )
+    return index
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import logging
+import re
+from functools import lru_cache
 from pathlib import Path
 
 import pandas as pd
@@ -10,6 +12,7 @@ import pandas as pd
 logger = logging.getLogger(__name__)
 
 ACCOUNT_KEYWORDS = ("acct", "account", "hash", "id", "number")
+_ACCOUNT_NAME = re.compile("|".join(re.escape(kw) for kw in ACCOUNT_KEYWORDS))
 
 
 def detect_file_by_keywords(
@@ -118,12 +121,10 @@ def extract_account_column_by_inference(
             continue
 
         # Prefer columns with account-related names
-        for col in df.columns:
-            cname = str(col).strip().lower()
-            if any(kw in cname for kw in ACCOUNT_KEYWORDS):
-                series = df[col].dropna().astype(str)
-                if not series.empty:
-                    return series
+        for col in _account_name_columns(tuple(df.columns)):
+            series = df[col].dropna().astype(str)
+            if not series.empty:
+                return series
 
         # Fallback: first column with values that look like hashes/IDs
         for col in df.columns:
@@ -157,6 +158,12 @@ def extract_accounts(
     return extract_account_column_by_inference(file_path, hash_min_length)
 
 
+@lru_cache(maxsize=256)
+def _account_name_columns(columns: tuple) -> tuple:
+    """Columns whose names suggest an account field, in order (memoized per header)."""
+    return tuple(c for c in columns if _ACCOUNT_NAME.search(str(c).strip().lower()))
+
+
 def _letter_to_index(letter: str) -> int:
     """Convert a column letter (A-Z) to a 0-based index."""
     return ord(letter.upper()) - ord("A")
@@ -8,9 +8,11 @@ from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
-from ics_toolkit.append.normalizer import normalize_hash, normalize_series
+from ics_toolkit.append.account_index import index_sources
+from ics_toolkit.append.normalizer import normalize_series
 
 logger = logging.getLogger(__name__)
 
@@ -66,7 +68,8 @@ def match_and_annotate(
 ) -> tuple[pd.DataFrame, dict[str, int]]:
     """Match ICS accounts against ODD and append columns.
 
-    Uses pd.merge for vectorized matching.
+    Both sides are normalized with ``normalize_series`` and joined on the
+    normalized hash.
 
     Returns:
         Annotated ODD DataFrame with:
@@ -74,37 +77,51 @@ def match_and_annotate(
         - "ICS Source": "REF" / "DM" / "Both" / ""
         And a stats dict with match counts.
     """
-    # Normalize both sides for matching
-    odd_work = odd_df.copy()
-    odd_work["_norm_acct"] = normalize_series(odd_work[acct_column])
-
-    ics_lookup = merged_df[["Acct Hash", "Source"]].copy()
-    ics_lookup = ics_lookup.rename(columns={"Source": "_ics_source"})
-    ics_lookup["_norm_acct"] = ics_lookup["Acct Hash"].apply(normalize_hash)
-    ics_lookup = ics_lookup.drop_duplicates(subset=["_norm_acct"], keep="first")
-
-    # Left merge: all ODD rows preserved, matched rows get _ics_source
-    merged = odd_work.merge(
-        ics_lookup[["_norm_acct", "_ics_source"]],
-        on="_norm_acct",
-        how="left",
+    lookup = pd.Series(
+        merged_df["Source"].to_numpy(),
+        index=normalize_series(merged_df["Acct Hash"]).to_numpy(),
     )
+    return _annotate(odd_df, lookup, acct_column)
 
-    # Create ICS Account and ICS Source columns
-    merged["ICS Account"] = merged["_ics_source"].notna().map({True: "Yes", False: "No"})
-    merged["ICS Source"] = merged["_ics_source"].fillna("")
 
-    # Count stats
-    matched = (merged["ICS Account"] == "Yes").sum()
-    ref_count = (merged["ICS Source"] == "REF").sum()
-    dm_count = (merged["ICS Source"] == "DM").sum()
-    both_count = (merged["ICS Source"] == "Both").sum()
+def match_against_index(
+    odd_df: pd.DataFrame,
+    index: pd.DataFrame,
+    acct_column: str = "Acct Number",
+) -> tuple[pd.DataFrame, dict[str, int]]:
+    """Match an ODD against a client's account index (see ``account_index``).
+
+    Same output as ``match_and_annotate``; the index is already keyed by
+    normalized hash, so only the ODD side is normalized.
+    """
+    lookup = pd.Series(index_sources(index).to_numpy(), index=index["Norm Hash"].to_numpy())
+    return _annotate(odd_df, lookup, acct_column)
+
 
-    # Clean up temp columns
-    result = merged.drop(columns=["_norm_acct", "_ics_source"])
+def _annotate(
+    odd_df: pd.DataFrame,
+    lookup: pd.Series,
+    acct_column: str,
+) -> tuple[pd.DataFrame, dict[str, int]]:
+    """Hash-join ODD accounts against ``lookup`` (normalized hash -> source)."""
+    # First occurrence wins; blank hashes never match
+    lookup = lookup[(lookup.index != "") & ~lookup.index.duplicated(keep="first")]
+
+    sources = normalize_series(odd_df[acct_column]).map(lookup)
+    matched_mask = sources.notna().to_numpy()
+
+    result = odd_df.reset_index(drop=True)
+    result["ICS Account"] = np.where(matched_mask, "Yes", "No")
+    result["ICS Source"] = sources.fillna("").to_numpy()
+
+    # Count stats
+    matched = int(matched_mask.sum())
+    ref_count = (result["ICS Source"] == "REF").sum()
+    dm_count = (result["ICS Source"] == "DM").sum()
+    both_count = (result["ICS Source"] == "Both").sum()
 
     stats = {
-        "matched": int(matched),
+        "matched": matched,
         "unmatched": int(len(result) - matched),
         "ref_match_count": int(ref_count),
         "dm_match_count": int(dm_count),
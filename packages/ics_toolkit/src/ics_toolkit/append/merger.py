@@ -9,7 +9,7 @@ from pathlib import Path
 import pandas as pd
 
 from ics_toolkit.append.column_detect import detect_file_by_keywords, extract_accounts
-from ics_toolkit.append.normalizer import normalize_hash
+from ics_toolkit.append.normalizer import normalize_series
 from ics_toolkit.settings import AppendSettings as Settings
 
 logger = logging.getLogger(__name__)
@@ -52,7 +52,7 @@ def merge_sources(
         return pd.DataFrame(columns=["Acct Hash", "Source"])
 
     df = pd.concat(parts, ignore_index=True)
-    df["_norm"] = df["Acct Hash"].apply(normalize_hash)
+    df["_norm"] = normalize_series(df["Acct Hash"])
 
     # Drop empty normalized hashes, then deduplicate
     df = df[df["_norm"].astype(bool)]
@@ -28,7 +28,9 @@ def normalize_hash(value: str | None) -> str:
 
 
 def normalize_series(series: pd.Series) -> pd.Series:
-    """Vectorized hash normalization for a pandas Series."""
+    """Vectorized hash normalization for a pandas Series.
 
-    s = series.astype(str).str.strip()
-    return s.str.replace(_NON_ALNUM, "", regex=True)
+    Same rules as ``normalize_hash``; missing values (None/NaN) become "".
+    """
+    s = series.astype(str).str.replace(_NON_ALNUM, "", regex=True)
+    return s.mask(series.isna(), "")
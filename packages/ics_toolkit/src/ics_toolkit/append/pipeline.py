@@ -6,15 +6,24 @@ import logging
 import os
 import tempfile
 from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 
 import pandas as pd
 
+from ics_toolkit.append.account_index import (
+    INDEX_FILENAME,
+    index_as_of,
+    index_path,
+    load_index,
+    record_month,
+)
 from ics_toolkit.append.matcher import (
     MatchMetadata,
     build_match_metadata,
+    match_against_index,
     match_and_annotate,
     read_odd_file,
     write_metadata_json,
@@ -27,6 +36,10 @@ from ics_toolkit.settings import AppendSettings as Settings
 
 logger = logging.getLogger(__name__)
 
+ANNOTATED_SUFFIX = "_annotated"
+ICS_COLUMNS_SUFFIX = "_ics_columns"
+ICS_COLUMNS = ("ICS Account", "ICS Source")
+
 
 @dataclass
 class PipelineResult:
@@ -92,15 +105,36 @@ def run_merge(
 
             logger.info("%s: Wrote merged file with %d rows", cid, result.total)
 
+            if settings.account_index:
+                record_month(client_dir, result.merged_df, month)
+
     return results
 
 
+@dataclass(frozen=True)
+class _MatchJob:
+    """One client's inputs for the match step (picklable for worker processes)."""
+
+    client_id: str
+    month: str
+    client_dir: Path
+    odd_path: Path
+    merged_path: Path  # merged ICS workbook, or the client's account index
+    ref_file: str = ""
+    dm_file: str = ""
+
+
 def run_match(
     settings: Settings,
     merge_results: list[MergeResult] | None = None,
     on_progress: Callable[[str, str], None] | None = None,
 ) -> list[MatchMetadata]:
-    """Step 3: Match ICS accounts against ODD files."""
+    """Step 3: Match ICS accounts against ODD files.
+
+    Clients are independent, so with ``settings.match_workers > 1`` they are
+    matched in a process pool. Metadata is returned in client-folder order
+    either way.
+    """
     if settings.ars_dir is None:
         logger.info("Step 3: Skipped (no ars_dir configured)")
         return []
@@ -114,9 +148,9 @@ def run_match(
         logger.warning("ARS month directory not found: %s", month_dir)
         return []
 
-    metadata_list: list[MatchMetadata] = []
     merge_lookup = {r.client_id: r for r in (merge_results or [])}
 
+    jobs: list[_MatchJob] = []
     for client_dir in sorted(month_dir.iterdir()):
         if not client_dir.is_dir():
             continue
@@ -124,9 +158,6 @@ def run_match(
         if not (cid.isdigit() and len(cid) == 4):
             continue
 
-        if on_progress:
-            on_progress(cid, f"Matching {cid}")
-
         # Find ODD file
         odd_files = [
             f
@@ -134,6 +165,7 @@ def run_match(
             if f.is_file()
             and "odd" in f.name.lower()
             and f.suffix.lower() in (".xlsx", ".xls", ".csv")
+            and not _is_match_output(f)
         ]
         if not odd_files:
             logger.info("%s %s: No ODD file found", month, cid)
@@ -141,8 +173,12 @@ def run_match(
 
         odd_path = odd_files[0]
 
-        # Find merged ICS file
-        merged_path = _find_merged_file(settings.base_dir / cid, cid, month)
+        # Find the client's account index, else its merged ICS file
+        ics_dir = settings.base_dir / cid
+        if settings.account_index and index_path(ics_dir).exists():
+            merged_path = index_path(ics_dir)
+        else:
+            merged_path = _find_merged_file(ics_dir, cid, month)
         if merged_path is None:
             logger.info("%s %s: No merged ICS file found", month, cid)
             continue
@@ -151,63 +187,170 @@ def run_match(
             logger.info("DRY-RUN: Would match %s against %s", odd_path.name, merged_path.name)
             continue
 
-        try:
-            # Validate ODD
-            odd_df, acct_col = read_odd_file(odd_path)
-            odd_report = validate_odd_file(odd_df, acct_col)
-            if not odd_report.is_valid:
-                logger.error("%s %s: ODD validation failed: %s", month, cid, odd_report.summary)
-                continue
-
-            # Read merged ICS
-            merged_df = pd.read_excel(merged_path, dtype=str)
-
-            # Match and annotate
-            annotated_df, stats = match_and_annotate(odd_df, merged_df, acct_col)
-
-            # Validate output
-            out_report = validate_annotated_output(annotated_df)
-            if not out_report.is_valid:
-                logger.error("%s %s: Output validation failed: %s", month, cid, out_report.summary)
-
-            # Build metadata
-            merge_result = merge_lookup.get(cid)
-            meta = build_match_metadata(
+        merge_result = merge_lookup.get(cid)
+        jobs.append(
+            _MatchJob(
                 client_id=cid,
-                stats=stats,
-                total_odd_rows=len(odd_df),
-                merged_count=len(merged_df),
+                month=month,
+                client_dir=client_dir,
+                odd_path=odd_path,
+                merged_path=merged_path,
                 ref_file=merge_result.ref_file if merge_result else "",
                 dm_file=merge_result.dm_file if merge_result else "",
-                odd_file=odd_path.name,
             )
+        )
+
+    workers = min(settings.match_workers, len(jobs))
+    if workers <= 1:
+        metadata_list: list[MatchMetadata] = []
+        for job in jobs:
+            if on_progress:
+                on_progress(job.client_id, f"Matching {job.client_id}")
+            try:
+                meta = _match_client(job, settings)
+            except Exception as e:
+                logger.error("%s %s: Match failed: %s", month, job.client_id, e)
+                continue
+            if meta is not None:
+                metadata_list.append(meta)
+        return metadata_list
+
+    logger.info("Matching %d clients with %d workers", len(jobs), workers)
+    results: dict[str, MatchMetadata] = {}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(_match_client, job, settings): job for job in jobs}
+        for future in as_completed(futures):
+            job = futures[future]
+            if on_progress:
+                on_progress(job.client_id, f"Matched {job.client_id}")
+            try:
+                meta = future.result()
+            except Exception as e:
+                logger.error("%s %s: Match failed: %s", month, job.client_id, e)
+                continue
+            if meta is not None:
+                results[job.client_id] = meta
 
-            # Warn on low match rate
-            if meta.match_rate < settings.match_rate_warn_threshold:
-                logger.warning(
-                    "%s %s: Low match rate %.1f%% (threshold: %.0f%%)",
-                    month,
-                    cid,
-                    meta.match_rate * 100,
-                    settings.match_rate_warn_threshold * 100,
-                )
+    return [results[job.client_id] for job in jobs if job.client_id in results]
 
-            logger.info("%s %s: %s", month, cid, meta.summary)
 
-            # Write outputs
-            out_name = odd_path.stem + "_annotated.xlsx"
-            out_path = client_dir / out_name
-            _atomic_write_excel(annotated_df, out_path)
+def _match_client(job: _MatchJob, settings: Settings) -> MatchMetadata | None:
+    """Match one client's ODD file and write its outputs.
 
-            json_path = client_dir / f"{cid}_match_metadata.json"
-            write_metadata_json(meta, json_path)
+    Returns None when the ODD file fails validation. Runs in a worker
+    process when ``match_workers > 1``.
+    """
+    month, cid = job.month, job.client_id
 
-            metadata_list.append(meta)
+    # Validate ODD
+    odd_df, acct_col = read_odd_file(job.odd_path)
+    odd_report = validate_odd_file(odd_df, acct_col)
+    if not odd_report.is_valid:
+        logger.error("%s %s: ODD validation failed: %s", month, cid, odd_report.summary)
+        return None
+
+    if job.merged_path.name == INDEX_FILENAME:
+        # Already normalized and deduplicated: a single hash-join against
+        # the accounts known by the month being matched
+        index = index_as_of(load_index(job.merged_path), month)
+        annotated_df, stats = match_against_index(odd_df, index, acct_col)
+        merged_count = len(index)
+    else:
+        # Read merged ICS -- only the two columns matching needs
+        merged_df = pd.read_excel(job.merged_path, dtype=str, usecols=["Acct Hash", "Source"])
+        annotated_df, stats = match_and_annotate(odd_df, merged_df, acct_col)
+        merged_count = len(merged_df)
+
+    # Validate output
+    out_report = validate_annotated_output(annotated_df)
+    if not out_report.is_valid:
+        logger.error("%s %s: Output validation failed: %s", month, cid, out_report.summary)
+
+    # Build metadata
+    meta = build_match_metadata(
+        client_id=cid,
+        stats=stats,
+        total_odd_rows=len(odd_df),
+        merged_count=merged_count,
+        ref_file=job.ref_file,
+        dm_file=job.dm_file,
+        odd_file=job.odd_path.name,
+    )
+
+    # Warn on low match rate
+    if meta.match_rate < settings.match_rate_warn_threshold:
+        logger.warning(
+            "%s %s: Low match rate %.1f%% (threshold: %.0f%%)",
+            month,
+            cid,
+            meta.match_rate * 100,
+            settings.match_rate_warn_threshold * 100,
+        )
+
+    logger.info("%s %s: %s", month, cid, meta.summary)
+
+    # Write outputs
+    write_match_output(annotated_df, job.odd_path, acct_col, settings.match_output)
+
+    json_path = job.client_dir / f"{cid}_match_metadata.json"
+    write_metadata_json(meta, json_path)
+
+    return meta
+
+
+def write_match_output(
+    annotated_df: pd.DataFrame,
+    odd_path: Path,
+    acct_column: str,
+    output: str = "xlsx",
+) -> Path:
+    """Write the annotated ODD next to ``odd_path`` in the requested format.
+
+    ``xlsx`` re-serializes the whole annotated ODD workbook (the historical
+    output); ``parquet`` and ``csv`` write the same table without openpyxl;
+    ``columns`` writes only the account key and the ICS columns, for
+    consumers that join them back onto the ODD they already have.
+    """
+    stem = odd_path.parent / f"{odd_path.stem}{ANNOTATED_SUFFIX}"
+
+    if output == "xlsx":
+        out_path = stem.with_suffix(".xlsx")
+        _atomic_write_excel(annotated_df, out_path)
+    elif output == "parquet":
+        out_path = stem.with_suffix(".parquet")
+        _atomic_write(out_path, lambda tmp: _to_parquet(annotated_df, tmp))
+    elif output == "csv":
+        out_path = stem.with_suffix(".csv")
+        _atomic_write(out_path, lambda tmp: annotated_df.to_csv(tmp, index=False))
+    elif output == "columns":
+        out_path = odd_path.parent / f"{odd_path.stem}{ICS_COLUMNS_SUFFIX}.csv"
+        columns = annotated_df[[acct_column, *ICS_COLUMNS]]
+        _atomic_write(out_path, lambda tmp: columns.to_csv(tmp, index=False))
+    else:
+        raise ValueError(f"Unknown match output format: {output}")
+
+    return out_path
+
+
+def _to_parquet(df: pd.DataFrame, path: str) -> None:
+    """Write ``df`` as Parquet; mixed-type object columns are stored as strings."""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError as e:
+        raise ImportError(
+            "Parquet output requires the 'pyarrow' package. Install it with: pip install pyarrow"
+        ) from e
+
+    obj_cols = df.select_dtypes(include="object").columns
+    if len(obj_cols):
+        df = df.astype({c: "string" for c in obj_cols})
+    df.to_parquet(path, index=False)
 
-        except Exception as e:
-            logger.error("%s %s: Match failed: %s", month, cid, e)
 
-    return metadata_list
+def _is_match_output(path: Path) -> bool:
+    """True for files run_match itself wrote next to the ODD."""
+    stem = path.stem.lower()
+    return stem.endswith(ANNOTATED_SUFFIX) or stem.endswith(ICS_COLUMNS_SUFFIX)
 
 
 def run_pipeline(
@@ -276,11 +419,16 @@ def _find_merged_file(client_dir: Path, client_id: str, month: str) -> Path | No
 
 def _atomic_write_excel(df: pd.DataFrame, output_path: Path) -> None:
     """Write DataFrame to Excel using atomic write pattern."""
+    _atomic_write(output_path, lambda tmp: df.to_excel(tmp, index=False))
+
+
+def _atomic_write(output_path: Path, write: Callable[[str], object]) -> None:
+    """Call ``write`` on a temp file beside ``output_path``, then move it into place."""
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    fd, tmp_path = tempfile.mkstemp(suffix=".xlsx", dir=str(output_path.parent))
+    fd, tmp_path = tempfile.mkstemp(suffix=output_path.suffix, dir=str(output_path.parent))
     try:
         os.close(fd)
-        df.to_excel(tmp_path, index=False)
+        write(tmp_path)
         os.replace(tmp_path, str(output_path))
     except Exception:
         try:
@@ -59,6 +59,14 @@ def append_callback(
     ars_dir: Path | None = typer.Option(None, "--ars-dir", help="ARS directory with ODD files"),
     dry_run: bool | None = typer.Option(None, "--dry-run", "-n", help="Preview without changes"),
     match_month: str | None = typer.Option(None, "--match-month", "-m", help="Month (YYYY.MM)"),
+    workers: int | None = typer.Option(
+        None, "--workers", "-w", help="Clients matched in parallel (default 1)"
+    ),
+    output_format: str | None = typer.Option(
+        None,
+        "--output-format",
+        help="Annotated ODD output: xlsx, parquet, csv, or columns (ICS columns only)",
+    ),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Debug logging"),
 ) -> None:
     """ICS Append -- organize, merge, match."""
@@ -69,6 +77,8 @@ def append_callback(
     ctx.obj["ars_dir"] = ars_dir
     ctx.obj["dry_run"] = dry_run
     ctx.obj["match_month"] = match_month
+    ctx.obj["match_workers"] = workers
+    ctx.obj["match_output"] = output_format
 
 
 def _build_append_settings(ctx: typer.Context):
@@ -76,7 +86,7 @@ def _build_append_settings(ctx: typer.Context):
     from ics_toolkit.settings import AppendSettings
 
     overrides: dict = {}
-    for key in ("base_dir", "ars_dir", "dry_run", "match_month"):
+    for key in ("base_dir", "ars_dir", "dry_run", "match_month", "match_workers", "match_output"):
         val = ctx.obj.get(key)
         if val is not None:
             overrides[key] = val
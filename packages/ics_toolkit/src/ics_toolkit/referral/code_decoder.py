@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import numpy as np
 import pandas as pd
 
 if TYPE_CHECKING:
@@ -25,35 +26,65 @@ _TYPE_RELIABILITY_MAP = {
     "Exception": "Low",
 }
 
+# Trie key marking the end of a configured prefix
+_END = None
+
 
 def decode_referral_codes(df: pd.DataFrame, settings: ReferralSettings) -> pd.DataFrame:
     """Decode referral codes into channel, type, and reliability tags.
 
+    Each distinct code is classified once and the result mapped back, so
+    cost follows the number of distinct codes rather than rows.
+
     Added columns: Referral Channel, Referral Type, Referral Reliability
     """
     df = df.copy()
-    sorted_prefixes = sorted(settings.code_prefix_map.keys(), key=len, reverse=True)
+    trie = PrefixTrie(settings.code_prefix_map)
+
+    positions, uniques = pd.factorize(df["Referral Code"])
+    channels = [_classify_channel(code, trie) for code in uniques]
+    channels.append("MANUAL")  # position -1: missing code
+    df["Referral Channel"] = np.asarray(channels, dtype=object)[positions]
 
-    df["Referral Channel"] = df["Referral Code"].apply(
-        lambda c: _classify_channel(c, sorted_prefixes, settings.code_prefix_map)
-    )
     df["Referral Type"] = df["Referral Channel"].map(_CHANNEL_TYPE_MAP).fillna("Exception")
     df["Referral Reliability"] = df["Referral Type"].map(_TYPE_RELIABILITY_MAP)
     return df
 
 
-def _classify_channel(
-    code: object,
-    sorted_prefixes: list[str],
-    prefix_map: dict[str, str],
-) -> str:
+class PrefixTrie:
+    """Case-insensitive longest-prefix lookup over ``{prefix: channel}``.
+
+    When two prefixes differ only in case, the first one configured wins.
+    """
+
+    def __init__(self, prefix_map: dict[str, str]) -> None:
+        self._root: dict = {}
+        for prefix, channel in prefix_map.items():
+            node = self._root
+            for char in prefix.upper():
+                node = node.setdefault(char, {})
+            node.setdefault(_END, channel)
+
+    def longest(self, text: str) -> str | None:
+        """Channel of the longest configured prefix of ``text`` (uppercase), or None."""
+        node = self._root
+        found = node.get(_END)
+        for char in text:
+            node = node.get(char)
+            if node is None:
+                break
+            found = node.get(_END, found)
+        return found
+
+
+def _classify_channel(code: object, trie: PrefixTrie) -> str:
     """Classify a single referral code into a channel."""
     if pd.isna(code) or str(code).strip() in ("", "None", "none", "NONE"):
         return "MANUAL"
     code_str = str(code).strip().upper()
-    for prefix in sorted_prefixes:
-        if code_str.startswith(prefix.upper()):
-            return prefix_map[prefix]
+    channel = trie.longest(code_str)
+    if channel is not None:
+        return channel
     if "EMAIL" in code_str:
         return "EMAIL"
     return "OTHER"
@@ -1,5 +1,7 @@
 """Required columns and aliases for referral data files."""
 
+from shared.headers import HeaderResolver
+
 REQUIRED_COLUMNS = [
     "Referrer Name",
     "Issue Date",
@@ -38,3 +40,6 @@ COLUMN_ALIASES: dict[str, str] = {
     "cert id": "Cert ID",
     "certificate_id": "Cert ID",
 }
+
+# Canonical columns already present win over their aliases.
+HEADERS = HeaderResolver(COLUMN_ALIASES, required=REQUIRED_COLUMNS, keep_existing=True)
@@ -9,7 +9,7 @@ from typing import TYPE_CHECKING
 import pandas as pd
 
 from ics_toolkit.exceptions import DataError
-from ics_toolkit.referral.column_map import COLUMN_ALIASES, REQUIRED_COLUMNS
+from ics_toolkit.referral.column_map import HEADERS, REQUIRED_COLUMNS
 
 if TYPE_CHECKING:
     from ics_toolkit.settings import ReferralSettings
@@ -66,16 +66,10 @@ def _read_file(path: Path, header_row: int = 0) -> pd.DataFrame:
 
 def _resolve_aliases(df: pd.DataFrame) -> pd.DataFrame:
     """Map alternative column names to canonical names."""
-    rename_map: dict[str, str] = {}
-    for col in df.columns:
-        lower = col.strip().lower().replace("-", "_")
-        if col not in REQUIRED_COLUMNS and lower in COLUMN_ALIASES:
-            canonical = COLUMN_ALIASES[lower]
-            if canonical not in df.columns:
-                rename_map[col] = canonical
-    if rename_map:
-        logger.debug("Column aliases resolved: %s", rename_map)
-        df = df.rename(columns=rename_map)
+    resolution = HEADERS.resolve(df.columns)
+    if resolution.renames:
+        logger.debug("Column aliases resolved: %s", resolution.describe())
+        df = resolution.apply(df)
     return df
 
 
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import re
 from typing import TYPE_CHECKING
 
 import pandas as pd
@@ -43,23 +42,19 @@ def _normalize_name(
 ) -> pd.Series:
     """Strip, uppercase, collapse whitespace, apply alias table."""
     normalized = series.fillna(null_sentinel).astype(str).str.strip().str.upper()
-    normalized = normalized.apply(lambda n: re.sub(r"\s+", " ", n))
+    normalized = normalized.str.replace(r"\s+", " ", regex=True)
     normalized = normalized.replace("", null_sentinel)
     if aliases:
         upper_aliases = {k.upper(): v.upper() for k, v in aliases.items()}
-        normalized = normalized.map(lambda n: upper_aliases.get(n, n))
+        normalized = normalized.map(upper_aliases).fillna(normalized)
     return normalized
 
 
 def _extract_surname(series: pd.Series) -> pd.Series:
     """Extract surname from full name, skipping common suffixes."""
-
-    def _surname(name: str) -> str:
-        parts = name.split()
-        if len(parts) <= 1:
-            return name
-        if parts[-1] in SUFFIXES and len(parts) > 2:
-            return parts[-2]
-        return parts[-1]
-
-    return series.apply(_surname)
+    parts = series.str.split()
+    n_parts = parts.str.len()
+    last = parts.str[-1]
+    # "JOHN SMITH JR" -> SMITH, but a two-word "SMITH JR" keeps JR
+    surname = last.mask(last.isin(SUFFIXES) & (n_parts > 2), parts.str[-2])
+    return surname.where(n_parts > 1, series)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from dataclasses import replace
 from pathlib import Path
 
 from shared.context import PipelineContext
@@ -47,6 +48,38 @@ def run_ics(ctx: PipelineContext) -> dict[str, SharedResult]:
     return _convert_results(result.analyses)
 
 
+def run_ics_referral(ctx: PipelineContext) -> dict[str, SharedResult]:
+    """Run the Referral Intelligence pipeline via PipelineContext bridge.
+
+    Expects ctx.input_files to contain a 'referral' key pointing to the
+    referral data file. Failed analyses are kept (with ``error`` set) so
+    callers can report them; ``metadata["has_chart"]`` marks charted ones.
+    """
+    from ics_toolkit.referral.pipeline import export_outputs, run_pipeline
+    from ics_toolkit.settings import ReferralSettings
+
+    data_file = ctx.input_files.get("referral")
+    if not data_file:
+        raise FileNotFoundError("No 'referral' input file in PipelineContext")
+
+    settings = ReferralSettings(
+        data_file=Path(data_file),
+        output_dir=ctx.output_dir,
+        client_id=ctx.client_id or None,
+    )
+
+    def _progress_bridge(step: int, total: int, msg: str) -> None:
+        if ctx.progress_callback:
+            ctx.progress_callback(f"[Referral {step}/{total}] {msg}")
+
+    result = run_pipeline(settings, on_progress=_progress_bridge)
+    export_outputs(result)
+    return {
+        ar.name: replace(ar, metadata={**ar.metadata, "has_chart": ar.name in result.chart_pngs})
+        for ar in result.analyses
+    }
+
+
 def run_ics_append(ctx: PipelineContext) -> dict[str, SharedResult]:
     """Run ICS append pipeline via PipelineContext bridge.
 
@@ -3,7 +3,7 @@
 import logging
 import re
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, Literal
 
 import yaml
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
@@ -94,6 +94,14 @@ class AppendSettings(BaseModel):
     )
     hash_min_length: int = 6
     match_rate_warn_threshold: float = 0.5
+    # Clients matched concurrently by run_match (1 = serial, in-process).
+    match_workers: Annotated[int, Field(ge=1, le=16)] = 1
+    # Annotated ODD output: full workbook (xlsx), full table as parquet/csv,
+    # or "columns" -- only the account key plus ICS Account / ICS Source.
+    match_output: Literal["xlsx", "parquet", "csv", "columns"] = "xlsx"
+    # Keep a per-client index of every ICS account seen (updated by run_merge)
+    # and match ODD files against it instead of the month's merged workbook.
+    account_index: bool = True
 
     @field_validator("base_dir", "ars_dir", "output_dir", mode="before")
     @classmethod
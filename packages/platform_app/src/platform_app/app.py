@@ -537,6 +537,7 @@ modules = st.Page("pages/module_library.py", title="Analysis Library", icon=":ma
 run_page = st.Page("pages/run_analysis.py", title="Run (Advanced)", icon=":material/tune:")
 batch = st.Page("pages/batch_workflow.py", title="Batch Run", icon=":material/playlist_play:")
 logs = st.Page("pages/logs.py", title="View Logs", icon=":material/description:")
+performance = st.Page("pages/performance.py", title="Performance", icon=":material/speed:")
 
 pg = st.navigation(
     {
@@ -544,7 +545,7 @@ pg = st.navigation(
         "PIPELINES": [ars_page, ics_page, txn_page, attrition_page],
         "OUTPUTS": [outputs, history],
         "ADVANCED": [workspace, data_ingest, modules, run_page, batch],
-        "DIAGNOSTICS": [logs],
+        "DIAGNOSTICS": [logs, performance],
     }
 )
 
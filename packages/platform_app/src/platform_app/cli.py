@@ -104,6 +104,60 @@ def format_oddd(
     typer.echo(f"Saved formatted file: {output_path} ({len(df)} rows, {len(df.columns)} columns)")
 
 
+@app.command()
+def perf(
+    roots: list[Path] = typer.Argument(
+        None, help="Output folders or run report files (default: dirs from run history)"
+    ),
+    kind: str = typer.Option("module", "--kind", help="Span kind: step, module or function"),
+    top: int = typer.Option(20, "--top", help="Rows per table"),
+    threshold: float = typer.Option(
+        1.25, "--threshold", help="Slowdown ratio vs previous month that counts as a regression"
+    ),
+    log_dir: Path = typer.Option(Path("logs"), "--log-dir", help="Run history directory"),
+) -> None:
+    """Summarise runtimes and memory across clients from collected run reports."""
+    from platform_app.core.perf_report import (
+        find_reports,
+        load_samples,
+        regressions,
+        slowest_runs,
+        span_stats,
+    )
+    from platform_app.core.run_logger import pipeline_stats
+
+    reports = find_reports(roots, log_dir=log_dir)
+    samples = load_samples(reports)
+    typer.echo(f"{len(reports)} run reports, {len(samples)} profiled spans")
+
+    stats = pipeline_stats(log_dir)
+    if stats:
+        typer.echo("\nRun history (per pipeline):")
+        for s in stats:
+            typer.echo(
+                f"  {s.pipeline:<12} {s.runs:>5} runs  p50 {s.p50_seconds:7.1f}s  "
+                f"p95 {s.p95_seconds:7.1f}s  failures {s.failure_rate:.0%}"
+            )
+    if samples.empty:
+        return
+
+    with _pd_display():
+        typer.echo(f"\nSlowest {kind}s (p95):")
+        typer.echo(span_stats(samples, kind=kind).head(top).to_string(index=False))
+        typer.echo("\nSlowest client runs:")
+        typer.echo(slowest_runs(samples, n=top).to_string(index=False))
+        regressed = regressions(samples, kind=kind, threshold=threshold)
+        typer.echo(f"\nRegressions vs previous month (>= {threshold:.2f}x):")
+        typer.echo(regressed.head(top).to_string(index=False) if not regressed.empty else "  none")
+
+
+def _pd_display():
+    """Wide, 2-decimal pandas output for CLI tables."""
+    import pandas as pd
+
+    return pd.option_context("display.width", 200, "display.precision", 2)
+
+
 def _build_input_files(
     pipeline: str,
     data_file: Path,
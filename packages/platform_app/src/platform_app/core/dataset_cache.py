@@ -0,0 +1,169 @@
+"""Process-wide cache of parsed input files, keyed by a cheap file fingerprint.
+
+Reading an ODD workbook or a month of transaction files off the network
+drive dominates a run's setup time. ``DatasetCache`` keeps parsed frames in
+memory across pages, sessions and re-runs of the same client, evicting the
+least recently used once ``max_bytes`` is exceeded.
+
+Entries are keyed by ``fingerprint(path)`` -- size, mtime and a hash of a few
+sampled blocks -- so an edited or replaced file is re-read, but no call reads
+the whole file just to decide that.
+
+Cached frames are shared: callers must treat them as read-only (copy before
+mutating).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from pathlib import Path
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Memory budget for cached frames; override with UAP_DATASET_CACHE_MB.
+DEFAULT_MAX_BYTES = 2 * 1024**3
+# Bytes hashed from the start, middle and end of a file.
+SAMPLE_BYTES = 64 * 1024
+
+
+def fingerprint(path: Path, sample_bytes: int = SAMPLE_BYTES) -> str:
+    """Short identity for a file's current contents (16 hex chars).
+
+    Combines size, mtime and a BLAKE2 hash of up to three ``sample_bytes``
+    blocks (head, middle, tail), so it costs at most ~200 KB of I/O however
+    large the file is.
+    """
+    path = Path(path)
+    st = path.stat()
+    h = hashlib.blake2b(digest_size=8)
+    h.update(f"{st.st_size}:{st.st_mtime_ns}".encode())
+    with open(path, "rb") as f:
+        if st.st_size <= 3 * sample_bytes:
+            h.update(f.read())
+        else:
+            for offset in (0, st.st_size // 2, st.st_size - sample_bytes):
+                f.seek(offset)
+                h.update(f.read(sample_bytes))
+    return h.hexdigest()
+
+
+@dataclass
+class _Entry:
+    frame: pd.DataFrame
+    nbytes: int
+
+
+class DatasetCache:
+    """Thread-safe LRU of DataFrames bounded by total memory."""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._key_locks: dict[Hashable, threading.Lock] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def nbytes(self) -> int:
+        with self._lock:
+            return sum(e.nbytes for e in self._entries.values())
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, key: Hashable) -> pd.DataFrame | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry.frame
+
+    def put(self, key: Hashable, frame: pd.DataFrame) -> None:
+        nbytes = int(frame.memory_usage(deep=True).sum())
+        if nbytes > self.max_bytes:
+            logger.info("Not caching %s: %.0f MB exceeds the cache budget", key, nbytes / 1e6)
+            return
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = _Entry(frame, nbytes)
+            total = sum(e.nbytes for e in self._entries.values())
+            while total > self.max_bytes:
+                old_key, old = self._entries.popitem(last=False)
+                total -= old.nbytes
+                logger.debug("Evicted %s (%.0f MB)", old_key, old.nbytes / 1e6)
+
+    def get_or_load(
+        self,
+        path: Path,
+        loader: Callable[[Path], pd.DataFrame],
+        kind: str = "",
+    ) -> pd.DataFrame:
+        """Parsed contents of ``path``, loading with ``loader`` on a miss.
+
+        ``kind`` distinguishes different parses of the same file (e.g. an
+        ODD read as a workbook vs. as a transaction export).
+        """
+        path = Path(path)
+        key = (kind or getattr(loader, "__qualname__", ""), str(path), fingerprint(path))
+        frame = self.get(key)
+        if frame is not None:
+            self.hits += 1
+            logger.info("Dataset cache hit: %s", path.name)
+            return frame
+
+        # One loader per key: a second page asking for the same file waits
+        # for the first read instead of starting its own.
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            frame = self.get(key)
+            if frame is not None:
+                self.hits += 1
+                return frame
+            self.misses += 1
+            frame = loader(path)
+            self.put(key, frame)
+        with self._lock:
+            self._key_locks.pop(key, None)
+        return frame
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+_CACHE: DatasetCache | None = None
+_CACHE_LOCK = threading.Lock()
+
+
+def get_dataset_cache() -> DatasetCache:
+    """The cache shared by every page and session in this process."""
+    global _CACHE
+    with _CACHE_LOCK:
+        if _CACHE is None:
+            mb = os.environ.get("UAP_DATASET_CACHE_MB")
+            _CACHE = DatasetCache(int(mb) * 1024**2 if mb else DEFAULT_MAX_BYTES)
+        return _CACHE
+
+
+def read_odd(path: Path) -> pd.DataFrame:
+    """Read an ODD workbook (or CSV export) through the shared cache."""
+
+    def _load(p: Path) -> pd.DataFrame:
+        if p.suffix.lower() == ".csv":
+            return pd.read_csv(p, low_memory=False)
+        return pd.read_excel(p)
+
+    return get_dataset_cache().get_or_load(path, _load, kind="odd")
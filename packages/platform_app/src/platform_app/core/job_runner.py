@@ -0,0 +1,615 @@
+"""Background pipeline jobs -- run pipelines outside the Streamlit script run.
+
+Pages submit a job instead of calling ``orchestrator.run_pipeline`` inline.
+Jobs live in a ``JobStore`` on disk (one JSON file per job under
+``logs/jobs/``, indexed by status in ``jobs.db``), so a browser refresh or
+a second session sees the same queue. ``JobRunner`` starts queued jobs in
+worker processes, at most ``max_slots`` CPU slots at a time; a job is
+claimed by creating its ``.claim`` marker exclusively, so when several
+server processes share the store exactly one of them starts it. Each worker
+streams its progress messages into the job file, pickles the results next
+to it for the page to render, and logs the run to run history. Finished
+jobs are deleted after ``JOB_RETENTION_DAYS``.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import multiprocessing
+import os
+import pickle
+import signal
+import sqlite3
+import threading
+import time
+import traceback
+import uuid
+from contextlib import closing
+from dataclasses import asdict, dataclass, field, fields, replace
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_JOB_DIR = Path("logs") / "jobs"
+INDEX_NAME = "jobs.db"
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCESS = "success"
+ERROR = "error"
+CANCELLED = "cancelled"
+FINISHED_STATES = (SUCCESS, ERROR, CANCELLED)
+
+# Progress messages kept per job (the page shows the tail).
+MAX_MESSAGES = 50
+# Minimum seconds between progress writes to the job file.
+PROGRESS_WRITE_INTERVAL = 0.5
+# Finished jobs (record, results, claim marker) are deleted after this long.
+JOB_RETENTION_DAYS = 30
+# Seconds between retention sweeps by the background dispatcher.
+PRUNE_INTERVAL = 3600
+
+# input_files key of a pickled DataFrame handed to the pipeline as
+# ``pre_loaded_data`` (e.g. several transaction files combined by the page).
+PRELOADED_INPUT = "pre_loaded_data"
+
+
+_INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    submitted_at REAL NOT NULL,
+    finished_at REAL NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, submitted_at);
+CREATE INDEX IF NOT EXISTS idx_jobs_submitted ON jobs (submitted_at);
+"""
+
+
+class JobCancelled(BaseException):
+    """Raised in a worker whose job was cancelled by another process.
+
+    A ``BaseException`` so pipeline code that catches ``Exception`` around
+    a module does not swallow it.
+    """
+
+
+@dataclass
+class Job:
+    """One queued or executed pipeline run."""
+
+    job_id: str
+    pipeline: str
+    input_files: dict[str, str]
+    output_dir: str
+    client_id: str = ""
+    client_name: str = ""
+    client_config: dict = field(default_factory=dict)
+    csm: str = ""
+    slots: int = 1
+    status: str = QUEUED
+    submitted_at: float = 0.0
+    started_at: float = 0.0
+    finished_at: float = 0.0
+    progress: float = 0.0
+    message: str = ""
+    messages: list[str] = field(default_factory=list)
+    result_count: int = 0
+    error: str = ""
+    pid: int = 0
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATES
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds spent running (so far, while still running)."""
+        if not self.started_at:
+            return 0.0
+        return (self.finished_at or time.time()) - self.started_at
+
+
+def extract_progress(msg: str) -> float | None:
+    """Extract a fractional progress from a message like '[3/10] ...'."""
+    if "[" in msg and "/" in msg and "]" in msg:
+        try:
+            inside = msg.split("[", 1)[1].split("]", 1)[0]
+            cur, total = inside.split("/")
+            return int(cur) / int(total)
+        except (ValueError, ZeroDivisionError):
+            pass
+    return None
+
+
+class JobStore:
+    """Job records as JSON files in ``root``; results pickled alongside.
+
+    ``jobs.db`` indexes every record by status and submission time, so
+    listing the queue or the latest jobs never reads the whole directory.
+    """
+
+    def __init__(self, root: Path = DEFAULT_JOB_DIR) -> None:
+        self.root = Path(root)
+
+    def path(self, job_id: str) -> Path:
+        return self.root / f"{job_id}.json"
+
+    def results_path(self, job_id: str) -> Path:
+        return self.root / f"{job_id}.results.pkl"
+
+    def claim_path(self, job_id: str) -> Path:
+        return self.root / f"{job_id}.claim"
+
+    def claim(self, job_id: str) -> bool:
+        """Take exclusive ownership of a queued job; False if already claimed.
+
+        The marker is created with ``O_EXCL``, which is atomic across
+        processes, so two servers polling the same store never both start
+        (or one start and the other cancel) the same job.
+        """
+        try:
+            fd = os.open(self.claim_path(job_id), os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            return False
+        with os.fdopen(fd, "w") as f:
+            f.write(str(os.getpid()))
+        return True
+
+    def submit(
+        self,
+        pipeline: str,
+        *,
+        input_files: dict[str, Path],
+        output_dir: Path,
+        client_id: str = "",
+        client_name: str = "",
+        client_config: dict | None = None,
+        csm: str = "",
+        slots: int = 1,
+    ) -> Job:
+        """Queue a job and return it."""
+        job = Job(
+            job_id=f"{time.strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}",
+            pipeline=pipeline,
+            input_files={k: str(v) for k, v in input_files.items()},
+            output_dir=str(output_dir),
+            client_id=client_id,
+            client_name=client_name,
+            client_config=client_config or {},
+            csm=csm,
+            slots=max(1, slots),
+            submitted_at=time.time(),
+        )
+        self.save(job)
+        logger.info("Queued job %s (%s, client %s)", job.job_id, pipeline, client_id)
+        return job
+
+    def save(self, job: Job) -> None:
+        """Write ``job`` atomically so pollers never read a partial file."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self.path(job.job_id)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(asdict(job), default=str))
+        os.replace(tmp, path)
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO jobs VALUES (?, ?, ?, ?)",
+                (job.job_id, job.status, job.submitted_at, job.finished_at),
+            )
+
+    def load(self, job_id: str) -> Job | None:
+        path = self.path(job_id)
+        if not path.exists():
+            return None
+        return self._read(path)
+
+    def update(self, job_id: str, **changes) -> Job | None:
+        job = self.load(job_id)
+        if job is None:
+            return None
+        job = replace(job, **changes)
+        self.save(job)
+        return job
+
+    def list_jobs(self, limit: int = 100, status: str | None = None) -> list[Job]:
+        """Jobs newest first, optionally only those in ``status``."""
+        if not self.root.is_dir():
+            return []
+        where, params = ("WHERE status = ?", [status]) if status is not None else ("", [])
+        with closing(self._connect()) as conn:
+            ids = conn.execute(
+                f"SELECT job_id FROM jobs {where} ORDER BY submitted_at DESC LIMIT ?",
+                [*params, limit],
+            ).fetchall()
+        return [job for (job_id,) in ids if (job := self.load(job_id)) is not None]
+
+    def prune(self, max_age_days: float = JOB_RETENTION_DAYS) -> int:
+        """Delete jobs that finished more than ``max_age_days`` ago. Returns the count."""
+        if not self.root.is_dir():
+            return 0
+        cutoff = time.time() - max_age_days * 86400
+        marks = ", ".join("?" * len(FINISHED_STATES))
+        with closing(self._connect()) as conn:
+            ids = [
+                job_id
+                for (job_id,) in conn.execute(
+                    f"SELECT job_id FROM jobs WHERE status IN ({marks}) AND finished_at < ?",
+                    [*FINISHED_STATES, cutoff],
+                )
+            ]
+            for job_id in ids:
+                for path in (self.path(job_id), self.results_path(job_id), self.claim_path(job_id)):
+                    path.unlink(missing_ok=True)
+                conn.execute("DELETE FROM jobs WHERE job_id = ?", (job_id,))
+        if ids:
+            logger.info("Pruned %d finished job(s) older than %s days", len(ids), max_age_days)
+        return len(ids)
+
+    def save_results(self, job_id: str, results: dict) -> None:
+        path = self.results_path(job_id)
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump(results, f)
+        os.replace(tmp, path)
+
+    def load_results(self, job_id: str) -> dict:
+        """Results of a finished job ({} if it produced none)."""
+        path = self.results_path(job_id)
+        if not path.exists():
+            return {}
+        with open(path, "rb") as f:
+            return pickle.load(f)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the status index, building it from the job files on first use."""
+        db = self.root / INDEX_NAME
+        existed = db.exists()
+        conn = sqlite3.connect(db, timeout=30, isolation_level=None)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_INDEX_SCHEMA)
+            if not existed:
+                jobs = (self._read(p) for p in self.root.glob("*.json"))
+                conn.executemany(
+                    "INSERT OR IGNORE INTO jobs VALUES (?, ?, ?, ?)",
+                    [(j.job_id, j.status, j.submitted_at, j.finished_at) for j in jobs if j],
+                )
+        except Exception:
+            conn.close()
+            raise
+        return conn
+
+    def _read(self, path: Path) -> Job | None:
+        try:
+            data = json.loads(path.read_text())
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning("Skipping unreadable job file %s: %s", path.name, e)
+            return None
+        known = {f.name for f in fields(Job)}
+        return Job(**{k: v for k, v in data.items() if k in known})
+
+
+class _ProgressWriter:
+    """Progress callback that records messages into the running job's file."""
+
+    def __init__(self, store: JobStore, job: Job) -> None:
+        self.store = store
+        self.job = job
+        self._last_write = 0.0
+
+    def __call__(self, msg: str) -> None:
+        short = msg.split("] ", 1)[-1] if "] " in msg else msg
+        fraction = extract_progress(msg)
+        messages = (self.job.messages + [short])[-MAX_MESSAGES:]
+        self.job = replace(
+            self.job,
+            message=short,
+            messages=messages,
+            progress=min(fraction, 0.99) if fraction is not None else self.job.progress,
+        )
+        now = time.monotonic()
+        if now - self._last_write >= PROGRESS_WRITE_INTERVAL:
+            _check_not_cancelled(self.store, self.job.job_id)
+            self.store.save(self.job)
+            self._last_write = now
+
+
+def _check_not_cancelled(store: JobStore, job_id: str) -> None:
+    """Raise ``JobCancelled`` if the job file no longer says it is running.
+
+    The worker's in-memory ``Job`` is stale once another process cancels the
+    job; saving it would resurrect the job as running.
+    """
+    current = store.load(job_id)
+    if current is None or current.status == CANCELLED:
+        raise JobCancelled(job_id)
+
+
+def run_job(root: Path, job_id: str) -> None:
+    """Execute one job; the worker process entry point.
+
+    The worker owns the job file while it runs: it records progress and the
+    final status, checking before every write that the job was not
+    cancelled meanwhile (then it stops without writing). Results are pickled
+    for ``JobStore.load_results`` and the run is logged to the history in
+    the store's parent directory (``logs/`` for the default store).
+    """
+    import pandas as pd
+
+    from platform_app.core.run_logger import RunRecord, hash_file, log_run
+    from platform_app.orchestrator import run_pipeline
+
+    store = JobStore(root)
+    job = store.load(job_id)
+    if job is None or job.status == CANCELLED:
+        return
+    # The dispatcher has already marked the job running; the first progress
+    # write records these after checking for a cancel.
+    job = replace(job, status=RUNNING, started_at=job.started_at or time.time(), pid=os.getpid())
+
+    writer = _ProgressWriter(store, job)
+    results: dict = {}
+    error = ""
+    try:
+        input_files = {k: Path(v) for k, v in job.input_files.items()}
+        preloaded = input_files.pop(PRELOADED_INPUT, None)
+        results = run_pipeline(
+            job.pipeline,
+            input_files=input_files,
+            output_dir=Path(job.output_dir),
+            client_id=job.client_id,
+            client_name=job.client_name,
+            client_config=job.client_config,
+            progress_callback=writer,
+            pre_loaded_data=pd.read_pickle(preloaded) if preloaded else None,
+        )
+        _check_not_cancelled(store, job_id)
+        store.save_results(job_id, results)
+    except JobCancelled:
+        logger.info("Job %s was cancelled; worker stopping", job_id)
+        return
+    except Exception:
+        error = traceback.format_exc()
+        logger.error("Job %s (%s) failed:\n%s", job_id, job.pipeline, error)
+
+    try:
+        _check_not_cancelled(store, job_id)
+    except JobCancelled:
+        logger.info("Job %s was cancelled; worker stopping", job_id)
+        return
+    job = replace(
+        writer.job,
+        status=ERROR if error else SUCCESS,
+        finished_at=time.time(),
+        progress=1.0,
+        result_count=len(results),
+        error=error,
+    )
+    store.save(job)
+
+    try:
+        first_input = next((v for k, v in job.input_files.items() if k != PRELOADED_INPUT), "")
+        log_run(
+            RunRecord(
+                run_id=job.job_id,
+                timestamp=time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(job.started_at)),
+                csm=job.csm,
+                client_id=job.client_id,
+                client_name=job.client_name,
+                pipeline=job.pipeline,
+                modules_run=list(job.client_config.get("module_ids", [])),
+                runtime_seconds=round(job.elapsed, 1),
+                status=job.status,
+                output_dir=job.output_dir,
+                input_file_hash=hash_file(Path(first_input)) if first_input else "",
+                error_message=error.strip().rsplit("\n", 1)[-1] if error else "",
+                result_count=job.result_count,
+            ),
+            log_dir=store.root.parent,
+        )
+    except Exception:
+        logger.exception("Could not log run for job %s", job_id)
+
+
+def _terminate(pid: int) -> None:
+    """Stop the worker process ``pid`` started by another server process."""
+    if not _pid_alive(pid):
+        return
+    try:
+        os.kill(pid, signal.SIGTERM)
+    except OSError as e:
+        logger.warning("Could not stop worker %s: %s", pid, e)
+
+
+def _pid_alive(pid: int) -> bool:
+    if pid <= 0:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class JobRunner:
+    """Starts queued jobs in worker processes within a CPU-slot budget.
+
+    ``dispatch`` is cheap and idempotent; pages call it on every rerun and
+    ``start`` runs it periodically on a daemon thread so the queue drains
+    with no browser attached.
+    """
+
+    def __init__(
+        self,
+        store: JobStore | None = None,
+        max_slots: int | None = None,
+        poll_interval: float = 1.0,
+    ) -> None:
+        self.store = store or JobStore()
+        self.max_slots = max_slots or max(1, (os.cpu_count() or 2) // 2)
+        self.poll_interval = poll_interval
+        self._mp = multiprocessing.get_context("spawn")
+        self._procs: dict[str, multiprocessing.process.BaseProcess] = {}
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+        self._last_prune = float("-inf")
+        self.recover()
+
+    def submit(self, pipeline: str, **kwargs) -> Job:
+        """Queue a job (see ``JobStore.submit``) and try to start it."""
+        job = self.store.submit(pipeline, **kwargs)
+        self.dispatch()
+        return job
+
+    def recover(self) -> int:
+        """Fail jobs left "running" by a previous server whose worker is gone.
+
+        Jobs without a pid yet are still being started by a dispatcher.
+        """
+        n = 0
+        for job in self.store.list_jobs(limit=10_000, status=RUNNING):
+            if job.pid and job.job_id not in self._procs and not _pid_alive(job.pid):
+                self.store.update(
+                    job.job_id,
+                    status=ERROR,
+                    finished_at=time.time(),
+                    error="Interrupted: the worker stopped before the job finished.",
+                )
+                n += 1
+        return n
+
+    def dispatch(self) -> list[str]:
+        """Reap finished workers, then start queued jobs that fit. Returns started ids."""
+        started: list[str] = []
+        with self._lock:
+            self._reap()
+            used = sum(self._slots(jid) for jid in self._procs)
+            queued = sorted(
+                self.store.list_jobs(limit=10_000, status=QUEUED), key=lambda j: j.submitted_at
+            )
+            for job in queued:
+                slots = min(job.slots, self.max_slots)
+                if used + slots > self.max_slots:
+                    break
+                if not self.store.claim(job.job_id):
+                    continue  # another server process is starting it
+                job = self.store.load(job.job_id)
+                if job is None or job.status != QUEUED:
+                    continue  # cancelled between listing and claiming
+                proc = self._mp.Process(
+                    target=run_job,
+                    args=(self.store.root, job.job_id),
+                    name=f"job-{job.job_id}",
+                )
+                self.store.update(job.job_id, status=RUNNING, started_at=time.time())
+                proc.start()
+                # Recorded at once so other servers' recover() and cancel() see
+                # a live worker; the worker writes progress from here on.
+                self.store.update(job.job_id, pid=proc.pid)
+                self._procs[job.job_id] = proc
+                used += slots
+                started.append(job.job_id)
+                logger.info("Started job %s (pid %s)", job.job_id, proc.pid)
+        return started
+
+    def cancel(self, job_id: str) -> bool:
+        """Drop a queued job or terminate a running one (started by any server)."""
+        with self._lock:
+            job = self.store.load(job_id)
+            if job is None or job.finished:
+                return False
+            proc = self._procs.pop(job_id, None)
+            if proc is None and job.status == QUEUED and not self.store.claim(job_id):
+                return False  # just claimed by a dispatcher; it is starting
+            # Mark first: a worker that outlives the signal sees it before its
+            # next write and stops without overwriting the status.
+            self.store.update(job_id, status=CANCELLED, finished_at=time.time())
+            if proc is not None:
+                proc.terminate()
+                proc.join(timeout=5)
+            elif job.status == RUNNING:
+                _terminate(job.pid)
+            logger.info("Cancelled job %s", job_id)
+            return True
+
+    def active_jobs(self) -> list[str]:
+        with self._lock:
+            return list(self._procs)
+
+    def wait(self, job_id: str, timeout: float | None = None) -> Job | None:
+        """Block until ``job_id`` finishes (dispatching as needed); mainly for tests/CLI."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            self.dispatch()
+            job = self.store.load(job_id)
+            if job is None or job.finished:
+                with self._lock:
+                    proc = self._procs.pop(job_id, None)
+                if proc is not None:
+                    proc.join(timeout=10)  # worker is only flushing its logs by now
+                return job
+            if deadline is not None and time.monotonic() > deadline:
+                return job
+            time.sleep(min(self.poll_interval, 0.2))
+
+    def start(self) -> None:
+        """Dispatch in the background every ``poll_interval`` seconds."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="job-dispatcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.poll_interval * 2)
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self.dispatch()
+                if time.monotonic() - self._last_prune >= PRUNE_INTERVAL:
+                    self._last_prune = time.monotonic()
+                    self.store.prune()
+            except Exception:
+                logger.exception("Job dispatch failed")
+
+    def _slots(self, job_id: str) -> int:
+        job = self.store.load(job_id)
+        return min(job.slots, self.max_slots) if job else 1
+
+    def _reap(self) -> None:
+        for job_id, proc in list(self._procs.items()):
+            if proc.is_alive():
+                continue
+            proc.join()
+            del self._procs[job_id]
+            job = self.store.load(job_id)
+            if job is not None and not job.finished:
+                # The worker died without recording an outcome (crash, kill -9).
+                self.store.update(
+                    job_id,
+                    status=ERROR,
+                    finished_at=time.time(),
+                    error=f"Worker exited with code {proc.exitcode} before finishing.",
+                )
+
+
+_RUNNER: JobRunner | None = None
+_RUNNER_LOCK = threading.Lock()
+
+
+def get_runner() -> JobRunner:
+    """Process-wide runner shared by every Streamlit session."""
+    global _RUNNER
+    with _RUNNER_LOCK:
+        if _RUNNER is None:
+            _RUNNER = JobRunner()
+            _RUNNER.start()
+        return _RUNNER
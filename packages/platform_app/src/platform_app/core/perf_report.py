@@ -0,0 +1,191 @@
+"""Cross-client performance report built from per-run profiles.
+
+Every ARS run report (``<client>_<YYYY.MM>_run_report.json``) and every
+TXN/ICS report (``<client>_TXN_run_report.json``) carries a ``profile``
+section written by ``shared.profiling``. This module collects those spans
+across clients and months into one frame and summarises it: runtime
+percentiles and memory high-water marks per module, the slowest clients,
+and month-over-month regressions.
+
+Reports are found in the output directories recorded in the run history
+plus any extra roots given explicitly.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+from platform_app.core.run_logger import DEFAULT_LOG_DIR, query_runs
+
+logger = logging.getLogger(__name__)
+
+REPORT_GLOB = "*_run_report.json"
+SAMPLE_COLUMNS = [
+    "client_id",
+    "month",
+    "pipeline",
+    "kind",
+    "name",
+    "wall_seconds",
+    "cpu_seconds",
+    "peak_rss_delta_mb",
+    "rows",
+    "success",
+    "report",
+]
+
+_NAME_RE = re.compile(
+    r"^(?P<client>.+?)_(?:(?P<month>\d{4}\.\d{2})|(?P<pipeline>TXN|ICS))_run_report\.json$"
+)
+
+
+def find_reports(
+    roots: list[Path] | None = None,
+    log_dir: Path = DEFAULT_LOG_DIR,
+    history_limit: int = 1000,
+) -> list[Path]:
+    """Run reports under ``roots`` (recursive) and in recent runs' output dirs."""
+    found: set[Path] = set()
+    for root in roots or []:
+        root = Path(root)
+        if root.is_file():
+            found.add(root)
+        elif root.is_dir():
+            found.update(root.rglob(REPORT_GLOB))
+
+    # Output dirs from the history: the report sits in the dir itself or, for
+    # ARS, in <output>/<client>/<month>/.
+    seen_dirs: set[str] = set()
+    for record in query_runs(log_dir, limit=history_limit):
+        if not record.output_dir or record.output_dir in seen_dirs:
+            continue
+        seen_dirs.add(record.output_dir)
+        out = Path(record.output_dir)
+        if not out.is_dir():
+            continue
+        found.update(out.glob(REPORT_GLOB))
+        found.update(out.glob(f"*/*/{REPORT_GLOB}"))
+    return sorted(found)
+
+
+def _report_identity(path: Path, data: dict) -> tuple[str, str, str]:
+    """(client_id, month, pipeline) from the report body or its filename."""
+    match = _NAME_RE.match(path.name)
+    client_id = str(data.get("client_id") or (match and match["client"]) or "")
+    month = str(data.get("month") or (match and match["month"]) or "")
+    pipeline = ((match and match["pipeline"]) or "ars").lower()
+    if not month:
+        month = datetime.fromtimestamp(path.stat().st_mtime).strftime("%Y.%m")
+    return client_id, month, pipeline
+
+
+def load_samples(paths: list[Path]) -> pd.DataFrame:
+    """One row per profiled span across all ``paths``."""
+    rows: list[dict] = []
+    for path in paths:
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning("Skipping unreadable run report %s: %s", path, e)
+            continue
+        spans = (data.get("profile") or {}).get("spans") or []
+        if not spans:
+            continue
+        client_id, month, pipeline = _report_identity(path, data)
+        for span in spans:
+            rows.append(
+                {
+                    "client_id": client_id,
+                    "month": month,
+                    "pipeline": pipeline,
+                    "kind": span.get("kind", ""),
+                    "name": span.get("name", ""),
+                    "wall_seconds": float(span.get("wall_seconds") or 0.0),
+                    "cpu_seconds": float(span.get("cpu_seconds") or 0.0),
+                    "peak_rss_delta_mb": float(span.get("peak_rss_delta_mb") or 0.0),
+                    "rows": span.get("rows"),
+                    "success": bool(span.get("success", True)),
+                    "report": str(path),
+                }
+            )
+    return pd.DataFrame(rows, columns=SAMPLE_COLUMNS)
+
+
+def span_stats(samples: pd.DataFrame, kind: str = "module") -> pd.DataFrame:
+    """Runtime percentiles and memory high-water mark per pipeline/name.
+
+    Sorted slowest first by p95 wall time.
+    """
+    cols = ["pipeline", "name", "runs", "p50_s", "p95_s", "max_s", "max_rss_mb", "failures"]
+    df = samples[samples["kind"] == kind]
+    if df.empty:
+        return pd.DataFrame(columns=cols)
+    grouped = df.groupby(["pipeline", "name"])
+    wall = grouped["wall_seconds"]
+    out = pd.DataFrame(
+        {
+            "runs": grouped.size(),
+            "p50_s": wall.quantile(0.50),
+            "p95_s": wall.quantile(0.95),
+            "max_s": wall.max(),
+            "max_rss_mb": grouped["peak_rss_delta_mb"].max(),
+            "failures": (~df["success"]).groupby([df["pipeline"], df["name"]]).sum(),
+        }
+    ).reset_index()
+    return out.sort_values(["p95_s", "max_s"], ascending=False, ignore_index=True)[cols]
+
+
+def slowest_runs(samples: pd.DataFrame, n: int = 10) -> pd.DataFrame:
+    """Client runs ranked by total step time (``n`` slowest)."""
+    cols = ["client_id", "month", "pipeline", "total_s", "max_rss_mb", "slowest_step"]
+    steps = samples[samples["kind"] == "step"]
+    if steps.empty:
+        return pd.DataFrame(columns=cols)
+    keys = ["client_id", "month", "pipeline"]
+    grouped = steps.groupby(keys)
+    slowest = steps.loc[grouped["wall_seconds"].idxmax()].set_index(keys)["name"]
+    out = pd.DataFrame(
+        {
+            "total_s": grouped["wall_seconds"].sum(),
+            "max_rss_mb": samples.groupby(keys)["peak_rss_delta_mb"].max(),
+            "slowest_step": slowest,
+        }
+    ).dropna(subset=["total_s"])
+    return out.reset_index().nlargest(n, "total_s").reset_index(drop=True)[cols]
+
+
+def regressions(
+    samples: pd.DataFrame,
+    kind: str = "module",
+    threshold: float = 1.25,
+    min_seconds: float = 1.0,
+) -> pd.DataFrame:
+    """Modules that got slower for a client since that client's previous month.
+
+    Compares each client's latest month with the month before it and keeps
+    spans at least ``threshold`` times slower and ``min_seconds`` long.
+    """
+    cols = ["client_id", "pipeline", "name", "month", "previous_month", "wall_s", "previous_s"]
+    cols += ["ratio"]
+    df = samples[samples["kind"] == kind]
+    if df.empty:
+        return pd.DataFrame(columns=cols)
+    # Several runs in one month: judge the month by its fastest run.
+    per_month = (
+        df.groupby(["client_id", "pipeline", "name", "month"])["wall_seconds"].min().reset_index()
+    )
+    per_month = per_month.sort_values("month")
+    keys = ["client_id", "pipeline", "name"]
+    per_month["previous_month"] = per_month.groupby(keys)["month"].shift()
+    per_month["previous_s"] = per_month.groupby(keys)["wall_seconds"].shift()
+    latest = per_month.groupby(keys).tail(1).dropna(subset=["previous_s"])
+    latest = latest.rename(columns={"wall_seconds": "wall_s"})
+    latest["ratio"] = latest["wall_s"] / latest["previous_s"].where(latest["previous_s"] > 0)
+    hits = latest[(latest["ratio"] >= threshold) & (latest["wall_s"] >= min_seconds)]
+    return hits.sort_values("ratio", ascending=False, ignore_index=True)[cols]
@@ -1,20 +1,53 @@
 """Run history logger -- tracks all pipeline executions.
 
-Stored as JSON Lines in logs/run_history.jsonl for append-only writes.
+Stored in an SQLite database at logs/run_history.db, indexed on client,
+pipeline and timestamp so the history page can filter, paginate and
+aggregate without reading every run ever logged. A legacy
+logs/run_history.jsonl is imported on first use and renamed to
+``run_history.jsonl.migrated``.
 """
 
 from __future__ import annotations
 
-import hashlib
 import json
 import logging
-from dataclasses import asdict, dataclass
+import math
+import sqlite3
+from contextlib import closing
+from dataclasses import asdict, dataclass, fields
 from datetime import datetime
 from pathlib import Path
 
+from platform_app.core.dataset_cache import fingerprint
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_LOG_DIR = Path("logs")
+DB_NAME = "run_history.db"
+LEGACY_NAME = "run_history.jsonl"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    csm TEXT NOT NULL DEFAULT '',
+    client_id TEXT NOT NULL DEFAULT '',
+    client_name TEXT NOT NULL DEFAULT '',
+    pipeline TEXT NOT NULL DEFAULT '',
+    modules_run TEXT NOT NULL DEFAULT '[]',
+    runtime_seconds REAL NOT NULL DEFAULT 0,
+    status TEXT NOT NULL DEFAULT '',
+    output_dir TEXT NOT NULL DEFAULT '',
+    input_file_hash TEXT NOT NULL DEFAULT '',
+    error_message TEXT NOT NULL DEFAULT '',
+    result_count INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_runs_timestamp ON runs (timestamp);
+CREATE INDEX IF NOT EXISTS idx_runs_client ON runs (client_id, timestamp);
+CREATE INDEX IF NOT EXISTS idx_runs_pipeline ON runs (pipeline, timestamp);
+CREATE INDEX IF NOT EXISTS idx_runs_pipeline_runtime ON runs (pipeline, runtime_seconds);
+"""
 
 
 @dataclass(frozen=True)
@@ -36,6 +69,25 @@ class RunRecord:
     result_count: int = 0
 
 
+_COLUMNS = tuple(f.name for f in fields(RunRecord))
+
+
+@dataclass(frozen=True)
+class PipelineStats:
+    """Runtime and failure summary for one pipeline."""
+
+    pipeline: str
+    runs: int
+    failures: int
+    mean_seconds: float
+    p50_seconds: float
+    p95_seconds: float
+
+    @property
+    def failure_rate(self) -> float:
+        return self.failures / self.runs if self.runs else 0.0
+
+
 def generate_run_id() -> str:
     """Generate a short unique run ID."""
     now = datetime.now()
@@ -43,46 +95,222 @@ def generate_run_id() -> str:
 
 
 def hash_file(path: Path) -> str:
-    """SHA-256 hash of a file (first 16 hex chars)."""
+    """Sampled fingerprint of a file (16 hex chars); see ``dataset_cache.fingerprint``."""
     if not path.exists():
         return ""
-    h = hashlib.sha256()
-    with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            h.update(chunk)
-    return h.hexdigest()[:16]
+    return fingerprint(path)
 
 
-def log_run(record: RunRecord, log_dir: Path = DEFAULT_LOG_DIR) -> Path:
-    """Append a run record to the history file. Returns log file path."""
+# ---------------------------------------------------------------------------
+# Storage
+# ---------------------------------------------------------------------------
+
+
+def _to_row(record: RunRecord) -> tuple:
+    data = asdict(record)
+    data["modules_run"] = json.dumps(list(data["modules_run"]))
+    return tuple(data[c] for c in _COLUMNS)
+
+
+def _from_row(row: sqlite3.Row) -> RunRecord:
+    data = {c: row[c] for c in _COLUMNS}
+    try:
+        data["modules_run"] = json.loads(data["modules_run"])
+    except json.JSONDecodeError:
+        data["modules_run"] = [data["modules_run"]]
+    return RunRecord(**data)
+
+
+_INSERT = f"INSERT INTO runs ({', '.join(_COLUMNS)}) VALUES ({', '.join('?' * len(_COLUMNS))})"
+
+
+def _migrate_jsonl(conn: sqlite3.Connection, log_dir: Path) -> None:
+    """Import a legacy JSONL history once, then move it aside."""
+    legacy = log_dir / LEGACY_NAME
+    # IMMEDIATE takes the write lock first, so two processes starting at
+    # once cannot both import the file.
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        if not legacy.exists():
+            conn.rollback()
+            return
+        rows = []
+        for line in legacy.read_text().splitlines():
+            if not line.strip():
+                continue
+            try:
+                data = json.loads(line)
+                if isinstance(data.get("modules_run"), str):
+                    data["modules_run"] = [data["modules_run"]]
+                rows.append(_to_row(RunRecord(**data)))
+            except (json.JSONDecodeError, TypeError) as e:
+                logger.warning("Skipping malformed log line: %s", e)
+        conn.executemany(_INSERT, rows)
+        # Move the file aside while the import is still uncommitted: a crash
+        # before the rename rolls the rows back and leaves the file to retry,
+        # and a failed commit puts the file back.
+        migrated = legacy.with_name(LEGACY_NAME + ".migrated")
+        legacy.replace(migrated)
+        try:
+            conn.commit()
+        except Exception:
+            migrated.replace(legacy)
+            raise
+    except Exception:
+        conn.rollback()
+        raise
+    logger.info("Migrated %d runs from %s", len(rows), legacy)
+
+
+def _connect(log_dir: Path, create: bool = True) -> sqlite3.Connection | None:
+    """Open the history database, creating and migrating it as needed.
+
+    Returns None when ``create`` is False and there is no history at all.
+    """
+    db = log_dir / DB_NAME
+    has_legacy = (log_dir / LEGACY_NAME).exists()
+    if not create and not db.exists() and not has_legacy:
+        return None
     log_dir.mkdir(parents=True, exist_ok=True)
-    log_file = log_dir / "run_history.jsonl"
+    # Background job workers log from their own processes; wait out their
+    # short write locks instead of failing.
+    conn = sqlite3.connect(db, timeout=30, isolation_level=None)
+    try:
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_SCHEMA)
+        if has_legacy:
+            _migrate_jsonl(conn, log_dir)
+    except Exception:
+        conn.close()
+        raise
+    return conn
+
+
+def _where(**filters: str | None) -> tuple[str, list]:
+    clauses, params = [], []
+    for column, value in filters.items():
+        if value:
+            clauses.append(f"{column} = ?")
+            params.append(value)
+    return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
 
-    with open(log_file, "a") as f:
-        f.write(json.dumps(asdict(record), default=str) + "\n")
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
 
-    logger.info("Run %s logged to %s", record.run_id, log_file)
-    return log_file
+
+def log_run(record: RunRecord, log_dir: Path = DEFAULT_LOG_DIR) -> Path:
+    """Insert a run record into the history database. Returns the database path."""
+    with closing(_connect(log_dir)) as conn:
+        conn.execute(_INSERT, _to_row(record))
+
+    db = log_dir / DB_NAME
+    logger.info("Run %s logged to %s", record.run_id, db)
+    return db
+
+
+def query_runs(
+    log_dir: Path = DEFAULT_LOG_DIR,
+    *,
+    client_id: str | None = None,
+    pipeline: str | None = None,
+    status: str | None = None,
+    limit: int = 100,
+    offset: int = 0,
+) -> list[RunRecord]:
+    """One page of run records (newest first), optionally filtered."""
+    conn = _connect(log_dir, create=False)
+    if conn is None:
+        return []
+    where, params = _where(client_id=client_id, pipeline=pipeline, status=status)
+    with closing(conn):
+        rows = conn.execute(
+            f"SELECT * FROM runs{where} ORDER BY timestamp DESC, id DESC LIMIT ? OFFSET ?",
+            [*params, limit, offset],
+        ).fetchall()
+    return [_from_row(r) for r in rows]
 
 
 def load_history(log_dir: Path = DEFAULT_LOG_DIR, limit: int = 100) -> list[RunRecord]:
     """Load recent run records (newest first)."""
-    log_file = log_dir / "run_history.jsonl"
-    if not log_file.exists():
+    return query_runs(log_dir, limit=limit)
+
+
+def count_runs(
+    log_dir: Path = DEFAULT_LOG_DIR,
+    *,
+    client_id: str | None = None,
+    pipeline: str | None = None,
+    status: str | None = None,
+) -> int:
+    """Number of runs matching the filters."""
+    conn = _connect(log_dir, create=False)
+    if conn is None:
+        return 0
+    where, params = _where(client_id=client_id, pipeline=pipeline, status=status)
+    with closing(conn):
+        return conn.execute(f"SELECT COUNT(*) FROM runs{where}", params).fetchone()[0]
+
+
+def status_counts(
+    log_dir: Path = DEFAULT_LOG_DIR,
+    *,
+    client_id: str | None = None,
+    pipeline: str | None = None,
+) -> dict[str, int]:
+    """Run count per status."""
+    conn = _connect(log_dir, create=False)
+    if conn is None:
+        return {}
+    where, params = _where(client_id=client_id, pipeline=pipeline)
+    with closing(conn):
+        rows = conn.execute(
+            f"SELECT status, COUNT(*) FROM runs{where} GROUP BY status", params
+        ).fetchall()
+    return {status: n for status, n in rows}
+
+
+def pipeline_stats(
+    log_dir: Path = DEFAULT_LOG_DIR,
+    *,
+    client_id: str | None = None,
+) -> list[PipelineStats]:
+    """Runtime percentiles and failure counts per pipeline.
+
+    Percentiles use the nearest-rank method; each is a single indexed
+    ``ORDER BY runtime_seconds LIMIT 1 OFFSET k`` lookup, so no run
+    history is pulled into memory.
+    """
+    conn = _connect(log_dir, create=False)
+    if conn is None:
         return []
+    where, params = _where(client_id=client_id)
+    with closing(conn):
+        groups = conn.execute(
+            "SELECT pipeline, COUNT(*), SUM(status = 'error'), AVG(runtime_seconds) "
+            f"FROM runs{where} GROUP BY pipeline ORDER BY pipeline",
+            params,
+        ).fetchall()
 
-    records: list[RunRecord] = []
-    for line in log_file.read_text().strip().splitlines():
-        if not line.strip():
-            continue
-        try:
-            data = json.loads(line)
-            # Handle modules_run as list
-            if isinstance(data.get("modules_run"), str):
-                data["modules_run"] = [data["modules_run"]]
-            records.append(RunRecord(**data))
-        except (json.JSONDecodeError, TypeError) as e:
-            logger.warning("Skipping malformed log line: %s", e)
-
-    # Newest first, limited
-    return list(reversed(records[-limit:]))
+        def percentile(pipeline: str, n: int, q: float) -> float:
+            rank = max(math.ceil(q * n) - 1, 0)
+            clause = f"{where} AND pipeline = ?" if where else " WHERE pipeline = ?"
+            return conn.execute(
+                f"SELECT runtime_seconds FROM runs{clause} "
+                "ORDER BY runtime_seconds LIMIT 1 OFFSET ?",
+                [*params, pipeline, rank],
+            ).fetchone()[0]
+
+        return [
+            PipelineStats(
+                pipeline=pipeline,
+                runs=n,
+                failures=failures or 0,
+                mean_seconds=mean or 0.0,
+                p50_seconds=percentile(pipeline, n, 0.50),
+                p95_seconds=percentile(pipeline, n, 0.95),
+            )
+            for pipeline, n, failures, mean in groups
+        ]
@@ -2,7 +2,8 @@
 
 CSMs operate in: /data/{csm_name}/{YYYY.MM}/{client_id}/
 The session manager resolves paths, auto-detects data files,
-and persists workspace state across Streamlit reruns.
+and persists workspace state across Streamlit reruns. Folder listings go
+through the shared directory index, so reruns re-list only changed folders.
 """
 
 from __future__ import annotations
@@ -12,6 +13,8 @@ import re
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from shared.dir_index import ROLE_PATTERNS, DirListing, get_directory_index
+
 logger = logging.getLogger(__name__)
 
 # Known ODD data roots (checked in order; first existing one is the default)
@@ -81,26 +84,20 @@ _MONTH_RE = re.compile(r"^\d{4}\.\d{2}$")
 
 def discover_csm_folders(data_root: Path) -> list[str]:
     """Return sorted list of CSM folder names under data_root."""
-    if not data_root.is_dir():
-        return []
-    return sorted(d.name for d in data_root.iterdir() if d.is_dir() and not d.name.startswith("."))
+    return [d for d in get_directory_index().subdirs(data_root) if not d.startswith(".")]
 
 
 def discover_months(csm_dir: Path) -> list[str]:
     """Return sorted list of YYYY.MM month folders under a CSM directory."""
-    if not csm_dir.is_dir():
-        return []
     return sorted(
-        (d.name for d in csm_dir.iterdir() if d.is_dir() and _MONTH_RE.match(d.name)),
+        (d for d in get_directory_index().subdirs(csm_dir) if _MONTH_RE.match(d)),
         reverse=True,
     )
 
 
 def discover_clients(month_dir: Path) -> list[str]:
     """Return sorted list of client folder names under a month directory."""
-    if not month_dir.is_dir():
-        return []
-    return sorted(d.name for d in month_dir.iterdir() if d.is_dir() and not d.name.startswith("."))
+    return [d for d in get_directory_index().subdirs(month_dir) if not d.startswith(".")]
 
 
 def auto_detect_files(
@@ -125,24 +122,13 @@ def auto_detect_files(
         oddd, tran, ics, config -- each Path or None
         tran_files -- list[Path] of ALL transaction files found (all months)
     """
-    oddd = _find_by_patterns(client_dir, ["*ODD*.xlsx", "*ODDD*.xlsx", "*odd*.xlsx"])
-    ics = _find_by_patterns(client_dir, ["*ICS*.xlsx", "*ics*.xlsx", "*ICS*.csv"])
-    config = _find_by_patterns(client_dir, ["*config*.json", "*config*.yaml"])
+    oddd = _find_by_patterns(client_dir, ROLE_PATTERNS["oddd"])
+    ics = _find_by_patterns(client_dir, ROLE_PATTERNS["ics"])
+    config = _find_by_patterns(client_dir, ROLE_PATTERNS["config"])
 
     # Transaction files: first check inside the ODD client folder
     # Note: avoid broad "*.csv" pattern -- it catches non-transaction files.
-    tran = _find_by_patterns(
-        client_dir,
-        [
-            "*tran*.csv",
-            "*Tran*.csv",
-            "*TRAN*.csv",
-            "*txn*.csv",
-            "*TXN*.csv",
-            "*transaction*.csv",
-            "*Transaction*.csv",
-        ],
-    )
+    tran = _find_by_patterns(client_dir, ROLE_PATTERNS["tran"])
     tran_files: list[Path] = [tran] if tran else []
 
     # If not found locally, look in Incoming/Transaction Files/{ClientID}*/
@@ -173,9 +159,6 @@ def _find_all_tran_files(
         return []
 
     tran_root = incoming_root / "Transaction Files"
-    if not tran_root.is_dir():
-        return []
-
     tran_dir = _find_client_tran_dir(tran_root, client_id)
     if tran_dir is None:
         return []
@@ -185,15 +168,12 @@ def _find_all_tran_files(
     # Collect files directly in the client folder (flat layout)
     all_files.extend(_find_all_by_patterns(tran_dir, ["*.csv", "*.txt"]))
 
-    # Collect files from year subfolders (nested layout)
+    # Collect files from year subfolders (nested layout), listed in parallel
     _year_re = re.compile(r"^\d{4}$")
-    try:
-        year_dirs = sorted(d for d in tran_dir.iterdir() if d.is_dir() and _year_re.match(d.name))
-    except PermissionError:
-        year_dirs = []
-
-    for yd in year_dirs:
-        all_files.extend(_find_all_by_patterns(yd, ["*.csv", "*.txt"]))
+    year_dirs = [tran_dir / d for d in get_directory_index().subdirs(tran_dir) if _year_re.match(d)]
+    for listing in get_directory_index().listings(year_dirs):
+        if listing is not None:
+            all_files.extend(_match_patterns(listing, ["*.csv", "*.txt"]))
 
     if all_files:
         logger.info(
@@ -208,19 +188,14 @@ def _find_all_tran_files(
 
 def _find_client_tran_dir(tran_root: Path, client_id: str) -> Path | None:
     """Find a transaction folder matching the client ID prefix."""
-    if not tran_root.is_dir():
-        return None
-    try:
-        for d in tran_root.iterdir():
-            if d.is_dir() and (
-                d.name == client_id
-                or d.name.startswith(f"{client_id} ")
-                or d.name.startswith(f"{client_id}-")
-                or d.name.startswith(f"{client_id}_")
-            ):
-                return d
-    except PermissionError:
-        logger.warning("Permission denied scanning %s", tran_root)
+    for name in get_directory_index().subdirs(tran_root):
+        if (
+            name == client_id
+            or name.startswith(f"{client_id} ")
+            or name.startswith(f"{client_id}-")
+            or name.startswith(f"{client_id}_")
+        ):
+            return tran_root / name
     return None
 
 
@@ -267,23 +242,24 @@ def resolve_workspace(
 
 def _find_by_patterns(directory: Path, patterns: list[str]) -> Path | None:
     """Return the first file matching any of the glob patterns."""
+    listing = get_directory_index().listing(directory)
+    if listing is None:
+        return None
     for pattern in patterns:
-        try:
-            matches = sorted(directory.glob(pattern))
-        except PermissionError:
-            logger.warning("Permission denied scanning %s for %s", directory, pattern)
-            continue
+        matches = listing.match(pattern)
         if matches:
-            return matches[-1]  # most recent
+            return matches[-1].path  # most recent
     return None
 
 
 def _find_all_by_patterns(directory: Path, patterns: list[str]) -> list[Path]:
     """Return ALL files matching any of the glob patterns."""
+    listing = get_directory_index().listing(directory)
+    return _match_patterns(listing, patterns) if listing is not None else []
+
+
+def _match_patterns(listing: DirListing, patterns: list[str]) -> list[Path]:
     found: list[Path] = []
     for pattern in patterns:
-        try:
-            found.extend(sorted(directory.glob(pattern)))
-        except PermissionError:
-            logger.warning("Permission denied scanning %s for %s", directory, pattern)
+        found.extend(f.path for f in listing.match(pattern))
     return found
@@ -13,7 +13,7 @@ from shared.types import AnalysisResult
 
 logger = logging.getLogger(__name__)
 
-PIPELINE_NAMES = ("ars", "txn", "ics", "ics_append")
+PIPELINE_NAMES = ("ars", "txn", "ics", "ics_referral", "ics_append")
 
 
 def run_pipeline(
@@ -32,7 +32,7 @@ def run_pipeline(
     Parameters
     ----------
     pipeline : str
-        One of 'ars', 'txn', 'ics', 'ics_append'.
+        One of 'ars', 'txn', 'ics', 'ics_referral', 'ics_append'.
     input_files : dict
         Mapping of file role to Path (e.g. {"oddd": Path("..."), "tran": Path("...")}).
     output_dir : Path
@@ -83,6 +83,10 @@ def run_pipeline(
         results = run_ics(ctx)
         _ensure_deck(results, pipeline, client_id, client_name, output_dir, progress_callback)
         return results
+    elif pipeline == "ics_referral":
+        from ics_toolkit.runner import run_ics_referral
+
+        return run_ics_referral(ctx)
     elif pipeline == "ics_append":
         from ics_toolkit.runner import run_ics_append
 
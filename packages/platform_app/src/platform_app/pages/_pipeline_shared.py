@@ -7,6 +7,8 @@ from pathlib import Path
 
 import streamlit as st
 
+from platform_app.core.job_runner import QUEUED, Job, get_runner
+from platform_app.core.job_runner import extract_progress as _extract_progress
 from platform_app.core.module_registry import ModuleInfo, Product, get_modules_by_product
 from platform_app.core.templates import BUILTIN_TEMPLATES
 
@@ -127,6 +129,8 @@ def render_run_button(
     def _on_click():
         st.session_state[f"{session_key}_running"] = True
         st.session_state[f"{session_key}_start"] = time.time()
+        st.session_state.pop(f"{session_key}_job_id", None)
+        st.session_state.pop(f"{session_key}_job_ids", None)
 
     clicked = st.button(
         "Running..." if is_running else f"{label} ({selected_count} analyses)",
@@ -139,6 +143,61 @@ def render_run_button(
     return clicked or is_running
 
 
+# Seconds between reruns while a background job is in flight.
+JOB_POLL_SECONDS = 1.0
+
+
+def current_job(session_key: str) -> Job | None:
+    """The background job this page last submitted (None before the first run)."""
+    job_id = st.session_state.get(f"{session_key}_job_id")
+    if not job_id:
+        return None
+    runner = get_runner()
+    runner.dispatch()
+    job = runner.store.load(job_id)
+    if job is None:
+        # Job file removed (e.g. logs cleared) -- forget it rather than resubmitting.
+        st.session_state.pop(f"{session_key}_job_id", None)
+        st.session_state.pop(f"{session_key}_job_ids", None)
+        st.session_state[f"{session_key}_running"] = False
+    return job
+
+
+def current_jobs(session_key: str) -> dict[str, Job]:
+    """Background jobs this page last submitted, by the label it gave them.
+
+    For pages that submit several jobs per run (one per segment, ICS plus
+    Referral). Empty before the first run or once any job file is gone.
+    """
+    job_ids: dict[str, str] = st.session_state.get(f"{session_key}_job_ids") or {}
+    if not job_ids:
+        return {}
+    runner = get_runner()
+    runner.dispatch()
+    jobs = {label: runner.store.load(job_id) for label, job_id in job_ids.items()}
+    if any(job is None for job in jobs.values()):
+        # Job file removed (e.g. logs cleared) -- forget the run rather than resubmitting.
+        st.session_state.pop(f"{session_key}_job_ids", None)
+        st.session_state[f"{session_key}_running"] = False
+        return {}
+    return jobs
+
+
+def render_job_progress(job: Job, pipeline_name: str) -> None:
+    """Progress bar, latest message and a Cancel button for an unfinished job."""
+    if job.status == QUEUED:
+        st.info(f"{pipeline_name.upper()} queued -- waiting for a free worker slot...")
+    else:
+        st.progress(min(job.progress, 0.99), text=job.message or "Starting...")
+        st.caption(
+            f"Running in the background for {job.elapsed:.0f}s -- job `{job.job_id}`. "
+            "You can refresh or leave this page; the run continues."
+        )
+    if st.button("Cancel", key=f"_cancel_{job.job_id}", type="secondary"):
+        get_runner().cancel(job.job_id)
+        st.rerun()
+
+
 def render_progress(session_key: str, pipeline_name: str):
     """Render a progress bar + status text. Returns (bar, text) placeholders."""
     bar = st.progress(0, text=f"{pipeline_name.upper()} -- Initializing...")
@@ -225,15 +284,3 @@ def render_results(
                 mime=_MIME.get(f.suffix, "application/octet-stream"),
                 key=f"_dl_{pipeline_name}_{f.name}",
             )
-
-
-def _extract_progress(msg: str) -> float | None:
-    """Extract a fractional progress from a message like '[3/10] ...'."""
-    if "[" in msg and "/" in msg and "]" in msg:
-        try:
-            inside = msg.split("[", 1)[1].split("]", 1)[0]
-            cur, total = inside.split("/")
-            return int(cur) / int(total)
-        except (ValueError, ZeroDivisionError):
-            pass
-    return None
@@ -1,22 +1,22 @@
-"""RPE Batch Run -- run multiple pipelines sequentially for multiple clients."""
+"""RPE Batch Run -- run multiple pipelines for a client as background jobs."""
 
 from __future__ import annotations
 
 import time
-import traceback
 from pathlib import Path
 
 import streamlit as st
 
 from platform_app.components.results_display import render_results
-from platform_app.core.run_logger import RunRecord, generate_run_id, log_run
+from platform_app.core.job_runner import get_runner
+from platform_app.pages._pipeline_shared import JOB_POLL_SECONDS
 
 # ---------------------------------------------------------------------------
 # Header
 # ---------------------------------------------------------------------------
 st.markdown('<p class="uap-label">ANALYSIS / BATCH RUN</p>', unsafe_allow_html=True)
 st.title("Batch Run")
-st.caption("Queue multiple pipelines and execute sequentially.")
+st.caption("Queue multiple pipelines and run them as background jobs.")
 
 # ---------------------------------------------------------------------------
 # Config -- main area, not sidebar
@@ -106,7 +106,9 @@ st.divider()
 # ---------------------------------------------------------------------------
 # Queue display
 # ---------------------------------------------------------------------------
-if not selected and "batch_results" not in st.session_state:
+_batch_active = "batch_job_ids" in st.session_state
+
+if not selected and "batch_results" not in st.session_state and not _batch_active:
     st.info("Select pipelines above to build your execution queue.")
     st.stop()
 
@@ -124,7 +126,7 @@ run_btn = st.button(
     width="stretch",
 )
 
-if selected and not run_btn and "batch_results" not in st.session_state:
+if selected and not run_btn and "batch_results" not in st.session_state and not _batch_active:
     st.markdown('<p class="uap-label">EXECUTION QUEUE</p>', unsafe_allow_html=True)
 
     for i, key in enumerate(selected, 1):
@@ -140,30 +142,19 @@ if selected and not run_btn and "batch_results" not in st.session_state:
     st.stop()
 
 # ---------------------------------------------------------------------------
-# Execute
+# Execute -- each pipeline is submitted as a background job (core.job_runner)
 # ---------------------------------------------------------------------------
-if run_btn:
+if run_btn and not _batch_active:
     # Validation
     if not client_id.strip():
         st.error("Client ID is required.")
         st.stop()
 
-    from platform_app.orchestrator import run_pipeline
-
-    run_id = generate_run_id()
-    all_results: dict[str, dict] = {}
-    all_output_dirs: dict[str, Path] = {}
-    all_timings: dict[str, float] = {}
+    runner = get_runner()
+    job_ids: dict[str, str] = {}
     errors: dict[str, str] = {}
 
-    overall_progress = st.progress(0, text="Starting batch...")
-
-    for i, key in enumerate(selected):
-        overall_progress.progress(
-            i / len(selected),
-            text=f"[{i + 1}/{len(selected)}] Running {key.upper()}...",
-        )
-
+    for key in selected:
         # Resolve files
         input_files: dict[str, Path] = {}
         if key == "ars":
@@ -206,37 +197,60 @@ if run_btn:
             continue
 
         out.mkdir(parents=True, exist_ok=True)
+        job = runner.submit(
+            key,
+            input_files=input_files,
+            output_dir=out,
+            client_id=client_id.strip(),
+            client_name=client_name.strip(),
+            csm=st.session_state.get("uap_csm", ""),
+        )
+        job_ids[key] = job.job_id
+
+    for k in ["batch_results", "batch_output_dirs", "batch_errors", "batch_timings"]:
+        st.session_state.pop(k, None)
+    st.session_state["batch_job_ids"] = job_ids
+    st.session_state["batch_submit_errors"] = errors
+    st.session_state["batch_run_id"] = next(iter(job_ids.values()), "")
+    _batch_active = True
+
+if _batch_active:
+    runner = get_runner()
+    runner.dispatch()
+    job_ids = st.session_state["batch_job_ids"]
+    jobs = {key: runner.store.load(job_id) for key, job_id in job_ids.items()}
+    pending = [key for key, job in jobs.items() if job is not None and not job.finished]
+
+    if pending:
+        st.markdown('<p class="uap-label">RUNNING</p>', unsafe_allow_html=True)
+        done = len(jobs) - len(pending)
+        st.progress(done / len(jobs), text=f"[{done}/{len(jobs)}] pipelines finished")
+        for key, job in jobs.items():
+            if job is None:
+                continue
+            label = f"{key.upper()} -- {job.status.upper()}"
+            if job.status == "running":
+                label += f" ({job.elapsed:.0f}s): {job.message or 'starting...'}"
+            st.markdown(f"**{label}**")
+        st.caption("Jobs run in the background; you can refresh or leave this page.")
+        time.sleep(JOB_POLL_SECONDS)
+        st.rerun()
 
-        t0 = time.time()
-        try:
-            with st.status(f"Running {key.upper()}...", expanded=True) as status:
-                messages: list[str] = []
-
-                def _cb(msg: str, msgs: list[str] = messages, s=status) -> None:
-                    msgs.append(msg)
-                    s.write(msg)
-
-                results = run_pipeline(
-                    key,
-                    input_files=input_files,
-                    output_dir=out,
-                    client_id=client_id.strip(),
-                    client_name=client_name.strip(),
-                    progress_callback=_cb,
-                )
-                elapsed = time.time() - t0
-                status.update(
-                    label=f"{key.upper()} -- {elapsed:.1f}s", state="complete", expanded=False
-                )
-
-            all_results[key] = results
-            all_output_dirs[key] = out
-            all_timings[key] = elapsed
-        except Exception:
-            all_timings[key] = time.time() - t0
-            errors[key] = traceback.format_exc()
-
-    overall_progress.progress(1.0, text="Batch complete!")
+    # All jobs finished -- collect outcomes (each job logged its own run).
+    all_results: dict[str, dict] = {}
+    all_output_dirs: dict[str, Path] = {}
+    all_timings: dict[str, float] = {}
+    errors = dict(st.session_state.get("batch_submit_errors", {}))
+    for key, job in jobs.items():
+        if job is None:
+            errors[key] = "Job record missing"
+            continue
+        all_timings[key] = job.elapsed
+        if job.status == "success":
+            all_results[key] = runner.store.load_results(job.job_id)
+            all_output_dirs[key] = Path(job.output_dir)
+        else:
+            errors[key] = job.error or job.status
 
     total_time = sum(all_timings.values())
     if errors:
@@ -247,26 +261,10 @@ if run_btn:
         st.success(f"All {len(all_results)} pipelines completed in {total_time:.1f}s")
         st.toast("Batch complete!", icon=":material/check_circle:")
 
-    # Log
-    record = RunRecord(
-        run_id=run_id,
-        timestamp=time.strftime("%Y-%m-%d %H:%M:%S"),
-        csm=st.session_state.get("uap_csm", ""),
-        client_id=client_id.strip(),
-        client_name=client_name.strip(),
-        pipeline=",".join(selected),
-        modules_run=selected,
-        runtime_seconds=round(total_time, 1),
-        status="success" if not errors else "partial",
-        output_dir=output_base.strip() or str(out),
-        result_count=sum(len(r) for r in all_results.values()),
-    )
-    try:
-        log_run(record)
-    except Exception:
-        pass
-
     # Store
+    run_id = st.session_state.pop("batch_run_id", "")
+    st.session_state.pop("batch_job_ids", None)
+    st.session_state.pop("batch_submit_errors", None)
     st.session_state["batch_results"] = all_results
     st.session_state["batch_output_dirs"] = all_output_dirs
     st.session_state["batch_errors"] = errors
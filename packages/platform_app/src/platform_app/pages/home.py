@@ -9,6 +9,7 @@ import tempfile
 import time
 import traceback
 import warnings
+from dataclasses import replace
 from pathlib import Path
 
 import pandas as pd
@@ -20,8 +21,9 @@ try:
         load_raw_client_entry,
         resolve_master_config_path,
     )
+    from platform_app.core.dataset_cache import get_dataset_cache, read_odd
+    from platform_app.core.job_runner import PRELOADED_INPUT, SUCCESS, get_runner
     from platform_app.core.module_registry import Product, get_registry
-    from platform_app.core.run_logger import RunRecord, generate_run_id, hash_file, log_run
     from platform_app.core.session_manager import (
         KNOWN_DATA_ROOTS,
         auto_detect_files,
@@ -30,7 +32,7 @@ try:
         discover_months,
     )
     from platform_app.core.templates import load_templates
-    from platform_app.orchestrator import run_pipeline
+    from platform_app.pages._pipeline_shared import JOB_POLL_SECONDS, render_job_progress
     from shared.format_odd import format_odd
 except Exception as _import_err:
     st.error(f"Import error -- check package installation:\n\n```\n{traceback.format_exc()}\n```")
@@ -108,38 +110,6 @@ def _make_status_line(msg: str, pipeline: str) -> str:
     return f"{pipeline.upper()} -- {short}"
 
 
-def _extract_progress(msg: str) -> float | None:
-    """Extract progress fraction (0.0-1.0) from callback message patterns.
-
-    When a message contains both a step prefix [step/total] AND a finer
-    counter (Analysis i/n or Module i/n), computes composite progress:
-        overall = step/total + (1/total) * (i/n)
-    This gives smooth 0->1 progress across all phases.
-    """
-    import re
-
-    # Step prefix: [0/3], [1/3], [ICS 2/5], etc.
-    step_m = re.search(r"\[(?:\w+\s+)?(\d+)/(\d+)\]", msg)
-    step_frac = int(step_m.group(1)) / max(int(step_m.group(2)), 1) if step_m else None
-    step_total = int(step_m.group(2)) if step_m else None
-
-    # Fine-grained: Analysis 5/38
-    fine_m = re.search(r"Analysis (\d+)/(\d+)", msg)
-    if not fine_m:
-        # Fine-grained: Module 3/12
-        fine_m = re.search(r"Module (\d+)/(\d+)", msg)
-    fine_frac = int(fine_m.group(1)) / max(int(fine_m.group(2)), 1) if fine_m else None
-
-    # Composite: step + fine within step
-    if step_frac is not None and fine_frac is not None and step_total:
-        return step_frac + (1.0 / step_total) * fine_frac
-    if fine_frac is not None:
-        return fine_frac
-    if step_frac is not None:
-        return step_frac
-    return None
-
-
 def _read_tran_file(p: Path) -> pd.DataFrame:
     """Read a single transaction file, auto-detecting delimiter and header.
 
@@ -170,7 +140,8 @@ def _read_tran_file(p: Path) -> pd.DataFrame:
 def _load_tran_to_df(file_paths: list[str]) -> pd.DataFrame | None:
     """Load multiple transaction files directly into a DataFrame (no disk write).
 
-    Reads all files, concatenates in memory, and returns the combined DataFrame.
+    Reads all files (parsed files are reused from the app-wide dataset cache
+    while unchanged), concatenates in memory, and returns the combined DataFrame.
     Returns None if no valid files found.
     """
     if not file_paths:
@@ -182,9 +153,11 @@ def _load_tran_to_df(file_paths: list[str]) -> pd.DataFrame | None:
 
     from concurrent.futures import ThreadPoolExecutor
 
+    cache = get_dataset_cache()
+
     def _read_one(p: Path) -> pd.DataFrame | None:
         try:
-            df = _read_tran_file(p)
+            df = cache.get_or_load(p, _read_tran_file, kind="tran")
             logger.info("  Loaded %s: %d rows, %d cols", p.name, len(df), len(df.columns))
             return df
         except Exception as exc:
@@ -982,8 +955,8 @@ _is_running = st.session_state.get("uap_running", False)
 def _on_run_click() -> None:
     """Callback fires BEFORE the page reruns -- disables button immediately."""
     st.session_state["uap_running"] = True
-    st.session_state["uap_progress_log"] = []
     st.session_state["uap_run_start"] = time.time()
+    st.session_state.pop("uap_job_ids", None)
 
 
 st.markdown('<div class="uap-run-btn">', unsafe_allow_html=True)
@@ -1001,304 +974,241 @@ if not run_btn and not _is_running:
     _render_results_dashboard()
     st.stop()
 
-# Guard: if pipeline is already running (user clicked something during execution),
-# show stored progress and poll for completion instead of re-executing.
-if not run_btn and _is_running:
-    _progress_log: list[str] = st.session_state.get("uap_progress_log", [])
-    _run_elapsed = time.time() - st.session_state.get("uap_run_start", time.time())
-
-    st.info(f"Pipeline running ({round(_run_elapsed)}s elapsed)... Do not close this page.")
-    if _progress_log:
-        _last_msg = _progress_log[-1] if _progress_log else "Starting..."
-        _last_frac = _extract_progress(_last_msg) if _progress_log else None
-        st.progress(min(_last_frac or 0.1, 0.99), text=_last_msg)
-    else:
-        st.progress(0, text="Pipeline starting...")
+_job_ids: dict[str, str] = st.session_state.get("uap_job_ids") or {}
 
-    # Poll: wait a few seconds then rerun to check for updates
-    time.sleep(3)
+if not run_btn and not _job_ids:
+    # Running flag without jobs (e.g. the job files were cleared) -- reset.
+    st.session_state["uap_running"] = False
     st.rerun()
 
 # ---------------------------------------------------------------------------
-# Execution -- full analytics dashboard
+# Submit -- prepare inputs, then queue one background job per pipeline
+# (core.job_runner); the run survives refreshes and leaving the page.
 # ---------------------------------------------------------------------------
+if not _job_ids:
+    tran_path = st.session_state.get("uap_file_tran", "")
+    _all_tran_paths = st.session_state.get("uap_tran_files", [])
+    ics_path = st.session_state.get("uap_file_ics", "")
+    t0 = time.time()
+    total_pipelines = len(needed_products)
 
-run_id = generate_run_id()
-all_results: dict[str, dict] = {}
-all_output_dirs: dict[str, Path] = {}
-pipeline_errors: dict[str, str] = {}
-
-tran_path = st.session_state.get("uap_file_tran", "")
-_all_tran_paths = st.session_state.get("uap_tran_files", [])
-ics_path = st.session_state.get("uap_file_ics", "")
-odd_path = st.session_state.get("uap_file_oddd", "")
-t0 = time.time()
-total_pipelines = len(needed_products)
-
-_pipelines_label = " + ".join(
-    p.value.upper() for p in sorted(needed_products, key=lambda x: x.value)
-)
-
-# ---- Single progress tracker: one st.status() per phase ----
-
-# PHASE 1: Data preparation
-_data_status = st.status(f"Step 1 of {total_pipelines + 1} -- Loading data files...", expanded=True)
-_data_status.write(f"Client **{client_id}** -- {_pipelines_label}")
-
-_local_oddd: str = oddd_path
-_local_dir = Path(tempfile.mkdtemp(prefix="uap_run_"))
-_needs_odd = Product.ARS in needed_products or Product.ICS in needed_products
-
-if _needs_odd and oddd_path and Path(oddd_path).exists():
-    _data_status.write("Reading ODD Excel from network drive...")
-    st.session_state.setdefault("uap_progress_log", []).append("Loading ODD Excel...")
-    logger.info("Loading ODD Excel: %s", oddd_path)
-    with warnings.catch_warnings():
-        warnings.filterwarnings("ignore", category=UserWarning, module="openpyxl")
-        _oddd_df = pd.read_excel(oddd_path)
-    _local_csv = _local_dir / (Path(oddd_path).stem + ".csv")
-    _oddd_df.to_csv(_local_csv, index=False)
-    _local_oddd = str(_local_csv)
-    _data_status.write(f"ODD loaded: {len(_oddd_df):,} accounts")
-    logger.info("ODD loaded: %d rows", len(_oddd_df))
-    del _oddd_df
-
-_effective_tran: Path | None = None
-_txn_preloaded_df: pd.DataFrame | None = None
-if Product.TXN in needed_products:
-    n_tran = len(_all_tran_paths)
-    _data_status.write(f"Reading {n_tran} transaction file{'s' if n_tran != 1 else ''}...")
-    st.session_state.setdefault("uap_progress_log", []).append(
-        f"Loading {n_tran} transaction file{'s' if n_tran != 1 else ''}..."
+    _pipelines_label = " + ".join(
+        p.value.upper() for p in sorted(needed_products, key=lambda x: x.value)
     )
-    logger.info("Loading %d transaction files", n_tran)
-
-    if n_tran == 1:
-        # Single file: pass path directly (no combine needed)
-        _effective_tran = Path(_all_tran_paths[0]) if _all_tran_paths else None
-        if not _effective_tran and tran_path:
-            _effective_tran = Path(tran_path)
-    elif n_tran > 1:
-        # Multiple files: load into memory — no disk write
-        _txn_preloaded_df = _load_tran_to_df(_all_tran_paths)
-        if _txn_preloaded_df is not None:
-            _data_status.write(
-                f"Transaction data ready: {len(_txn_preloaded_df):,} rows from {n_tran} files"
-            )
-    else:
-        if tran_path:
-            _effective_tran = Path(tran_path)
 
-    if _effective_tran:
-        _data_status.write(f"Transaction data ready: {_effective_tran.name}")
+    # Data preparation: local copies the workers read instead of the network drive
+    _data_status = st.status("Loading data files...", expanded=True)
+    _data_status.write(f"Client **{client_id}** -- {_pipelines_label}")
 
-_data_elapsed = round(time.time() - t0, 1)
-_data_status.update(
-    label=f"Step 1 of {total_pipelines + 1} -- Data loaded ({_data_elapsed}s)",
-    state="complete",
-    expanded=False,
-)
+    _local_oddd: str = oddd_path
+    _local_dir = Path(tempfile.mkdtemp(prefix="uap_run_"))
+    _needs_odd = Product.ARS in needed_products or Product.ICS in needed_products
 
-# PHASE 2+: Pipeline execution -- progress bar per pipeline
-for idx, product in enumerate(sorted(needed_products, key=lambda p: p.value)):
-    pipeline_name = product.value
-    _step_num = idx + 2
+    if _needs_odd and oddd_path and Path(oddd_path).exists():
+        _data_status.write("Reading ODD Excel from network drive...")
+        logger.info("Loading ODD Excel: %s", oddd_path)
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", category=UserWarning, module="openpyxl")
+            _oddd_df = read_odd(Path(oddd_path))
+        _local_csv = _local_dir / (Path(oddd_path).stem + ".csv")
+        _oddd_df.to_csv(_local_csv, index=False)
+        _local_oddd = str(_local_csv)
+        _data_status.write(f"ODD loaded: {len(_oddd_df):,} accounts")
+        logger.info("ODD loaded: %d rows", len(_oddd_df))
+        del _oddd_df
+
+    _effective_tran: Path | None = None
+    _txn_preloaded: Path | None = None
+    if Product.TXN in needed_products:
+        n_tran = len(_all_tran_paths)
+        _data_status.write(f"Reading {n_tran} transaction file{'s' if n_tran != 1 else ''}...")
+        logger.info("Loading %d transaction files", n_tran)
+
+        if n_tran == 1:
+            # Single file: pass path directly (no combine needed)
+            _effective_tran = Path(_all_tran_paths[0]) if _all_tran_paths else None
+            if not _effective_tran and tran_path:
+                _effective_tran = Path(tran_path)
+        elif n_tran > 1:
+            # Multiple files: combine once and hand the frame to the worker as a pickle
+            _txn_df = _load_tran_to_df(_all_tran_paths)
+            if _txn_df is not None:
+                _txn_preloaded = _local_dir / "tran_combined.pkl"
+                _txn_df.to_pickle(_txn_preloaded)
+                _data_status.write(
+                    f"Transaction data ready: {len(_txn_df):,} rows from {n_tran} files"
+                )
+                del _txn_df
+        else:
+            if tran_path:
+                _effective_tran = Path(tran_path)
+
+        if _effective_tran:
+            _data_status.write(f"Transaction data ready: {_effective_tran.name}")
 
-    st.markdown(
-        f'<p class="uap-label">{pipeline_name.upper()} PIPELINE '
-        f"(Step {_step_num} of {total_pipelines + 1})</p>",
-        unsafe_allow_html=True,
+    _data_elapsed = round(time.time() - t0, 1)
+    _data_status.update(
+        label=f"Data loaded ({_data_elapsed}s) -- queuing {total_pipelines} pipeline(s)",
+        state="complete",
+        expanded=False,
     )
-    _progress_bar = st.progress(0, text=f"{pipeline_name.upper()} -- Initializing...")
-    _status_text = st.empty()
-
-    input_files: dict[str, Path] = {}
-    _pre_loaded_data: pd.DataFrame | None = None
-    if product == Product.ARS:
-        input_files["oddd"] = Path(_local_oddd)
-        out = Path(oddd_path).parent / "output"
-    elif product == Product.TXN:
-        if _txn_preloaded_df is not None:
-            # Multiple files already loaded in memory — skip file I/O
-            _pre_loaded_data = _txn_preloaded_df
-            # Still need a dummy tran key for pipeline detection
-            input_files["tran"] = Path("(preloaded)")
-        elif _effective_tran:
-            input_files["tran"] = _effective_tran
-        if _local_oddd and Path(_local_oddd).exists():
-            input_files["odd"] = Path(_local_oddd)
-        _tran_base = (
-            _effective_tran.parent
-            if _effective_tran
-            else Path(oddd_path).parent
-            if oddd_path
-            else Path(".")
-        )
-        out = _tran_base / "output_txn"
-
-        # Guard: TXN pipeline needs at least one data source
-        if "tran" not in input_files and _pre_loaded_data is None:
-            _err_msg = (
-                "No transaction file found.\n\n"
-                "Expected: CSV file matching *tran*.csv or *txn*.csv pattern "
-                "in the client directory or Transaction Files folder.\n\n"
-                "Check that transaction files exist and match the naming pattern."
-            )
-            pipeline_errors[pipeline_name] = _err_msg
-            logger.error("No transaction file found for TXN pipeline")
-            _progress_bar.progress(1.0, text="TXN FAILED (no transaction file)")
-            _status_text.error("No transaction file found")
-            continue
-    elif product == Product.ICS:
-        input_files["ics"] = Path(ics_path) if ics_path else Path(_local_oddd)
-        out = Path(oddd_path).parent / "output_ics"
-    else:
-        continue
 
-    try:
-        out.mkdir(parents=True, exist_ok=True)
-    except OSError as exc:
-        _err_msg = (
-            f"Cannot create output directory: {out}\n\n"
-            f"If this is a network path (M: drive), check that the drive is connected.\n\n"
-            f"{type(exc).__name__}: {exc}"
-        )
-        pipeline_errors[pipeline_name] = _err_msg
-        logger.error("Output dir creation failed for %s: %s", pipeline_name, exc)
-        _progress_bar.progress(1.0, text=f"{pipeline_name.upper()} FAILED (output dir)")
-        _status_text.error(f"Cannot create output directory: {out}")
-        continue
-
-    def _on_progress(
-        msg: str,
-        _bar=_progress_bar,
-        _text=_status_text,
-        _pipe=pipeline_name,
-    ) -> None:
-        _short = _make_status_line(msg, _pipe)
-        fraction = _extract_progress(msg)
-        if fraction is not None:
-            _bar.progress(min(fraction, 0.99), text=_short)
-        # Always update status text so the user sees what's happening
-        _text.markdown(f"**{_pipe.upper()}** -- {_short}")
-        # Store in session_state so reruns can replay progress
-        _log = st.session_state.get("uap_progress_log")
-        if _log is not None:
-            _log.append(_short)
-
-    _product_keys = [
-        k for k in selected_modules if module_map.get(k) and module_map[k].product == product
-    ]
-    _pipeline_config = {**_client_config}
-    if _product_keys:
-        _pipeline_config["module_ids"] = _product_keys
-
-    # Pass segment filter toggles to TXN pipeline
-    if product == Product.TXN:
-        _seg_ars_on = st.session_state.get("uap_seg_ars", False)
-        _seg_ics_on = st.session_state.get("uap_seg_ics", False)
-        if _seg_ars_on or _seg_ics_on:
-            _pipeline_config["segments"] = {
-                "ars_responders": _seg_ars_on,
-                "ics_accounts": _seg_ics_on,
-            }
-            # TXN segmentation needs the ODD file for account lookup
-            if oddd_path and Path(oddd_path).exists() and "odd" not in input_files:
+    _runner = get_runner()
+    _submit_errors: dict[str, str] = {}
+    for product in sorted(needed_products, key=lambda p: p.value):
+        pipeline_name = product.value
+
+        input_files: dict[str, Path] = {}
+        if product == Product.ARS:
+            input_files["oddd"] = Path(_local_oddd)
+            out = Path(oddd_path).parent / "output"
+        elif product == Product.TXN:
+            if _txn_preloaded is not None:
+                # Multiple files already combined -- the worker loads the pickle
+                input_files[PRELOADED_INPUT] = _txn_preloaded
+                # Still need a dummy tran key for pipeline detection
+                input_files["tran"] = Path("(preloaded)")
+            elif _effective_tran:
+                input_files["tran"] = _effective_tran
+            if _local_oddd and Path(_local_oddd).exists():
                 input_files["odd"] = Path(_local_oddd)
+            _tran_base = (
+                _effective_tran.parent
+                if _effective_tran
+                else Path(oddd_path).parent
+                if oddd_path
+                else Path(".")
+            )
+            out = _tran_base / "output_txn"
+
+            # Guard: TXN pipeline needs at least one data source
+            if "tran" not in input_files:
+                _submit_errors[pipeline_name] = (
+                    "No transaction file found.\n\n"
+                    "Expected: CSV file matching *tran*.csv or *txn*.csv pattern "
+                    "in the client directory or Transaction Files folder.\n\n"
+                    "Check that transaction files exist and match the naming pattern."
+                )
+                logger.error("No transaction file found for TXN pipeline")
+                continue
+        elif product == Product.ICS:
+            input_files["ics"] = Path(ics_path) if ics_path else Path(_local_oddd)
+            out = Path(oddd_path).parent / "output_ics"
+        else:
+            continue
 
-    _status_text.markdown(f"**{pipeline_name.upper()}** -- Starting pipeline...")
-    print(f"[{pipeline_name.upper()}] Starting...")
+        try:
+            out.mkdir(parents=True, exist_ok=True)
+        except OSError as exc:
+            _submit_errors[pipeline_name] = (
+                f"Cannot create output directory: {out}\n\n"
+                f"If this is a network path (M: drive), check that the drive is connected.\n\n"
+                f"{type(exc).__name__}: {exc}"
+            )
+            logger.error("Output dir creation failed for %s: %s", pipeline_name, exc)
+            continue
 
-    step_t0 = time.time()
-    try:
-        results = run_pipeline(
+        _product_keys = [
+            k for k in selected_modules if module_map.get(k) and module_map[k].product == product
+        ]
+        _pipeline_config = {**_client_config}
+        if _product_keys:
+            _pipeline_config["module_ids"] = _product_keys
+
+        # Pass segment filter toggles to TXN pipeline
+        if product == Product.TXN:
+            _seg_ars_on = st.session_state.get("uap_seg_ars", False)
+            _seg_ics_on = st.session_state.get("uap_seg_ics", False)
+            if _seg_ars_on or _seg_ics_on:
+                _pipeline_config["segments"] = {
+                    "ars_responders": _seg_ars_on,
+                    "ics_accounts": _seg_ics_on,
+                }
+                # TXN segmentation needs the ODD file for account lookup
+                if oddd_path and Path(oddd_path).exists() and "odd" not in input_files:
+                    input_files["odd"] = Path(_local_oddd)
+
+        _job = _runner.submit(
             pipeline_name,
             input_files=input_files,
             output_dir=out,
             client_id=client_id,
             client_name=client_name,
             client_config=_pipeline_config,
-            progress_callback=_on_progress,
-            pre_loaded_data=_pre_loaded_data,
+            csm=csm,
         )
-        all_results[pipeline_name] = results
-        all_output_dirs[pipeline_name] = out
-        _step_elapsed = round(time.time() - step_t0, 1)
-        _progress_bar.progress(
-            1.0,
-            text=f"{pipeline_name.upper()} complete -- {len(results)} results in {_step_elapsed}s",
-        )
-        _status_text.empty()
-        print(f"[{pipeline_name.upper()}] Complete -- {len(results)} results ({_step_elapsed}s)")
-        logger.info(
-            "Pipeline %s complete: %d results in %.1fs", pipeline_name, len(results), _step_elapsed
-        )
-    except Exception:
-        import traceback as _tb
-
-        _step_elapsed = round(time.time() - step_t0, 1)
-        _tb_str = _tb.format_exc()
-        pipeline_errors[pipeline_name] = _tb_str
-        _progress_bar.progress(1.0, text=f"{pipeline_name.upper()} FAILED ({_step_elapsed}s)")
-        # Show last line as inline error, full traceback in expander
-        _last_line = _tb_str.strip().rsplit("\n", 1)[-1]
-        _status_text.error(_last_line)
-        with st.expander("Full traceback", expanded=False):
-            st.code(_tb_str, language="python")
-        print(f"[{pipeline_name.upper()}] FAILED ({_step_elapsed}s)")
-        logger.error("Pipeline %s failed for client %s:\n%s", pipeline_name, client_id, _tb_str)
-
-total_elapsed = round(time.time() - t0, 1)
-
-# Re-enable the run button and clear progress log
+        _job_ids[pipeline_name] = _job.job_id
+        logger.info("Pipeline %s queued as job %s", pipeline_name, _job.job_id)
+
+    st.session_state["uap_job_ids"] = _job_ids
+    st.session_state["uap_submit_errors"] = _submit_errors
+    st.session_state["uap_local_dir"] = str(_local_dir)
+    if _job_ids:
+        st.rerun()
+
+# ---------------------------------------------------------------------------
+# Poll -- progress per pipeline while any job is unfinished
+# ---------------------------------------------------------------------------
+_runner = get_runner()
+_runner.dispatch()
+_jobs = {name: _runner.store.load(job_id) for name, job_id in _job_ids.items()}
+
+if any(job is not None and not job.finished for job in _jobs.values()):
+    _run_elapsed = time.time() - st.session_state.get("uap_run_start", time.time())
+    st.info(
+        f"Pipelines running in the background ({round(_run_elapsed)}s elapsed). "
+        "You can refresh or leave this page; the run continues."
+    )
+    for name, job in _jobs.items():
+        if job is None or job.finished:
+            continue
+        st.markdown(f'<p class="uap-label">{name.upper()} PIPELINE</p>', unsafe_allow_html=True)
+        render_job_progress(replace(job, message=_make_status_line(job.message, name)), name)
+    time.sleep(JOB_POLL_SECONDS)
+    st.rerun()
+
+# ---------------------------------------------------------------------------
+# Collect -- every job finished (run history is logged by the workers)
+# ---------------------------------------------------------------------------
+all_results: dict[str, dict] = {}
+all_output_dirs: dict[str, Path] = {}
+pipeline_errors: dict[str, str] = dict(st.session_state.get("uap_submit_errors") or {})
+
+for name, job in _jobs.items():
+    if job is None:
+        pipeline_errors[name] = "Job record missing -- the job files were removed."
+    elif job.status == SUCCESS:
+        all_results[name] = _runner.store.load_results(job.job_id)
+        all_output_dirs[name] = Path(job.output_dir)
+    else:
+        pipeline_errors[name] = job.error or f"Job {job.status}."
+
+total_elapsed = round(time.time() - st.session_state.get("uap_run_start", time.time()), 1)
+
+# Re-enable the run button and clean up the local input copies
 st.session_state["uap_running"] = False
-st.session_state.pop("uap_progress_log", None)
 st.session_state.pop("uap_run_start", None)
-
-# Clean up local copy
-shutil.rmtree(_local_dir, ignore_errors=True)
+st.session_state.pop("uap_job_ids", None)
+st.session_state.pop("uap_submit_errors", None)
+_local_dir_str = st.session_state.pop("uap_local_dir", "")
+if _local_dir_str:
+    shutil.rmtree(_local_dir_str, ignore_errors=True)
 
 # Final summary line
 _ok = len(all_results)
 _fail = len(pipeline_errors)
 if _fail:
     st.warning(
-        f"Completed in {total_elapsed}s -- {_ok} pipeline(s) OK, {_fail} failed. Check errors above."
+        f"Completed in {total_elapsed}s -- {_ok} pipeline(s) OK, {_fail} failed. Check errors below."
     )
 else:
     st.success(f"All {_ok} pipeline(s) complete in {total_elapsed}s.")
 
-# ---------------------------------------------------------------------------
-# Log run
-# ---------------------------------------------------------------------------
-run_status = "success" if not pipeline_errors else ("partial" if all_results else "error")
-first_file = oddd_path or tran_path or ics_path
-
-record = RunRecord(
-    run_id=run_id,
-    timestamp=time.strftime("%Y-%m-%d %H:%M:%S"),
-    csm=csm,
-    client_id=client_id,
-    client_name=client_name,
-    pipeline=",".join(sorted(p.value for p in needed_products)),
-    modules_run=sorted(selected_modules),
-    runtime_seconds=round(time.time() - t0, 1),
-    status=run_status,
-    output_dir=str(out),
-    input_file_hash=hash_file(Path(first_file)) if first_file else "",
-    result_count=sum(len(r) for r in all_results.values()),
-)
-
-try:
-    log_run(record)
-except Exception:
-    pass
-
 # Store results
 st.session_state["uap_last_results"] = all_results
 st.session_state["uap_last_output_dirs"] = all_output_dirs
 st.session_state["uap_last_errors"] = pipeline_errors
-st.session_state["uap_last_run_id"] = run_id
+st.session_state["uap_last_run_id"] = ", ".join(_job_ids.values())
 st.session_state["uap_last_elapsed"] = total_elapsed
 st.session_state["uap_last_client"] = client_name or client_id
 
@@ -1321,9 +1231,12 @@ for out_dir in all_output_dirs.values():
                 continue
             _seen_reports.add(_rpt_key)
             try:
-                _run_reports.append(_json.loads(rpt_path.read_text()))
+                _rpt = _json.loads(rpt_path.read_text())
             except Exception:
-                pass
+                continue
+            # TXN/ICS reports only carry a "profile" -- no slides to diagnose
+            if "slides" in _rpt:
+                _run_reports.append(_rpt)
 
 if _run_reports:
     with st.expander("Slide Diagnostics", expanded=bool(pipeline_errors)):
@@ -0,0 +1,129 @@
+"""RPE Performance -- runtimes and memory across clients from run report profiles."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import streamlit as st
+
+from platform_app.core.perf_report import (
+    find_reports,
+    load_samples,
+    regressions,
+    slowest_runs,
+    span_stats,
+)
+from platform_app.core.run_logger import pipeline_stats
+
+# ---------------------------------------------------------------------------
+# Header
+# ---------------------------------------------------------------------------
+st.markdown('<p class="uap-label">DIAGNOSTICS / PERFORMANCE</p>', unsafe_allow_html=True)
+st.title("Performance")
+st.caption(
+    "Step and module timings collected from every run report. "
+    "Use this to spot slow modules, heavy clients and month-over-month regressions."
+)
+
+# ---------------------------------------------------------------------------
+# Controls
+# ---------------------------------------------------------------------------
+c1, c2, c3 = st.columns([3, 1, 1])
+with c1:
+    extra_roots = st.text_input(
+        "Extra output folders (comma-separated)",
+        key="perf_roots",
+        placeholder="Folders from Run History are always included",
+    )
+with c2:
+    kind = st.selectbox("Level", ["module", "step", "function"], key="perf_kind")
+with c3:
+    threshold = st.number_input(
+        "Regression ratio", min_value=1.0, value=1.25, step=0.05, key="perf_threshold"
+    )
+
+
+@st.cache_data(ttl=300, show_spinner="Collecting run reports...")
+def _load(roots: tuple[str, ...]) -> tuple[pd.DataFrame, int]:
+    reports = find_reports([Path(r) for r in roots])
+    return load_samples(reports), len(reports)
+
+
+roots = tuple(r.strip() for r in extra_roots.split(",") if r.strip())
+samples, n_reports = _load(roots)
+
+# ---------------------------------------------------------------------------
+# Run history summary
+# ---------------------------------------------------------------------------
+stats = pipeline_stats()
+if stats:
+    st.markdown('<p class="uap-label">PIPELINES (RUN HISTORY)</p>', unsafe_allow_html=True)
+    cols = st.columns(len(stats))
+    for col, s in zip(cols, stats):
+        col.metric(
+            s.pipeline.upper(),
+            f"{s.p50_seconds:.0f}s p50",
+            f"p95 {s.p95_seconds:.0f}s / {s.failure_rate:.0%} failed",
+            delta_color="off",
+        )
+
+if samples.empty:
+    st.info(
+        "No profiled run reports found yet. Run reports written after timing "
+        "was added include a profile section."
+    )
+    st.stop()
+
+m1, m2, m3, m4 = st.columns(4)
+m1.metric("Run Reports", n_reports)
+m2.metric("Clients", samples["client_id"].nunique())
+m3.metric("Months", samples["month"].nunique())
+m4.metric("Peak RSS Growth", f"{samples['peak_rss_delta_mb'].max():.0f} MB")
+
+st.divider()
+
+# ---------------------------------------------------------------------------
+# Slowest modules
+# ---------------------------------------------------------------------------
+st.markdown(f'<p class="uap-label">SLOWEST {kind.upper()}S</p>', unsafe_allow_html=True)
+stats_df = span_stats(samples, kind=kind)
+if stats_df.empty:
+    st.info(f"No {kind}-level timings recorded.")
+else:
+    st.bar_chart(stats_df.head(15), x="name", y="p95_s", color="#0090D4")
+    st.dataframe(
+        stats_df.round(2),
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            "name": "Name",
+            "pipeline": "Pipeline",
+            "runs": "Runs",
+            "p50_s": "p50 (s)",
+            "p95_s": "p95 (s)",
+            "max_s": "Max (s)",
+            "max_rss_mb": "Max RSS growth (MB)",
+            "failures": "Failures",
+        },
+    )
+
+# ---------------------------------------------------------------------------
+# Slowest clients
+# ---------------------------------------------------------------------------
+st.divider()
+st.markdown('<p class="uap-label">SLOWEST CLIENT RUNS</p>', unsafe_allow_html=True)
+runs_df = slowest_runs(samples, n=20)
+st.dataframe(runs_df.round(2), use_container_width=True, hide_index=True)
+
+# ---------------------------------------------------------------------------
+# Regressions
+# ---------------------------------------------------------------------------
+st.divider()
+st.markdown('<p class="uap-label">REGRESSIONS VS PREVIOUS MONTH</p>', unsafe_allow_html=True)
+regressed = regressions(samples, kind=kind, threshold=threshold)
+if regressed.empty:
+    st.success("No regressions above the threshold.")
+else:
+    st.warning(f"{len(regressed)} {kind}(s) slowed down by {threshold:.2f}x or more.")
+    st.dataframe(regressed.round(2), use_container_width=True, hide_index=True)
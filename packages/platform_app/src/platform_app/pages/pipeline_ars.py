@@ -8,15 +8,15 @@ from pathlib import Path
 
 import streamlit as st
 
+from platform_app.core.job_runner import get_runner
 from platform_app.core.module_registry import Product
-from platform_app.core.run_logger import RunRecord, generate_run_id, hash_file, log_run
-from platform_app.orchestrator import run_pipeline
 from platform_app.pages._pipeline_shared import (
-    make_progress_callback,
+    JOB_POLL_SECONDS,
+    current_job,
     render_file_input,
+    render_job_progress,
     render_module_picker,
     render_preset_picker,
-    render_progress,
     render_results,
     render_run_button,
 )
@@ -91,17 +91,53 @@ if errors:
         st.warning(e)
 
 # ---------------------------------------------------------------------------
-# Run
+# Run -- the pipeline executes as a background job (core.job_runner)
 # ---------------------------------------------------------------------------
 should_run = render_run_button("Run ARS Analysis", PREFIX, len(selected))
+job = current_job(PREFIX)
+should_run = should_run and st.session_state.get(f"{PREFIX}_running", False)
+
+if should_run and errors:
+    st.session_state[f"{PREFIX}_running"] = False
+    st.stop()
+
+if should_run and job is None:
+    output_path = Path(out_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+    client_config: dict = {"client_id": client_id}
+    if selected:
+        client_config["module_ids"] = sorted(selected)
+    job = get_runner().submit(
+        "ars",
+        input_files={"oddd": Path(odd_path)},
+        output_dir=output_path,
+        client_id=client_id,
+        client_config=client_config,
+    )
+    st.session_state[f"{PREFIX}_job_id"] = job.job_id
+    logger.info("ARS submitted as job %s", job.job_id)
+
+if job is not None and not job.finished:
+    render_job_progress(job, "ars")
+    time.sleep(JOB_POLL_SECONDS)
+    st.rerun()
+
+if job is not None and st.session_state.get(f"{PREFIX}_running"):
+    # Job just finished -- keep its outcome for later reruns (run history is
+    # logged by the worker).
+    st.session_state[f"{PREFIX}_running"] = False
+    st.session_state[f"{PREFIX}_last_results"] = get_runner().store.load_results(job.job_id)
+    st.session_state[f"{PREFIX}_last_error"] = job.error or None
+    st.session_state[f"{PREFIX}_last_elapsed"] = round(job.elapsed, 1)
+    st.session_state[f"{PREFIX}_last_out_dir"] = job.output_dir
+    logger.info("ARS job %s finished: %s", job.job_id, job.status)
 
-# Show previous results if not running
 prev_results = st.session_state.get(f"{PREFIX}_last_results")
 prev_errors = st.session_state.get(f"{PREFIX}_last_error")
 prev_elapsed = st.session_state.get(f"{PREFIX}_last_elapsed", 0)
 prev_out = st.session_state.get(f"{PREFIX}_last_out_dir", "")
 
-if not should_run and (prev_results is not None or prev_errors):
+if prev_results is not None or prev_errors:
     render_results(
         prev_results or {},
         Path(prev_out) if prev_out else Path("."),
@@ -109,80 +145,3 @@ if not should_run and (prev_results is not None or prev_errors):
         "ars",
         errors=prev_errors,
     )
-    st.stop()
-
-if not should_run:
-    st.stop()
-
-if errors:
-    st.session_state[f"{PREFIX}_running"] = False
-    st.stop()
-
-# ---------------------------------------------------------------------------
-# Execution
-# ---------------------------------------------------------------------------
-run_id = generate_run_id()
-output_path = Path(out_dir)
-output_path.mkdir(parents=True, exist_ok=True)
-
-bar, status_text = render_progress(PREFIX, "ars")
-
-input_files: dict[str, Path] = {"oddd": Path(odd_path)}
-client_config: dict = {"client_id": client_id}
-if selected:
-    client_config["module_ids"] = sorted(selected)
-
-t0 = time.time()
-pipeline_error: str | None = None
-results: dict = {}
-
-try:
-    results = run_pipeline(
-        "ars",
-        input_files=input_files,
-        output_dir=output_path,
-        client_id=client_id,
-        client_config=client_config,
-        progress_callback=make_progress_callback(bar, status_text, "ars", PREFIX),
-    )
-    elapsed = round(time.time() - t0, 1)
-    bar.progress(1.0, text=f"ARS complete -- {len(results)} results in {elapsed}s")
-    status_text.empty()
-    logger.info("ARS complete: %d results in %.1fs", len(results), elapsed)
-except Exception:
-    import traceback
-
-    elapsed = round(time.time() - t0, 1)
-    pipeline_error = traceback.format_exc()
-    bar.progress(1.0, text=f"ARS FAILED ({elapsed}s)")
-    logger.error("ARS failed:\n%s", pipeline_error)
-
-# Store results
-st.session_state[f"{PREFIX}_running"] = False
-st.session_state[f"{PREFIX}_last_results"] = results
-st.session_state[f"{PREFIX}_last_error"] = pipeline_error
-st.session_state[f"{PREFIX}_last_elapsed"] = elapsed
-st.session_state[f"{PREFIX}_last_out_dir"] = str(output_path)
-
-# Log run
-try:
-    record = RunRecord(
-        run_id=run_id,
-        timestamp=time.strftime("%Y-%m-%d %H:%M:%S"),
-        csm="",
-        client_id=client_id,
-        client_name="",
-        pipeline="ars",
-        modules_run=sorted(selected),
-        runtime_seconds=elapsed,
-        status="success" if not pipeline_error else "error",
-        output_dir=str(output_path),
-        input_file_hash=hash_file(Path(odd_path)),
-        result_count=len(results),
-    )
-    log_run(record)
-except Exception:
-    pass
-
-# Render results
-render_results(results, output_path, elapsed, "ars", errors=pipeline_error)
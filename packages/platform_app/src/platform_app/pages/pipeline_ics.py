@@ -8,15 +8,15 @@ from pathlib import Path
 
 import streamlit as st
 
+from platform_app.core.job_runner import get_runner
 from platform_app.core.module_registry import Product
-from platform_app.core.run_logger import RunRecord, generate_run_id, hash_file, log_run
-from platform_app.orchestrator import run_pipeline
 from platform_app.pages._pipeline_shared import (
-    make_progress_callback,
+    JOB_POLL_SECONDS,
+    current_jobs,
     render_file_input,
+    render_job_progress,
     render_module_picker,
     render_preset_picker,
-    render_progress,
     render_results,
     render_run_button,
 )
@@ -138,17 +138,81 @@ if errors:
         st.warning(e)
 
 # ---------------------------------------------------------------------------
-# Run
+# Run -- ICS and Referral Intelligence execute as background jobs (core.job_runner)
 # ---------------------------------------------------------------------------
 should_run = render_run_button("Run ICS Analysis", PREFIX, total_count)
+jobs = current_jobs(PREFIX)
+should_run = should_run and st.session_state.get(f"{PREFIX}_running", False)
+
+if should_run and errors:
+    st.session_state[f"{PREFIX}_running"] = False
+    st.stop()
+
+if should_run and not jobs:
+    output_path = Path(out_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+    client_config: dict = {"client_id": client_id}
+    if selected:
+        client_config["module_ids"] = sorted(selected)
+    if per_section:
+        client_config["per_section"] = True
+
+    runner = get_runner()
+    jobs["ics"] = runner.submit(
+        "ics",
+        input_files={"ics": Path(ics_path)},
+        output_dir=output_path,
+        client_id=client_id,
+        client_config=client_config,
+    )
+    if enable_referral:
+        jobs["referral"] = runner.submit(
+            "ics_referral",
+            input_files={"referral": Path(referral_path)},
+            output_dir=output_path / "referral",
+            client_id=client_id,
+        )
+    st.session_state[f"{PREFIX}_job_ids"] = {name: j.job_id for name, j in jobs.items()}
+    logger.info("ICS submitted as job(s) %s", ", ".join(j.job_id for j in jobs.values()))
+
+if any(not j.finished for j in jobs.values()):
+    for name, job in jobs.items():
+        if not job.finished:
+            render_job_progress(job, name)
+    time.sleep(JOB_POLL_SECONDS)
+    st.rerun()
+
+if jobs and st.session_state.get(f"{PREFIX}_running"):
+    # Jobs just finished -- keep their outcome for later reruns (run history
+    # is logged by the workers).
+    store = get_runner().store
+    ics_job = jobs["ics"]
+    st.session_state[f"{PREFIX}_running"] = False
+    st.session_state[f"{PREFIX}_last_results"] = store.load_results(ics_job.job_id)
+    st.session_state[f"{PREFIX}_last_error"] = ics_job.error or None
+    st.session_state[f"{PREFIX}_last_elapsed"] = round(max(j.elapsed for j in jobs.values()), 1)
+    st.session_state[f"{PREFIX}_last_out_dir"] = ics_job.output_dir
+
+    ref_job = jobs.get("referral")
+    ref_summary: dict | None = None
+    if ref_job is not None and not ref_job.error:
+        ref_results = store.load_results(ref_job.job_id)
+        ref_summary = {
+            "analyses": [{"name": r.name, "error": r.error} for r in ref_results.values()],
+            "chart_pngs": {
+                name: True for name, r in ref_results.items() if r.metadata.get("has_chart")
+            },
+        }
+    st.session_state[f"{PREFIX}_last_referral_results"] = ref_summary
+    st.session_state[f"{PREFIX}_last_referral_error"] = (ref_job.error or None) if ref_job else None
+    logger.info("ICS job(s) finished: %s", ", ".join(j.status for j in jobs.values()))
 
-# Show previous results
 prev_results = st.session_state.get(f"{PREFIX}_last_results")
 prev_errors = st.session_state.get(f"{PREFIX}_last_error")
 prev_elapsed = st.session_state.get(f"{PREFIX}_last_elapsed", 0)
 prev_out = st.session_state.get(f"{PREFIX}_last_out_dir", "")
 
-if not should_run and (prev_results is not None or prev_errors):
+if prev_results is not None or prev_errors:
     render_results(
         prev_results or {},
         Path(prev_out) if prev_out else Path("."),
@@ -171,174 +235,10 @@ if not should_run and (prev_results is not None or prev_errors):
             with st.expander("Error Details"):
                 st.code(prev_ref_err)
         elif prev_ref:
-            ref_result = prev_ref
-            n_analyses = len(ref_result.get("analyses", []))
-            n_charts = len(ref_result.get("chart_pngs", {}))
+            n_analyses = len(prev_ref.get("analyses", []))
+            n_charts = len(prev_ref.get("chart_pngs", {}))
             cols = st.columns(3)
             cols[0].metric("Referral Analyses", n_analyses)
             cols[1].metric("Charts Generated", n_charts)
             cols[2].metric("Status", "Complete")
-    st.stop()
-
-if not should_run:
-    st.stop()
-
-if errors:
-    st.session_state[f"{PREFIX}_running"] = False
-    st.stop()
-
-# ---------------------------------------------------------------------------
-# Execution -- ICS Pipeline
-# ---------------------------------------------------------------------------
-run_id = generate_run_id()
-output_path = Path(out_dir)
-output_path.mkdir(parents=True, exist_ok=True)
-
-bar, status_text = render_progress(PREFIX, "ics")
-
-input_files: dict[str, Path] = {"ics": Path(ics_path)}
-client_config: dict = {"client_id": client_id}
-if selected:
-    client_config["module_ids"] = sorted(selected)
-if per_section:
-    client_config["per_section"] = True
-
-t0 = time.time()
-pipeline_error: str | None = None
-results: dict = {}
-
-try:
-    results = run_pipeline(
-        "ics",
-        input_files=input_files,
-        output_dir=output_path,
-        client_id=client_id,
-        client_config=client_config,
-        progress_callback=make_progress_callback(bar, status_text, "ics", PREFIX),
-    )
-    elapsed_ics = round(time.time() - t0, 1)
-    bar.progress(1.0, text=f"ICS complete -- {len(results)} results in {elapsed_ics}s")
-    status_text.empty()
-    logger.info("ICS complete: %d results in %.1fs", len(results), elapsed_ics)
-except Exception:
-    import traceback
-
-    elapsed_ics = round(time.time() - t0, 1)
-    pipeline_error = traceback.format_exc()
-    bar.progress(1.0, text=f"ICS FAILED ({elapsed_ics}s)")
-    logger.error("ICS failed:\n%s", pipeline_error)
-
-# ---------------------------------------------------------------------------
-# Execution -- Referral Intelligence (if enabled)
-# ---------------------------------------------------------------------------
-referral_result_data: dict | None = None
-referral_error: str | None = None
-
-if enable_referral and referral_path and not pipeline_error:
-    st.divider()
-    st.markdown(
-        '<p style="font-size:0.82rem;font-weight:700;color:#475569;'
-        'text-transform:uppercase;">REFERRAL INTELLIGENCE</p>',
-        unsafe_allow_html=True,
-    )
-    ref_bar = st.progress(0, text="Referral Intelligence -- Initializing...")
-    ref_text = st.empty()
-
-    try:
-        from ics_toolkit.referral.pipeline import export_outputs
-        from ics_toolkit.referral.pipeline import run_pipeline as run_referral
-        from ics_toolkit.settings import ReferralSettings
-
-        ref_settings = ReferralSettings(
-            input_file=Path(referral_path),
-            output_dir=output_path / "referral",
-            client_id=client_id,
-        )
-
-        def _ref_progress(step: int, total: int, msg: str) -> None:
-            frac = step / total if total > 0 else 0
-            ref_bar.progress(min(frac, 0.99), text=f"Referral -- {msg}")
-            ref_text.markdown(f"**REFERRAL** -- {msg}")
-
-        t_ref = time.time()
-        ref_result = run_referral(ref_settings, on_progress=_ref_progress)
-        ref_elapsed = round(time.time() - t_ref, 1)
-
-        # Export outputs
-        export_outputs(ref_result)
-
-        n_analyses = len(ref_result.analyses)
-        n_charts = len(ref_result.chart_pngs)
-        ref_bar.progress(
-            1.0,
-            text=f"Referral complete -- {n_analyses} analyses, {n_charts} charts in {ref_elapsed}s",
-        )
-        ref_text.empty()
-
-        referral_result_data = {
-            "analyses": [{"name": a.name, "error": a.error} for a in ref_result.analyses],
-            "chart_pngs": {k: True for k in ref_result.chart_pngs},
-        }
-        logger.info(
-            "Referral complete: %d analyses, %d charts in %.1fs", n_analyses, n_charts, ref_elapsed
-        )
-    except Exception:
-        import traceback
-
-        referral_error = traceback.format_exc()
-        ref_bar.progress(1.0, text="Referral FAILED")
-        logger.error("Referral failed:\n%s", referral_error)
-
-elapsed = round(time.time() - t0, 1)
-
-# Store results
-st.session_state[f"{PREFIX}_running"] = False
-st.session_state[f"{PREFIX}_last_results"] = results
-st.session_state[f"{PREFIX}_last_error"] = pipeline_error
-st.session_state[f"{PREFIX}_last_elapsed"] = elapsed
-st.session_state[f"{PREFIX}_last_out_dir"] = str(output_path)
-st.session_state[f"{PREFIX}_last_referral_results"] = referral_result_data
-st.session_state[f"{PREFIX}_last_referral_error"] = referral_error
-
-# Log run
-try:
-    record = RunRecord(
-        run_id=run_id,
-        timestamp=time.strftime("%Y-%m-%d %H:%M:%S"),
-        csm="",
-        client_id=client_id,
-        client_name="",
-        pipeline="ics" + ("+referral" if enable_referral else ""),
-        modules_run=sorted(selected),
-        runtime_seconds=elapsed,
-        status="success" if not pipeline_error else "error",
-        output_dir=str(output_path),
-        input_file_hash=hash_file(Path(ics_path)),
-        result_count=len(results),
-    )
-    log_run(record)
-except Exception:
-    pass
-
-# Render results
-render_results(results, output_path, elapsed, "ics", errors=pipeline_error)
-
-if referral_result_data and not referral_error:
-    st.divider()
-    st.markdown(
-        '<p style="font-size:0.82rem;font-weight:700;color:#475569;'
-        'text-transform:uppercase;">REFERRAL INTELLIGENCE RESULTS</p>',
-        unsafe_allow_html=True,
-    )
-    n_a = len(referral_result_data.get("analyses", []))
-    n_c = len(referral_result_data.get("chart_pngs", {}))
-    cols = st.columns(3)
-    cols[0].metric("Referral Analyses", n_a)
-    cols[1].metric("Charts Generated", n_c)
-    cols[2].metric("Status", "Complete")
-    st.success(f"Referral Intelligence -- {n_a} analyses, {n_c} charts")
-elif referral_error:
-    st.divider()
-    st.error("Referral Intelligence failed")
-    with st.expander("Referral Error Details"):
-        st.code(referral_error)
+            st.success(f"Referral Intelligence -- {n_analyses} analyses, {n_charts} charts")
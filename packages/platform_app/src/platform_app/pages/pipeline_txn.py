@@ -14,15 +14,15 @@ from pathlib import Path
 
 import streamlit as st
 
+from platform_app.core.job_runner import get_runner
 from platform_app.core.module_registry import Product
-from platform_app.core.run_logger import RunRecord, generate_run_id, hash_file, log_run
-from platform_app.orchestrator import run_pipeline
 from platform_app.pages._pipeline_shared import (
-    make_progress_callback,
+    JOB_POLL_SECONDS,
+    current_jobs,
     render_file_input,
+    render_job_progress,
     render_module_picker,
     render_preset_picker,
-    render_progress,
     render_results,
     render_run_button,
 )
@@ -274,204 +274,92 @@ run_label = (
 )
 
 # ---------------------------------------------------------------------------
-# Run
+# Run -- one background job per segment (core.job_runner)
 # ---------------------------------------------------------------------------
 should_run = render_run_button(run_label, PREFIX, len(selected) * n_segments)
+jobs = current_jobs(PREFIX)
+should_run = should_run and st.session_state.get(f"{PREFIX}_running", False)
 
-# Show previous results
-prev_results = st.session_state.get(f"{PREFIX}_last_results")
-prev_errors = st.session_state.get(f"{PREFIX}_last_error")
-prev_elapsed = st.session_state.get(f"{PREFIX}_last_elapsed", 0)
-prev_out = st.session_state.get(f"{PREFIX}_last_out_dir", "")
-prev_segments = st.session_state.get(f"{PREFIX}_last_segments", {})
-
-if not should_run and (prev_results is not None or prev_errors):
-    if prev_segments and len(prev_segments) > 1:
-        _render_segment_results(prev_segments, prev_elapsed, prev_errors)
-    else:
-        render_results(
-            prev_results or {},
-            Path(prev_out) if prev_out else Path("."),
-            prev_elapsed,
-            "txn",
-            errors=prev_errors,
-        )
-    st.stop()
-
-if not should_run:
-    st.stop()
-
-if errors:
+if should_run and errors:
     st.session_state[f"{PREFIX}_running"] = False
     st.stop()
 
-# ---------------------------------------------------------------------------
-# Execution -- run TXN for each segment
-# ---------------------------------------------------------------------------
-run_id = generate_run_id()
-output_path = Path(out_dir)
-output_path.mkdir(parents=True, exist_ok=True)
-
-t0 = time.time()
-
-# Single segment (All only) -- simple path
-if segments_selected == ["all"]:
-    bar, status_text = render_progress(PREFIX, "txn")
-
+if should_run and not jobs:
+    output_path = Path(out_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
     input_files: dict[str, Path] = {"tran": Path(txn_path)}
     if odd_path and Path(odd_path).exists():
         input_files["odd"] = Path(odd_path)
 
-    client_config: dict = {"client_id": client_id}
-    if selected:
-        client_config["module_ids"] = sorted(selected)
-
-    pipeline_error: str | None = None
-    results: dict = {}
-
-    try:
-        results = run_pipeline(
+    runner = get_runner()
+    single = segments_selected == ["all"]
+    for segment in segments_selected:
+        client_config: dict = {"client_id": client_id}
+        if not single:
+            client_config["txn_segment"] = segment
+        if selected:
+            client_config["module_ids"] = sorted(selected)
+        jobs[segment] = runner.submit(
             "txn",
             input_files=input_files,
-            output_dir=output_path,
+            output_dir=output_path if single else output_path / segment,
             client_id=client_id,
             client_config=client_config,
-            progress_callback=make_progress_callback(bar, status_text, "txn", PREFIX),
         )
-        elapsed = round(time.time() - t0, 1)
-        bar.progress(1.0, text=f"TXN complete -- {len(results)} results in {elapsed}s")
-        status_text.empty()
-        logger.info("TXN complete: %d results in %.1fs", len(results), elapsed)
-    except Exception:
-        import traceback
-
-        elapsed = round(time.time() - t0, 1)
-        pipeline_error = traceback.format_exc()
-        bar.progress(1.0, text=f"TXN FAILED ({elapsed}s)")
-        logger.error("TXN failed:\n%s", pipeline_error)
-
-    # Store results
+    st.session_state[f"{PREFIX}_job_ids"] = {seg: j.job_id for seg, j in jobs.items()}
+    logger.info("TXN submitted as job(s) %s", ", ".join(j.job_id for j in jobs.values()))
+
+if any(not j.finished for j in jobs.values()):
+    for segment, job in jobs.items():
+        if not job.finished:
+            render_job_progress(job, f"txn ({_SEGMENT_LABELS.get(segment, segment)})")
+    time.sleep(JOB_POLL_SECONDS)
+    st.rerun()
+
+if jobs and st.session_state.get(f"{PREFIX}_running"):
+    # Jobs just finished -- keep their outcome for later reruns (run history
+    # is logged by the workers).
+    store = get_runner().store
     st.session_state[f"{PREFIX}_running"] = False
-    st.session_state[f"{PREFIX}_last_results"] = results
-    st.session_state[f"{PREFIX}_last_error"] = pipeline_error
-    st.session_state[f"{PREFIX}_last_elapsed"] = elapsed
-    st.session_state[f"{PREFIX}_last_out_dir"] = str(output_path)
-    st.session_state[f"{PREFIX}_last_segments"] = {}
-
-    # Log run
-    try:
-        record = RunRecord(
-            run_id=run_id,
-            timestamp=time.strftime("%Y-%m-%d %H:%M:%S"),
-            csm="",
-            client_id=client_id,
-            client_name="",
-            pipeline="txn",
-            modules_run=sorted(selected),
-            runtime_seconds=elapsed,
-            status="success" if not pipeline_error else "error",
-            output_dir=str(output_path),
-            input_file_hash=hash_file(Path(txn_path)),
-            result_count=len(results),
-        )
-        log_run(record)
-    except Exception:
-        pass
-
-    render_results(results, output_path, elapsed, "txn", errors=pipeline_error)
-
-else:
-    # Multi-segment path
-    segment_results: dict[str, dict] = {}
-    segment_errors: dict[str, str] = {}
-
-    for seg_idx, segment in enumerate(segments_selected):
-        seg_label = _SEGMENT_LABELS.get(segment, segment)
-        seg_out = output_path / segment
-
-        st.markdown(
-            f'<p style="font-size:0.82rem;font-weight:700;color:#475569;'
-            f'text-transform:uppercase;">SEGMENT {seg_idx + 1}/{len(segments_selected)}: '
-            f"{seg_label}</p>",
-            unsafe_allow_html=True,
-        )
-
-        bar, status_text = render_progress(f"{PREFIX}_{segment}", f"txn ({seg_label})")
-
-        input_files = {"tran": Path(txn_path)}
-        if odd_path and Path(odd_path).exists():
-            input_files["odd"] = Path(odd_path)
-
-        client_config = {
-            "client_id": client_id,
-            "txn_segment": segment,
+    st.session_state[f"{PREFIX}_last_elapsed"] = round(max(j.elapsed for j in jobs.values()), 1)
+    st.session_state[f"{PREFIX}_last_out_dir"] = out_dir
+    if list(jobs) == ["all"]:
+        job = jobs["all"]
+        st.session_state[f"{PREFIX}_last_results"] = store.load_results(job.job_id)
+        st.session_state[f"{PREFIX}_last_error"] = job.error or None
+        st.session_state[f"{PREFIX}_last_out_dir"] = job.output_dir
+        st.session_state[f"{PREFIX}_last_segments"] = {}
+    else:
+        segment_results = {
+            seg: store.load_results(j.job_id) for seg, j in jobs.items() if not j.error
         }
-        if selected:
-            client_config["module_ids"] = sorted(selected)
-
-        try:
-            seg_out.mkdir(parents=True, exist_ok=True)
-            results = run_pipeline(
-                "txn",
-                input_files=input_files,
-                output_dir=seg_out,
-                client_id=client_id,
-                client_config=client_config,
-                progress_callback=make_progress_callback(
-                    bar, status_text, f"txn ({seg_label})", PREFIX
-                ),
-            )
-            bar.progress(1.0, text=f"{seg_label} complete -- {len(results)} results")
-            status_text.empty()
-            segment_results[segment] = results
-            logger.info("TXN %s complete: %d results", segment, len(results))
-        except Exception:
-            import traceback
-
-            tb = traceback.format_exc()
-            segment_errors[segment] = tb
-            bar.progress(1.0, text=f"{seg_label} FAILED")
-            logger.error("TXN %s failed:\n%s", segment, tb)
+        segment_errors = {seg: j.error for seg, j in jobs.items() if j.error}
+        st.session_state[f"{PREFIX}_last_results"] = segment_results
+        st.session_state[f"{PREFIX}_last_error"] = segment_errors or None
+        st.session_state[f"{PREFIX}_last_segments"] = {
+            seg: {
+                "results": segment_results.get(seg, {}),
+                "error": segment_errors.get(seg),
+                "label": _SEGMENT_LABELS.get(seg, seg),
+            }
+            for seg in jobs
+        }
+    logger.info("TXN job(s) finished: %s", ", ".join(j.status for j in jobs.values()))
 
-    elapsed = round(time.time() - t0, 1)
+prev_results = st.session_state.get(f"{PREFIX}_last_results")
+prev_errors = st.session_state.get(f"{PREFIX}_last_error")
+prev_elapsed = st.session_state.get(f"{PREFIX}_last_elapsed", 0)
+prev_out = st.session_state.get(f"{PREFIX}_last_out_dir", "")
+prev_segments = st.session_state.get(f"{PREFIX}_last_segments", {})
 
-    # Store results
-    st.session_state[f"{PREFIX}_running"] = False
-    st.session_state[f"{PREFIX}_last_results"] = segment_results
-    st.session_state[f"{PREFIX}_last_error"] = segment_errors if segment_errors else None
-    st.session_state[f"{PREFIX}_last_elapsed"] = elapsed
-    st.session_state[f"{PREFIX}_last_out_dir"] = str(output_path)
-    st.session_state[f"{PREFIX}_last_segments"] = {
-        seg: {
-            "results": segment_results.get(seg, {}),
-            "error": segment_errors.get(seg),
-            "label": _SEGMENT_LABELS.get(seg, seg),
-        }
-        for seg in segments_selected
-    }
-
-    # Log run
-    try:
-        record = RunRecord(
-            run_id=run_id,
-            timestamp=time.strftime("%Y-%m-%d %H:%M:%S"),
-            csm="",
-            client_id=client_id,
-            client_name="",
-            pipeline="txn",
-            modules_run=sorted(selected),
-            runtime_seconds=elapsed,
-            status="success" if not segment_errors else "partial",
-            output_dir=str(output_path),
-            input_file_hash=hash_file(Path(txn_path)),
-            result_count=sum(len(r) for r in segment_results.values()),
+if prev_results is not None or prev_errors:
+    if prev_segments and len(prev_segments) > 1:
+        _render_segment_results(prev_segments, prev_elapsed, prev_errors)
+    else:
+        render_results(
+            prev_results or {},
+            Path(prev_out) if prev_out else Path("."),
+            prev_elapsed,
+            "txn",
+            errors=prev_errors,
         )
-        log_run(record)
-    except Exception:
-        pass
-
-    _render_segment_results(
-        st.session_state[f"{PREFIX}_last_segments"],
-        elapsed,
-        segment_errors if segment_errors else None,
-    )
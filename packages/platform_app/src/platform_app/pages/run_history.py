@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
-from collections import Counter
+import time
+from datetime import datetime
 
 import pandas as pd
 import streamlit as st
 
-from platform_app.core.run_logger import load_history
+from platform_app.core.job_runner import FINISHED_STATES, get_runner
+from platform_app.core.run_logger import count_runs, pipeline_stats, query_runs, status_counts
 
 # ---------------------------------------------------------------------------
 # Header
@@ -16,24 +18,80 @@ st.markdown('<p class="uap-label">OUTPUTS / RUN HISTORY</p>', unsafe_allow_html=
 st.title("Run History")
 st.caption("Track all pipeline executions with timing, status, and output paths.")
 
+# ---------------------------------------------------------------------------
+# Background jobs -- queued / running / recently finished
+# ---------------------------------------------------------------------------
+_runner = get_runner()
+_runner.dispatch()
+jobs = _runner.store.list_jobs(limit=25)
+active = [j for j in jobs if j.status not in FINISHED_STATES]
+
+if jobs:
+    st.markdown('<p class="uap-label">JOBS</p>', unsafe_allow_html=True)
+    st.caption(
+        f"{len(active)} active -- up to {_runner.max_slots} run at once. "
+        "Finished jobs also appear in the run list below."
+    )
+    st.dataframe(
+        pd.DataFrame(
+            [
+                {
+                    "Job ID": j.job_id,
+                    "Submitted": datetime.fromtimestamp(j.submitted_at).strftime(
+                        "%Y-%m-%d %H:%M:%S"
+                    ),
+                    "Client": j.client_id,
+                    "Pipeline": j.pipeline,
+                    "Status": j.status.upper(),
+                    "Progress": f"{j.progress:.0%}",
+                    "Time (s)": f"{j.elapsed:.1f}",
+                    "Last Message": j.message,
+                }
+                for j in jobs
+            ]
+        ),
+        use_container_width=True,
+        hide_index=True,
+    )
+    for j in active:
+        if st.button(f"Cancel {j.job_id}", key=f"hist_cancel_{j.job_id}", type="secondary"):
+            _runner.cancel(j.job_id)
+            st.rerun()
+    if active:
+        st.toggle("Auto-refresh while jobs are active", value=True, key="hist_jobs_auto")
+    st.divider()
+
+
+def _refresh_jobs() -> None:
+    """Poll again shortly while jobs are queued or running."""
+    if active and st.session_state.get("hist_jobs_auto", True):
+        time.sleep(2)
+        st.rerun()
+
+
 # ---------------------------------------------------------------------------
 # Load history
 # ---------------------------------------------------------------------------
-history = load_history(limit=200)
+PAGE_SIZE = 50
 
-if not history:
+counts = status_counts()
+total = sum(counts.values())
+
+if not total:
     st.info("No run history yet. Execute a pipeline from **Run Analysis** or **Batch Run**.")
+    _refresh_jobs()
     st.stop()
 
+stats = pipeline_stats()
+
 # ---------------------------------------------------------------------------
 # Summary metrics
 # ---------------------------------------------------------------------------
-total = len(history)
-successes = sum(1 for r in history if r.status == "success")
-failures = sum(1 for r in history if r.status == "error")
-partials = sum(1 for r in history if r.status == "partial")
-avg_time = sum(r.runtime_seconds for r in history) / total if total else 0
-success_rate = (successes / total * 100) if total else 0
+successes = counts.get("success", 0)
+failures = counts.get("error", 0)
+partials = counts.get("partial", 0)
+avg_time = sum(s.mean_seconds * s.runs for s in stats) / total
+success_rate = successes / total * 100
 
 m1, m2, m3, m4, m5, m6 = st.columns(6)
 m1.metric("Total Runs", total)
@@ -54,15 +112,12 @@ if total >= 3:
 
     # Status breakdown bar chart
     with chart_col1:
-        status_counts = Counter(r.status for r in history)
-        status_df = pd.DataFrame(
-            {"Status": list(status_counts.keys()), "Count": list(status_counts.values())}
-        )
+        status_df = pd.DataFrame({"Status": list(counts.keys()), "Count": list(counts.values())})
         st.bar_chart(status_df, x="Status", y="Count", color="#16A34A")
 
     # Runtime over time (line chart of last 20 runs)
     with chart_col2:
-        recent = history[:20]
+        recent = query_runs(limit=20)
         runtime_df = pd.DataFrame(
             {
                 "Run": [r.run_id[:8] for r in recent],
@@ -72,41 +127,72 @@ if total >= 3:
         st.line_chart(runtime_df, x="Run", y="Runtime (s)", color="#0090D4")
 
     # Pipeline breakdown
-    pipeline_counts = Counter(r.pipeline for r in history)
-    if len(pipeline_counts) > 1:
+    if len(stats) > 1:
         pipeline_df = pd.DataFrame(
-            {"Pipeline": list(pipeline_counts.keys()), "Runs": list(pipeline_counts.values())}
+            {"Pipeline": [s.pipeline for s in stats], "Runs": [s.runs for s in stats]}
         )
         st.bar_chart(pipeline_df, x="Pipeline", y="Runs", color="#F59E0B")
 
+    st.markdown('<p class="uap-label">RUNTIME BY PIPELINE</p>', unsafe_allow_html=True)
+    st.dataframe(
+        pd.DataFrame(
+            [
+                {
+                    "Pipeline": s.pipeline,
+                    "Runs": s.runs,
+                    "p50 (s)": f"{s.p50_seconds:.1f}",
+                    "p95 (s)": f"{s.p95_seconds:.1f}",
+                    "Mean (s)": f"{s.mean_seconds:.1f}",
+                    "Failure Rate": f"{s.failure_rate:.0%}",
+                }
+                for s in stats
+            ]
+        ),
+        use_container_width=True,
+        hide_index=True,
+    )
+
 st.divider()
 
 # ---------------------------------------------------------------------------
 # Filter
 # ---------------------------------------------------------------------------
-f1, f2 = st.columns(2)
+f1, f2, f3 = st.columns(3)
 with f1:
-    client_filter = st.text_input("Filter by client ID", key="hist_client_filter")
+    client_filter = st.text_input("Client ID", key="hist_client_filter")
 with f2:
+    pipeline_filter = st.selectbox(
+        "Pipeline", ["All", *(s.pipeline for s in stats)], key="hist_pipeline_filter"
+    )
+with f3:
     status_filter = st.selectbox(
         "Status", ["All", "success", "partial", "error"], key="hist_status_filter"
     )
 
-filtered = history
-if client_filter.strip():
-    filtered = [r for r in filtered if client_filter.strip().lower() in r.client_id.lower()]
-if status_filter != "All":
-    filtered = [r for r in filtered if r.status == status_filter]
+filters = {
+    "client_id": client_filter.strip() or None,
+    "pipeline": None if pipeline_filter == "All" else pipeline_filter,
+    "status": None if status_filter == "All" else status_filter,
+}
+matching = count_runs(**filters)
 
 # ---------------------------------------------------------------------------
 # History table
 # ---------------------------------------------------------------------------
 st.markdown('<p class="uap-label">RUNS</p>', unsafe_allow_html=True)
 
-if not filtered:
+if not matching:
     st.info("No matching runs.")
+    _refresh_jobs()
     st.stop()
 
+pages = max(1, -(-matching // PAGE_SIZE))
+page = 1
+if pages > 1:
+    page = int(st.number_input(f"Page (of {pages})", 1, pages, 1, key="hist_page"))
+filtered = query_runs(**filters, limit=PAGE_SIZE, offset=(page - 1) * PAGE_SIZE)
+st.caption(f"{matching} matching runs")
+
 rows = []
 for r in filtered:
     rows.append(
@@ -152,3 +238,5 @@ for record in filtered[:10]:
         st.caption(f"Output: `{record.output_dir}`")
         if record.input_file_hash:
             st.caption(f"Input hash: `{record.input_file_hash}`")
+
+_refresh_jobs()
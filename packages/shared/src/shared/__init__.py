@@ -1,9 +1,30 @@
-"""Shared infrastructure for the RPE Analysis Platform."""
+"""Shared infrastructure for the RPE Analysis Platform.
 
-from shared.config import PipelineConfig, PlatformConfig
-from shared.context import PipelineContext
-from shared.format_odd import FormatStatus, check_ics_ready, check_odd_formatted
-from shared.types import AnalysisResult
+The re-exports below are resolved on first access so that importing a light
+submodule (``shared.profiling``, ``shared.images``) does not load pydantic
+and pandas through ``shared.config`` and ``shared.context``.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from shared.config import PipelineConfig, PlatformConfig
+    from shared.context import PipelineContext
+    from shared.format_odd import FormatStatus, check_ics_ready, check_odd_formatted
+    from shared.types import AnalysisResult
+
+_EXPORTS = {
+    "AnalysisResult": "shared.types",
+    "FormatStatus": "shared.format_odd",
+    "PipelineConfig": "shared.config",
+    "PipelineContext": "shared.context",
+    "PlatformConfig": "shared.config",
+    "check_ics_ready": "shared.format_odd",
+    "check_odd_formatted": "shared.format_odd",
+}
 
 __all__ = [
     "AnalysisResult",
@@ -14,3 +35,11 @@ __all__ = [
     "check_ics_ready",
     "check_odd_formatted",
 ]
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module 'shared' has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -11,6 +11,7 @@ from typing import Any
 import pandas as pd
 
 from shared.config import PlatformConfig
+from shared.timeseries import TimeSeriesBlocks
 from shared.types import AnalysisResult
 
 
@@ -59,3 +60,15 @@ class PipelineContext:
 
     # --- Progress ---
     progress_callback: Callable[[str], None] | None = None
+
+    @property
+    def timeseries(self) -> TimeSeriesBlocks:
+        """Monthly families of ``data`` as accounts x months arrays (shared.timeseries).
+
+        Each family is parsed on first use and kept until ``data`` is replaced.
+        """
+        blocks = self.__dict__.get("_timeseries")
+        if blocks is None or blocks.data is not self.data:
+            blocks = TimeSeriesBlocks(self.data if self.data is not None else pd.DataFrame())
+            self.__dict__["_timeseries"] = blocks
+        return blocks
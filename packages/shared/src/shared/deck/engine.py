@@ -14,6 +14,9 @@ from pptx import Presentation
 from pptx.enum.text import PP_ALIGN
 from pptx.util import Inches, Pt
 
+from shared.deck.template_cache import prepared_template
+from shared.images import ImagePipeline
+
 logger = logging.getLogger(__name__)
 
 _FALLBACK_TEMPLATE = Path(__file__).parent / "template" / "2025-CSI-PPT-Template.pptx"
@@ -32,6 +35,16 @@ LAYOUT_TITLE_RPE = 17
 LAYOUT_TITLE_ARS = 18
 LAYOUT_TITLE_ICS = 19
 
+# (left, top, width) for single-chart slides by layout
+_SINGLE_DEFAULT = (Inches(0.86), Inches(1.6), Inches(11.6))
+_SINGLE_POSITIONS = {
+    LAYOUT_CUSTOM: _SINGLE_DEFAULT,  # workhorse layout
+    LAYOUT_BLANK: _SINGLE_DEFAULT,  # full canvas
+    LAYOUT_TWO_CONTENT: (Inches(0.86), Inches(1.82), Inches(5.67)),  # left half
+}
+# (top, left_pos, right_pos, width) for multi-chart slides
+_MULTI_DEFAULT = (Inches(1.82), Inches(0.86), Inches(6.81), Inches(5.67))
+
 
 @dataclass
 class SlideContent:
@@ -124,45 +137,31 @@ class DeckBuilder:
         else:
             self.template_path = None
         self.prs: Presentation | None = None
+        self.images = ImagePipeline()
 
     # -- positioning helpers --------------------------------------------------
 
     def _get_single_positioning(self, layout_index: int) -> tuple:
         """Return (left, top, width) in EMU for a single-chart layout."""
-        # LAYOUT_CUSTOM (8) -- workhorse layout
-        if layout_index == LAYOUT_CUSTOM:
-            return (Inches(0.86), Inches(1.6), Inches(11.6))
-        # LAYOUT_BLANK (11) -- full canvas
-        if layout_index == LAYOUT_BLANK:
-            return (Inches(0.86), Inches(1.6), Inches(11.6))
-        # LAYOUT_TWO_CONTENT (9) -- single chart in left half
-        if layout_index == LAYOUT_TWO_CONTENT:
-            return (Inches(0.86), Inches(1.82), Inches(5.67))
-        # Default
-        return (Inches(0.86), Inches(1.6), Inches(11.6))
+        return _SINGLE_POSITIONS.get(layout_index, _SINGLE_DEFAULT)
 
     def _get_multi_positioning(self, layout_index: int) -> tuple:
         """Return (top, left_pos, right_pos, width) in EMU for multi-chart layouts."""
-        return (Inches(1.82), Inches(0.86), Inches(6.81), Inches(5.67))
+        return _MULTI_DEFAULT
 
     # -- build ----------------------------------------------------------------
 
     def build(self, slides: list[SlideContent], output_path: Path | str) -> Path:
         """Build complete PowerPoint deck from slide definitions."""
-        from pptx.oxml.ns import qn
-
         output_path = Path(output_path)
 
         if self.template_path is not None:
-            self.prs = Presentation(str(self.template_path))
-            # Remove sample slides shipped with 2025 template
-            while len(self.prs.slides) > 0:
-                rId = self.prs.slides._sldIdLst[0].get(qn("r:id"))
-                self.prs.part.drop_rel(rId)
-                self.prs.slides._sldIdLst.remove(self.prs.slides._sldIdLst[0])
+            # Cleaned once per process (sample slides removed), cloned per deck
+            self.prs = prepared_template(self.template_path).open()
         else:
             self.prs = Presentation()
 
+        self.images = ImagePipeline()
         n_layouts = len(self.prs.slide_layouts)
 
         for i, slide_content in enumerate(slides):
@@ -189,7 +188,9 @@ class DeckBuilder:
 
         output_path.parent.mkdir(parents=True, exist_ok=True)
         self.prs.save(str(output_path))
-        logger.info("Deck saved: %s (%d slides)", output_path, len(slides))
+        logger.info(
+            "Deck saved: %s (%d slides; %s)", output_path, len(slides), self.images.summary()
+        )
         return output_path
 
     def _add_slide(self, content: SlideContent) -> None:
@@ -206,27 +207,11 @@ class DeckBuilder:
 
     # -- image helper ---------------------------------------------------------
 
-    @staticmethod
-    def _add_fitted_picture(slide, img_path, left, top, max_width, max_height=None):
+    def _add_fitted_picture(self, slide, img_path, left, top, max_width, max_height=None):
         """Add image scaled to fit within max_width and max_height."""
-        effective_max_h = max_height or MAX_CHART_HEIGHT
-        try:
-            import warnings
-
-            from PIL import Image
-
-            with warnings.catch_warnings():
-                warnings.filterwarnings("ignore", category=Image.DecompressionBombWarning)
-                with Image.open(img_path) as img:
-                    native_w, native_h = img.size
-            aspect = native_h / native_w
-            height_at_width = int(max_width * aspect)
-            if height_at_width > effective_max_h:
-                slide.shapes.add_picture(img_path, left, top, height=effective_max_h)
-            else:
-                slide.shapes.add_picture(img_path, left, top, width=max_width)
-        except ImportError:
-            slide.shapes.add_picture(img_path, left, top, width=max_width)
+        self.images.add_picture(
+            slide, img_path, left, top, max_width, max_height or MAX_CHART_HEIGHT
+        )
 
     # -- shared title helper --------------------------------------------------
 
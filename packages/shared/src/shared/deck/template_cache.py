@@ -0,0 +1,84 @@
+"""Process-wide cache of pre-cleaned PPTX templates.
+
+The CSI templates ship with sample slides that every deck build deletes
+before adding its own. Parsing the 1.9 MB template and dropping its slides
+costs ~0.1 s per deck -- 30 s over a 300-client batch. ``prepared_template``
+does it once per template file and keeps the cleaned package (a few dozen
+KB: masters, layouts and theme only) in memory; ``PreparedTemplate.open``
+then yields a fresh, independent ``Presentation`` from it in a few ms.
+
+Layout names are recorded up front so builders can check a layout index
+without opening the template.
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+from pptx import Presentation
+from pptx.oxml.ns import qn
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PreparedTemplate:
+    """A template with its sample slides removed, ready to clone per deck."""
+
+    path: Path
+    data: bytes
+    layout_names: tuple[str, ...]
+
+    @property
+    def n_layouts(self) -> int:
+        return len(self.layout_names)
+
+    def open(self) -> Presentation:
+        """A new ``Presentation`` with the template's layouts and no slides."""
+        return Presentation(io.BytesIO(self.data))
+
+
+def remove_all_slides(prs: Presentation) -> None:
+    """Drop every slide (and its relationship) from ``prs``."""
+    sld_ids = prs.slides._sldIdLst
+    for sld_id in list(sld_ids):
+        prs.part.drop_rel(sld_id.get(qn("r:id")))
+        sld_ids.remove(sld_id)
+
+
+def prepared_template(path: Path | str) -> PreparedTemplate:
+    """The cleaned template for ``path``, prepared on first use.
+
+    Cached per file version, so an edited template is picked up.
+    """
+    resolved = Path(path).resolve()
+    stat = resolved.stat()
+    return _prepare(resolved, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=8)
+def _prepare(path: Path, mtime_ns: int, size: int) -> PreparedTemplate:
+    prs = Presentation(str(path))
+    n_samples = len(prs.slides)
+    remove_all_slides(prs)
+    buf = io.BytesIO()
+    prs.save(buf)
+    layout_names = tuple(layout.name for layout in prs.slide_layouts)
+    logger.debug(
+        "Prepared template %s: %d sample slides removed, %d layouts, %d -> %d bytes",
+        path.name,
+        n_samples,
+        len(layout_names),
+        size,
+        buf.tell(),
+    )
+    return PreparedTemplate(path=path, data=buf.getvalue(), layout_names=layout_names)
+
+
+def clear_template_cache() -> None:
+    """Forget all prepared templates."""
+    _prepare.cache_clear()
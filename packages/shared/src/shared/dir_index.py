@@ -0,0 +1,242 @@
+"""Persistent index of the client data share's directory listings.
+
+The M: drive layout (CSM / YYYY.MM / ClientID, Transaction Files / ClientID /
+YYYY) is walked on every batch start and on every Streamlit rerun. Over SMB
+each ``iterdir`` + ``is_file`` is a round trip per entry, so listing a few
+hundred client folders takes tens of seconds.
+
+``DirectoryIndex`` keeps each directory's listing -- subfolders plus files
+with size and mtime -- in a local SQLite database and only
+re-lists a directory when its own mtime has changed (adding, removing or
+renaming an entry updates it). A cached directory costs one ``stat``; whole
+levels are checked in parallel::
+
+    index = get_directory_index()
+    for listing in index.listings(month_dirs):     # one stat each when unchanged
+        for entry in listing.files:
+            ...
+
+A file modified in place does not touch its directory's mtime, so callers
+that report a file's size or date should ``stat`` the files they pick.
+
+The database lives in ``~/.cache/analysis-platform/dir_index.db`` unless
+``UAP_DIR_INDEX`` names another path.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import stat
+import threading
+import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from fnmatch import fnmatch
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_PATH = Path.home() / ".cache" / "analysis-platform" / "dir_index.db"
+DEFAULT_WORKERS = 16
+
+# File roles by name pattern. Patterns within a role are in priority order
+# (session_manager picks the first pattern that matches).
+ROLE_PATTERNS: dict[str, list[str]] = {
+    "oddd": ["*ODD*.xlsx", "*ODDD*.xlsx", "*odd*.xlsx"],
+    "ics": ["*ICS*.xlsx", "*ics*.xlsx", "*ICS*.csv"],
+    "config": ["*config*.json", "*config*.yaml"],
+    "tran": [
+        "*tran*.csv",
+        "*Tran*.csv",
+        "*TRAN*.csv",
+        "*txn*.csv",
+        "*TXN*.csv",
+        "*transaction*.csv",
+        "*Transaction*.csv",
+    ],
+}
+
+# A directory modified this close to when it was listed may have changed again
+# within the same mtime tick (FAT/SMB report 2 s granularity); list it again.
+_RACY_NS = 2_000_000_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS dirs (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    listed_ns INTEGER NOT NULL,
+    subdirs TEXT NOT NULL,
+    files TEXT NOT NULL
+);
+"""
+
+
+@dataclass(frozen=True)
+class FileEntry:
+    """One file in an indexed directory."""
+
+    path: Path
+    size: int
+    mtime_ns: int
+
+    @property
+    def name(self) -> str:
+        return self.path.name
+
+    @property
+    def modified_time(self) -> datetime:
+        return datetime.fromtimestamp(self.mtime_ns / 1e9)
+
+
+@dataclass(frozen=True)
+class DirListing:
+    """Subfolder names and files of one directory, sorted by name."""
+
+    path: Path
+    subdirs: tuple[str, ...]
+    files: tuple[FileEntry, ...]
+
+    def match(self, pattern: str) -> list[FileEntry]:
+        """Files whose name matches a glob ``pattern`` (like ``Path.glob``)."""
+        return [f for f in self.files if fnmatch(f.name, pattern)]
+
+
+class DirectoryIndex:
+    """SQLite-backed cache of directory listings, refreshed by directory mtime.
+
+    Safe to share between threads; several processes may share one database.
+    """
+
+    def __init__(self, db_path: Path | str = DEFAULT_DB_PATH, workers: int = DEFAULT_WORKERS):
+        self.db_path = Path(db_path)
+        self.workers = workers
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            self.db_path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        self.listed = 0  # directories actually read since creation
+        self.reused = 0  # directories answered from the index
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # -- listings -------------------------------------------------------------
+
+    def listing(self, path: Path | str) -> DirListing | None:
+        """The listing of ``path``, or None if it is not a readable directory."""
+        path = Path(path)
+        key = os.fspath(path)
+        try:
+            st = os.stat(key)
+        except OSError:
+            return None
+        if not stat.S_ISDIR(st.st_mode):
+            return None
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT mtime_ns, listed_ns, subdirs, files FROM dirs WHERE path = ?", (key,)
+            ).fetchone()
+        if row is not None and row[0] == st.st_mtime_ns and row[1] - row[0] > _RACY_NS:
+            with self._lock:
+                self.reused += 1
+            return _decode(path, row[2], row[3])
+
+        listed_ns = time.time_ns()
+        try:
+            subdirs, files = _scan(path)
+        except PermissionError:
+            logger.warning("Permission denied scanning %s", path)
+            return None
+        except OSError as exc:
+            logger.warning("Could not list %s: %s", path, exc)
+            return None
+        listing = DirListing(path, tuple(subdirs), tuple(files))
+        with self._lock:
+            self.listed += 1
+            self._conn.execute(
+                "INSERT OR REPLACE INTO dirs VALUES (?, ?, ?, ?, ?)",
+                (key, st.st_mtime_ns, listed_ns, *_encode(listing)),
+            )
+        return listing
+
+    def listings(self, paths: Iterable[Path | str]) -> list[DirListing | None]:
+        """``listing`` for each path, checked in parallel; order is preserved."""
+        paths = list(paths)
+        if len(paths) <= 1 or self.workers <= 1:
+            return [self.listing(p) for p in paths]
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(paths))) as pool:
+            return list(pool.map(self.listing, paths))
+
+    def subdirs(self, path: Path | str) -> list[str]:
+        """Sorted subfolder names of ``path`` ([] if it is not a directory)."""
+        listing = self.listing(path)
+        return list(listing.subdirs) if listing else []
+
+    def walk(self, root: Path | str, depth: int) -> dict[Path, DirListing]:
+        """Listings of ``root`` and its subfolders down to ``depth`` levels, by path."""
+        found: dict[Path, DirListing] = {}
+        level = [Path(root)]
+        for _ in range(depth + 1):
+            next_level: list[Path] = []
+            for path, listing in zip(level, self.listings(level)):
+                if listing is None:
+                    continue
+                found[path] = listing
+                next_level.extend(path / name for name in listing.subdirs)
+            level = next_level
+        return found
+
+
+def _scan(path: Path) -> tuple[list[str], list[FileEntry]]:
+    subdirs: list[str] = []
+    files: list[FileEntry] = []
+    with os.scandir(path) as it:
+        for entry in it:
+            try:
+                if entry.is_dir():
+                    subdirs.append(entry.name)
+                elif entry.is_file():
+                    # DirEntry.stat() is free on Windows (it comes with the listing).
+                    st = entry.stat()
+                    files.append(FileEntry(path / entry.name, st.st_size, st.st_mtime_ns))
+            except OSError:
+                continue
+    subdirs.sort()
+    files.sort(key=lambda f: f.name)
+    return subdirs, files
+
+
+def _encode(listing: DirListing) -> tuple[str, str]:
+    files = [[f.name, f.size, f.mtime_ns] for f in listing.files]
+    return json.dumps(listing.subdirs), json.dumps(files)
+
+
+def _decode(path: Path, subdirs: str, files: str) -> DirListing:
+    return DirListing(
+        path,
+        tuple(json.loads(subdirs)),
+        tuple(FileEntry(path / name, size, mtime_ns) for name, size, mtime_ns in json.loads(files)),
+    )
+
+
+_INDEX: DirectoryIndex | None = None
+_INDEX_LOCK = threading.Lock()
+
+
+def get_directory_index() -> DirectoryIndex:
+    """The index shared by every caller in this process."""
+    global _INDEX
+    with _INDEX_LOCK:
+        if _INDEX is None:
+            _INDEX = DirectoryIndex(os.environ.get("UAP_DIR_INDEX") or DEFAULT_DB_PATH)
+        return _INDEX
@@ -0,0 +1,165 @@
+"""Header resolution -- alias tables compiled once, decisions memoized per layout.
+
+Every loader maps raw file headers onto canonical column names through an
+alias table. The table is normalized once when the resolver is built, and
+the decision for a header signature (the tuple of raw column names) is
+cached, so the second file with the same layout -- the usual case across
+clients -- skips resolution entirely::
+
+    resolver = HeaderResolver(COLUMN_ALIASES, required=REQUIRED_COLUMNS)
+    resolution = resolver.resolve(df.columns)
+    df = resolution.apply(df)
+    logger.info("Columns: %s", resolution.describe())
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable, Collection, Hashable, Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_header(name: object) -> str:
+    """``" Txn-Amount "`` -> ``"txn_amount"``: stripped, lowercase, dashes as underscores."""
+    return str(name).strip().lower().replace("-", "_")
+
+
+@dataclass(frozen=True)
+class HeaderResolution:
+    """The mapping decision for one header layout.
+
+    ``renames`` maps raw column names to their new names; ``sources`` says
+    why each was renamed (``"alias"``, ``"keyword"`` or ``"strip"``).
+    ``columns`` is the resolved header and ``missing`` the required names
+    it still lacks.
+    """
+
+    renames: Mapping[Hashable, str]
+    sources: Mapping[Hashable, str]
+    columns: tuple
+    missing: frozenset[str] = field(default_factory=frozenset)
+
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        """``df`` with the renames applied (``df`` itself when there are none)."""
+        return df.rename(columns=dict(self.renames)) if self.renames else df
+
+    def describe(self) -> str:
+        """Log line, e.g. ``"Amt -> amount (alias), Posted -> transaction_date (keyword)"``."""
+        if not self.renames:
+            return "no renames"
+        return ", ".join(
+            f"{raw} -> {new} ({self.sources[raw]})" for raw, new in self.renames.items()
+        )
+
+
+class HeaderResolver:
+    """Resolves raw headers against an alias table.
+
+    Parameters
+    ----------
+    aliases
+        Raw header variation -> canonical name. Keys are matched after
+        ``normalize`` is applied to both sides.
+    normalize
+        Key normalization (default ``normalize_header``; pass
+        ``str.strip``-style functions for case-sensitive tables).
+    required
+        Canonical names a usable file must have; reported in ``missing``.
+    keywords
+        ``(canonical, substrings)`` fallbacks for required names still
+        missing after aliasing: the first column whose lowercased name
+        contains a substring is renamed.
+    strip
+        Rename unmatched columns that carry surrounding whitespace to their
+        stripped form.
+    keep_existing
+        Leave columns that already have a canonical name alone, and skip an
+        alias whose canonical column is already present.
+    cache_size
+        Header layouts remembered.
+    """
+
+    def __init__(
+        self,
+        aliases: Mapping[str, str],
+        *,
+        normalize: Callable[[object], str] = normalize_header,
+        required: Collection[str] = (),
+        keywords: Sequence[tuple[str, Sequence[str]]] = (),
+        strip: bool = False,
+        keep_existing: bool = False,
+        cache_size: int = 256,
+    ) -> None:
+        self.normalize = normalize
+        self.aliases = MappingProxyType({normalize(k): v for k, v in aliases.items()})
+        self.required = frozenset(required)
+        self.keywords = tuple((canonical, tuple(words)) for canonical, words in keywords)
+        self.strip = strip
+        self.keep_existing = keep_existing
+        self.canonical = frozenset(self.aliases.values()) | self.required
+        self.known = frozenset(self.aliases) | {normalize(c) for c in self.required}
+        self._resolve = lru_cache(maxsize=cache_size)(self._compute)
+
+    def recognizes(self, name: object) -> bool:
+        """Is ``name`` a known alias or required name (after normalization)?"""
+        return self.normalize(name) in self.known
+
+    def resolve(self, columns: Iterable) -> HeaderResolution:
+        """The mapping decision for ``columns``, memoized per header signature."""
+        return self._resolve(tuple(columns))
+
+    def cache_info(self):
+        """``functools`` cache statistics (hits = layouts resolved for free)."""
+        return self._resolve.cache_info()
+
+    def clear_cache(self) -> None:
+        self._resolve.cache_clear()
+
+    def _compute(self, columns: tuple) -> HeaderResolution:
+        renames: dict[Hashable, str] = {}
+        sources: dict[Hashable, str] = {}
+        present = set(columns)
+
+        for col in columns:
+            if col in renames:
+                continue
+            if self.keep_existing and col in self.canonical:
+                continue
+            canonical = self.aliases.get(self.normalize(col))
+            if canonical is not None and not (self.keep_existing and canonical in present):
+                if canonical != col:
+                    renames[col], sources[col] = canonical, "alias"
+            elif self.strip and str(col).strip() != col:
+                renames[col], sources[col] = str(col).strip(), "strip"
+
+        resolved = [renames.get(c, c) for c in columns]
+        missing = self.required - set(resolved)
+        if missing and self.keywords:
+            taken: set[str] = set()
+            for canonical, words in self.keywords:
+                if canonical not in missing:
+                    continue
+                for raw, name in zip(columns, resolved):
+                    if name in taken:
+                        continue
+                    if any(word in str(name).strip().lower() for word in words):
+                        renames[raw], sources[raw] = canonical, "keyword"
+                        taken.add(canonical)
+                        break
+            resolved = [renames.get(c, c) for c in columns]
+            missing = self.required - set(resolved)
+
+        resolution = HeaderResolution(
+            MappingProxyType(renames),
+            MappingProxyType(sources),
+            tuple(resolved),
+            frozenset(missing),
+        )
+        logger.debug("Resolved header layout (%d columns): %s", len(columns), resolution.describe())
+        return resolution
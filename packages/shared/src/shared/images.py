@@ -0,0 +1,176 @@
+"""Slide-resolution chart images for PPTX and Excel outputs.
+
+Charts are rendered at 150-300 DPI for standalone use, but on a slide they
+occupy a fixed box of a few inches. ``ImagePipeline`` turns a chart PNG into
+the bytes actually embedded: resampled to the box at ``SLIDE_DPI``,
+palette-quantized when that is smaller, and cached by content hash so a
+chart used twice in a deck -- or in both the deck and the Excel workbook --
+is processed once and stored once::
+
+    images = ImagePipeline()
+    images.add_picture(slide, "chart.png", left, top, max_width, max_height)
+    xl_bytes = images.fit("chart.png", max_width, max_height).data
+
+Image dimensions come from the PNG header, never from decoding the image.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import logging
+import math
+import os
+import struct
+import threading
+import warnings
+from dataclasses import dataclass
+from pathlib import Path
+
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+EMU_PER_INCH = 914400
+SLIDE_DPI = 200  # pixels per inch of slide area; sharp on projectors and 4K screens
+
+# Only resample when it saves at least this much (avoids re-encoding near-fits).
+_MIN_SHRINK = 0.9
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+ImageSource = str | os.PathLike | bytes
+
+
+def _png_header_size(head: bytes) -> tuple[int, int] | None:
+    """(width, height) from the first 24 bytes of a PNG, or None if not a PNG."""
+    if len(head) < 24 or not head.startswith(_PNG_SIGNATURE) or head[12:16] != b"IHDR":
+        return None
+    return struct.unpack(">II", head[16:24])
+
+
+def image_size(source: ImageSource) -> tuple[int, int]:
+    """Pixel (width, height) of an image file or bytes without decoding it."""
+    if isinstance(source, bytes):
+        size = _png_header_size(source[:24])
+        if size is not None:
+            return size
+        return _decoded_size(io.BytesIO(source))
+
+    path = os.fspath(source)
+    with open(path, "rb") as fh:
+        size = _png_header_size(fh.read(24))
+    return size if size is not None else _decoded_size(path)
+
+
+def _decoded_size(source) -> tuple[int, int]:
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", category=Image.DecompressionBombWarning)
+        with Image.open(source) as img:
+            return img.size
+
+
+def fit_within(
+    native_w: int, native_h: int, max_width: int, max_height: int | None = None
+) -> tuple[int, int]:
+    """Largest (width, height) with the native aspect that fits the box.
+
+    Units follow ``max_width``/``max_height`` (EMU, pixels, ...).
+    """
+    width = max_width
+    height = round(max_width * native_h / native_w)
+    if max_height is not None and height > max_height:
+        height = max_height
+        width = round(max_height * native_w / native_h)
+    return width, height
+
+
+@dataclass(frozen=True)
+class FittedImage:
+    """Embed-ready image bytes plus their pixel size and on-slide size (EMU)."""
+
+    data: bytes
+    width_px: int
+    height_px: int
+    width_emu: int
+    height_emu: int
+
+    def stream(self) -> io.BytesIO:
+        return io.BytesIO(self.data)
+
+
+class ImagePipeline:
+    """Resample, quantize and dedupe images for one output (or several).
+
+    Share one instance between outputs built from the same charts so the
+    optimized bytes are produced once. Thread-safe.
+    """
+
+    def __init__(self, dpi: int = SLIDE_DPI, quantize: bool = True) -> None:
+        self.dpi = dpi
+        self.quantize = quantize
+        self._cache: dict[tuple[str, int, int], bytes] = {}
+        self._lock = threading.Lock()
+        self.images = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    def fit(
+        self, source: ImageSource, max_width: int, max_height: int | None = None
+    ) -> FittedImage:
+        """``source`` scaled to fit the EMU box, as slide-resolution bytes."""
+        data = source if isinstance(source, bytes) else Path(source).read_bytes()
+        native_w, native_h = image_size(data)
+        width_emu, height_emu = fit_within(native_w, native_h, max_width, max_height)
+        target_w = max(1, math.ceil(width_emu / EMU_PER_INCH * self.dpi))
+        target_h = max(1, math.ceil(height_emu / EMU_PER_INCH * self.dpi))
+        if target_w >= native_w * _MIN_SHRINK:
+            target_w, target_h = native_w, native_h
+
+        key = (hashlib.sha1(data).hexdigest(), target_w, target_h)
+        with self._lock:
+            out = self._cache.get(key)
+        if out is None:
+            out = self._encode(data, (native_w, native_h), (target_w, target_h))
+            with self._lock:
+                self._cache[key] = out
+                self.images += 1
+                self.bytes_in += len(data)
+                self.bytes_out += len(out)
+        return FittedImage(out, target_w, target_h, width_emu, height_emu)
+
+    def add_picture(self, slide, source: ImageSource, left, top, max_width, max_height=None):
+        """Add ``source`` to ``slide`` scaled to fit within the box; returns the shape."""
+        img = self.fit(source, max_width, max_height)
+        return slide.shapes.add_picture(
+            img.stream(), left, top, width=img.width_emu, height=img.height_emu
+        )
+
+    def _encode(self, data: bytes, native: tuple[int, int], target: tuple[int, int]) -> bytes:
+        if target == native and not self.quantize:
+            return data
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", category=Image.DecompressionBombWarning)
+            with Image.open(io.BytesIO(data)) as img:
+                img.load()
+                if img.mode not in ("RGB", "RGBA"):
+                    img = img.convert("RGBA" if "A" in img.getbands() else "RGB")
+                if target != native:
+                    img = img.resize(target, Image.Resampling.LANCZOS)
+                if self.quantize:
+                    # Charts are flat colours plus anti-aliasing: 256 colours is lossless
+                    # to the eye and usually a third of the size.
+                    img = img.quantize(256, method=Image.Quantize.FASTOCTREE)
+                buf = io.BytesIO()
+                img.save(buf, format="PNG", optimize=True)
+        out = buf.getvalue()
+        # Keep the original when re-encoding bought nothing.
+        return data if target == native and len(out) >= len(data) else out
+
+    def summary(self) -> str:
+        """One-line size report, e.g. for a log message."""
+        saved = 1 - self.bytes_out / self.bytes_in if self.bytes_in else 0.0
+        return (
+            f"{self.images} images, {self.bytes_in / 1024**2:.1f} MB -> "
+            f"{self.bytes_out / 1024**2:.1f} MB ({saved:.0%} smaller)"
+        )
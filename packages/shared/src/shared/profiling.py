@@ -0,0 +1,233 @@
+"""Lightweight timing and memory instrumentation for pipeline runs.
+
+A ``Profiler`` collects one ``Span`` per instrumented block -- pipeline
+step, analysis module or analysis function -- with wall time, CPU time,
+growth of the process's peak RSS and the number of input rows::
+
+    profiler = Profiler()
+    with use_profiler(profiler):
+        with track("load_data", kind="step") as span:
+            df = load(...)
+            span.rows = len(df)
+        run_analyses(df)          # functions decorated with @profiled record too
+    profiler.merge_into(report_path)
+
+``track`` and ``@profiled`` record into the profiler activated with
+``use_profiler`` in the current context (and in threads started with
+``contextvars.copy_context``); without one they cost nothing.
+
+Setting ``Profiler(target=...)`` additionally runs cProfile around spans
+whose name matches the glob and writes ``<name>.prof`` plus a text summary
+to ``profile_dir``.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import io
+import json
+import logging
+import pstats
+import re
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from fnmatch import fnmatchcase
+from functools import wraps
+from pathlib import Path
+from typing import Any, TypeVar
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def peak_rss_bytes() -> int:
+    """High-water mark of this process's resident memory, or 0 if unknown."""
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is bytes on macOS, kilobytes elsewhere
+        return peak if sys.platform == "darwin" else peak * 1024
+    try:
+        import psutil
+    except ImportError:
+        return 0
+    info = psutil.Process().memory_info()
+    return getattr(info, "peak_wset", info.rss)
+
+
+@dataclass
+class Span:
+    """Measurements for one instrumented block.
+
+    ``peak_rss_delta_mb`` is how far the process-wide peak RSS rose while
+    the block ran; blocks running concurrently share that growth.
+    """
+
+    name: str
+    kind: str = "function"  # "step", "module", "function"
+    parent: str = ""
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    peak_rss_delta_mb: float = 0.0
+    rows: int | None = None
+    success: bool = True
+
+
+class Profiler:
+    """Thread-safe collector of ``Span`` records for one run."""
+
+    def __init__(self, target: str | None = None, profile_dir: Path | None = None) -> None:
+        self.target = target
+        self.profile_dir = Path(profile_dir) if profile_dir else Path("profiles")
+        self.spans: list[Span] = []
+        self._lock = threading.Lock()
+        self._profiling = False
+
+    @contextmanager
+    def track(self, name: str, kind: str = "function", rows: int | None = None) -> Iterator[Span]:
+        """Measure the enclosed block; callers may set ``span.rows`` inside it."""
+        span = Span(name=name, kind=kind, parent=_PARENT.get(), rows=rows)
+        token = _PARENT.set(name)
+        prof = self._start_cprofile(name)
+        rss0 = peak_rss_bytes()
+        cpu0 = time.thread_time()
+        t0 = time.perf_counter()
+        try:
+            yield span
+        except BaseException:
+            span.success = False
+            raise
+        finally:
+            span.wall_seconds = time.perf_counter() - t0
+            span.cpu_seconds = time.thread_time() - cpu0
+            span.peak_rss_delta_mb = (peak_rss_bytes() - rss0) / 1024**2
+            _PARENT.reset(token)
+            if prof is not None:
+                self._stop_cprofile(prof, name)
+            with self._lock:
+                self.spans.append(span)
+
+    def _start_cprofile(self, name: str) -> cProfile.Profile | None:
+        if not self.target or not fnmatchcase(name, self.target):
+            return None
+        with self._lock:
+            if self._profiling:
+                logger.warning("Not profiling %s: another span is already being profiled", name)
+                return None
+            self._profiling = True
+        prof = cProfile.Profile()
+        try:
+            prof.enable()
+        except ValueError as exc:  # another profiler (e.g. a debugger) is active
+            logger.warning("Could not profile %s: %s", name, exc)
+            with self._lock:
+                self._profiling = False
+            return None
+        return prof
+
+    def _stop_cprofile(self, prof: cProfile.Profile, name: str) -> None:
+        prof.disable()
+        with self._lock:
+            self._profiling = False
+        self.profile_dir.mkdir(parents=True, exist_ok=True)
+        stem = re.sub(r"[^\w.-]", "_", name)
+        prof.dump_stats(self.profile_dir / f"{stem}.prof")
+        text = io.StringIO()
+        pstats.Stats(prof, stream=text).sort_stats("cumulative").print_stats(40)
+        (self.profile_dir / f"{stem}.txt").write_text(text.getvalue(), encoding="utf-8")
+        logger.info("cProfile output for %s written to %s", name, self.profile_dir)
+
+    def slowest(self, n: int = 10, kind: str | None = None) -> list[Span]:
+        """The ``n`` spans with the longest wall time."""
+        with self._lock:
+            spans = [s for s in self.spans if kind is None or s.kind == kind]
+        return sorted(spans, key=lambda s: s.wall_seconds, reverse=True)[:n]
+
+    def to_dict(self) -> dict:
+        """JSON-ready report: every span plus wall-time totals per kind."""
+        with self._lock:
+            spans = list(self.spans)
+        totals: dict[str, float] = {}
+        for s in spans:
+            totals[s.kind] = totals.get(s.kind, 0.0) + s.wall_seconds
+        return {
+            "totals_seconds": {k: round(v, 3) for k, v in totals.items()},
+            "spans": [asdict(s) for s in spans],
+        }
+
+    def merge_into(self, report_path: Path, key: str = "profile") -> None:
+        """Add this profile under ``key`` in an existing (or new) JSON report."""
+        report_path = Path(report_path)
+        data: dict = {}
+        if report_path.exists():
+            try:
+                data = json.loads(report_path.read_text(encoding="utf-8"))
+            except json.JSONDecodeError:
+                logger.warning("Replacing unreadable report %s", report_path)
+        data[key] = self.to_dict()
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        report_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+
+_ACTIVE: ContextVar[Profiler | None] = ContextVar("active_profiler", default=None)
+_PARENT: ContextVar[str] = ContextVar("profile_parent", default="")
+
+
+def current_profiler() -> Profiler | None:
+    """The profiler activated with ``use_profiler`` in this context, if any."""
+    return _ACTIVE.get()
+
+
+@contextmanager
+def use_profiler(profiler: Profiler | None) -> Iterator[Profiler | None]:
+    """Make ``profiler`` the target of ``track`` and ``@profiled`` in this context."""
+    token = _ACTIVE.set(profiler)
+    try:
+        yield profiler
+    finally:
+        _ACTIVE.reset(token)
+
+
+@contextmanager
+def track(name: str, kind: str = "function", rows: int | None = None) -> Iterator[Span]:
+    """``Profiler.track`` on the active profiler; a no-op span when none is active."""
+    profiler = _ACTIVE.get()
+    if profiler is None:
+        yield Span(name=name, kind=kind, rows=rows)
+        return
+    with profiler.track(name, kind=kind, rows=rows) as span:
+        yield span
+
+
+def profiled(func: F | None = None, *, name: str | None = None, kind: str = "function"):
+    """Decorator recording each call as a span on the active profiler.
+
+    ``rows`` is taken from the first positional argument when it is a
+    DataFrame (anything with ``shape``).
+    """
+
+    def decorate(fn: F) -> F:
+        label = name or f"{fn.__module__.rsplit('.', 1)[-1]}.{fn.__qualname__}"
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _ACTIVE.get() is None:
+                return fn(*args, **kwargs)
+            shape = getattr(args[0], "shape", ()) if args else ()
+            rows = int(shape[0]) if shape else None
+            with track(label, kind=kind, rows=rows):
+                return fn(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate(func) if func is not None else decorate
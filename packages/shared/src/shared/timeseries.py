@@ -0,0 +1,354 @@
+"""Monthly ODD column families as dense accounts x months arrays.
+
+ODD extracts carry one column per month for each monthly measure --
+``Jan25 Spend``, ``Jan25 Swipes``, ``Jan25 Mail``, ``Jan25 Reg E Code``, ...
+-- and each pipeline used to find them with its own regex and read them
+column by column. ``TimeSeriesBlock`` parses one family once into a
+``float32`` array (numeric families) or ``int16`` category codes (mail,
+response, Reg E, segmentation), with the months in chronological order, so
+windows and per-account reductions are array slices::
+
+    blocks = TimeSeriesBlocks(odd)              # lazy: nothing parsed yet
+    spend = blocks["spend"]                     # accounts x months, float32
+    l12m = spend.window(12).sum()               # per-account Series
+    mailed = blocks["mail"].isin(["NU", "TH-10"]).any(axis=1)
+    first = blocks["resp"].first(blocks["resp"].isin(["TH-10"]))   # month position
+
+Missing values are NaN (numeric) or code -1 (categorical).
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+MONTH_PREFIX = r"[A-Z][a-z]{2}\d{2}"
+
+# Family name -> column suffix after the "MmmYY " month tag.
+FAMILIES: dict[str, str] = {
+    "reg_e_code": "Reg E Code",
+    "reg_e_desc": "Reg E Desc",
+    "od_limit": "OD Limit",
+    "pin_dollar": "PIN $",
+    "sig_dollar": "Sig $",
+    "pin_count": "PIN #",
+    "sig_count": "Sig #",
+    "mtd": "MTD",
+    "spend": "Spend",
+    "swipes": "Swipes",
+    "mail": "Mail",
+    "resp": "Resp",
+    "segmentation": "Segmentation",
+}
+
+# Families holding labels rather than amounts.
+CATEGORICAL_FAMILIES = frozenset({"reg_e_code", "reg_e_desc", "mail", "resp", "segmentation"})
+
+_MONTHLY_COLUMN = re.compile(rf"^({MONTH_PREFIX}) (.+)$")
+_LEADING_TAG = re.compile(r"^\s*([A-Za-z]{3}\d{2})")
+
+
+@lru_cache(maxsize=4096)
+def parse_month_tag(tag: str) -> datetime | None:
+    """``"Jan25"`` -> datetime(2025, 1, 1); None if ``tag`` is not a month tag."""
+    try:
+        return datetime.strptime(tag, "%b%y")
+    except ValueError:
+        return None
+
+
+def split_monthly_column(name: object) -> tuple[datetime, str] | None:
+    """``"Jan25 Spend"`` -> (datetime(2025, 1, 1), ``"Spend"``); None for other columns."""
+    m = _MONTHLY_COLUMN.match(str(name))
+    if not m:
+        return None
+    month = parse_month_tag(m.group(1))
+    return (month, m.group(2)) if month else None
+
+
+def _leading_month(name: object) -> datetime | None:
+    m = _LEADING_TAG.match(str(name))
+    return parse_month_tag(m.group(1)) if m else None
+
+
+def family_columns(columns: Iterable, suffix: str) -> list[str]:
+    """Columns ``"MmmYY <suffix>"`` in chronological order."""
+    found = []
+    for col in columns:
+        parsed = split_monthly_column(col)
+        if parsed and parsed[1] == suffix:
+            found.append((parsed[0], col))
+    return [col for _, col in sorted(found)]
+
+
+@dataclass(frozen=True, eq=False)
+class TimeSeriesBlock:
+    """One monthly family: ``values[account, month]`` with months ascending."""
+
+    family: str
+    columns: tuple[str, ...]
+    months: pd.DatetimeIndex
+    index: pd.Index
+    values: np.ndarray
+    categories: pd.Index | None = None
+
+    @classmethod
+    def from_frame(
+        cls,
+        df: pd.DataFrame,
+        family: str,
+        *,
+        columns: list[str] | None = None,
+        categorical: bool | None = None,
+        dtype: np.dtype | type = np.float32,
+    ) -> TimeSeriesBlock:
+        """Parse ``family`` (a ``FAMILIES`` key or a raw suffix) from ``df``.
+
+        ``columns`` overrides discovery: exactly those columns, in the given
+        order, each month read from its leading ``MmmYY`` tag. Numeric
+        families are coerced with ``to_numeric`` (unparseable -> NaN).
+        """
+        if columns is None:
+            cols = family_columns(df.columns, FAMILIES.get(family, family))
+        else:
+            cols = list(columns)
+        if categorical is None:
+            categorical = family in CATEGORICAL_FAMILIES
+        months = pd.DatetimeIndex([_leading_month(c) for c in cols])
+
+        if categorical:
+            stacked = pd.Categorical(df[cols].to_numpy(dtype=object).ravel())
+            codes = stacked.codes.astype(np.int16).reshape(len(df), len(cols))
+            return cls(family, tuple(cols), months, df.index, codes, stacked.categories)
+
+        values = np.empty((len(df), len(cols)), dtype=dtype)
+        for j, col in enumerate(cols):
+            series = df[col]
+            if not pd.api.types.is_numeric_dtype(series):
+                series = pd.to_numeric(series, errors="coerce")
+            values[:, j] = series.to_numpy(dtype=dtype, na_value=np.nan)
+        return cls(family, tuple(cols), months, df.index, values)
+
+    # -- shape ------------------------------------------------------------------
+
+    @property
+    def tags(self) -> list[str]:
+        """Month tags in order, e.g. ``["Dec24", "Jan25"]``."""
+        return [m.strftime("%b%y") for m in self.months]
+
+    @property
+    def n_months(self) -> int:
+        return len(self.months)
+
+    @property
+    def is_categorical(self) -> bool:
+        return self.categories is not None
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def _replace(self, values: np.ndarray, month_pos=slice(None), index=None) -> TimeSeriesBlock:
+        return TimeSeriesBlock(
+            self.family,
+            tuple(np.asarray(self.columns, dtype=object)[month_pos]),
+            self.months[month_pos],
+            self.index if index is None else index,
+            values,
+            self.categories,
+        )
+
+    # -- selection ----------------------------------------------------------------
+
+    def window(self, months: int, end: datetime | str | None = None) -> TimeSeriesBlock:
+        """The last ``months`` months up to and including ``end`` (default: latest)."""
+        stop = self.n_months if end is None else self._position(end, side="right")
+        start = max(stop - months, 0)
+        return self._replace(self.values[:, start:stop], slice(start, stop))
+
+    def since(self, start: datetime | str) -> TimeSeriesBlock:
+        """Months from ``start`` onward."""
+        pos = self._position(start, side="left")
+        return self._replace(self.values[:, pos:], slice(pos, None))
+
+    def select(self, tags: Iterable[str]) -> TimeSeriesBlock:
+        """The given months (tags like ``"Jan25"``) that exist, in block order."""
+        wanted = {parse_month_tag(t) for t in tags}
+        pos = np.flatnonzero([m in wanted for m in self.months])
+        return self._replace(self.values[:, pos], pos)
+
+    def rows(self, index: pd.Index) -> TimeSeriesBlock:
+        """Restrict to the accounts in ``index`` (e.g. a subset's index), in that order."""
+        if not self.index.is_unique:
+            raise KeyError("rows(): block index is not unique")
+        pos = self.index.get_indexer(index)
+        if (pos < 0).any():
+            raise KeyError("rows(): index contains labels not in the block")
+        return self._replace(self.values[pos], index=self.index[pos])
+
+    def column(self, month: datetime | str) -> pd.Series:
+        """One month as a Series (decoded labels for categorical families)."""
+        pos = self._position(month, side="left")
+        if pos >= self.n_months or self.months[pos] != _as_month(month):
+            raise KeyError(f"{self.family}: no column for {month}")
+        return self.to_frame().iloc[:, pos]
+
+    def _position(self, month: datetime | str, side: str) -> int:
+        return int(self.months.searchsorted(_as_month(month), side=side))
+
+    # -- per-cell tests -----------------------------------------------------------
+
+    def present(self) -> np.ndarray:
+        """Boolean ``accounts x months``: the cell has a value."""
+        if self.is_categorical:
+            return self.values >= 0
+        return ~np.isnan(self.values)
+
+    def isin(self, labels: Iterable) -> np.ndarray:
+        """Boolean ``accounts x months``: the cell's label is in ``labels``."""
+        if not self.is_categorical:
+            return np.isin(self.values, list(labels))
+        codes = [self.categories.get_loc(v) for v in labels if v in self.categories]
+        return np.isin(self.values, codes)
+
+    # -- per-account reductions -----------------------------------------------------
+
+    def sum(self) -> pd.Series:
+        """Per-account total over the block's months (missing = 0)."""
+        return pd.Series(np.nansum(self.values, axis=1, dtype=np.float64), index=self.index)
+
+    def mean(self) -> pd.Series:
+        """Per-account mean over months with a value (NaN if none)."""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            total = np.nansum(self.values, axis=1, dtype=np.float64)
+            return pd.Series(total / self.present().sum(axis=1), index=self.index)
+
+    def any(self, mask: np.ndarray | None = None) -> pd.Series:
+        """Per account: any month where ``mask`` (default: has a value) holds."""
+        mask = self.present() if mask is None else mask
+        return pd.Series(mask.any(axis=1), index=self.index)
+
+    def first(self, mask: np.ndarray | None = None) -> pd.Series:
+        """Per account: position of the first month where ``mask`` holds, or -1."""
+        mask = self.present() if mask is None else mask
+        if mask.shape[1] == 0:
+            return pd.Series(-1, index=self.index)
+        pos = mask.argmax(axis=1)
+        return pd.Series(np.where(mask.any(axis=1), pos, -1), index=self.index)
+
+    def last(self, mask: np.ndarray | None = None) -> pd.Series:
+        """Per account: position of the last month where ``mask`` holds, or -1."""
+        mask = self.present() if mask is None else mask
+        if mask.shape[1] == 0:
+            return pd.Series(-1, index=self.index)
+        pos = mask.shape[1] - 1 - mask[:, ::-1].argmax(axis=1)
+        return pd.Series(np.where(mask.any(axis=1), pos, -1), index=self.index)
+
+    def latest(self, skip_zero: bool = False) -> pd.Series:
+        """Per account: the most recent value (most recent non-zero with ``skip_zero``).
+
+        Numeric families only; accounts without one get NaN.
+        """
+        if self.n_months == 0:
+            return pd.Series(np.nan, index=self.index)
+        mask = self.present()
+        if skip_zero:
+            mask &= self.values != 0
+        pos = self.last(mask).to_numpy()
+        rows = np.arange(len(pos))
+        picked = self.values[rows, np.maximum(pos, 0)].astype(np.float64)
+        return pd.Series(np.where(pos >= 0, picked, np.nan), index=self.index)
+
+    def to_frame(self) -> pd.DataFrame:
+        """Back to ``"MmmYY <suffix>"`` columns (labels decoded for categorical families)."""
+        if self.is_categorical:
+            data = {
+                col: pd.Categorical.from_codes(self.values[:, j], self.categories).astype(object)
+                for j, col in enumerate(self.columns)
+            }
+            return pd.DataFrame(data, index=self.index)
+        return pd.DataFrame(self.values, index=self.index, columns=list(self.columns))
+
+
+def family_block(
+    data: pd.DataFrame,
+    family: str,
+    blocks: TimeSeriesBlocks | None = None,
+    *,
+    dtype: np.dtype | type = np.float32,
+) -> TimeSeriesBlock:
+    """``family`` for the rows of ``data``, reusing ``blocks`` when they cover them.
+
+    ``blocks`` is usually ``ctx.timeseries`` (parsed once from the full
+    ODD) and ``data`` a subset of it; otherwise ``data`` is parsed directly.
+    Pass ``dtype=np.float64`` where values feed reported dollar figures.
+    """
+    if blocks is not None and family in blocks:
+        try:
+            return blocks.block(family, dtype).rows(data.index)
+        except KeyError:
+            pass
+    return TimeSeriesBlock.from_frame(data, family, dtype=dtype)
+
+
+def _as_month(month: datetime | str) -> pd.Timestamp:
+    if isinstance(month, str):
+        parsed = parse_month_tag(month)
+        if parsed is None:
+            raise ValueError(f"Not a month tag: {month!r}")
+        return pd.Timestamp(parsed)
+    return pd.Timestamp(month).to_period("M").to_timestamp()
+
+
+class TimeSeriesBlocks(Mapping):
+    """Lazily parsed ``TimeSeriesBlock`` per family present in a frame.
+
+    Keys are the ``FAMILIES`` names with at least one column in ``data``.
+    Each block is built on first access and kept; safe to share between
+    threads.
+    """
+
+    def __init__(self, data: pd.DataFrame) -> None:
+        self.data = data
+        self._families = [f for f, sfx in FAMILIES.items() if family_columns(data.columns, sfx)]
+        self._blocks: dict[tuple[str, np.dtype], TimeSeriesBlock] = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, family: str) -> TimeSeriesBlock:
+        return self.block(family)
+
+    def block(self, family: str, dtype: np.dtype | type = np.float32) -> TimeSeriesBlock:
+        """``family`` parsed as ``dtype`` (numeric families), built once per dtype."""
+        if family not in self._families:
+            raise KeyError(family)
+        key = (family, np.dtype(dtype))
+        with self._lock:
+            block = self._blocks.get(key)
+            if block is None:
+                block = TimeSeriesBlock.from_frame(self.data, family, dtype=dtype)
+                self._blocks[key] = block
+            return block
+
+    def __contains__(self, family: object) -> bool:
+        return family in self._families
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._families)
+
+    def __len__(self) -> int:
+        return len(self._families)
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
@@ -7,6 +7,7 @@ from collections.abc import Callable
 
 import pandas as pd
 
+from shared.profiling import track
 from txn_analysis.analyses.activation import analyze_activation
 from txn_analysis.analyses.base import AnalysisResult
 from txn_analysis.analyses.business import (
@@ -187,7 +188,8 @@ def run_all_analyses(
         if on_progress:
             on_progress(name)
         try:
-            result = func(df, business_df, personal_df, settings, context)
+            with track(name, kind="module", rows=len(df)):
+                result = func(df, business_df, personal_df, settings, context)
             results.append(result)
             context["completed_results"][name] = result
         except Exception as e:
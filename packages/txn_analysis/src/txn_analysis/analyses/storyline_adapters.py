@@ -4,6 +4,10 @@ Each adapter converts main pipeline arguments (df, settings, context) into the
 V4 context dict, calls the storyline's run(), and wraps the result in an
 AnalysisResult.  If no ODD data is available, adapters that require it return
 a graceful empty result.
+
+Nothing downstream draws storyline figures, so they are counted and closed as
+they are wrapped; a finished result does not keep dozens of live matplotlib
+figures in memory.
 """
 
 from __future__ import annotations
@@ -40,6 +44,8 @@ def _wrap_storyline_result(
     result: dict,
 ) -> AnalysisResult:
     """Convert a V4 storyline result dict into an AnalysisResult."""
+    chart_count = sum(len(s.get("figures", [])) for s in result.get("sections", []))
+    _close_figures(result)
     sheets = result.get("sheets", [])
     primary_df = sheets[0]["df"] if sheets else pd.DataFrame()
     return AnalysisResult.from_df(
@@ -49,12 +55,27 @@ def _wrap_storyline_result(
         metadata={
             "storyline": result,
             "section_count": len(result.get("sections", [])),
-            "chart_count": sum(len(s.get("figures", [])) for s in result.get("sections", [])),
+            "chart_count": chart_count,
             "sheet_count": len(sheets),
         },
     )
 
 
+def _close_figures(result: dict) -> None:
+    """Close and drop the matplotlib figures in each section's ``figures``."""
+    import matplotlib.pyplot as plt
+    from matplotlib.figure import Figure
+
+    for section in result.get("sections", []):
+        figures = section.get("figures")
+        if not figures:
+            continue
+        for fig in figures:
+            if isinstance(fig, Figure):
+                plt.close(fig)
+        section["figures"] = [f for f in figures if not isinstance(f, Figure)]
+
+
 def analyze_demographics(
     df: pd.DataFrame,
     business_df: pd.DataFrame,
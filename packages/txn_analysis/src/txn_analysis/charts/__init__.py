@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
 from io import BytesIO
 from pathlib import Path
 
@@ -132,51 +133,121 @@ CHART_REGISTRY: dict[str, ChartFunc] = {
 }
 
 
-def create_charts(
+@dataclass(frozen=True)
+class ChartSpec:
+    """A chart that has not been drawn yet: its builder plus the results it reads.
+
+    Building is deferred so a run can render charts one at a time (see
+    ``iter_chart_pngs``) instead of holding every live Figure at once.
+    """
+
+    key: str
+    func: Callable[..., Figure]
+    results: tuple[AnalysisResult, ...]
+    client_name: str = ""
+    date_range: str = ""
+
+    def build(self, config: ChartConfig) -> Figure | None:
+        """Draw the figure (with source footer); None if it came out empty."""
+        from txn_analysis.charts.theme import add_source_footer
+
+        fig = self.func(*self.results, config)
+        if not fig.get_axes():
+            plt.close(fig)
+            return None
+        add_source_footer(fig, self.client_name, self.date_range)
+        return fig
+
+
+def chart_specs(
     results: list[AnalysisResult],
-    config: ChartConfig,
     client_name: str = "",
     date_range: str = "",
-) -> dict[str, Figure]:
-    """Generate all registered charts from analysis results.
-
-    Returns mapping of chart name -> matplotlib Figure.
-    """
+) -> dict[str, ChartSpec]:
+    """Charts the registry can draw from these results, keyed by chart name."""
     from txn_analysis.charts.mcc import chart_mcc_comparison
-    from txn_analysis.charts.theme import add_source_footer
 
     results_by_name = {r.name: r for r in results}
-    charts: dict[str, Figure] = {}
+    specs: dict[str, ChartSpec] = {}
 
     # Standard single-result charts (supports composite keys like "name:variant")
     for key, func in CHART_REGISTRY.items():
-        analysis_name = key.split(":")[0]
-        result = results_by_name.get(analysis_name)
+        result = results_by_name.get(key.split(":")[0])
         if result is None or result.error or result.df.empty:
             continue
-        try:
-            fig = func(result, config)
-            if fig.get_axes():
-                add_source_footer(fig, client_name, date_range)
-                charts[key] = fig
-        except Exception as e:
-            logger.warning("Chart '%s' failed: %s", key, e)
+        specs[key] = ChartSpec(key, func, (result,), client_name, date_range)
 
     # MCC comparison (needs 3 results)
     mcc_names = ("mcc_by_accounts", "mcc_by_transactions", "mcc_by_spend")
     mcc_results = [results_by_name.get(n) for n in mcc_names]
     if all(r and not r.error and not r.df.empty for r in mcc_results):
+        specs["mcc_comparison"] = ChartSpec(
+            "mcc_comparison", chart_mcc_comparison, tuple(mcc_results), client_name, date_range
+        )
+
+    return specs
+
+
+def create_charts(
+    results: list[AnalysisResult],
+    config: ChartConfig,
+    client_name: str = "",
+    date_range: str = "",
+) -> dict[str, Figure]:
+    """Generate all registered charts from analysis results.
+
+    Returns mapping of chart name -> matplotlib Figure. Every figure stays
+    alive until the caller closes it; pipelines render through
+    ``iter_chart_pngs`` instead.
+    """
+    charts: dict[str, Figure] = {}
+    for key, spec in chart_specs(results, client_name, date_range).items():
         try:
-            fig = chart_mcc_comparison(mcc_results[0], mcc_results[1], mcc_results[2], config)
-            if fig.get_axes():
-                add_source_footer(fig, client_name, date_range)
-                charts["mcc_comparison"] = fig
+            fig = spec.build(config)
         except Exception as e:
-            logger.warning("Chart 'mcc_comparison' failed: %s", e)
-
+            logger.warning("Chart '%s' failed: %s", key, e)
+            continue
+        if fig is not None:
+            charts[key] = fig
     return charts
 
 
+def chart_dpi(config: ChartConfig, scale: int | None = None) -> int:
+    """Export DPI for a chart config: scale x dpi, capped at 300."""
+    raw_dpi = (
+        (scale or config.scale) * config.dpi
+        if hasattr(config, "dpi")
+        else 150 * (scale or config.scale)
+    )
+    return min(raw_dpi, 300)
+
+
+def iter_chart_pngs(
+    specs: dict[str, ChartSpec],
+    config: ChartConfig,
+) -> Iterator[tuple[str, bytes]]:
+    """Build, render and close each chart in turn, yielding (name, PNG bytes).
+
+    At most one figure is alive at a time. Charts that fail to build or
+    render are logged and skipped.
+    """
+    dpi = chart_dpi(config)
+    for key, spec in specs.items():
+        try:
+            fig = spec.build(config)
+        except Exception as e:
+            logger.warning("Chart '%s' failed: %s", key, e)
+            continue
+        if fig is None:
+            continue
+        try:
+            png = render_chart_png_bytes(fig, dpi=dpi)
+        except Exception as e:
+            logger.warning("Chart PNG for '%s' failed: %s", key, e)
+            continue
+        yield key, png
+
+
 def render_chart_png(
     fig: Figure,
     output_path: Path,
@@ -185,13 +256,12 @@ def render_chart_png(
 ) -> Path:
     """Write a matplotlib figure to PNG."""
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    raw_dpi = (
-        (scale or config.scale) * config.dpi
-        if hasattr(config, "dpi")
-        else 150 * (scale or config.scale)
+    fig.savefig(
+        str(output_path),
+        dpi=chart_dpi(config, scale),
+        bbox_inches="tight",
+        facecolor="white",
     )
-    dpi = min(raw_dpi, 300)
-    fig.savefig(str(output_path), dpi=dpi, bbox_inches="tight", facecolor="white")
     plt.close(fig)
     return output_path
 
@@ -199,6 +269,8 @@ def render_chart_png(
 def render_chart_png_bytes(fig: Figure, dpi: int = 150) -> bytes:
     """Render a matplotlib figure to PNG bytes for embedding."""
     buf = BytesIO()
-    fig.savefig(buf, format="png", dpi=dpi, bbox_inches="tight", facecolor="white")
-    plt.close(fig)
+    try:
+        fig.savefig(buf, format="png", dpi=dpi, bbox_inches="tight", facecolor="white")
+    finally:
+        plt.close(fig)
     return buf.getvalue()
@@ -1,4 +1,8 @@
-"""Typer CLI for txn_analysis."""
+"""Typer CLI for txn_analysis.
+
+The pipeline (pandas, matplotlib, every analysis and chart module) is
+imported when a command runs, not at startup, so ``--help`` is instant.
+"""
 
 from __future__ import annotations
 
@@ -9,9 +13,6 @@ import typer
 from rich.console import Console
 from rich.logging import RichHandler
 
-from txn_analysis.pipeline import export_outputs, run_pipeline
-from txn_analysis.settings import Settings
-
 app = typer.Typer(help="Credit union debit card transaction analysis.")
 console = Console()
 
@@ -36,6 +37,9 @@ def analyze(
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose logging"),
 ) -> None:
     """Run the full analysis pipeline."""
+    from txn_analysis.pipeline import export_outputs, run_pipeline
+    from txn_analysis.settings import Settings
+
     _setup_logging(verbose)
 
     overrides = {
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import pandas as pd
 
+from shared.headers import HeaderResolver
 from txn_analysis.exceptions import ColumnMismatchError
 
 REQUIRED_COLUMNS = {
@@ -109,6 +110,14 @@ _KEYWORD_FALLBACKS: list[tuple[str, list[str]]] = [
 ]
 
 
+# Alias table compiled once; decisions are cached per header layout.
+HEADERS = HeaderResolver(
+    COLUMN_ALIASES,
+    required=REQUIRED_COLUMNS,
+    keywords=_KEYWORD_FALLBACKS,
+)
+
+
 def resolve_columns(df: pd.DataFrame) -> pd.DataFrame:
     """Rename columns to canonical names using COLUMN_ALIASES.
 
@@ -116,38 +125,15 @@ def resolve_columns(df: pd.DataFrame) -> pd.DataFrame:
     1. Exact alias match (fast, deterministic)
     2. Keyword fallback for remaining missing columns (catches non-standard names)
 
+    The decision is memoized per header layout (``HEADERS``), so files with
+    the same columns are resolved once per process.
+
     Returns a new DataFrame with resolved column names.
     Raises ColumnMismatchError if required columns are missing after resolution.
     """
-    rename_map: dict[str, str] = {}
-    for col in df.columns:
-        key = str(col).strip().lower().replace("-", "_")
-        if key in COLUMN_ALIASES:
-            rename_map[col] = COLUMN_ALIASES[key]
-
-    result = df.rename(columns=rename_map)
-
-    # Pass 2: keyword fallback for still-missing required columns
-    resolved = set(result.columns)
-    missing = REQUIRED_COLUMNS - resolved
-    if missing:
-        extra_renames: dict[str, str] = {}
-        for canonical, keywords in _KEYWORD_FALLBACKS:
-            if canonical not in missing:
-                continue
-            for col in result.columns:
-                if col in extra_renames.values():
-                    continue
-                cl = str(col).strip().lower()
-                if any(kw in cl for kw in keywords):
-                    extra_renames[col] = canonical
-                    break
-        if extra_renames:
-            result = result.rename(columns=extra_renames)
-
-    resolved = set(result.columns)
-    missing = REQUIRED_COLUMNS - resolved
-    if missing:
-        raise ColumnMismatchError(missing=missing, available=resolved)
-
-    return result
+    resolution = HEADERS.resolve(df.columns)
+    if resolution.missing:
+        raise ColumnMismatchError(
+            missing=set(resolution.missing), available=set(resolution.columns)
+        )
+    return df.rename(columns=dict(resolution.renames))
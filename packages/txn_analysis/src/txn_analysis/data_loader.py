@@ -17,7 +17,8 @@ from pathlib import Path
 
 import pandas as pd
 
-from txn_analysis.column_map import resolve_columns
+from shared.timeseries import FAMILIES, MONTH_PREFIX, family_columns
+from txn_analysis.column_map import HEADERS, resolve_columns
 from txn_analysis.exceptions import DataLoadError
 from txn_analysis.merchant_rules import standardize_merchant_name
 from txn_analysis.settings import Settings
@@ -48,21 +49,8 @@ TRANSACTION_COLUMNS = [
 # ODD time-series regex patterns (MmmYY prefix, e.g. "Jan25 Spend")
 # ---------------------------------------------------------------------------
 
-_MONTH_PREFIX = r"[A-Z][a-z]{2}\d{2}"
 ODD_TIMESERIES_PATTERNS: dict[str, re.Pattern[str]] = {
-    "reg_e_code": re.compile(rf"^{_MONTH_PREFIX} Reg E Code$"),
-    "reg_e_desc": re.compile(rf"^{_MONTH_PREFIX} Reg E Desc$"),
-    "od_limit": re.compile(rf"^{_MONTH_PREFIX} OD Limit$"),
-    "pin_dollar": re.compile(rf"^{_MONTH_PREFIX} PIN \$$"),
-    "sig_dollar": re.compile(rf"^{_MONTH_PREFIX} Sig \$$"),
-    "pin_count": re.compile(rf"^{_MONTH_PREFIX} PIN #$"),
-    "sig_count": re.compile(rf"^{_MONTH_PREFIX} Sig #$"),
-    "mtd": re.compile(rf"^{_MONTH_PREFIX} MTD$"),
-    "spend": re.compile(rf"^{_MONTH_PREFIX} Spend$"),
-    "swipes": re.compile(rf"^{_MONTH_PREFIX} Swipes$"),
-    "mail": re.compile(rf"^{_MONTH_PREFIX} Mail$"),
-    "resp": re.compile(rf"^{_MONTH_PREFIX} Resp$"),
-    "segmentation": re.compile(rf"^{_MONTH_PREFIX} Segmentation$"),
+    name: re.compile(rf"^{MONTH_PREFIX} {re.escape(suffix)}$") for name, suffix in FAMILIES.items()
 }
 
 # Generation boundaries based on Account Holder Age
@@ -157,13 +145,7 @@ def _read_file(path: Path) -> pd.DataFrame:
 
 def _has_recognizable_columns(df: pd.DataFrame) -> bool:
     """Check if any column names match known aliases or required columns."""
-    from txn_analysis.column_map import COLUMN_ALIASES, REQUIRED_COLUMNS
-
-    known = set(COLUMN_ALIASES.keys()) | REQUIRED_COLUMNS
-    for col in df.columns:
-        if str(col).strip().lower().replace("-", "_") in known:
-            return True
-    return False
+    return any(HEADERS.recognizes(col) for col in df.columns)
 
 
 def _sniff_delimiter(path: Path) -> tuple[str, bool]:
@@ -174,10 +156,6 @@ def _sniff_delimiter(path: Path) -> tuple[str, bool]:
     Handles files with multiple metadata rows or blank lines before data by checking
     up to 5 non-empty lines.  Uses utf-8-sig encoding to handle BOM-prefixed files.
     """
-    from txn_analysis.column_map import COLUMN_ALIASES, REQUIRED_COLUMNS
-
-    known = {k.lower() for k in COLUMN_ALIASES} | {c.lower() for c in REQUIRED_COLUMNS}
-
     # Read up to 5 non-empty lines (handles multi-row metadata + blank lines)
     lines: list[str] = []
     try:
@@ -204,8 +182,7 @@ def _sniff_delimiter(path: Path) -> tuple[str, bool]:
         parts = line1.split(sep)
         if len(parts) >= 4:
             # Check if first line looks like a header (has recognizable column names)
-            normalized = {p.strip().lower().replace("-", "_") for p in parts}
-            if normalized & known:
+            if any(HEADERS.recognizes(p) for p in parts):
                 return sep, True
             # First line isn't a header -- check if ANY subsequent line splits
             # the same way (handles multi-row metadata + blank lines)
@@ -545,10 +522,10 @@ def _detect_timeseries_columns(columns: pd.Index) -> dict[str, list[str]]:
     with values being lists of matching column names sorted chronologically.
     """
     result: dict[str, list[str]] = {}
-    for series_name, pattern in ODD_TIMESERIES_PATTERNS.items():
-        matches = [c for c in columns if pattern.match(c)]
+    for series_name, suffix in FAMILIES.items():
+        matches = family_columns(columns, suffix)
         if matches:
-            result[series_name] = sorted(matches)
+            result[series_name] = matches
     return result
 
 
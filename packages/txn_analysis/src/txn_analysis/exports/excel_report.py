@@ -18,6 +18,8 @@ from openpyxl.styles import (
 )
 from openpyxl.utils import get_column_letter
 
+from shared.images import ImagePipeline, fit_within
+from txn_analysis.exports.pptx_report import IMG_HEIGHT, IMG_WIDTH
 from txn_analysis.formatting import (
     excel_number_format,
     is_grand_total_row,
@@ -139,7 +141,12 @@ def _write_toc_sheet(wb: Workbook, result) -> None:
     ws.column_dimensions["C"].width = 25
 
 
-def _write_analysis_sheet(wb: Workbook, analysis, chart_png: bytes | None = None) -> None:
+def _write_analysis_sheet(
+    wb: Workbook,
+    analysis,
+    chart_png: bytes | None = None,
+    images: ImagePipeline | None = None,
+) -> None:
     """Write a single analysis as a formatted worksheet."""
     df = analysis.df
     if df.empty:
@@ -196,7 +203,7 @@ def _write_analysis_sheet(wb: Workbook, analysis, chart_png: bytes | None = None
     chart_start_row = len(df) + 3
     if chart_png:
         try:
-            _embed_chart(ws, chart_png, chart_start_row)
+            _embed_chart(ws, chart_png, chart_start_row, images)
             chart_start_row += 30  # ~30 rows for 500px chart at default row height
         except Exception as exc:
             logger.warning("Chart embed failed for '%s': %s", sheet_name, exc)
@@ -210,24 +217,25 @@ def _write_analysis_sheet(wb: Workbook, analysis, chart_png: bytes | None = None
     )
 
 
-def _embed_chart(ws, png_bytes: bytes, start_row: int) -> None:
-    """Embed a chart PNG image into the worksheet."""
-    from io import BytesIO
-
-    from PIL import Image as _PILImage
-
-    _PILImage.MAX_IMAGE_PIXELS = None  # our chart PNGs are safe
-
+def _embed_chart(ws, png_bytes: bytes, start_row: int, images: ImagePipeline | None = None) -> None:
+    """Embed a chart PNG image into the worksheet, fitted to 900x500 px."""
     from openpyxl.drawing.image import Image as XlImage
 
-    img = XlImage(BytesIO(png_bytes))
-    img.width = 900
-    img.height = 500
+    # Same box as the PPTX chart slides, so a shared pipeline hands both
+    # outputs one set of slide-resolution bytes.
+    fitted = (images or ImagePipeline()).fit(png_bytes, IMG_WIDTH, IMG_HEIGHT)
+    img = XlImage(fitted.stream())
+    img.width, img.height = fit_within(fitted.width_px, fitted.height_px, 900, 500)
     ws.add_image(img, f"A{start_row}")
 
 
-def write_excel_report(result, output_path: Path) -> None:
-    """Write the complete Excel report."""
+def write_excel_report(result, output_path: Path, images: ImagePipeline | None = None) -> None:
+    """Write the complete Excel report.
+
+    Pass the ``images`` pipeline used for the PPTX deck to reuse its
+    optimized chart bytes.
+    """
+    images = images or ImagePipeline()
     wb = Workbook()
     _register_styles(wb)
     _write_cover_sheet(wb, result)
@@ -245,7 +253,7 @@ def write_excel_report(result, output_path: Path) -> None:
                 if key.split(":")[0] == analysis.name:
                     png = data
                     break
-        _write_analysis_sheet(wb, analysis, chart_png=png)
+        _write_analysis_sheet(wb, analysis, chart_png=png, images=images)
 
     wb.save(output_path)
     logger.info("Excel report saved: %s", output_path)
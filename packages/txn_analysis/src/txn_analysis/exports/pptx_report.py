@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime
-from io import BytesIO
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -13,6 +12,8 @@ from pptx import Presentation
 from pptx.dml.color import RGBColor
 from pptx.util import Inches, Pt
 
+from shared.images import ImagePipeline
+
 # python-pptx uses PIL internally to read image dimensions.
 # Our chart PNGs are safe -- suppress the decompression bomb check.
 _PILImage.MAX_IMAGE_PIXELS = None
@@ -54,7 +55,9 @@ def _add_title_slide(prs: Presentation, title: str, subtitle: str) -> None:
         sub_box.text_frame.text = subtitle
 
 
-def _add_chart_slide(prs: Presentation, title: str, img_bytes: bytes | None) -> None:
+def _add_chart_slide(
+    prs: Presentation, title: str, img_bytes: bytes | None, images: ImagePipeline
+) -> None:
     layout = prs.slide_layouts[6]  # blank
     slide = prs.slides.add_slide(layout)
 
@@ -66,13 +69,21 @@ def _add_chart_slide(prs: Presentation, title: str, img_bytes: bytes | None) ->
     title_tf.paragraphs[0].font.color.rgb = NAVY
 
     if img_bytes:
-        slide.shapes.add_picture(
-            BytesIO(img_bytes), IMG_LEFT, IMG_TOP, width=IMG_WIDTH, height=IMG_HEIGHT
-        )
+        images.add_picture(slide, img_bytes, IMG_LEFT, IMG_TOP, IMG_WIDTH, IMG_HEIGHT)
+
 
+def write_pptx_report(
+    result: PipelineResult,
+    path: Path,
+    chart_pngs: dict[str, bytes],
+    images: ImagePipeline | None = None,
+) -> None:
+    """Generate a simple charts-only PPTX deck.
 
-def write_pptx_report(result: PipelineResult, path: Path, chart_pngs: dict[str, bytes]) -> None:
-    """Generate a simple charts-only PPTX deck."""
+    Charts are fitted to the slide at slide resolution by ``images``; share
+    the pipeline with the Excel report to process each chart once.
+    """
+    images = images or ImagePipeline()
     prs = Presentation()
     prs.slide_width = SLIDE_WIDTH
     prs.slide_height = SLIDE_HEIGHT
@@ -82,7 +93,7 @@ def write_pptx_report(result: PipelineResult, path: Path, chart_pngs: dict[str,
     _add_title_slide(prs, "Transaction Analysis", f"{client} • {date_str}")
 
     if not chart_pngs:
-        _add_chart_slide(prs, "No charts available", None)
+        _add_chart_slide(prs, "No charts available", None, images)
         prs.save(str(path))
         return
 
@@ -104,7 +115,7 @@ def write_pptx_report(result: PipelineResult, path: Path, chart_pngs: dict[str,
             if ":" in key:
                 suffix = f" — {key.split(':', 1)[1].replace('_', ' ').title()}"
             title = (analysis.title or analysis.name.replace("_", " ").title()) + suffix
-            _add_chart_slide(prs, title, png)
+            _add_chart_slide(prs, title, png, images)
 
     # Append charts that didn't match an analysis name
     for analysis_key, charts in charts_by_analysis.items():
@@ -114,7 +125,7 @@ def write_pptx_report(result: PipelineResult, path: Path, chart_pngs: dict[str,
             title = analysis_key.replace("_", " ").title()
             if ":" in key:
                 title += f" — {key.split(':', 1)[1].replace('_', ' ').title()}"
-            _add_chart_slide(prs, title, png)
+            _add_chart_slide(prs, title, png, images)
 
     prs.save(str(path))
-    logger.info("PPTX report: %s", path)
+    logger.info("PPTX report: %s (%s)", path, images.summary())
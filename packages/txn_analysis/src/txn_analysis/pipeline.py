@@ -7,10 +7,11 @@ from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import pandas as pd
-from matplotlib.figure import Figure
 
+from shared.profiling import Profiler, track, use_profiler
 from txn_analysis.analyses import run_all_analyses
 from txn_analysis.analyses.base import AnalysisResult
 from txn_analysis.column_map import resolve_columns
@@ -19,6 +20,9 @@ from txn_analysis.segment_runner import SegmentedResult, run_segmented_analyses
 from txn_analysis.segments import build_segment_filters
 from txn_analysis.settings import Settings
 
+if TYPE_CHECKING:
+    from txn_analysis.charts import ChartSpec
+
 logger = logging.getLogger(__name__)
 
 
@@ -29,9 +33,10 @@ class PipelineResult:
     settings: Settings
     df: pd.DataFrame
     analyses: list[AnalysisResult] = field(default_factory=list)
-    charts: dict[str, Figure] = field(default_factory=dict)
+    charts: dict[str, ChartSpec] = field(default_factory=dict)
     chart_pngs: dict[str, bytes] = field(default_factory=dict)
     segmented_results: list[SegmentedResult] = field(default_factory=list)
+    profile: Profiler | None = None
 
 
 def run_pipeline(
@@ -45,37 +50,57 @@ def run_pipeline(
         settings: Application configuration.
         on_progress: Optional callback(step, total, message) for UI progress.
         pre_loaded_df: Pre-loaded transaction DataFrame (skips file I/O).
+
+    Step and per-analysis timings are collected in ``result.profile``.
     """
+    profiler = Profiler()
+    with use_profiler(profiler):
+        result = _run_steps(settings, on_progress, pre_loaded_df)
+    result.profile = profiler
+    for span in profiler.slowest(5, kind="module"):
+        logger.info(
+            "Analysis %s: %.1fs wall, %.1fs CPU", span.name, span.wall_seconds, span.cpu_seconds
+        )
+    return result
+
+
+def _run_steps(
+    settings: Settings,
+    on_progress: Callable[[int, int, str], None] | None,
+    pre_loaded_df: pd.DataFrame | None,
+) -> PipelineResult:
     # Step 1: Load data
     if on_progress:
         on_progress(0, 3, "Loading transaction data...")
-    if pre_loaded_df is not None:
-        logger.info("Using pre-loaded DataFrame: %d rows", len(pre_loaded_df))
-        from txn_analysis.data_loader import (
-            _apply_merchant_consolidation,
-            _derive_year_month,
-            _flag_partial_month,
-            _normalize_business_flag,
-            _warn_negative_amounts,
-        )
-
+    with track("load_data", kind="step") as span:
+        if pre_loaded_df is not None:
+            logger.info("Using pre-loaded DataFrame: %d rows", len(pre_loaded_df))
+            from txn_analysis.data_loader import (
+                _apply_merchant_consolidation,
+                _derive_year_month,
+                _flag_partial_month,
+                _normalize_business_flag,
+                _warn_negative_amounts,
+            )
+
+            if on_progress:
+                on_progress(0, 3, f"Resolving columns ({len(pre_loaded_df):,} rows)...")
+            df = resolve_columns(pre_loaded_df)
+            if on_progress:
+                on_progress(0, 3, "Standardizing merchant names...")
+            df = _apply_merchant_consolidation(df)
+            if on_progress:
+                on_progress(0, 3, "Deriving date fields...")
+            df = _derive_year_month(df)
+            df = _normalize_business_flag(df)
+            df = _flag_partial_month(df)
+            _warn_negative_amounts(df)
+        else:
+            df = load_data(settings)
         if on_progress:
-            on_progress(0, 3, f"Resolving columns ({len(pre_loaded_df):,} rows)...")
-        df = resolve_columns(pre_loaded_df)
-        if on_progress:
-            on_progress(0, 3, "Standardizing merchant names...")
-        df = _apply_merchant_consolidation(df)
-        if on_progress:
-            on_progress(0, 3, "Deriving date fields...")
-        df = _derive_year_month(df)
-        df = _normalize_business_flag(df)
-        df = _flag_partial_month(df)
-        _warn_negative_amounts(df)
-    else:
-        df = load_data(settings)
-    if on_progress:
-        on_progress(0, 3, f"Transaction data ready: {len(df):,} rows")
-    odd_df = load_odd(settings)
+            on_progress(0, 3, f"Transaction data ready: {len(df):,} rows")
+        odd_df = load_odd(settings)
+        span.rows = len(df)
 
     # Step 2: Run analyses (segmented if configured and ODD available)
     if on_progress:
@@ -104,12 +129,13 @@ def run_pipeline(
             ics_accounts=seg_cfg.ics_accounts,
         )
 
-    if seg_filters:
-        segmented_results = run_segmented_analyses(df, settings, odd_df, seg_filters)
-        # Use full-population analyses as the primary result set
-        analyses = segmented_results[0].analyses if segmented_results else []
-    else:
-        analyses = run_all_analyses(df, settings, on_progress=_per_analysis, odd_df=odd_df)
+    with track("analyses", kind="step", rows=len(df)):
+        if seg_filters:
+            segmented_results = run_segmented_analyses(df, settings, odd_df, seg_filters)
+            # Use full-population analyses as the primary result set
+            analyses = segmented_results[0].analyses if segmented_results else []
+        else:
+            analyses = run_all_analyses(df, settings, on_progress=_per_analysis, odd_df=odd_df)
 
     successful = [a for a in analyses if a.error is None]
     failed = [a for a in analyses if a.error is not None]
@@ -118,12 +144,12 @@ def run_pipeline(
             logger.warning("Skipped: %s (%s)", a.name, a.error)
     logger.info("%d/%d analyses completed", len(successful), len(analyses))
 
-    # Step 3: Build charts
+    # Step 3: Plan charts. Figures are drawn one at a time during export
+    # (iter_chart_pngs), so no more than one is alive at once.
     if on_progress:
         on_progress(2, 3, "Building charts...")
-    charts: dict[str, Figure] = {}
-    try:
-        from txn_analysis.charts import create_charts
+    with track("charts", kind="step"):
+        from txn_analysis.charts import chart_specs
 
         # Derive date range from data for source footers
         date_range = ""
@@ -132,17 +158,12 @@ def run_pipeline(
             if len(months) > 0:
                 date_range = f"{min(months)} to {max(months)}"
 
-        charts = create_charts(
+        charts = chart_specs(
             analyses,
-            settings.charts,
             client_name=settings.client_name or "",
             date_range=date_range,
         )
-        logger.info("Built %d charts", len(charts))
-    except Exception as e:
-        logger.error("Chart generation failed: %s", e, exc_info=True)
-        if on_progress:
-            on_progress(2, 3, f"Chart generation failed: {e}")
+        logger.info("Planned %d charts", len(charts))
 
     return PipelineResult(
         settings=settings,
@@ -165,38 +186,45 @@ def export_outputs(result: PipelineResult) -> list[Path]:
     date_str = datetime.now().strftime("%Y%m%d")
     client_id = settings.client_id or "unknown"
 
-    # Render charts to disk once, then read bytes for Excel/PPTX embedding.
-    # Previous approach rendered figures twice (bytes then disk) but the first
-    # render closed figures via plt.close(), causing corrupt output on the second.
+    # Draw each chart straight to PNG bytes and close it before the next;
+    # Excel and PPTX embed the bytes, chart_images also writes them to disk.
     chart_pngs: dict[str, bytes] = {}
     need_pngs = (
         settings.outputs.chart_images or settings.outputs.excel or settings.outputs.powerpoint
     )
     if result.charts and need_pngs:
         chart_dir = settings.output_dir / "charts"
-        chart_dir.mkdir(parents=True, exist_ok=True)
-        from txn_analysis.charts import render_chart_png
+        if settings.outputs.chart_images:
+            chart_dir.mkdir(parents=True, exist_ok=True)
 
-        for name, fig in result.charts.items():
-            try:
-                png_path = chart_dir / f"{name}.png"
-                render_chart_png(fig, png_path, settings.charts)
+        from txn_analysis.charts import iter_chart_pngs
+
+        with use_profiler(result.profile), track("render_charts", kind="step"):
+            for name, png in iter_chart_pngs(result.charts, settings.charts):
+                chart_pngs[name] = png
                 if settings.outputs.chart_images:
-                    generated.append(png_path)
-                chart_pngs[name] = png_path.read_bytes()
-            except Exception as e:
-                logger.warning("Chart PNG for '%s' failed: %s", name, e)
+                    png_path = chart_dir / f"{name}.png"
+                    try:
+                        png_path.write_bytes(png)
+                        generated.append(png_path)
+                    except OSError as e:
+                        logger.warning("Chart PNG for '%s' failed: %s", name, e)
 
         result.chart_pngs = chart_pngs
         logger.info("Rendered %d chart PNGs", len(chart_pngs))
 
+    # One image pipeline for both outputs: each chart is downsampled to
+    # slide resolution once and the same bytes go into the deck and workbook.
+    from shared.images import ImagePipeline
+
+    images = ImagePipeline()
     excel_error: Exception | None = None
     if settings.outputs.excel:
         try:
             from txn_analysis.exports.excel_report import write_excel_report
 
             path = settings.output_dir / f"{client_id}_TXN_Analysis_{date_str}.xlsx"
-            write_excel_report(result, path)
+            write_excel_report(result, path, images=images)
             generated.append(path)
             logger.info("Excel report: %s", path)
         except Exception as e:
@@ -208,13 +236,19 @@ def export_outputs(result: PipelineResult) -> list[Path]:
             from txn_analysis.exports.pptx_report import write_pptx_report
 
             pptx_path = settings.output_dir / f"{client_id}_TXN_Analysis_{date_str}.pptx"
-            write_pptx_report(result, pptx_path, chart_pngs)
+            write_pptx_report(result, pptx_path, chart_pngs, images=images)
             generated.append(pptx_path)
         except Exception as e:
             logger.error("PowerPoint report failed: %s", e, exc_info=True)
             if excel_error is None:
                 excel_error = e
 
+    if result.profile is not None:
+        try:
+            result.profile.merge_into(settings.output_dir / f"{client_id}_TXN_run_report.json")
+        except OSError as e:
+            logger.warning("Run report failed: %s", e)
+
     if excel_error is not None:
         raise RuntimeError("TXN export failed") from excel_error
 
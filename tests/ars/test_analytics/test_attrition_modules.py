@@ -216,6 +216,22 @@ class TestAttritionImpact:
         assert "total_lost" in a11
         assert a11["total_lost"] > 0
 
+    def test_revenue_uses_latest_calendar_month(self, attrition_ctx):
+        """Last spend is the most recent non-zero month, not the last alphabetically."""
+        df = attrition_ctx.data.drop(
+            columns=[c for c in attrition_ctx.data.columns if c.endswith(" Spend")]
+        )
+        df["Feb24 Spend"] = 50.0
+        df["Mar24 Spend"] = 0.0
+        df["Nov23 Spend"] = 7.0
+        attrition_ctx.data = df
+        attrition_ctx.results.pop("_attrition_data", None)
+
+        AttritionImpact().run(attrition_ctx)
+        a11 = attrition_ctx.results["attrition_11"]
+        n_closed = df["Date Closed"].notna().sum()
+        assert a11["total_lost"] == pytest.approx(n_closed * 50.0 * 0.0015 * 12)
+
 
 # ---------------------------------------------------------------------------
 # Edge cases
@@ -254,3 +270,15 @@ class TestAttritionEdgeCases:
         results = AttritionImpact().run(attrition_ctx)
         a9_12 = [r for r in results if r.slide_id == "A9.12"][0]
         assert not a9_12.success
+
+    def test_a9_10_same_from_odd_store(self, attrition_ctx):
+        """Out-of-core clients read the mail history from the spilled ODD."""
+        pytest.importorskip("pyarrow")
+        from ars_analysis.pipeline.odd_store import OddStore
+
+        AttritionImpact().run(attrition_ctx)
+        expected = attrition_ctx.results["attrition_10"]
+        attrition_ctx.results.clear()
+        attrition_ctx.store = OddStore.spill(attrition_ctx.data)
+        AttritionImpact().run(attrition_ctx)
+        assert attrition_ctx.results["attrition_10"] == expected
@@ -0,0 +1,99 @@
+"""Tests for analytics.breakdown -- bin tables and the shared rate engine."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ars_analysis.analytics.attrition import _helpers as attrition
+from ars_analysis.analytics.breakdown import Bins, rate_breakdown
+from ars_analysis.analytics.dctr import _helpers as dctr
+from ars_analysis.analytics.rege import _helpers as rege
+
+# Integers around every boundary plus fractional and extreme values.
+_VALUES = pd.Series(
+    [float(v) for v in range(-20, 4000)]
+    + [-1e9, -0.01, 0.01, 0.5, 499.99, 24.999, 1e9, np.nan]
+    + [float(v) for v in (5000, 9999.5, 10000, 24999, 25000, 50000, 99999.99, 100000)]
+)
+
+
+@pytest.mark.parametrize(
+    ("bins", "categorize"),
+    [
+        (dctr.ACCOUNT_AGE_BINS, dctr.categorize_account_age),
+        (
+            dctr.SIMPLE_AGE_BINS,
+            lambda days: dctr.simplify_account_age(dctr.categorize_account_age(days)),
+        ),
+        (dctr.HOLDER_AGE_BINS, dctr.categorize_holder_age),
+        (dctr.BALANCE_BINS, dctr.categorize_balance),
+        (rege.ACCT_AGE_BINS, rege.categorize_account_age),
+        (rege.HOLDER_AGE_BINS, rege.categorize_holder_age),
+        (attrition.DURATION_BINS, attrition.categorize_duration),
+        (attrition.TENURE_BINS, attrition.categorize_tenure),
+        (attrition.BALANCE_BINS, attrition.categorize_balance),
+    ],
+)
+def test_bins_match_scalar_categorizers(bins, categorize):
+    expected = [categorize(v) for v in _VALUES]
+    expected = [None if e in (None, "Unknown") else e for e in expected]
+    actual = [None if pd.isna(c) else c for c in bins.cut(_VALUES)]
+    assert actual == expected
+
+
+class TestBins:
+    def test_edge_count_checked(self):
+        with pytest.raises(ValueError, match="one more edge"):
+            Bins((0, 1), ("a", "b"))
+
+    def test_cut_is_ordered_categorical(self):
+        cats = Bins((0, 10, np.inf), ("low", "high")).cut(pd.Series([5, "x", 20]))
+        assert list(cats.cat.categories) == ["low", "high"]
+        assert cats.cat.ordered
+        assert pd.isna(cats.iloc[1])
+
+
+class TestRateBreakdown:
+    def test_counts_rates_and_split(self):
+        cats = Bins((0, 10, 20, np.inf), ("a", "b", "c")).cut(pd.Series([1, 2, 25, 26, np.nan]))
+        hits = pd.Series([True, False, True, True, True])
+        business = pd.Series(["No", "Yes", "Yes", "No", "No"])
+        table = rate_breakdown(cats, hits, business=business)
+        assert list(table.index) == ["a", "c"]
+        assert table["Total"].tolist() == [2, 2]
+        assert table["Hits"].tolist() == [1, 2]
+        assert table["Rate"].tolist() == [0.5, 1.0]
+        assert table["Personal Hits"].tolist() == [1, 1]
+        assert table["Business Hits"].tolist() == [0, 1]
+
+    def test_two_keys(self):
+        rows = pd.Series(["x", "x", "y"], dtype="category")
+        cols = pd.Series(["p", "q", "p"], dtype="category")
+        table = rate_breakdown([rows, cols], pd.Series([True, False, True]))
+        assert table["Total"].tolist() == [1, 1, 1]
+        assert table.index.nlevels == 2
+
+
+class TestByDimension:
+    def test_dctr_breakdown(self):
+        df = pd.DataFrame(
+            {
+                "Avg Bal": [100, 200, 600, 30000, np.nan],
+                "Debit?": ["Yes", "No", "Yes", "Yes", "Yes"],
+                "Business?": ["No", "No", "Yes", "No", "No"],
+            }
+        )
+        out, ins = dctr.by_dimension(df, "Avg Bal", dctr.BALANCE_BINS, "Balance Range")
+        assert out["Balance Range"].tolist() == ["$0-$499", "$500-$999", "$25K-$50K", "TOTAL"]
+        assert out["Total Accounts"].tolist() == [2, 1, 1, 4]
+        assert out["Business w/Debit"].tolist() == [0, 1, 0, 1]
+        assert ins["total_with_data"] == 4
+
+    def test_rege_breakdown(self):
+        df = pd.DataFrame({"Reg E": ["In", "Out", "In"], "Age": [30, 31, 70]})
+        out = rege.rege_by_dimension(
+            df, rege.HOLDER_AGE_BINS.cut(df["Age"]), "Reg E", ["In"], "Age Group"
+        )
+        assert out["Age Group"].tolist() == ["25-34", "65-74"]
+        assert out["Opted In"].tolist() == [1, 1]
+        assert out["Opt-In Rate"].tolist() == [0.5, 1.0]
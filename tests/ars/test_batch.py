@@ -138,3 +138,75 @@ class TestRunBatch:
         ids = {r.client_id for r in results}
         assert "5001" in ids
         assert "5002" in ids
+
+
+def _make_valid_scanned(tmp_path, client_id):
+    """ScannedFile whose ODD passes load validation (so the client succeeds)."""
+    scanned = _make_scanned(tmp_path, client_id)
+    pd.DataFrame(
+        {
+            "Stat Code": ["O"] * 10,
+            "Product Code": ["001"] * 10,
+            "Date Opened": pd.date_range("2020-01-01", periods=10, freq="ME"),
+            "Avg Bal": [500.0] * 10,
+        }
+    ).to_excel(scanned.file_path, index=False)
+    return scanned
+
+
+class TestResume:
+    """--resume skips completed clients and restarts failed ones from checkpoint."""
+
+    def test_manifest_skips_completed_client(self, tmp_path):
+        out = tmp_path / "out"
+        files = [_make_valid_scanned(tmp_path, "6001")]
+        first = run_batch(files, settings=_MockSettings(), output_base=out)
+        assert first[0].success
+        assert (out / "batch_manifest_2026.01.json").exists()
+
+        second = run_batch(files, settings=_MockSettings(), output_base=out, resume=True)
+        assert len(second) == 1
+        assert second[0].success
+        assert second[0].resumed
+        assert second[0].elapsed == 0.0
+
+    def test_changed_module_set_is_not_skipped(self, tmp_path):
+        out = tmp_path / "out"
+        files = [_make_valid_scanned(tmp_path, "6002")]
+        run_batch(files, settings=_MockSettings(), output_base=out)
+        again = run_batch(
+            files,
+            settings=_MockSettings(),
+            output_base=out,
+            module_ids=["overview.stat_codes"],
+            resume=True,
+        )
+        assert not again[0].resumed
+
+    def test_generate_failure_resumes_without_reload(self, tmp_path, monkeypatch):
+        import ars_analysis.pipeline.batch as batch_mod
+
+        out = tmp_path / "out"
+        files = [_make_valid_scanned(tmp_path, "6003")]
+
+        def _boom(ctx):
+            raise RuntimeError("disk full")
+
+        def _no_hash(path):
+            raise AssertionError("input should only be hashed on resume")
+
+        monkeypatch.setattr(batch_mod, "step_generate", _boom)
+        monkeypatch.setattr(batch_mod, "file_hash", _no_hash)
+        failed = run_batch(files, settings=_MockSettings(), output_base=out)
+        assert not failed[0].success
+        assert (out / "6003" / "2026.01" / ".checkpoint" / "state.pkl").exists()
+
+        def _no_reload(ctx, fp):
+            raise AssertionError("load_data should be skipped on resume")
+
+        monkeypatch.undo()
+        monkeypatch.setattr(batch_mod, "step_load_file", _no_reload)
+        resumed = run_batch(files, settings=_MockSettings(), output_base=out, resume=True)
+        assert resumed[0].success
+        assert resumed[0].resumed
+        assert not (out / "6003" / "2026.01" / ".checkpoint").exists()
@@ -11,8 +11,12 @@ runner = CliRunner()
 
 @pytest.fixture(autouse=True)
 def _ars_base_env(tmp_path, monkeypatch):
-    """Ensure ARSSettings can load without a real config file."""
+    """Ensure ARSSettings can load without a real config file.
+
+    Also runs from ``tmp_path`` so the CLI's ``logs/`` sinks stay out of the repo.
+    """
     monkeypatch.setenv("ARS_PATHS__ARS_BASE", str(tmp_path))
+    monkeypatch.chdir(tmp_path)
 
 
 @pytest.fixture
@@ -0,0 +1,130 @@
+"""Tests for ars.pipeline.checkpoint -- batch manifest + per-client checkpoints."""
+
+from dataclasses import replace
+from datetime import datetime
+from pathlib import Path
+
+from ars_analysis.analytics.base import AnalysisResult
+from ars_analysis.pipeline.batch import BatchResult
+from ars_analysis.pipeline.checkpoint import (
+    BatchManifest,
+    ClientCheckpoint,
+    file_hash,
+    file_identity,
+    module_signature,
+    run_key,
+)
+from ars_analysis.pipeline.context import ClientInfo, OutputPaths, PipelineContext
+from ars_analysis.pipeline.steps.scan import ScannedFile
+
+
+def _scanned(path: Path, client_id: str = "1001") -> ScannedFile:
+    return ScannedFile(
+        client_id=client_id,
+        csm_name="TestCSM",
+        filename=path.name,
+        file_path=path,
+        month="2026.01",
+        file_size_mb=0.01,
+        is_formatted=True,
+        modified_time=datetime.now(),
+    )
+
+
+def _ctx(base: Path) -> PipelineContext:
+    return PipelineContext(
+        client=ClientInfo(client_id="1001", client_name="Test CU", month="2026.01"),
+        paths=OutputPaths.from_dir(base),
+    )
+
+
+class TestKeys:
+    def test_module_signature_is_order_independent(self):
+        assert module_signature(["b", "a"]) == module_signature(["a", "b"])
+        assert module_signature(None) == "all"
+
+    def test_run_key_depends_on_modules(self):
+        client = _ctx(Path(".")).client
+        assert run_key("abc", None, client) != run_key("abc", ["dctr.penetration"], client)
+
+    def test_run_key_depends_on_client_config(self):
+        client = _ctx(Path(".")).client
+        changed = replace(client, ic_rate=0.005)
+        assert run_key("abc", None, client) == run_key("abc", None, _ctx(Path(".")).client)
+        assert run_key("abc", None, client) != run_key("abc", None, changed)
+
+    def test_file_identity_changes_with_size(self, tmp_path):
+        f = tmp_path / "odd.xlsx"
+        f.write_bytes(b"one")
+        first = file_identity(f)
+        f.write_bytes(b"three")
+        assert file_identity(f) != first
+
+    def test_file_hash_changes_with_content(self, tmp_path):
+        f = tmp_path / "odd.xlsx"
+        f.write_bytes(b"one")
+        h1 = file_hash(f)
+        f.write_bytes(b"two")
+        assert file_hash(f) != h1
+
+
+class TestBatchManifest:
+    def _complete(self, tmp_path):
+        odd = tmp_path / "odd.xlsx"
+        odd.write_bytes(b"data" * 10)
+        scanned = _scanned(odd)
+        manifest = BatchManifest.load(tmp_path / "manifest.json")
+        result = BatchResult("1001", "Test", True, 3.0, 12, file_hash=file_hash(odd))
+        manifest.mark_complete(scanned, None, result)
+        return odd, scanned
+
+    def test_round_trip(self, tmp_path):
+        _, scanned = self._complete(tmp_path)
+        reloaded = BatchManifest.load(tmp_path / "manifest.json")
+        assert reloaded.is_complete(scanned, None)
+        assert not reloaded.is_complete(scanned, ["overview.stat_codes"])
+
+    def test_content_change_invalidates(self, tmp_path):
+        odd, scanned = self._complete(tmp_path)
+        odd.write_bytes(b"DATA" * 10)  # same size, new content and mtime
+        assert not BatchManifest.load(tmp_path / "manifest.json").is_complete(scanned, None)
+
+    def test_corrupt_manifest_is_empty(self, tmp_path):
+        path = tmp_path / "manifest.json"
+        path.write_text("{not json")
+        assert BatchManifest.load(path).clients == {}
+
+
+class TestClientCheckpoint:
+    def test_state_round_trip(self, tmp_path):
+        ctx = _ctx(tmp_path / "run")
+        chart = ctx.paths.charts_dir / "dctr.png"
+        result = AnalysisResult(slide_id="DCTR-1", title="DCTR", chart_path=chart)
+        ctx.results["dctr.penetration"] = [result]
+        ctx.all_slides.append(result)
+
+        cp = ClientCheckpoint(tmp_path / "run", "key1")
+        cp.mark_step("load_data", ctx)
+        cp.mark_step("run_analyses", ctx)
+        assert cp.completed_steps() == ["load_data", "run_analyses"]
+
+        fresh = _ctx(tmp_path / "other")
+        assert ClientCheckpoint(tmp_path / "run", "key1").restore_state(fresh)
+        assert fresh.all_slides[0].slide_id == "DCTR-1"
+        # Identity between results and all_slides survives the pickle
+        assert fresh.all_slides[0] is fresh.results["dctr.penetration"][0]
+        # Chart paths are rebased onto the new run's charts dir
+        assert fresh.all_slides[0].chart_path == fresh.paths.charts_dir / "dctr.png"
+
+    def test_different_key_ignored(self, tmp_path):
+        ctx = _ctx(tmp_path / "run")
+        ClientCheckpoint(tmp_path / "run", "key1").mark_step("run_analyses", ctx)
+        other = ClientCheckpoint(tmp_path / "run", "key2")
+        assert other.completed_steps() == []
+        assert not other.restore_state(_ctx(tmp_path / "run"))
+
+    def test_clear(self, tmp_path):
+        cp = ClientCheckpoint(tmp_path, "key1")
+        cp.mark_step("run_analyses", _ctx(tmp_path))
+        cp.clear()
+        assert not (tmp_path / ".checkpoint").exists()
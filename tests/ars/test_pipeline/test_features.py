@@ -0,0 +1,135 @@
+"""Tests for pipeline.features -- the shared per-account feature frame."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ars_analysis.analytics.dctr._helpers import (
+    BALANCE_BINS,
+    by_dimension,
+    by_feature,
+    categorize_account_age,
+    categorize_balance,
+)
+from ars_analysis.pipeline.context import ClientInfo, OutputPaths, PipelineContext
+from ars_analysis.pipeline.features import build_feature_frame, features_for
+from ars_analysis.pipeline.steps.subsets import step_subsets
+
+NOW = pd.Timestamp("2026-02-15")
+
+
+@pytest.fixture
+def odd_df():
+    return pd.DataFrame(
+        {
+            "Stat Code": ["O", "O", "C", "O", "C"],
+            "Date Opened": ["2025-12-01", "2020-01-15", "2019-05-01", "bad", "2010-03-03"],
+            "Date Closed": [None, None, "2025-06-01", None, None],
+            "Debit?": ["Yes", " y ", "No", "DC", None],
+            "Business?": ["No", "Yes", "Y", "", "no"],
+            "Account Holder Age": [22, 40, "x", 70, 55],
+            "Avg Bal": [-5.0, 0.0, 750.0, None, 150_000.0],
+            "Reg E Code Jan26": ["Opt In", "Opt In ATM", "Opt Out", " Opt In ", "Opt Out"],
+        },
+        index=[10, 11, 12, 13, 14],
+    )
+
+
+@pytest.fixture
+def ctx(tmp_path, odd_df):
+    return PipelineContext(
+        client=ClientInfo(
+            client_id="1200",
+            client_name="Test CU",
+            month="2026.02",
+            eligible_stat_codes=["O"],
+            reg_e_opt_in=["Opt In", "Opt In ATM/POS OD Limit"],
+        ),
+        paths=OutputPaths(base_dir=tmp_path, charts_dir=tmp_path / "charts"),
+        data=odd_df,
+    )
+
+
+class TestBuildFeatureFrame:
+    def test_index_and_dtypes(self, ctx, odd_df):
+        feats = build_feature_frame(odd_df, now=NOW)
+        assert feats.index.equals(odd_df.index)
+        assert pd.api.types.is_datetime64_any_dtype(feats["date_opened"])
+        for col in ("account_age", "holder_age_group", "balance_range"):
+            assert isinstance(feats[col].dtype, pd.CategoricalDtype)
+            assert feats[col].cat.ordered
+        assert feats["has_debit"].dtype == bool
+        assert feats["is_business"].dtype == "boolean"
+
+    def test_buckets_match_scalar_categorizers(self, ctx, odd_df):
+        feats = build_feature_frame(odd_df, now=NOW)
+        days = (NOW - pd.to_datetime(odd_df["Date Opened"], errors="coerce")).dt.days
+        for d, got in zip(days, feats["account_age"]):
+            expected = categorize_account_age(d)
+            assert (got if pd.notna(got) else "Unknown") == expected
+        for b, got in zip(feats["avg_bal"], feats["balance_range"]):
+            if pd.notna(b):
+                assert got == categorize_balance(b)
+
+    def test_flags(self, ctx, odd_df):
+        feats = build_feature_frame(odd_df, now=NOW)
+        assert feats["has_debit"].tolist() == [True, True, False, True, False]
+        assert feats["is_business"].tolist() == [False, True, True, pd.NA, False]
+
+    def test_unparseable_values_are_missing(self, ctx, odd_df):
+        feats = build_feature_frame(odd_df, now=NOW)
+        assert pd.isna(feats.loc[13, "date_opened"])
+        assert pd.isna(feats.loc[13, "account_age"])
+        assert np.isnan(feats.loc[12, "holder_age"])
+
+    def test_missing_columns(self):
+        feats = build_feature_frame(pd.DataFrame({"Stat Code": ["O", "C"]}), now=NOW)
+        assert feats["account_age"].isna().all()
+        assert not feats["has_debit"].any()
+
+    def test_holder_age_from_birth_date(self):
+        df = pd.DataFrame({"Birth Date": ["1976-02-15"]})
+        feats = build_feature_frame(df, now=NOW)
+        assert feats["holder_age"].iloc[0] == pytest.approx(50, abs=0.1)
+
+
+class TestStepSubsetsFeatures:
+    def test_step_subsets_attaches_features(self, ctx):
+        step_subsets(ctx)
+        assert ctx.features is not None
+        assert ctx.features.index.equals(ctx.data.index)
+
+    def test_features_for_slices_subset(self, ctx):
+        step_subsets(ctx)
+        ed = ctx.subsets.eligible_data
+        feats = features_for(ctx, ed)
+        assert feats.index.equals(ed.index)
+        assert feats.loc[ed.index[0], "has_debit"] == ctx.features.loc[ed.index[0], "has_debit"]
+
+    def test_features_for_foreign_frame_builds_directly(self, ctx, odd_df):
+        step_subsets(ctx)
+        other = odd_df.reset_index(drop=True).iloc[:2]
+        other.index = [100, 101]
+        feats = features_for(ctx, other)
+        assert feats.index.tolist() == [100, 101]
+        assert feats["has_debit"].tolist() == [True, True]
+
+    def test_features_for_without_frame(self, ctx, odd_df):
+        assert ctx.features is None
+        assert len(features_for(ctx, odd_df)) == len(odd_df)
+
+
+class TestByFeature:
+    def test_matches_by_dimension(self, ctx, odd_df):
+        df = odd_df.assign(
+            **{
+                "Avg Bal": pd.to_numeric(odd_df["Avg Bal"]),
+                "Business?": ["No", "Yes", "Yes", "", "No"],
+            }
+        )
+        valid = df[df["Avg Bal"].notna()]
+        expected, exp_ins = by_dimension(valid, "Avg Bal", BALANCE_BINS, "Balance Range")
+        feats = build_feature_frame(valid, now=NOW)
+        got, ins = by_feature(feats, "balance_range", "Balance Range")
+        pd.testing.assert_frame_equal(got, expected)
+        assert ins == exp_ins
@@ -67,7 +67,7 @@ def test_generate_excel_has_correct_sheets(ctx_with_results):
 def test_generate_no_results_is_noop(tmp_path):
     ctx = PipelineContext(
         client=ClientInfo(client_id="1200", client_name="Test CU", month="2026.02"),
-        paths=OutputPaths(base_dir=tmp_path, excel_dir=tmp_path),
+        paths=OutputPaths(base_dir=tmp_path, excel_dir=tmp_path, pptx_dir=tmp_path),
     )
     step_generate(ctx)
     excel_files = list(tmp_path.glob("*.xlsx"))
@@ -84,7 +84,7 @@ def test_generate_result_without_excel_data(tmp_path):
     """Results with no excel_data should be skipped without error."""
     ctx = PipelineContext(
         client=ClientInfo(client_id="1200", client_name="Test CU", month="2026.02"),
-        paths=OutputPaths(base_dir=tmp_path, excel_dir=tmp_path),
+        paths=OutputPaths(base_dir=tmp_path, excel_dir=tmp_path, pptx_dir=tmp_path),
     )
     ctx.all_slides = [
         AnalysisResult(slide_id="A1", title="Chart Only", chart_path=None),
@@ -0,0 +1,190 @@
+"""Tests for pipeline.module_cache -- incremental module re-runs."""
+
+import pandas as pd
+import pytest
+
+from ars_analysis.analytics.base import AnalysisModule, AnalysisResult
+from ars_analysis.analytics.registry import _REGISTRY, clear_registry, register
+from ars_analysis.pipeline.context import ClientInfo, OutputPaths, PipelineContext
+from ars_analysis.pipeline.module_cache import (
+    CACHE_DIRNAME,
+    ColumnHasher,
+    ModuleCache,
+    side_results,
+)
+from ars_analysis.pipeline.steps.analyze import step_analyze
+
+
+@pytest.fixture
+def odd_df():
+    return pd.DataFrame(
+        {
+            "Stat Code": ["O"] * 4 + ["C"] * 2,
+            "Product Code": ["DDA"] * 6,
+            "Branch": ["Main"] * 3 + ["North"] * 3,
+            "Balance": [100.0, 200.0, 300.0, 400.0, 500.0, 600.0],
+        }
+    )
+
+
+@pytest.fixture
+def ctx(tmp_path, odd_df):
+    paths = OutputPaths(
+        base_dir=tmp_path,
+        charts_dir=tmp_path / "charts",
+        excel_dir=tmp_path,
+        pptx_dir=tmp_path,
+    )
+    return PipelineContext(
+        client=ClientInfo(client_id="1200", client_name="Test CU", month="2026.02"),
+        paths=paths,
+        data=odd_df,
+        module_cache_dir=tmp_path / CACHE_DIRNAME,
+    )
+
+
+@pytest.fixture(autouse=True)
+def _clean_registry():
+    saved = dict(_REGISTRY)
+    clear_registry()
+    yield
+    clear_registry()
+    _REGISTRY.update(saved)
+
+
+def _counting_module(module_id, calls, **attrs):
+    class CountMod(AnalysisModule):
+        display_name = "Count"
+        section = "overview"
+
+        def run(self, ctx):
+            calls.append(module_id)
+            ctx.results[f"{module_id}_side"] = {"n": len(ctx.data)}
+            ctx.results[f"_{module_id}_memo"] = "private"
+            return [AnalysisResult(slide_id=module_id, title="Count")]
+
+    CountMod.module_id = module_id
+    for k, v in attrs.items():
+        setattr(CountMod, k, v)
+    return CountMod
+
+
+def _rerun(ctx):
+    ctx.results.clear()
+    ctx.all_slides.clear()
+    step_analyze(ctx)
+
+
+class TestColumnHasher:
+    def test_digest_changes_only_with_listed_columns(self, odd_df):
+        changed = odd_df.copy()
+        changed["Balance"] = changed["Balance"] + 1
+        a, b = ColumnHasher(odd_df), ColumnHasher(changed)
+        assert a.digest(("Branch",)) == b.digest(("Branch",))
+        assert a.digest(("Balance",)) != b.digest(("Balance",))
+        assert a.digest(None) != b.digest(None)
+
+    def test_missing_column_is_stable(self, odd_df):
+        assert ColumnHasher(odd_df).digest(("Nope",)) == ColumnHasher(None).digest(("Nope",))
+
+
+class TestFingerprint:
+    def test_client_field_only_affects_declaring_modules(self, ctx):
+        plain = _counting_module("test.plain", [])()
+        uses_ic = _counting_module("test.ic", [], client_fields=("ic_rate",))()
+        hasher = ColumnHasher(ctx.data)
+        before = (plain.fingerprint(ctx, hasher, {}), uses_ic.fingerprint(ctx, hasher, {}))
+        ctx.client.ic_rate = 0.02
+        after = (plain.fingerprint(ctx, hasher, {}), uses_ic.fingerprint(ctx, hasher, {}))
+        assert before[0] == after[0]
+        assert before[1] != after[1]
+
+    def test_upstream_fingerprint_propagates(self, ctx):
+        mod = _counting_module("test.down", [], depends_on=("test.up",))()
+        hasher = ColumnHasher(ctx.data)
+        assert mod.fingerprint(ctx, hasher, {"test.up": "a"}) != mod.fingerprint(
+            ctx, hasher, {"test.up": "b"}
+        )
+
+    def test_shared_code_change_invalidates(self, ctx, monkeypatch):
+        from ars_analysis.pipeline import module_cache
+
+        mod = _counting_module("test.plain", [])()
+        hasher = ColumnHasher(ctx.data)
+        before = mod.fingerprint(ctx, hasher, {})
+        monkeypatch.setattr(module_cache, "_package_code_hash", lambda: "edited")
+        assert mod.fingerprint(ctx, hasher, {}) != before
+
+
+class TestModuleCache:
+    def test_round_trip_restores_results_and_charts(self, ctx):
+        chart = ctx.paths.charts_dir / "a1.png"
+        chart.parent.mkdir(parents=True)
+        chart.write_bytes(b"png")
+        cache = ModuleCache(ctx, ctx.module_cache_dir)
+        result = AnalysisResult(slide_id="A1", title="A", chart_path=chart)
+        cache.store("test.mod", "fp", [result], {"a_side": 1})
+
+        assert cache.load("test.mod", "other") is None
+        restored = cache.load("test.mod", "fp")
+        assert [r.slide_id for r in restored] == ["A1"]
+        assert ctx.results["test.mod"][0].chart_path == chart
+        assert ctx.results["a_side"] == 1
+
+    def test_missing_chart_invalidates_entry(self, ctx):
+        chart = ctx.paths.charts_dir / "a1.png"
+        chart.parent.mkdir(parents=True)
+        chart.write_bytes(b"png")
+        cache = ModuleCache(ctx, ctx.module_cache_dir)
+        cache.store("test.mod", "fp", [AnalysisResult("A1", "A", chart_path=chart)], {})
+        chart.unlink()
+        assert cache.load("test.mod", "fp") is None
+
+    def test_side_results_excludes_own_and_private_keys(self):
+        written = {"test.mod": [], "new_key": 1, "_memo": 2}
+        assert side_results(written, "test.mod") == {"new_key": 1}
+
+
+class TestAnalyzeWithCache:
+    def test_unchanged_rerun_reuses_results(self, ctx):
+        calls = []
+        register(_counting_module("overview.stat_codes", calls))
+        step_analyze(ctx)
+        _rerun(ctx)
+        assert calls == ["overview.stat_codes"]
+        assert ctx.results["overview.stat_codes_side"] == {"n": 6}
+        assert "_overview.stat_codes_memo" not in ctx.results
+        assert len(ctx.all_slides) == 1
+
+    def test_changed_input_column_reruns_only_that_module(self, ctx):
+        calls = []
+        register(_counting_module("overview.stat_codes", calls, input_columns=("Stat Code",)))
+        register(_counting_module("overview.product_codes", calls, input_columns=("Balance",)))
+        step_analyze(ctx)
+        ctx.data = ctx.data.assign(Balance=ctx.data["Balance"] * 2)
+        _rerun(ctx)
+        assert calls == ["overview.stat_codes", "overview.product_codes", "overview.product_codes"]
+
+    def test_upstream_change_reruns_dependents(self, ctx):
+        calls = []
+        register(_counting_module("overview.stat_codes", calls, input_columns=("Balance",)))
+        register(
+            _counting_module(
+                "overview.product_codes",
+                calls,
+                input_columns=(),
+                depends_on=("overview.stat_codes",),
+            )
+        )
+        step_analyze(ctx)
+        ctx.data = ctx.data.assign(Balance=ctx.data["Balance"] * 2)
+        _rerun(ctx)
+        assert calls.count("overview.product_codes") == 2
+
+    def test_no_cache_dir_always_runs(self, ctx):
+        ctx.module_cache_dir = None
+        calls = []
+        register(_counting_module("overview.stat_codes", calls))
+        step_analyze(ctx)
+        _rerun(ctx)
+        assert calls == ["overview.stat_codes", "overview.stat_codes"]
@@ -0,0 +1,130 @@
+"""Tests for pipeline.odd_store -- out-of-core ODD storage."""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ars_analysis.pipeline.context import ClientInfo, OutputPaths, PipelineContext
+from ars_analysis.pipeline.odd_store import OddStore, current_columns
+from ars_analysis.pipeline.steps.subsets import step_subsets
+
+pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def odd_df():
+    n = 12
+    df = pd.DataFrame(
+        {
+            "Stat Code": ["O"] * 8 + ["C"] * 4,
+            "Product Code": ["DDA"] * 6 + [1, 2] * 3,  # mixed types, like real ODDs
+            "Date Opened": pd.date_range("2024-01-01", periods=n, freq="MS"),
+            "Branch": ["Main", "North", "South"] * 4,
+            "Avg Bal": np.arange(n, dtype=float) * 100,
+        },
+        index=pd.RangeIndex(100, 100 + n),
+    )
+    for month in ("Nov25", "Dec25", "Jan26"):
+        df[f"{month} Spend"] = np.arange(n, dtype=float)
+        df[f"{month} Mail"] = [month if i % 3 == 0 else None for i in range(n)]
+    return df
+
+
+class TestCurrentColumns:
+    def test_keeps_latest_month_per_family(self, odd_df):
+        cols = current_columns(odd_df.columns)
+        assert "Jan26 Spend" in cols and "Jan26 Mail" in cols
+        assert "Dec25 Spend" not in cols and "Nov25 Mail" not in cols
+        assert {"Stat Code", "Branch", "Avg Bal"} <= set(cols)
+
+    def test_orders_months_chronologically(self):
+        assert current_columns(["Dec25 Spend", "Jan26 Spend", "Feb25 Spend"]) == ["Jan26 Spend"]
+
+
+class TestOddStore:
+    def test_frame_round_trip(self, odd_df):
+        store = OddStore.spill(odd_df)
+        out = store.frame(["Branch", "Dec25 Spend"])
+        pd.testing.assert_frame_equal(out, odd_df[["Branch", "Dec25 Spend"]])
+
+    def test_mixed_object_column_stored_as_text(self, odd_df):
+        store = OddStore.spill(odd_df)
+        assert store.frame(["Product Code"])["Product Code"].tolist()[-2:] == ["1", "2"]
+
+    def test_subset_rows(self, odd_df):
+        store = OddStore.spill(odd_df)
+        store.add_subset("open", odd_df[odd_df["Stat Code"] == "O"])
+        out = store.frame(["Avg Bal"], subset="open")
+        assert list(out.index) == list(range(100, 108))
+
+    def test_any_present_matches_pandas(self, odd_df):
+        store = OddStore.spill(odd_df)
+        cols = ["Nov25 Mail", "Dec25 Mail"]
+        expected = odd_df[cols].notna().any(axis=1)
+        pd.testing.assert_series_equal(store.any_present(cols), expected, check_names=False)
+
+    def test_aggregate(self, odd_df):
+        store = OddStore.spill(odd_df)
+        out = store.aggregate(["Branch"], {"Jan26 Spend": "sum"}).set_index("Branch")
+        expected = odd_df.groupby("Branch")["Jan26 Spend"].sum()
+        assert out["Jan26 Spend_sum"].to_dict() == expected.to_dict()
+
+    def test_spill_in_row_groups(self, odd_df, monkeypatch):
+        monkeypatch.setattr("ars_analysis.pipeline.odd_store._ROW_GROUP", 5)
+        store = OddStore.spill(odd_df)
+        pd.testing.assert_frame_equal(store.frame(["Avg Bal"]), odd_df[["Avg Bal"]])
+
+    def test_file_removed_with_store(self, odd_df):
+        store = OddStore.spill(odd_df)
+        path = store.path
+        del store
+        assert not path.exists()
+
+    def test_sql_needs_duckdb(self, odd_df):
+        store = OddStore.spill(odd_df)
+        store.add_subset("open", odd_df[odd_df["Stat Code"] == "O"])
+        try:
+            import duckdb  # noqa: F401
+        except ImportError:
+            with pytest.raises(ImportError, match="duckdb"):
+                store.sql("SELECT count(*) FROM open")
+        else:
+            assert store.sql('SELECT count(*) AS n FROM "open"')["n"][0] == 8
+
+
+class TestOutOfCoreSubsets:
+    def _ctx(self, tmp_path, odd_df, limit_mb):
+        return PipelineContext(
+            client=ClientInfo(
+                client_id="1200",
+                client_name="Test CU",
+                month="2026.02",
+                eligible_stat_codes=["O"],
+                eligible_prod_codes=["DDA"],
+            ),
+            paths=OutputPaths.from_dir(tmp_path),
+            settings=SimpleNamespace(pipeline=SimpleNamespace(out_of_core_mb=limit_mb)),
+            data=odd_df,
+            data_original=odd_df,
+        )
+
+    def test_small_client_unchanged(self, tmp_path, odd_df):
+        ctx = self._ctx(tmp_path, odd_df, limit_mb=1000)
+        step_subsets(ctx)
+        assert ctx.store is None
+        assert "Nov25 Spend" in ctx.subsets.open_accounts.columns
+
+    def test_large_client_gets_narrow_subsets(self, tmp_path, odd_df):
+        ctx = self._ctx(tmp_path, odd_df, limit_mb=1e-6)
+        step_subsets(ctx)
+        assert ctx.store is not None
+        open_cols = set(ctx.subsets.open_accounts.columns)
+        assert "Jan26 Spend" in open_cols and "Nov25 Spend" not in open_cols
+        assert len(ctx.subsets.open_accounts) == 8
+        assert len(ctx.subsets.eligible_data) == 6
+        # History is still in ctx.data and queryable per subset from the store
+        assert "Nov25 Spend" in ctx.data.columns
+        hist = ctx.store.frame(["Nov25 Spend"], subset="eligible_data")
+        assert list(hist.index) == list(ctx.subsets.eligible_data.index)
@@ -1,5 +1,7 @@
 """Tests for the pipeline runner."""
 
+import json
+
 import pytest
 
 from ars_analysis.pipeline.context import ClientInfo, OutputPaths, PipelineContext
@@ -80,3 +82,30 @@ def test_pipeline_step_is_frozen():
 def test_pipeline_step_default_critical():
     step = PipelineStep("test", _noop_step)
     assert step.critical is True
+
+
+def test_run_pipeline_profiles_steps(ctx):
+    steps = [
+        PipelineStep("step_a", _noop_step),
+        PipelineStep("step_warn", _failing_step, critical=False),
+    ]
+    run_pipeline(ctx, steps)
+    spans = {s.name: s for s in ctx.profiler.spans}
+    assert spans["step_a"].kind == "step"
+    assert spans["step_a"].success is True
+    assert spans["step_warn"].success is False
+
+
+def test_run_pipeline_adds_profile_to_run_report(tmp_path):
+    ctx = PipelineContext(
+        client=ClientInfo(client_id="1200", client_name="Test CU", month="2026.02"),
+        paths=OutputPaths.from_dir(tmp_path),
+    )
+
+    def write_report(c):
+        c.run_report_path.write_text(json.dumps({"summary": {"total": 0}}))
+
+    run_pipeline(ctx, [PipelineStep("generate_output", write_report)])
+    report = json.loads(ctx.run_report_path.read_text())
+    assert report["summary"] == {"total": 0}
+    assert [s["name"] for s in report["profile"]["spans"]] == ["generate_output"]
@@ -87,6 +87,24 @@ class TestScanReadyFiles:
         result = scan_ready_files(mock_settings, target_month="2025.12")
         assert result == []
 
+    def test_rescan_sees_new_client_and_file(self, mock_settings, populated_watch_root):
+        import os
+        import time
+
+        mock_settings.paths.watch_root = populated_watch_root
+        month = populated_watch_root / "JamesG" / "2026.02"
+        past = time.time() - 60
+        for d in (month, month / "1453", month / "1776"):
+            os.utime(d, (past, past))
+        scan_ready_files(mock_settings, target_month="2026.02")
+
+        (month / "1776" / "1776-2026-02-Bank-ODD-formatted.xlsx").write_bytes(b"f")
+        (month / "2000").mkdir()
+        (month / "2000" / "2000-ODD.csv").write_text("a\n")
+        result = {f.client_id: f for f in scan_ready_files(mock_settings, target_month="2026.02")}
+        assert sorted(result) == ["1453", "1776", "2000"]
+        assert result["1776"].is_formatted is True
+
 
 class TestAvailableMonths:
     def test_empty(self, mock_settings):
@@ -0,0 +1,116 @@
+"""Tests for ars.pipeline.scheduling -- cost-aware batch scheduling."""
+
+import json
+from datetime import datetime
+from pathlib import Path
+
+from ars_analysis.pipeline.batch import BatchResult
+from ars_analysis.pipeline.scheduling import (
+    DEFAULT_SECONDS_PER_MB,
+    RunHistory,
+    estimate_costs,
+    next_admissible,
+    order_longest_first,
+)
+from ars_analysis.pipeline.steps.scan import ScannedFile
+
+
+def _scanned(client_id: str, size_mb: float) -> ScannedFile:
+    return ScannedFile(
+        client_id=client_id,
+        csm_name="TestCSM",
+        filename=f"{client_id}.xlsx",
+        file_path=Path(f"{client_id}.xlsx"),
+        month="2026.01",
+        file_size_mb=size_mb,
+        is_formatted=True,
+        modified_time=datetime.now(),
+    )
+
+
+def _result(client_id: str, elapsed: float, success: bool = True) -> BatchResult:
+    return BatchResult(
+        client_id=client_id,
+        client_name=client_id,
+        success=success,
+        elapsed=elapsed,
+        slide_count=10,
+        row_count=500,
+    )
+
+
+class TestEstimateCosts:
+    def test_default_rate_without_history(self):
+        costs = estimate_costs([_scanned("1001", 2.0)], RunHistory(), memory_per_mb=10.0)
+        assert costs["1001"].predicted_seconds == 2.0 * DEFAULT_SECONDS_PER_MB
+        assert costs["1001"].predicted_memory_mb == 20.0
+
+    def test_client_history_wins_over_fleet(self):
+        history = RunHistory(
+            runs={
+                "1001": [{"file_size_mb": 1.0, "rows": 100, "elapsed": 30.0}],
+                "1002": [{"file_size_mb": 1.0, "rows": 100, "elapsed": 2.0}],
+            }
+        )
+        costs = estimate_costs(
+            [_scanned("1001", 2.0), _scanned("1003", 2.0)], history, memory_per_mb=1.0
+        )
+        assert costs["1001"].predicted_seconds == 60.0
+        # Unseen client falls back to the fleet median (30 and 2 -> 16 s/MB)
+        assert costs["1003"].predicted_seconds == 32.0
+
+
+class TestOrdering:
+    def test_longest_first(self):
+        files = [_scanned("a", 1.0), _scanned("b", 5.0), _scanned("c", 3.0)]
+        costs = estimate_costs(files, RunHistory(), memory_per_mb=1.0)
+        ordered = order_longest_first(files, costs)
+        assert [f.client_id for f in ordered] == ["b", "c", "a"]
+
+
+class TestNextAdmissible:
+    def setup_method(self):
+        self.files = [_scanned("big", 10.0), _scanned("small", 1.0)]
+        self.costs = estimate_costs(self.files, RunHistory(), memory_per_mb=100.0)
+
+    def test_unlimited_budget_takes_head(self):
+        assert next_admissible(self.files, self.costs, 5000, 0, idle=False).client_id == "big"
+
+    def test_skips_to_smaller_client_that_fits(self):
+        picked = next_admissible(self.files, self.costs, 800, 1000, idle=False)
+        assert picked.client_id == "small"
+
+    def test_nothing_fits(self):
+        assert next_admissible(self.files, self.costs, 950, 1000, idle=False) is None
+
+    def test_oversized_client_runs_alone(self):
+        picked = next_admissible(self.files, self.costs, 0, 500, idle=True)
+        assert picked.client_id == "big"
+
+
+class TestRunHistory:
+    def test_missing_file_is_empty(self, tmp_path):
+        history = RunHistory.load(tmp_path / "nope.json")
+        assert history.runs == {}
+
+    def test_record_and_save_round_trip(self, tmp_path):
+        path = tmp_path / "run_tracker.json"
+        path.write_text(json.dumps({"other": 1}))
+        history = RunHistory.load(path)
+        history.record(
+            [_scanned("1001", 2.0), _scanned("1002", 1.0)],
+            [_result("1001", 12.0), _result("1002", 5.0, success=False)],
+        )
+        history.save()
+
+        data = json.loads(path.read_text())
+        assert data["other"] == 1
+        assert list(data["batch_runs"]) == ["1001"]
+        assert RunHistory.load(path).seconds_per_mb("1001") == 6.0
+
+    def test_history_depth_is_capped(self):
+        history = RunHistory()
+        for i in range(10):
+            history.record([_scanned("1001", 1.0)], [_result("1001", float(i + 1))])
+        assert len(history.runs["1001"]) == 5
+        assert history.runs["1001"][-1]["elapsed"] == 10.0
@@ -1,5 +1,7 @@
 """Tests for pipeline steps (load, subsets, analyze)."""
 
+import time
+
 import pandas as pd
 import pytest
 
@@ -7,7 +9,11 @@ from ars_analysis.analytics.base import AnalysisModule, AnalysisResult
 from ars_analysis.analytics.registry import _REGISTRY, clear_registry, register
 from ars_analysis.exceptions import DataError
 from ars_analysis.pipeline.context import ClientInfo, OutputPaths, PipelineContext
-from ars_analysis.pipeline.steps.analyze import step_analyze, step_analyze_selected
+from ars_analysis.pipeline.steps.analyze import (
+    module_prerequisites,
+    step_analyze,
+    step_analyze_selected,
+)
 from ars_analysis.pipeline.steps.load import step_load_file
 from ars_analysis.pipeline.steps.subsets import step_subsets
 
@@ -331,3 +337,92 @@ class TestAnalyzeStep:
         # Should not raise
         step_analyze(ctx)
         assert "test.fail" not in ctx.results
+
+
+def _sleepy_module(module_id, delay=0.0, depends_on=(), reads=None):
+    class SleepyMod(AnalysisModule):
+        display_name = "Sleepy"
+        section = "overview"
+
+        def run(self, ctx):
+            time.sleep(delay)
+            if reads:
+                ctx.results[f"{module_id}_out"] = ctx.results.get(reads, {}).get("v")
+            else:
+                ctx.results[f"{module_id}_out"] = {"v": module_id}
+            return [AnalysisResult(slide_id=module_id, title=module_id)]
+
+    SleepyMod.module_id = module_id
+    SleepyMod.depends_on = depends_on
+    return SleepyMod
+
+
+class TestParallelAnalyze:
+    def test_prerequisites_chain_family_and_declared_deps(self):
+        mods = [
+            _sleepy_module("dctr.a")(),
+            _sleepy_module("rege.a")(),
+            _sleepy_module("dctr.b")(),
+            _sleepy_module("insights.x", depends_on=("rege.a", "mailer.later"))(),
+        ]
+        prereqs = module_prerequisites(mods)
+        assert prereqs == {
+            "dctr.a": set(),
+            "rege.a": set(),
+            "dctr.b": {"dctr.a"},
+            "insights.x": {"rege.a"},
+        }
+
+    def test_slide_order_follows_module_order(self, ctx):
+        ctx.module_workers = 4
+        for cls in (
+            _sleepy_module("dctr.slow", delay=0.2),
+            _sleepy_module("rege.fast"),
+            _sleepy_module("attrition.fast"),
+        ):
+            register(cls)
+        step_analyze_selected(ctx, ["dctr.slow", "rege.fast", "attrition.fast"])
+        assert [s.slide_id for s in ctx.all_slides] == ["dctr.slow", "rege.fast", "attrition.fast"]
+        module_keys = [k for k in ctx.results if not k.endswith("_out")]
+        assert module_keys == ["dctr.slow", "rege.fast", "attrition.fast"]
+
+    def test_dependent_sees_upstream_results(self, ctx):
+        ctx.module_workers = 4
+        register(_sleepy_module("dctr.up", delay=0.1))
+        register(_sleepy_module("insights.down", depends_on=("dctr.up",), reads="dctr.up_out"))
+        step_analyze_selected(ctx, ["dctr.up", "insights.down"])
+        assert ctx.results["insights.down_out"] == "dctr.up"
+
+    def test_parallel_failure_is_isolated(self, ctx):
+        class FailMod(AnalysisModule):
+            module_id = "rege.fail"
+            display_name = "Fail"
+            section = "overview"
+
+            def run(self, ctx):
+                ctx.results["reg_e_partial"] = {"done": True}
+                raise RuntimeError("boom")
+
+        ctx.module_workers = 2
+        register(FailMod)
+        register(_sleepy_module("dctr.ok"))
+        step_analyze_selected(ctx, ["rege.fail", "dctr.ok"])
+        assert "rege.fail" not in ctx.results
+        assert ctx.results["reg_e_partial"] == {"done": True}
+        assert [s.slide_id for s in ctx.all_slides] == ["dctr.ok"]
+
+    def test_modules_share_timeseries_memo(self, ctx):
+        seen = []
+
+        class MemoMod(AnalysisModule):
+            module_id = "dctr.memo"
+            display_name = "Memo"
+            section = "overview"
+
+            def run(self, ctx):
+                seen.append(ctx.timeseries)
+                return []
+
+        register(MemoMod)
+        step_analyze_selected(ctx, ["dctr.memo"])
+        assert seen[0] is ctx.timeseries
@@ -0,0 +1,194 @@
+"""Tests for pipeline.work_queue -- shared-drive batch queue."""
+
+import os
+import time
+from datetime import datetime
+
+from ars_analysis.pipeline.batch import BatchResult, run_batch, run_worker
+from ars_analysis.pipeline.steps.scan import ScannedFile
+from ars_analysis.pipeline.work_queue import MAX_ATTEMPTS, Heartbeat, WorkQueue, iter_jobs
+
+
+def _scanned(tmp_path, client_id):
+    return ScannedFile(
+        client_id=client_id,
+        csm_name="TestCSM",
+        filename=f"{client_id}_formatted.xlsx",
+        file_path=tmp_path / f"{client_id}_formatted.xlsx",
+        month="2026.01",
+        file_size_mb=0.1,
+        is_formatted=True,
+        modified_time=datetime(2026, 1, 15, 9, 30),
+    )
+
+
+def _expire(queue):
+    """Observe the current leases, then age the observations past lease_seconds."""
+    queue.reclaim_expired()
+    queue._observed = {
+        name: (token, seen - 3600) for name, (token, seen) in queue._observed.items()
+    }
+
+
+class _MockSettings:
+    clients = {}
+
+
+class TestWorkQueue:
+    def test_claim_in_publish_order(self, tmp_path):
+        queue = WorkQueue(tmp_path / "q")
+        queue.publish([_scanned(tmp_path, c) for c in ("B", "A", "C")], module_ids=["m1"])
+        claimed = [queue.claim("w1").scanned.client_id for _ in range(3)]
+        assert claimed == ["B", "A", "C"]
+        assert queue.claim("w1") is None
+        assert queue.counts() == (0, 3)
+        assert queue.spec().module_ids == ["m1"]
+
+    def test_job_round_trips_scanned_file(self, tmp_path):
+        queue = WorkQueue(tmp_path / "q")
+        scanned = _scanned(tmp_path, "1234")
+        queue.publish([scanned])
+        assert queue.claim("w1").scanned == scanned
+
+    def test_complete_records_result_and_releases(self, tmp_path):
+        queue = WorkQueue(tmp_path / "q")
+        spec = queue.publish([_scanned(tmp_path, "1234")])
+        job = queue.claim("w1")
+        queue.complete(job, {"client_id": "1234", "success": True})
+        assert queue.counts() == (0, 0)
+        assert queue.results(spec.batch_id) == {"1234": {"client_id": "1234", "success": True}}
+
+    def test_republish_discards_old_batch(self, tmp_path):
+        queue = WorkQueue(tmp_path / "q")
+        old = queue.publish([_scanned(tmp_path, "1")])
+        stale = queue.claim("w1")
+        new = queue.publish([_scanned(tmp_path, "2")])
+        queue.complete(stale, {"client_id": "1"})
+        assert queue.results(new.batch_id) == {}
+        assert queue.results(old.batch_id) == {"1": {"client_id": "1"}}
+        assert queue.claim("w2").scanned.client_id == "2"
+
+    def test_expired_lease_is_requeued(self, tmp_path):
+        queue = WorkQueue(tmp_path / "q", lease_seconds=60)
+        queue.publish([_scanned(tmp_path, "1234")])
+        dead = queue.claim("dead-worker")
+        assert queue.reclaim_expired() == 0
+        _expire(queue)
+        assert queue.reclaim_expired() == 1
+        job = queue.claim("w2")
+        assert job.scanned.client_id == "1234"
+        assert job.attempts == 1
+        # The dead worker coming back must not release the new lease
+        queue.complete(dead, {"client_id": "1234"})
+        assert queue.counts() == (0, 1)
+
+    def test_repeatedly_lost_client_fails(self, tmp_path):
+        queue = WorkQueue(tmp_path / "q", lease_seconds=60)
+        spec = queue.publish([_scanned(tmp_path, "1234")])
+        for _ in range(MAX_ATTEMPTS):
+            queue.claim("w")
+            _expire(queue)
+            queue.reclaim_expired()
+        assert queue.counts() == (0, 0)
+        result = queue.results(spec.batch_id)["1234"]
+        assert not result["success"]
+        assert "lost" in result["error"]
+
+    def test_heartbeat_keeps_lease_alive(self, tmp_path):
+        queue = WorkQueue(tmp_path / "q", lease_seconds=0.4)
+        queue.publish([_scanned(tmp_path, "1234")])
+        job = queue.claim("w1")
+        with Heartbeat(queue, job) as hb:
+            time.sleep(1.0)
+            assert queue.reclaim_expired() == 0
+        assert not hb.lost
+
+    def test_old_lease_mtime_does_not_expire(self, tmp_path):
+        """Host clocks are never compared: a lagging worker's mtime is irrelevant."""
+        queue = WorkQueue(tmp_path / "q", lease_seconds=60)
+        queue.publish([_scanned(tmp_path, "1234")])
+        job = queue.claim("w1")
+        old = time.time() - 3600
+        os.utime(job.lease_path, (old, old))
+        assert queue.reclaim_expired() == 0
+        assert queue.reclaim_expired() == 0
+
+    def test_heartbeat_fails_after_reclaim_under_same_name(self, tmp_path):
+        queue = WorkQueue(tmp_path / "q", lease_seconds=60)
+        queue.publish([_scanned(tmp_path, "1234")])
+        slow = queue.claim("slow")
+        _expire(queue)
+        queue.reclaim_expired()
+        fresh = queue.claim("fresh")
+        assert fresh.lease_path == slow.lease_path
+        assert not queue.heartbeat(slow)
+        assert queue.heartbeat(fresh)
+
+    def test_heartbeat_beat_postpones_expiry(self, tmp_path):
+        queue = WorkQueue(tmp_path / "q", lease_seconds=60)
+        queue.publish([_scanned(tmp_path, "1234")])
+        job = queue.claim("w1")
+        _expire(queue)
+        assert queue.heartbeat(job)
+        assert queue.reclaim_expired() == 0
+
+    def test_iter_jobs_drains_queue(self, tmp_path):
+        queue = WorkQueue(tmp_path / "q")
+        queue.publish([_scanned(tmp_path, c) for c in ("1", "2")])
+        seen = []
+        for job in iter_jobs(queue, "w1", poll_seconds=0.01):
+            seen.append(job.scanned.client_id)
+            queue.complete(job, {"client_id": job.scanned.client_id})
+        assert seen == ["1", "2"]
+
+
+class TestQueuedBatch:
+    def test_worker_processes_published_jobs(self, tmp_path, monkeypatch):
+        def fake_run(scanned, settings, module_ids, output_base, use_local_temp, resume=False):
+            return BatchResult(scanned.client_id, scanned.client_id, True, 0.1, 3)
+
+        monkeypatch.setattr("ars_analysis.pipeline.batch._run_one_client", fake_run)
+        queue = WorkQueue(tmp_path / "q")
+        spec = queue.publish([_scanned(tmp_path, c) for c in ("1", "2")])
+        results = run_worker(tmp_path / "q", _MockSettings(), "w1", poll_seconds=0.01)
+        assert [r.client_id for r in results] == ["1", "2"]
+        assert queue.results(spec.batch_id)["2"]["slide_count"] == 3
+
+    def test_lost_lease_skips_complete(self, tmp_path, monkeypatch):
+        queue = WorkQueue(tmp_path / "q")
+        spec = queue.publish([_scanned(tmp_path, "1")])
+
+        def fake_run(scanned, settings, module_ids, output_base, use_local_temp, resume=False):
+            # Another worker reclaims and re-claims the client mid-run
+            _expire(queue)
+            queue.reclaim_expired()
+            other = queue.claim("other")
+            time.sleep(0.2)
+            queue.complete(other, {"client_id": "1", "by": "other"})
+            return BatchResult(scanned.client_id, scanned.client_id, True, 0.1, 3)
+
+        monkeypatch.setattr("ars_analysis.pipeline.batch._run_one_client", fake_run)
+        results = run_worker(
+            tmp_path / "q", _MockSettings(), "w1", lease_seconds=0.2, poll_seconds=0.01
+        )
+        assert results == []
+        assert queue.results(spec.batch_id) == {"1": {"client_id": "1", "by": "other"}}
+
+    def test_run_batch_with_queue(self, tmp_path, monkeypatch):
+        def fake_run(scanned, settings, module_ids, output_base, use_local_temp, resume=False):
+            return BatchResult(scanned.client_id, "Name", scanned.client_id != "2", 0.1, 5)
+
+        monkeypatch.setattr("ars_analysis.pipeline.batch._run_one_client", fake_run)
+        files = [_scanned(tmp_path, c) for c in ("1", "2", "3")]
+        results = run_batch(files, _MockSettings(), queue_dir=tmp_path / "q")
+        assert sorted(r.client_id for r in results) == ["1", "2", "3"]
+        assert [r.client_id for r in results if not r.success] == ["2"]
+        assert all(r.client_name == "Name" for r in results)
+
+    def test_local_worker_processes(self, tmp_path):
+        """max_workers > 1 works the queue from several processes."""
+        files = [_scanned(tmp_path, c) for c in ("1", "2", "3")]
+        results = run_batch(files, _MockSettings(), max_workers=2, queue_dir=tmp_path / "q")
+        assert sorted(r.client_id for r in results) == ["1", "2", "3"]
+        # The input files don't exist, so every client fails inside its worker
+        assert all(not r.success and r.error for r in results)
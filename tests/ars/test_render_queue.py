@@ -0,0 +1,113 @@
+"""Tests for charts.render_queue -- deferred chart rendering."""
+
+import matplotlib.pyplot as plt
+import pandas as pd
+import pytest
+
+from ars_analysis.analytics.base import AnalysisModule, AnalysisResult
+from ars_analysis.analytics.registry import _REGISTRY, clear_registry, register
+from ars_analysis.charts.guards import _ARS_STYLE, chart_figure, pyplot_lock, render_with_style
+from ars_analysis.charts.render_queue import (
+    RenderQueue,
+    active_render_queue,
+    deferred_rendering,
+)
+from ars_analysis.pipeline.context import ClientInfo, OutputPaths, PipelineContext
+from ars_analysis.pipeline.steps.analyze import step_analyze_selected
+
+
+@pytest.fixture(autouse=True)
+def _clean_registry():
+    saved = dict(_REGISTRY)
+    clear_registry()
+    yield
+    clear_registry()
+    _REGISTRY.update(saved)
+
+
+def _draw(path):
+    with chart_figure(figsize=(4, 3), dpi=72, save_path=path) as (fig, ax):
+        ax.bar(["a", "b", "c"], [3, 1, 2])
+        ax.set_title("Test")
+
+
+class TestRenderQueue:
+    def test_inline_without_active_queue(self, tmp_path):
+        assert active_render_queue() is None
+        _draw(tmp_path / "inline.png")
+        assert (tmp_path / "inline.png").exists()
+
+    def test_deferred_output_matches_inline(self, tmp_path):
+        _draw(tmp_path / "inline.png")
+        queue = RenderQueue(workers=2)
+        with deferred_rendering(queue):
+            _draw(tmp_path / "deferred.png")
+        assert queue.wait() == 0
+        assert queue.rendered == 1
+        assert (tmp_path / "deferred.png").read_bytes() == (tmp_path / "inline.png").read_bytes()
+
+    def test_failed_render_is_counted(self, tmp_path):
+        queue = RenderQueue(workers=1)
+        with deferred_rendering(queue):
+            _draw(tmp_path / "missing_dir" / "chart.png")
+        assert queue.wait() == 1
+        assert queue.failed == [tmp_path / "missing_dir" / "chart.png"]
+
+    def test_wait_without_submissions(self):
+        assert RenderQueue().wait() == 0
+
+    def test_queue_reusable_after_wait(self, tmp_path):
+        queue = RenderQueue(workers=1, max_pending=1)
+        with deferred_rendering(queue):
+            _draw(tmp_path / "one.png")
+            queue.wait()
+            _draw(tmp_path / "two.png")
+        queue.wait()
+        assert queue.rendered == 2
+
+
+class TestRenderWithStyle:
+    def test_draws_outside_lock_with_pinned_style(self, tmp_path):
+        _draw(tmp_path / "inline.png")
+        with pyplot_lock, plt.style.context(str(_ARS_STYLE)):
+            fig, ax = plt.subplots(figsize=(4, 3), dpi=72)
+            ax.bar(["a", "b", "c"], [3, 1, 2])
+            ax.set_title("Test")
+            plt.close(fig)
+        # Another thread's style active while this figure is drawn
+        with plt.style.context("dark_background"):
+            render_with_style(fig, tmp_path / "pinned.png", str(_ARS_STYLE), bbox_inches="tight")
+        assert (tmp_path / "pinned.png").read_bytes() == (tmp_path / "inline.png").read_bytes()
+
+
+class TestAnalyzeWithRenderQueue:
+    @pytest.mark.parametrize("workers", [1, 3])
+    def test_module_charts_rendered_in_background(self, tmp_path, workers):
+        class ChartMod(AnalysisModule):
+            display_name = "Chart"
+            section = "overview"
+
+            def run(self, ctx):
+                path = ctx.paths.charts_dir / f"{self.module_id}.png"
+                _draw(path)
+                return [AnalysisResult(slide_id=self.module_id, title="C", chart_path=path)]
+
+        ids = ["dctr.c", "rege.c", "attrition.c"]
+        for mid in ids:
+            register(type(mid, (ChartMod,), {"module_id": mid}))
+
+        charts = tmp_path / "charts"
+        charts.mkdir()
+        ctx = PipelineContext(
+            client=ClientInfo(client_id="1200", client_name="Test CU", month="2026.02"),
+            paths=OutputPaths(base_dir=tmp_path, charts_dir=charts),
+            data=pd.DataFrame({"Stat Code": ["O"]}),
+            module_workers=workers,
+            render_queue=RenderQueue(workers=2),
+        )
+        step_analyze_selected(ctx, ids)
+
+        assert ctx.render_queue.wait() == 0
+        assert ctx.render_queue.rendered == 3
+        assert all((charts / f"{mid}.png").exists() for mid in ids)
+        assert active_render_queue() is None
@@ -0,0 +1,47 @@
+"""Startup budget for the ARS CLI.
+
+``ars --help``, ``scan`` and ``retrieve`` must not pay for pandas,
+matplotlib or the analytics modules. Fails when an eager import creeps back
+into ``ars_analysis.cli``.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+# Measured ~0.2 s; generous headroom for slow CI machines.
+IMPORT_BUDGET_SECONDS = 0.8
+HEAVY_MODULES = ("pandas", "numpy", "matplotlib", "openpyxl", "pptx", "ars_analysis.analytics")
+
+
+def _import_seconds(module: str) -> float:
+    """Cumulative import time of ``module`` in a fresh interpreter (-X importtime)."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in proc.stderr.splitlines():
+        _, _, cumulative, name = (part.strip() for part in line.replace(":", "|", 1).split("|"))
+        if name == module:
+            return int(cumulative) / 1e6
+    raise AssertionError(f"{module} not in -X importtime output")
+
+
+def _loaded_after_import(module: str) -> list[str]:
+    code = f"import sys, {module}; print(' '.join(sys.modules))"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    loaded = set(out.stdout.split())
+    return [m for m in HEAVY_MODULES if m in loaded]
+
+
+class TestStartup:
+    def test_cli_import_skips_heavy_modules(self):
+        assert _loaded_after_import("ars_analysis.cli") == []
+
+    def test_cli_import_within_budget(self):
+        # Best of three: the first run also warms the filesystem cache.
+        seconds = min(_import_seconds("ars_analysis.cli") for _ in range(3))
+        assert seconds < IMPORT_BUDGET_SECONDS, f"ars_analysis.cli imports in {seconds:.2f}s"
@@ -39,3 +39,18 @@ def pytest_collection_modifyitems(config, items):
         # Skip individual chart-rendering tests
         if item.name in _KALEIDO_TESTS:
             item.add_marker(skip)
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _isolated_dir_index(tmp_path_factory):
+    """Keep the shared directory index out of the user's cache directory."""
+    import os
+
+    import shared.dir_index
+
+    os.environ["UAP_DIR_INDEX"] = str(tmp_path_factory.mktemp("dir_index") / "dir_index.db")
+    shared.dir_index._INDEX = None
+    yield
+    if shared.dir_index._INDEX is not None:
+        shared.dir_index._INDEX.close()
+        shared.dir_index._INDEX = None
@@ -15,6 +15,7 @@ from ics_toolkit.analysis.analyses.persona import (
     analyze_persona_revenue,
     analyze_persona_velocity,
 )
+from ics_toolkit.analysis.analyses.run_context import analysis_run
 
 
 class TestClassifyAccounts:
@@ -52,6 +53,40 @@ class TestClassifyAccounts:
         assert result.empty
 
 
+class TestClassifyMemo:
+    """Classification is computed once per analysis run."""
+
+    def test_reused_within_run(self, ics_stat_o_debit, sample_settings):
+        with analysis_run() as run:
+            first = _classify_accounts(ics_stat_o_debit, sample_settings)
+            second = _classify_accounts(ics_stat_o_debit, sample_settings)
+        assert first is second
+        assert run.hits == 1
+
+    def test_not_cached_outside_run(self, ics_stat_o_debit, sample_settings):
+        first = _classify_accounts(ics_stat_o_debit, sample_settings)
+        second = _classify_accounts(ics_stat_o_debit, sample_settings)
+        assert first is not second
+        pd.testing.assert_frame_equal(first, second)
+
+    def test_different_frame_recomputes(self, ics_stat_o_debit, sample_settings):
+        with analysis_run() as run:
+            _classify_accounts(ics_stat_o_debit, sample_settings)
+            _classify_accounts(ics_stat_o_debit.copy(), sample_settings)
+        assert run.hits == 0
+
+    def test_by_balance_leaves_shared_frame_untouched(
+        self, sample_df, ics_all, ics_stat_o, ics_stat_o_debit, sample_settings
+    ):
+        with analysis_run():
+            classified = _classify_accounts(ics_stat_o_debit, sample_settings)
+            columns = list(classified.columns)
+            analyze_persona_by_balance(
+                sample_df, ics_all, ics_stat_o, ics_stat_o_debit, sample_settings
+            )
+        assert list(classified.columns) == columns
+
+
 class TestAnalyzePersonaOverview:
     """ax55: Persona Overview."""
 
@@ -0,0 +1,130 @@
+"""Tests for account_index.py -- persistent per-client ICS account index."""
+
+import pandas as pd
+import pytest
+
+from ics_toolkit.append.account_index import (
+    INDEX_COLUMNS,
+    index_as_of,
+    index_path,
+    index_sources,
+    load_index,
+    new_rows,
+    record_month,
+    save_index,
+    update_index,
+)
+from ics_toolkit.append.matcher import match_against_index, match_and_annotate
+from ics_toolkit.append.pipeline import run_match, run_merge
+from ics_toolkit.settings import AppendSettings as Settings
+
+
+def _merged(hashes, sources):
+    return pd.DataFrame({"Acct Hash": hashes, "Source": sources})
+
+
+class TestUpdateIndex:
+    def test_new_index(self, sample_merged_df):
+        index = update_index(None, sample_merged_df, "2026.01")
+        assert list(index.columns) == INDEX_COLUMNS
+        assert len(index) == len(sample_merged_df)
+        assert set(index["First Seen"]) == {"2026.01"}
+
+    def test_normalizes_and_drops_blank(self):
+        index = update_index(None, _merged(["AB-12", " ", None], ["REF", "REF", "DM"]), "2026.01")
+        assert index["Norm Hash"].tolist() == ["AB12"]
+        assert index["Acct Hash"].tolist() == ["AB-12"]
+
+    def test_later_month_adds_source_keeps_first_seen(self):
+        index = update_index(None, _merged(["AB12", "CD34"], ["REF", "DM"]), "2026.01")
+        index = update_index(index, _merged(["AB-12", "EF56"], ["DM", "REF"]), "2026.02")
+        rows = index.set_index("Norm Hash")
+        assert index_sources(index).tolist() == ["Both", "DM", "REF"]
+        assert rows.loc["AB12", "First Seen"] == "2026.01"
+        assert rows.loc["EF56", "First Seen"] == "2026.02"
+
+    def test_reapplying_month_is_noop(self, sample_merged_df):
+        once = update_index(None, sample_merged_df, "2026.01")
+        twice = update_index(once, sample_merged_df, "2026.01")
+        pd.testing.assert_frame_equal(once, twice)
+
+    def test_backfilled_month_moves_first_seen_earlier(self):
+        index = update_index(None, _merged(["AB12"], ["REF"]), "2026.02")
+        index = update_index(index, _merged(["AB12"], ["REF"]), "2025.12")
+        assert index["First Seen"].tolist() == ["2025.12"]
+
+    def test_new_rows_only_unreflected(self):
+        index = update_index(None, _merged(["AB12", "CD34"], ["REF", "DM"]), "2026.01")
+        fresh = new_rows(index, _merged(["AB12", "CD34", "EF56"], ["REF", "Both", "DM"]), "2026.02")
+        assert fresh["Norm Hash"].tolist() == ["CD34", "EF56"]
+
+    def test_index_as_of_excludes_later_accounts(self):
+        index = update_index(None, _merged(["AB12"], ["REF"]), "2026.01")
+        index = update_index(index, _merged(["CD34"], ["DM"]), "2026.03")
+        assert index_as_of(index, "2026.02")["Norm Hash"].tolist() == ["AB12"]
+        assert len(index_as_of(index, "2026.03")) == 2
+
+
+class TestPersistence:
+    def test_round_trip(self, tmp_path, sample_merged_df):
+        index = update_index(None, sample_merged_df, "2026.01")
+        save_index(index, tmp_path / "index.csv")
+        loaded = load_index(tmp_path / "index.csv")
+        pd.testing.assert_frame_equal(loaded, index, check_dtype=False)
+        assert loaded["REF"].dtype == bool
+
+    def test_missing_returns_none(self, tmp_path):
+        assert load_index(tmp_path / "nope.csv") is None
+
+    def test_rejects_foreign_csv(self, tmp_path):
+        path = tmp_path / "index.csv"
+        pd.DataFrame({"A": [1]}).to_csv(path, index=False)
+        with pytest.raises(ValueError, match="not an ICS account index"):
+            load_index(path)
+
+    def test_record_month_accumulates(self, client_dir):
+        record_month(client_dir, _merged(["AB12"], ["REF"]), "2026.01")
+        index = record_month(client_dir, _merged(["CD34"], ["DM"]), "2026.02")
+        assert len(index) == 2
+        assert len(load_index(index_path(client_dir))) == 2
+
+    def test_record_month_skips_rewrite_when_unchanged(self, client_dir):
+        record_month(client_dir, _merged(["AB12"], ["REF"]), "2026.01")
+        path = index_path(client_dir)
+        mtime = path.stat().st_mtime_ns
+        record_month(client_dir, _merged(["AB12"], ["REF"]), "2026.02")
+        assert path.stat().st_mtime_ns == mtime
+
+
+class TestMatchAgainstIndex:
+    def test_same_as_merged_file_match(self, sample_odd_df, sample_merged_df):
+        index = update_index(None, sample_merged_df, "2026.01")
+        expected, expected_stats = match_and_annotate(sample_odd_df, sample_merged_df)
+        result, stats = match_against_index(sample_odd_df, index)
+        pd.testing.assert_frame_equal(result, expected)
+        assert stats == expected_stats
+
+
+class TestPipelineIndex:
+    def test_merge_writes_index_and_match_uses_it(
+        self, tmp_path, base_dir, client_dir, ref_excel, dm_excel, sample_odd_df
+    ):
+        settings = Settings(base_dir=base_dir, match_month="2026.01")
+        run_merge(settings)
+        assert index_path(client_dir).exists()
+
+        # Matching no longer needs the merged workbook
+        for merged in client_dir.glob("*ICS Accounts-All*"):
+            merged.unlink()
+        ars_client = tmp_path / "ars" / "2026.01" / "1453"
+        ars_client.mkdir(parents=True)
+        sample_odd_df.to_excel(ars_client / "1453_oddd.xlsx", index=False)
+
+        settings = Settings(base_dir=base_dir, ars_dir=tmp_path / "ars", match_month="2026.01")
+        metadata = run_match(settings)
+        assert len(metadata) == 1
+        assert metadata[0].matched_count > 0
+
+    def test_disabled(self, base_dir, client_dir, ref_excel, dm_excel):
+        run_merge(Settings(base_dir=base_dir, match_month="2026.01", account_index=False))
+        assert not index_path(client_dir).exists()
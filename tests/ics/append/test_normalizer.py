@@ -63,6 +63,15 @@ class TestNormalizeSeries:
         assert result.iloc[0] == "ABC"
         assert result.iloc[2] == "DEF"
 
+    def test_missing_values_are_blank(self):
+        s = pd.Series(["ABC", None, float("nan")])
+        assert normalize_series(s).tolist() == ["ABC", "", ""]
+
+    def test_matches_scalar_rules(self):
+        values = ["  ABC-123  ", "A@B#C", "0001234", "ABC\u2013123", "   ", 12345]
+        expected = [normalize_hash(v) for v in values]
+        assert normalize_series(pd.Series(values)).tolist() == expected
+
     def test_empty_series(self):
         s = pd.Series([], dtype=str)
         result = normalize_series(s)
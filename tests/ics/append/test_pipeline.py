@@ -1,6 +1,7 @@
 """Tests for pipeline.py -- end-to-end orchestration."""
 
 import pandas as pd
+import pytest
 
 from ics_toolkit.append.pipeline import (
     PipelineResult,
@@ -10,6 +11,7 @@ from ics_toolkit.append.pipeline import (
     run_merge,
     run_organize,
     run_pipeline,
+    write_match_output,
 )
 from ics_toolkit.settings import AppendSettings as Settings
 
@@ -239,6 +241,83 @@ class TestRunMatch:
         assert metadata == []
 
 
+class TestParallelMatch:
+    def _setup_clients(self, tmp_path, base_dir, sample_odd_df, sample_merged_df, ids):
+        ars_month = tmp_path / "ars" / "2026.01"
+        for cid in ids:
+            (base_dir / cid).mkdir()
+            sample_merged_df.to_excel(
+                base_dir / cid / f"{cid}-ICS Accounts-All-2026.01.xlsx", index=False
+            )
+            (ars_month / cid).mkdir(parents=True)
+            sample_odd_df.to_excel(ars_month / cid / f"{cid}_oddd.xlsx", index=False)
+        return tmp_path / "ars"
+
+    def test_workers_match_serial_results(
+        self, tmp_path, base_dir, sample_odd_df, sample_merged_df
+    ):
+        ids = ["1001", "1002", "1003"]
+        ars_dir = self._setup_clients(tmp_path, base_dir, sample_odd_df, sample_merged_df, ids)
+        serial = run_match(Settings(base_dir=base_dir, ars_dir=ars_dir, match_month="2026.01"))
+        parallel = run_match(
+            Settings(base_dir=base_dir, ars_dir=ars_dir, match_month="2026.01", match_workers=2)
+        )
+        assert [m.client_id for m in parallel] == ids
+        assert [m.matched_count for m in parallel] == [m.matched_count for m in serial]
+
+    def test_previous_outputs_not_taken_as_odd(
+        self, tmp_path, base_dir, sample_odd_df, sample_merged_df
+    ):
+        ars_dir = self._setup_clients(tmp_path, base_dir, sample_odd_df, sample_merged_df, ["1001"])
+        settings = Settings(
+            base_dir=base_dir, ars_dir=ars_dir, match_month="2026.01", match_output="csv"
+        )
+        run_match(settings)
+        metadata = run_match(settings)
+        assert metadata[0].odd_file == "1001_oddd.xlsx"
+
+
+class TestWriteMatchOutput:
+    def _annotated(self, sample_odd_df, sample_merged_df):
+        from ics_toolkit.append.matcher import match_and_annotate
+
+        annotated, _ = match_and_annotate(sample_odd_df, sample_merged_df, "Acct Number")
+        return annotated
+
+    def test_xlsx(self, tmp_path, sample_odd_df, sample_merged_df):
+        annotated = self._annotated(sample_odd_df, sample_merged_df)
+        path = write_match_output(annotated, tmp_path / "1453_oddd.xlsx", "Acct Number")
+        assert path.name == "1453_oddd_annotated.xlsx"
+        assert len(pd.read_excel(path)) == len(annotated)
+
+    def test_csv(self, tmp_path, sample_odd_df, sample_merged_df):
+        annotated = self._annotated(sample_odd_df, sample_merged_df)
+        path = write_match_output(annotated, tmp_path / "1453_oddd.xlsx", "Acct Number", "csv")
+        assert path.suffix == ".csv"
+        assert list(pd.read_csv(path).columns) == list(annotated.columns)
+
+    def test_parquet(self, tmp_path, sample_odd_df, sample_merged_df):
+        pytest.importorskip("pyarrow")
+        annotated = self._annotated(sample_odd_df, sample_merged_df)
+        annotated["Mixed"] = ["a", 1] * (len(annotated) // 2)
+        path = write_match_output(annotated, tmp_path / "1453_oddd.xlsx", "Acct Number", "parquet")
+        back = pd.read_parquet(path)
+        assert back["ICS Account"].tolist() == annotated["ICS Account"].tolist()
+
+    def test_columns_only(self, tmp_path, sample_odd_df, sample_merged_df):
+        annotated = self._annotated(sample_odd_df, sample_merged_df)
+        path = write_match_output(annotated, tmp_path / "1453_oddd.xlsx", "Acct Number", "columns")
+        assert path.name == "1453_oddd_ics_columns.csv"
+        back = pd.read_csv(path, dtype=str, keep_default_na=False)
+        assert list(back.columns) == ["Acct Number", "ICS Account", "ICS Source"]
+        assert back["ICS Account"].tolist() == annotated["ICS Account"].tolist()
+
+    def test_unknown_format(self, tmp_path, sample_odd_df, sample_merged_df):
+        annotated = self._annotated(sample_odd_df, sample_merged_df)
+        with pytest.raises(ValueError, match="Unknown match output"):
+            write_match_output(annotated, tmp_path / "x_odd.xlsx", "Acct Number", "pdf")
+
+
 class TestFindMergedFile:
     def test_finds_file(self, client_dir, merged_excel):
         result = _find_merged_file(client_dir, "1453", "2026.01")
@@ -91,6 +91,14 @@ class TestSettings:
         with pytest.raises(ValueError, match="YYYY.MM"):
             Settings(base_dir=base_dir, match_month="2026.13")
 
+    def test_match_parallel_output_options(self, base_dir):
+        s = Settings(base_dir=base_dir)
+        assert (s.match_workers, s.match_output) == (1, "xlsx")
+        with pytest.raises(ValueError):
+            Settings(base_dir=base_dir, match_workers=0)
+        with pytest.raises(ValueError):
+            Settings(base_dir=base_dir, match_output="pdf")
+
     def test_mutable(self, base_dir):
         """AppendSettings is a plain BaseModel -- fields are mutable."""
         s = Settings(base_dir=base_dir)
@@ -5,7 +5,11 @@ from __future__ import annotations
 import pandas as pd
 import pytest
 
-from ics_toolkit.referral.code_decoder import _classify_channel, decode_referral_codes
+from ics_toolkit.referral.code_decoder import (
+    PrefixTrie,
+    _classify_channel,
+    decode_referral_codes,
+)
 from ics_toolkit.settings import ReferralSettings
 
 
@@ -16,48 +20,51 @@ def settings():
 
 class TestClassifyChannel:
     def test_null_is_manual(self, settings):
-        prefixes = sorted(settings.code_prefix_map.keys(), key=len, reverse=True)
-        assert _classify_channel(None, prefixes, settings.code_prefix_map) == "MANUAL"
+        trie = PrefixTrie(settings.code_prefix_map)
+        assert _classify_channel(None, trie) == "MANUAL"
 
     def test_empty_string_is_manual(self, settings):
-        prefixes = sorted(settings.code_prefix_map.keys(), key=len, reverse=True)
-        assert _classify_channel("", prefixes, settings.code_prefix_map) == "MANUAL"
+        trie = PrefixTrie(settings.code_prefix_map)
+        assert _classify_channel("", trie) == "MANUAL"
 
     def test_none_string_is_manual(self, settings):
-        prefixes = sorted(settings.code_prefix_map.keys(), key=len, reverse=True)
-        assert _classify_channel("None", prefixes, settings.code_prefix_map) == "MANUAL"
+        trie = PrefixTrie(settings.code_prefix_map)
+        assert _classify_channel("None", trie) == "MANUAL"
 
     def test_branch_prefix_150a(self, settings):
-        prefixes = sorted(settings.code_prefix_map.keys(), key=len, reverse=True)
-        assert _classify_channel("150A001", prefixes, settings.code_prefix_map) == "BRANCH_STANDARD"
+        trie = PrefixTrie(settings.code_prefix_map)
+        assert _classify_channel("150A001", trie) == "BRANCH_STANDARD"
 
     def test_branch_prefix_120a(self, settings):
-        prefixes = sorted(settings.code_prefix_map.keys(), key=len, reverse=True)
-        assert _classify_channel("120A002", prefixes, settings.code_prefix_map) == "BRANCH_STANDARD"
+        trie = PrefixTrie(settings.code_prefix_map)
+        assert _classify_channel("120A002", trie) == "BRANCH_STANDARD"
 
     def test_digital_prefix_pc(self, settings):
-        prefixes = sorted(settings.code_prefix_map.keys(), key=len, reverse=True)
-        assert _classify_channel("PC100", prefixes, settings.code_prefix_map) == "DIGITAL_PROCESS"
+        trie = PrefixTrie(settings.code_prefix_map)
+        assert _classify_channel("PC100", trie) == "DIGITAL_PROCESS"
 
     def test_email_keyword(self, settings):
-        prefixes = sorted(settings.code_prefix_map.keys(), key=len, reverse=True)
-        assert _classify_channel("EMAIL_Q1", prefixes, settings.code_prefix_map) == "EMAIL"
+        trie = PrefixTrie(settings.code_prefix_map)
+        assert _classify_channel("EMAIL_Q1", trie) == "EMAIL"
 
     def test_unknown_code_is_other(self, settings):
-        prefixes = sorted(settings.code_prefix_map.keys(), key=len, reverse=True)
-        assert _classify_channel("UNKNOWN_XYZ", prefixes, settings.code_prefix_map) == "OTHER"
+        trie = PrefixTrie(settings.code_prefix_map)
+        assert _classify_channel("UNKNOWN_XYZ", trie) == "OTHER"
 
     def test_case_insensitive(self, settings):
-        prefixes = sorted(settings.code_prefix_map.keys(), key=len, reverse=True)
-        assert _classify_channel("150a001", prefixes, settings.code_prefix_map) == "BRANCH_STANDARD"
-        assert _classify_channel("pc200", prefixes, settings.code_prefix_map) == "DIGITAL_PROCESS"
+        trie = PrefixTrie(settings.code_prefix_map)
+        assert _classify_channel("150a001", trie) == "BRANCH_STANDARD"
+        assert _classify_channel("pc200", trie) == "DIGITAL_PROCESS"
 
     def test_whitespace_stripped(self, settings):
-        prefixes = sorted(settings.code_prefix_map.keys(), key=len, reverse=True)
-        assert (
-            _classify_channel("  150A001  ", prefixes, settings.code_prefix_map)
-            == "BRANCH_STANDARD"
-        )
+        trie = PrefixTrie(settings.code_prefix_map)
+        assert _classify_channel("  150A001  ", trie) == "BRANCH_STANDARD"
+
+    def test_longest_prefix_wins(self):
+        trie = PrefixTrie({"1": "SHORT", "150": "LONG", "": "ANY"})
+        assert _classify_channel("150A", trie) == "LONG"
+        assert _classify_channel("1A", trie) == "SHORT"
+        assert _classify_channel("EMAIL", trie) == "ANY"
 
 
 class TestDecodeReferralCodes:
@@ -88,6 +95,12 @@ class TestDecodeReferralCodes:
         result = decode_referral_codes(df, custom)
         assert result.loc[0, "Referral Channel"] == "CUSTOM_CHANNEL"
 
+    def test_matches_per_code_classification(self, settings):
+        codes = ["150A001", None, "pc9", "150A001", "EMAIL_X", "  ", "ZZZ", "pc9", 42]
+        result = decode_referral_codes(pd.DataFrame({"Referral Code": codes}), settings)
+        trie = PrefixTrie(settings.code_prefix_map)
+        assert result["Referral Channel"].tolist() == [_classify_channel(c, trie) for c in codes]
+
     def test_all_null_codes(self, settings):
         df = pd.DataFrame(
             {
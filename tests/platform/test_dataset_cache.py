@@ -0,0 +1,124 @@
+"""Tests for platform_app.core.dataset_cache -- fingerprinted dataset cache."""
+
+from __future__ import annotations
+
+import os
+
+import pandas as pd
+import pytest
+
+from platform_app.core import dataset_cache
+from platform_app.core.dataset_cache import DatasetCache, fingerprint, read_odd
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    p = tmp_path / "data.csv"
+    pd.DataFrame({"a": range(100), "b": ["x"] * 100}).to_csv(p, index=False)
+    return p
+
+
+def _counting_loader():
+    calls = []
+
+    def load(p):
+        calls.append(p)
+        return pd.read_csv(p)
+
+    return load, calls
+
+
+class TestFingerprint:
+    def test_stable_and_short(self, csv_file):
+        assert fingerprint(csv_file) == fingerprint(csv_file)
+        assert len(fingerprint(csv_file)) == 16
+
+    def test_changes_with_content(self, csv_file):
+        before = fingerprint(csv_file)
+        csv_file.write_text(csv_file.read_text().replace("x", "y"))
+        assert fingerprint(csv_file) != before
+
+    def test_changes_with_mtime(self, csv_file):
+        before = fingerprint(csv_file)
+        st = csv_file.stat()
+        os.utime(csv_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert fingerprint(csv_file) != before
+
+    def test_large_file_sampled(self, tmp_path):
+        p = tmp_path / "big.bin"
+        p.write_bytes(b"a" * 1_000_000)
+        before = fingerprint(p, sample_bytes=1024)
+        st = p.stat()
+        with open(p, "r+b") as f:
+            f.seek(500_000)
+            f.write(b"b")
+        os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns))
+        # The middle sample covers offset 500_000.
+        assert fingerprint(p, sample_bytes=1024) != before
+
+
+class TestDatasetCache:
+    def test_hit_skips_loader(self, csv_file):
+        cache = DatasetCache()
+        load, calls = _counting_loader()
+        first = cache.get_or_load(csv_file, load)
+        second = cache.get_or_load(csv_file, load)
+        assert second is first
+        assert len(calls) == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_changed_file_reloaded(self, csv_file):
+        cache = DatasetCache()
+        load, calls = _counting_loader()
+        cache.get_or_load(csv_file, load)
+        pd.DataFrame({"a": [1]}).to_csv(csv_file, index=False)
+        assert len(cache.get_or_load(csv_file, load)) == 1
+        assert len(calls) == 2
+
+    def test_kind_separates_entries(self, csv_file):
+        cache = DatasetCache()
+        load, calls = _counting_loader()
+        cache.get_or_load(csv_file, load, kind="odd")
+        cache.get_or_load(csv_file, load, kind="tran")
+        assert len(calls) == 2
+
+    def test_lru_eviction_by_memory(self, tmp_path):
+        frames = {}
+        for name in ("a", "b", "c"):
+            p = tmp_path / f"{name}.csv"
+            pd.DataFrame({"v": range(1000)}).to_csv(p, index=False)
+            frames[name] = p
+        one = int(pd.read_csv(frames["a"]).memory_usage(deep=True).sum())
+        cache = DatasetCache(max_bytes=2 * one)
+        load, calls = _counting_loader()
+
+        cache.get_or_load(frames["a"], load)
+        cache.get_or_load(frames["b"], load)
+        cache.get_or_load(frames["a"], load)  # a is now most recent
+        cache.get_or_load(frames["c"], load)  # evicts b
+        assert len(cache) == 2
+        assert cache.nbytes <= cache.max_bytes
+
+        cache.get_or_load(frames["a"], load)
+        assert len(calls) == 3
+        cache.get_or_load(frames["b"], load)
+        assert len(calls) == 4
+
+    def test_oversized_frame_not_cached(self, csv_file):
+        cache = DatasetCache(max_bytes=10)
+        load, calls = _counting_loader()
+        cache.get_or_load(csv_file, load)
+        cache.get_or_load(csv_file, load)
+        assert len(calls) == 2
+        assert len(cache) == 0
+
+
+class TestReadOdd:
+    def test_shared_cache(self, csv_file, monkeypatch):
+        monkeypatch.setattr(dataset_cache, "_CACHE", None)
+        monkeypatch.setenv("UAP_DATASET_CACHE_MB", "64")
+        first = read_odd(csv_file)
+        assert read_odd(csv_file) is first
+        cache = dataset_cache.get_dataset_cache()
+        assert cache.max_bytes == 64 * 1024**2
+        assert cache.hits == 1
@@ -0,0 +1,252 @@
+"""Tests for platform_app.core.job_runner -- background pipeline jobs."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from platform_app.core import job_runner
+from platform_app.core.job_runner import (
+    CANCELLED,
+    ERROR,
+    PRELOADED_INPUT,
+    QUEUED,
+    RUNNING,
+    SUCCESS,
+    JobRunner,
+    JobStore,
+    extract_progress,
+    run_job,
+)
+from platform_app.core.run_logger import load_history
+
+
+@pytest.fixture
+def store(tmp_path):
+    return JobStore(tmp_path / "jobs")
+
+
+def _submit(store, pipeline="ars", **kwargs):
+    return store.submit(
+        pipeline,
+        input_files={"oddd": store.root / "odd.xlsx"},
+        output_dir=store.root.parent / "out",
+        client_id="1200",
+        **kwargs,
+    )
+
+
+class TestExtractProgress:
+    def test_fraction(self):
+        assert extract_progress("[3/10] Running dctr") == 0.3
+
+    def test_no_fraction(self):
+        assert extract_progress("Loading data") is None
+        assert extract_progress("[a/b] nope") is None
+        assert extract_progress("[1/0] zero") is None
+
+
+class TestJobStore:
+    def test_submit_and_load_roundtrip(self, store):
+        job = _submit(store, client_config={"module_ids": ["dctr.overlays"]})
+        loaded = store.load(job.job_id)
+        assert loaded == job
+        assert loaded.status == QUEUED
+        assert loaded.input_files == {"oddd": str(store.root / "odd.xlsx")}
+
+    def test_load_missing(self, store):
+        assert store.load("nope") is None
+
+    def test_list_newest_first_and_filter(self, store):
+        first = _submit(store)
+        time.sleep(0.01)
+        second = _submit(store)
+        store.update(first.job_id, status=SUCCESS)
+        assert [j.job_id for j in store.list_jobs()] == [second.job_id, first.job_id]
+        assert [j.job_id for j in store.list_jobs(status=QUEUED)] == [second.job_id]
+
+    def test_unreadable_file_skipped(self, store):
+        _submit(store)
+        (store.root / "broken.json").write_text("{not json")
+        assert len(store.list_jobs()) == 1
+
+    def test_results_roundtrip(self, store):
+        job = _submit(store)
+        assert store.load_results(job.job_id) == {}
+        store.save_results(job.job_id, {"a": [1, 2]})
+        assert store.load_results(job.job_id) == {"a": [1, 2]}
+
+    def test_listing_reads_index_not_directory(self, store):
+        job = _submit(store)
+        (store.root / "stray.json").write_text(store.path(job.job_id).read_text())
+        assert [j.job_id for j in store.list_jobs()] == [job.job_id]
+
+    def test_index_built_from_existing_files(self, store):
+        job = _submit(store)
+        (store.root / job_runner.INDEX_NAME).unlink()
+        assert [j.job_id for j in store.list_jobs(status=QUEUED)] == [job.job_id]
+
+    def test_prune_removes_old_finished_jobs(self, store):
+        old, recent, queued = _submit(store), _submit(store), _submit(store)
+        store.update(old.job_id, status=SUCCESS, finished_at=time.time() - 40 * 86400)
+        store.save_results(old.job_id, {"a": 1})
+        store.claim(old.job_id)
+        store.update(recent.job_id, status=ERROR, finished_at=time.time())
+        assert store.prune(max_age_days=30) == 1
+        assert store.load(old.job_id) is None
+        assert not store.results_path(old.job_id).exists()
+        assert not store.claim_path(old.job_id).exists()
+        assert {j.job_id for j in store.list_jobs()} == {recent.job_id, queued.job_id}
+
+    def test_claim_is_exclusive(self, store):
+        job = _submit(store)
+        assert store.claim(job.job_id)
+        assert not store.claim(job.job_id)
+
+
+class TestRunJob:
+    def test_success_records_progress_results_and_history(self, store, monkeypatch):
+        def fake_run_pipeline(pipeline, *, progress_callback, **kwargs):
+            progress_callback("[1/2] Loading")
+            progress_callback("[2/2] Analyzing")
+            return {"dctr": "result"}
+
+        monkeypatch.setattr("platform_app.orchestrator.run_pipeline", fake_run_pipeline)
+        job = _submit(store)
+        run_job(store.root, job.job_id)
+
+        done = store.load(job.job_id)
+        assert done.status == SUCCESS
+        assert done.progress == 1.0
+        assert done.messages == ["Loading", "Analyzing"]
+        assert done.result_count == 1
+        assert done.pid == os.getpid()
+        assert store.load_results(job.job_id) == {"dctr": "result"}
+
+        history = load_history(log_dir=store.root.parent)
+        assert [(r.run_id, r.status) for r in history] == [(job.job_id, SUCCESS)]
+
+    def test_preloaded_frame_passed_to_pipeline(self, store, monkeypatch):
+        import pandas as pd
+
+        seen = {}
+
+        def fake_run_pipeline(pipeline, *, input_files, pre_loaded_data, **kwargs):
+            seen["inputs"] = set(input_files)
+            seen["rows"] = len(pre_loaded_data)
+            return {}
+
+        monkeypatch.setattr("platform_app.orchestrator.run_pipeline", fake_run_pipeline)
+        store.root.mkdir(parents=True)
+        frame = store.root / "tran.pkl"
+        pd.DataFrame({"amount": [1.0, 2.0, 3.0]}).to_pickle(frame)
+        job = store.submit(
+            "txn",
+            input_files={"tran": "(preloaded)", PRELOADED_INPUT: frame},
+            output_dir=store.root.parent / "out",
+        )
+        run_job(store.root, job.job_id)
+        assert store.load(job.job_id).status == SUCCESS
+        assert seen == {"inputs": {"tran"}, "rows": 3}
+
+    def test_cancelled_job_not_overwritten(self, store, monkeypatch):
+        def fake_run_pipeline(pipeline, *, progress_callback, **kwargs):
+            store.update(job.job_id, status=CANCELLED, finished_at=time.time())
+            progress_callback("[1/2] Loading")
+            raise AssertionError("worker should have stopped")
+
+        monkeypatch.setattr(job_runner, "PROGRESS_WRITE_INTERVAL", 0.0)
+        monkeypatch.setattr("platform_app.orchestrator.run_pipeline", fake_run_pipeline)
+        job = _submit(store)
+        run_job(store.root, job.job_id)
+        assert store.load(job.job_id).status == CANCELLED
+        assert store.load_results(job.job_id) == {}
+        assert load_history(log_dir=store.root.parent) == []
+
+    def test_failure_records_traceback(self, store):
+        job = _submit(store, pipeline="bogus")
+        run_job(store.root, job.job_id)
+        done = store.load(job.job_id)
+        assert done.status == ERROR
+        assert "Unknown pipeline" in done.error
+        assert load_history(log_dir=store.root.parent)[0].status == ERROR
+
+
+class TestJobRunner:
+    def test_slot_limit_and_completion(self, store):
+        runner = JobRunner(store, max_slots=1)
+        first = _submit(store, pipeline="bogus")
+        second = _submit(store, pipeline="bogus")
+
+        assert runner.dispatch() == [first.job_id]
+        assert store.load(second.job_id).status == QUEUED
+
+        assert runner.wait(first.job_id, timeout=60).status == ERROR
+        assert runner.wait(second.job_id, timeout=60).status == ERROR
+        assert runner.active_jobs() == []
+
+    def test_oversized_job_capped_to_budget(self, store):
+        runner = JobRunner(store, max_slots=2)
+        job = _submit(store, pipeline="bogus", slots=8)
+        assert runner.dispatch() == [job.job_id]
+        runner.wait(job.job_id, timeout=60)
+
+    def test_job_claimed_by_another_server_not_started(self, store):
+        runner = JobRunner(store, max_slots=1)
+        job = _submit(store)
+        assert store.claim(job.job_id)  # another server process got there first
+        assert runner.dispatch() == []
+        assert store.load(job.job_id).status == QUEUED
+
+    def test_dispatch_records_worker_pid(self, store):
+        runner = JobRunner(store, max_slots=1)
+        job = _submit(store, pipeline="bogus")
+        runner.dispatch()
+        assert store.load(job.job_id).pid == runner._procs[job.job_id].pid
+        runner.wait(job.job_id, timeout=60)
+
+    def test_cancel_running_job_of_other_server(self, store):
+        worker = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])
+        try:
+            job = _submit(store)
+            store.update(job.job_id, status=RUNNING, pid=worker.pid)
+            assert JobRunner(store).cancel(job.job_id)
+            assert worker.wait(timeout=10) != 0
+            assert store.load(job.job_id).status == CANCELLED
+        finally:
+            worker.kill()
+
+    def test_cancel_queued(self, store):
+        runner = JobRunner(store, max_slots=1)
+        job = _submit(store)
+        assert runner.cancel(job.job_id)
+        assert store.load(job.job_id).status == CANCELLED
+        assert runner.dispatch() == []
+        assert not runner.cancel(job.job_id)
+
+    def test_recover_marks_orphaned_running_jobs(self, store):
+        job = _submit(store)
+        store.update(job.job_id, status=RUNNING, pid=2**22 + 12345)
+        JobRunner(store)
+        recovered = store.load(job.job_id)
+        assert recovered.status == ERROR
+        assert "Interrupted" in recovered.error
+
+    def test_recover_skips_job_still_starting(self, store):
+        job = _submit(store)
+        store.update(job.job_id, status=RUNNING, pid=0)
+        JobRunner(store)
+        assert store.load(job.job_id).status == RUNNING
+
+    def test_get_runner_is_shared(self, monkeypatch, store):
+        monkeypatch.setattr(job_runner, "_RUNNER", None)
+        monkeypatch.setattr(job_runner, "JobStore", lambda: store)
+        runner = job_runner.get_runner()
+        try:
+            assert job_runner.get_runner() is runner
+        finally:
+            runner.stop()
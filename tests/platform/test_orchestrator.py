@@ -11,7 +11,7 @@ from platform_app.orchestrator import PIPELINE_NAMES, _detect_pipelines, run_pip
 
 class TestPipelineNames:
     def test_all_names_known(self):
-        assert set(PIPELINE_NAMES) == {"ars", "txn", "ics", "ics_append"}
+        assert set(PIPELINE_NAMES) == {"ars", "txn", "ics", "ics_referral", "ics_append"}
 
 
 class TestDetectPipelines:
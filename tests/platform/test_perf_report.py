@@ -0,0 +1,143 @@
+"""Tests for platform_app.core.perf_report -- cross-client performance summary."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+from typer.testing import CliRunner
+
+from platform_app.cli import app
+from platform_app.core.perf_report import (
+    find_reports,
+    load_samples,
+    regressions,
+    slowest_runs,
+    span_stats,
+)
+from platform_app.core.run_logger import RunRecord, log_run
+
+
+def _span(name, kind, wall, rss=0.0, success=True):
+    return {
+        "name": name,
+        "kind": kind,
+        "parent": "",
+        "wall_seconds": wall,
+        "cpu_seconds": wall,
+        "peak_rss_delta_mb": rss,
+        "rows": 100,
+        "success": success,
+    }
+
+
+def _write_ars(root, client_id, month, dctr, rege=1.0):
+    run_dir = root / client_id / month
+    run_dir.mkdir(parents=True, exist_ok=True)
+    path = run_dir / f"{client_id}_{month}_run_report.json"
+    spans = [
+        _span("dctr.overlays", "module", dctr, rss=50.0),
+        _span("rege.status", "module", rege),
+        _span("run_analyses", "step", dctr + rege, rss=60.0),
+        _span("load_data", "step", 2.0),
+    ]
+    path.write_text(
+        json.dumps({"client_id": client_id, "month": month, "profile": {"spans": spans}})
+    )
+    return path
+
+
+@pytest.fixture
+def output_root(tmp_path):
+    root = tmp_path / "out"
+    _write_ars(root, "1200", "2026.01", dctr=10.0)
+    _write_ars(root, "1200", "2026.02", dctr=20.0)
+    _write_ars(root, "1453", "2026.01", dctr=4.0)
+    _write_ars(root, "1453", "2026.02", dctr=4.2)
+    txn = root / "txn"
+    txn.mkdir()
+    (txn / "1200_TXN_run_report.json").write_text(
+        json.dumps({"profile": {"spans": [_span("m1_top_merchants", "module", 3.0)]}})
+    )
+    # Reports written before profiling existed carry no spans.
+    (root / "old_2025.12_run_report.json").write_text(json.dumps({"summary": {}}))
+    return root
+
+
+@pytest.fixture
+def samples(output_root, tmp_path):
+    return load_samples(find_reports([output_root], log_dir=tmp_path / "logs"))
+
+
+class TestLoad:
+    def test_find_and_identify(self, samples):
+        assert set(samples["pipeline"]) == {"ars", "txn"}
+        txn = samples[samples["pipeline"] == "txn"]
+        assert txn["client_id"].tolist() == ["1200"]
+        assert len(samples) == 17
+
+    def test_history_output_dirs_are_searched(self, output_root, tmp_path):
+        log_dir = tmp_path / "logs"
+        log_run(
+            RunRecord(
+                run_id="r1",
+                timestamp="2026-02-07 12:00:00",
+                csm="",
+                client_id="1200",
+                client_name="",
+                pipeline="ars",
+                modules_run=[],
+                runtime_seconds=1.0,
+                status="success",
+                output_dir=str(output_root),
+            ),
+            log_dir=log_dir,
+        )
+        assert len(find_reports(log_dir=log_dir)) == 5
+
+    def test_unreadable_report_skipped(self, tmp_path):
+        bad = tmp_path / "x_2026.01_run_report.json"
+        bad.write_text("{nope")
+        assert load_samples([bad]).empty
+
+
+class TestSummaries:
+    def test_span_stats(self, samples):
+        stats = span_stats(samples)
+        top = stats.iloc[0]
+        assert (top["pipeline"], top["name"], top["runs"]) == ("ars", "dctr.overlays", 4)
+        assert top["max_s"] == 20.0
+        assert top["max_rss_mb"] == 50.0
+        assert set(stats["name"]) == {"dctr.overlays", "rege.status", "m1_top_merchants"}
+
+    def test_slowest_runs(self, samples):
+        runs = slowest_runs(samples, n=2)
+        assert runs[["client_id", "month"]].values.tolist() == [
+            ["1200", "2026.02"],
+            ["1200", "2026.01"],
+        ]
+        assert runs.iloc[0]["total_s"] == 23.0
+        assert runs.iloc[0]["slowest_step"] == "run_analyses"
+
+    def test_regressions(self, samples):
+        hits = regressions(samples)
+        assert hits[["client_id", "name"]].values.tolist() == [["1200", "dctr.overlays"]]
+        assert hits.iloc[0]["ratio"] == 2.0
+        assert hits.iloc[0]["previous_month"] == "2026.01"
+
+    def test_empty(self):
+        empty = load_samples([])
+        assert span_stats(empty).empty
+        assert slowest_runs(empty).empty
+        assert regressions(empty).empty
+
+
+class TestPerfCli:
+    def test_perf_command(self, output_root, tmp_path):
+        result = CliRunner().invoke(
+            app, ["perf", str(output_root), "--log-dir", str(tmp_path / "logs")]
+        )
+        assert result.exit_code == 0, result.output
+        assert "6 run reports, 17 profiled spans" in result.output
+        assert "dctr.overlays" in result.output
+        assert "Regressions" in result.output
@@ -0,0 +1,130 @@
+"""Tests for platform_app.core.run_logger -- SQLite run history store."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import asdict
+from pathlib import Path
+
+import pytest
+
+from platform_app.core.run_logger import (
+    DB_NAME,
+    LEGACY_NAME,
+    RunRecord,
+    count_runs,
+    load_history,
+    log_run,
+    pipeline_stats,
+    query_runs,
+    status_counts,
+)
+
+
+def _record(i, client_id="1200", pipeline="ars", status="success", runtime=1.0):
+    return RunRecord(
+        run_id=f"run{i:03d}",
+        timestamp=f"2026-02-07 12:{i // 60:02d}:{i % 60:02d}",
+        csm="jg",
+        client_id=client_id,
+        client_name="Test CU",
+        pipeline=pipeline,
+        modules_run=["dctr.overlays", "rege.status"],
+        runtime_seconds=runtime,
+        status=status,
+        output_dir="/tmp/out",
+    )
+
+
+@pytest.fixture
+def populated(tmp_path):
+    for i in range(10):
+        log_run(_record(i, runtime=float(i + 1)), log_dir=tmp_path)
+    for i in range(10, 14):
+        status = "error" if i % 2 else "success"
+        log_run(_record(i, client_id="1453", pipeline="ics", status=status), log_dir=tmp_path)
+    return tmp_path
+
+
+class TestStore:
+    def test_roundtrip_preserves_fields(self, tmp_path):
+        record = _record(1)
+        assert log_run(record, log_dir=tmp_path) == tmp_path / DB_NAME
+        assert load_history(log_dir=tmp_path) == [record]
+
+    def test_reads_do_not_create_database(self, tmp_path):
+        assert query_runs(tmp_path) == []
+        assert count_runs(tmp_path) == 0
+        assert pipeline_stats(tmp_path) == []
+        assert not (tmp_path / DB_NAME).exists()
+
+    def test_newest_first_with_pagination(self, populated):
+        first = query_runs(populated, limit=5)
+        second = query_runs(populated, limit=5, offset=5)
+        assert [r.run_id for r in first] == [f"run{i:03d}" for i in range(13, 8, -1)]
+        assert [r.run_id for r in second] == [f"run{i:03d}" for i in range(8, 3, -1)]
+
+    def test_same_timestamp_keeps_insert_order(self, tmp_path):
+        log_run(_record(1), log_dir=tmp_path)
+        log_run(RunRecord(**{**asdict(_record(1)), "run_id": "later"}), log_dir=tmp_path)
+        assert [r.run_id for r in load_history(tmp_path)] == ["later", "run001"]
+
+    def test_filters(self, populated):
+        assert count_runs(populated) == 14
+        assert count_runs(populated, client_id="1453") == 4
+        assert count_runs(populated, pipeline="ics", status="error") == 2
+        runs = query_runs(populated, client_id="1453", status="success")
+        assert {r.run_id for r in runs} == {"run010", "run012"}
+
+
+class TestAggregates:
+    def test_status_counts(self, populated):
+        assert status_counts(populated) == {"success": 12, "error": 2}
+        assert status_counts(populated, pipeline="ics") == {"success": 2, "error": 2}
+
+    def test_pipeline_stats(self, populated):
+        stats = {s.pipeline: s for s in pipeline_stats(populated)}
+        ars = stats["ars"]
+        assert (ars.runs, ars.failures, ars.failure_rate) == (10, 0, 0.0)
+        assert ars.mean_seconds == pytest.approx(5.5)
+        # Nearest rank over runtimes 1..10.
+        assert ars.p50_seconds == 5.0
+        assert ars.p95_seconds == 10.0
+        assert stats["ics"].failure_rate == 0.5
+
+    def test_pipeline_stats_for_client(self, populated):
+        assert [s.pipeline for s in pipeline_stats(populated, client_id="1453")] == ["ics"]
+
+
+class TestMigration:
+    def test_imports_jsonl_once(self, tmp_path):
+        legacy = tmp_path / LEGACY_NAME
+        lines = [json.dumps(asdict(_record(i))) for i in range(3)]
+        bad = {**asdict(_record(9)), "modules_run": "dctr"}
+        lines += ["{not json", "", json.dumps(bad)]
+        legacy.write_text("\n".join(lines) + "\n")
+
+        history = load_history(tmp_path)
+        assert [r.run_id for r in history] == ["run009", "run002", "run001", "run000"]
+        assert history[0].modules_run == ["dctr"]
+        assert not legacy.exists()
+        assert (tmp_path / (LEGACY_NAME + ".migrated")).exists()
+
+        log_run(_record(20), log_dir=tmp_path)
+        assert count_runs(tmp_path) == 5
+
+    def test_failed_move_rolls_back_import(self, tmp_path, monkeypatch):
+        legacy = tmp_path / LEGACY_NAME
+        legacy.write_text(json.dumps(asdict(_record(1))) + "\n")
+
+        def fail(self, target):
+            raise OSError("locked")
+
+        with monkeypatch.context() as m:
+            m.setattr(Path, "replace", fail)
+            with pytest.raises(OSError):
+                load_history(tmp_path)
+        assert legacy.exists()
+
+        assert [r.run_id for r in load_history(tmp_path)] == ["run001"]
+        assert not legacy.exists()
@@ -0,0 +1,54 @@
+"""Tests for shared.deck.template_cache -- pre-cleaned, reusable templates."""
+
+from __future__ import annotations
+
+import shutil
+
+import pytest
+
+from shared.deck.engine import _FALLBACK_TEMPLATE, DeckBuilder, SlideContent
+from shared.deck.template_cache import _prepare, clear_template_cache, prepared_template
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_template_cache()
+    yield
+    clear_template_cache()
+
+
+class TestPreparedTemplate:
+    def test_sample_slides_removed_and_layouts_named(self):
+        template = prepared_template(_FALLBACK_TEMPLATE)
+        assert template.n_layouts == 20
+        assert len(template.data) < _FALLBACK_TEMPLATE.stat().st_size / 5
+        prs = template.open()
+        assert len(prs.slides) == 0
+        assert tuple(layout.name for layout in prs.slide_layouts) == template.layout_names
+
+    def test_prepared_once_per_process(self):
+        assert prepared_template(_FALLBACK_TEMPLATE) is prepared_template(str(_FALLBACK_TEMPLATE))
+
+    def test_clones_are_independent(self):
+        template = prepared_template(_FALLBACK_TEMPLATE)
+        first = template.open()
+        first.slides.add_slide(first.slide_layouts[11])
+        assert len(template.open().slides) == 0
+
+    def test_edited_template_is_reloaded(self, tmp_path):
+        copy = tmp_path / "t.pptx"
+        shutil.copy(_FALLBACK_TEMPLATE, copy)
+        before = prepared_template(copy)
+        prs = before.open()
+        prs.slides.add_slide(prs.slide_layouts[0])
+        prs.save(copy)
+        assert prepared_template(copy) is not before
+
+
+class TestBuilderUsesCache:
+    def test_decks_built_from_cached_template(self, tmp_path):
+        slides = [SlideContent(slide_type="section", title="Overview", layout_index=4)]
+        for i in range(2):
+            out = DeckBuilder(_FALLBACK_TEMPLATE).build(slides, tmp_path / f"deck{i}.pptx")
+            assert out.exists()
+        assert _prepare.cache_info().misses == 1
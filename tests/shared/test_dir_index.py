@@ -0,0 +1,91 @@
+"""Tests for shared.dir_index -- persistent directory listing index."""
+
+from __future__ import annotations
+
+import os
+import time
+
+import pytest
+
+from shared.dir_index import DirectoryIndex
+
+
+def _age(path, seconds=60):
+    """Backdate a directory's mtime so its listing is trusted (not racy)."""
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+@pytest.fixture
+def share(tmp_path):
+    client = tmp_path / "share" / "JamesG" / "2026.02" / "1453"
+    client.mkdir(parents=True)
+    (client / "1453-ODD-formatted.xlsx").write_bytes(b"x" * 10)
+    (client / "1453_tran.csv").write_text("Date,Amount\n")
+    (client / "notes.txt").write_text("")
+    for d in (client, client.parent, client.parent.parent, tmp_path / "share"):
+        _age(d)
+    return tmp_path / "share"
+
+
+@pytest.fixture
+def index(tmp_path):
+    idx = DirectoryIndex(tmp_path / "index.db", workers=4)
+    yield idx
+    idx.close()
+
+
+class TestListing:
+    def test_listing_contents(self, share, index):
+        listing = index.listing(share / "JamesG" / "2026.02" / "1453")
+        assert listing.subdirs == ()
+        assert [f.name for f in listing.files] == [
+            "1453-ODD-formatted.xlsx",
+            "1453_tran.csv",
+            "notes.txt",
+        ]
+        assert listing.files[0].size == 10
+        assert [f.name for f in listing.match("*.csv")] == ["1453_tran.csv"]
+
+    def test_missing_or_file_is_none(self, share, index):
+        assert index.listing(share / "nope") is None
+        assert index.listing(share / "JamesG" / "2026.02" / "1453" / "notes.txt") is None
+        assert index.subdirs(share / "nope") == []
+
+    def test_unchanged_directory_reused(self, share, index):
+        client = share / "JamesG" / "2026.02" / "1453"
+        first = index.listing(client)
+        assert index.listing(client) == first
+        assert (index.listed, index.reused) == (1, 1)
+
+    def test_added_file_relists(self, share, index):
+        client = share / "JamesG" / "2026.02" / "1453"
+        index.listing(client)
+        (client / "1453_ICS.xlsx").write_bytes(b"")
+        assert "1453_ICS.xlsx" in [f.name for f in index.listing(client).files]
+        assert index.listed == 2
+
+    def test_recently_modified_directory_not_trusted(self, tmp_path, index):
+        fresh = tmp_path / "fresh"
+        fresh.mkdir()
+        index.listing(fresh)
+        index.listing(fresh)
+        assert index.reused == 0
+
+    def test_persists_across_instances(self, share, tmp_path, index):
+        index.walk(share, depth=3)
+        again = DirectoryIndex(tmp_path / "index.db")
+        try:
+            assert len(again.walk(share, depth=3)) == 4
+            assert (again.listed, again.reused) == (0, 4)
+        finally:
+            again.close()
+
+    def test_walk(self, share, index):
+        listings = index.walk(share, depth=2)
+        assert sorted(p.relative_to(share).as_posix() for p in listings) == [
+            ".",
+            "JamesG",
+            "JamesG/2026.02",
+        ]
+        assert listings[share / "JamesG" / "2026.02"].subdirs == ("1453",)
@@ -0,0 +1,75 @@
+"""Tests for shared.headers -- cached header resolution."""
+
+from __future__ import annotations
+
+import pandas as pd
+
+from shared.headers import HeaderResolver, normalize_header
+
+ALIASES = {"amt": "amount", "Txn-Date": "transaction_date", "merchant": "merchant_name"}
+REQUIRED = {"amount", "transaction_date", "merchant_name"}
+
+
+class TestNormalize:
+    def test_normalize_header(self):
+        assert normalize_header(" Txn-Amount ") == "txn_amount"
+        assert normalize_header(5) == "5"
+
+
+class TestResolve:
+    def test_alias_match_normalized(self):
+        resolver = HeaderResolver(ALIASES, required=REQUIRED)
+        res = resolver.resolve(["AMT", " txn_date ", "Merchant", "Other"])
+        assert dict(res.renames) == {
+            "AMT": "amount",
+            " txn_date ": "transaction_date",
+            "Merchant": "merchant_name",
+        }
+        assert set(res.sources.values()) == {"alias"}
+        assert res.columns == ("amount", "transaction_date", "merchant_name", "Other")
+        assert not res.missing
+
+    def test_keyword_fallback_and_missing(self):
+        resolver = HeaderResolver(
+            ALIASES, required=REQUIRED, keywords=[("merchant_name", ["payee", "descr"])]
+        )
+        res = resolver.resolve(["amt", "Payee Description", "Posted"])
+        assert res.renames["Payee Description"] == "merchant_name"
+        assert res.sources["Payee Description"] == "keyword"
+        assert res.missing == frozenset({"transaction_date"})
+
+    def test_strip_unmatched(self):
+        resolver = HeaderResolver(ALIASES, normalize=lambda c: str(c).strip(), strip=True)
+        res = resolver.resolve(["amt ", " Branch", "AMT"])
+        assert dict(res.renames) == {"amt ": "amount", " Branch": "Branch"}
+        assert res.sources[" Branch"] == "strip"
+
+    def test_keep_existing(self):
+        resolver = HeaderResolver(ALIASES, keep_existing=True)
+        res = resolver.resolve(["amount", "amt", "merchant"])
+        assert dict(res.renames) == {"merchant": "merchant_name"}
+
+    def test_memoized_per_layout(self):
+        resolver = HeaderResolver(ALIASES, required=REQUIRED)
+        first = resolver.resolve(pd.Index(["amt", "Txn-Date", "merchant"]))
+        second = resolver.resolve(["amt", "Txn-Date", "merchant"])
+        assert first is second
+        assert resolver.cache_info().hits == 1
+        resolver.resolve(["amt", "merchant"])
+        assert resolver.cache_info().misses == 2
+
+    def test_apply_and_describe(self):
+        resolver = HeaderResolver(ALIASES)
+        df = pd.DataFrame({"amt": [1.0], "x": [2]})
+        res = resolver.resolve(df.columns)
+        assert list(res.apply(df).columns) == ["amount", "x"]
+        assert res.describe() == "amt -> amount (alias)"
+        untouched = resolver.resolve(["x"])
+        assert untouched.apply(df) is df
+        assert untouched.describe() == "no renames"
+
+    def test_recognizes(self):
+        resolver = HeaderResolver(ALIASES, required=REQUIRED)
+        assert resolver.recognizes(" TXN-DATE")
+        assert resolver.recognizes("Merchant_Name")
+        assert not resolver.recognizes("balance")
@@ -0,0 +1,97 @@
+"""Tests for shared.images -- slide-resolution image pipeline."""
+
+from __future__ import annotations
+
+import io
+
+import pytest
+from PIL import Image
+from pptx import Presentation
+from pptx.util import Inches
+
+from shared.images import (
+    ImagePipeline,
+    fit_within,
+    image_size,
+)
+
+
+def _chart_png(width=3000, height=1500, mode="RGB") -> bytes:
+    """A flat-colour 'chart' with a few bars, like a 300-DPI matplotlib export."""
+    img = Image.new(mode, (width, height), "white")
+    for i, colour in enumerate(["#2E4057", "#048A81", "#F18F01"]):
+        bar = Image.new(mode, (width // 8, height // (i + 2)), colour)
+        img.paste(bar, (width // 8 + i * width // 4, height - bar.height))
+    buf = io.BytesIO()
+    img.save(buf, format="PNG")
+    return buf.getvalue()
+
+
+class TestSizes:
+    def test_size_from_header(self, tmp_path):
+        data = _chart_png(640, 480)
+        path = tmp_path / "c.png"
+        path.write_bytes(data)
+        assert image_size(data) == (640, 480)
+        assert image_size(path) == (640, 480)
+
+    def test_non_png_falls_back_to_pil(self):
+        buf = io.BytesIO()
+        Image.new("RGB", (30, 20)).save(buf, format="JPEG")
+        assert image_size(buf.getvalue()) == (30, 20)
+
+    def test_fit_within(self):
+        assert fit_within(2000, 1000, 100) == (100, 50)
+        assert fit_within(2000, 1000, 100, 40) == (80, 40)
+
+
+class TestImagePipeline:
+    def test_downsamples_to_slide_resolution(self):
+        images = ImagePipeline(dpi=100)
+        fitted = images.fit(_chart_png(), Inches(10), Inches(10))
+        assert (fitted.width_px, fitted.height_px) == (1000, 500)
+        assert (fitted.width_emu, fitted.height_emu) == (Inches(10), Inches(5))
+        assert image_size(fitted.data) == (1000, 500)
+        assert images.bytes_out < images.bytes_in
+
+    def test_small_images_not_upscaled(self):
+        data = _chart_png(400, 200)
+        fitted = ImagePipeline(quantize=False).fit(data, Inches(10))
+        assert fitted.data == data
+
+    def test_quantizes_rgba(self):
+        fitted = ImagePipeline(dpi=50).fit(_chart_png(mode="RGBA"), Inches(4))
+        with Image.open(fitted.stream()) as img:
+            assert img.mode == "P"
+
+    def test_identical_images_processed_once(self, tmp_path):
+        data = _chart_png()
+        path = tmp_path / "c.png"
+        path.write_bytes(data)
+        images = ImagePipeline()
+        first = images.fit(path, Inches(6), Inches(4))
+        second = images.fit(data, Inches(6), Inches(4))
+        assert first.data is second.data
+        assert images.images == 1
+
+    def test_add_picture_embeds_once(self, tmp_path):
+        prs = Presentation()
+        images = ImagePipeline()
+        data = _chart_png()
+        for _ in range(3):
+            slide = prs.slides.add_slide(prs.slide_layouts[6])
+            pic = images.add_picture(slide, data, 0, 0, Inches(8), Inches(3))
+        assert (pic.width, pic.height) == (Inches(6), Inches(3))
+        out = tmp_path / "deck.pptx"
+        prs.save(out)
+        parts = Presentation(out).part.package.iter_parts()
+        assert len([p for p in parts if p.partname.startswith("/ppt/media/")]) == 1
+        assert images.summary().startswith("1 images")
+
+    @pytest.mark.parametrize("mode", ["L", "LA", "P"])
+    def test_other_modes(self, mode):
+        img = Image.new(mode, (2000, 1000))
+        buf = io.BytesIO()
+        img.save(buf, format="PNG")
+        fitted = ImagePipeline(dpi=50).fit(buf.getvalue(), Inches(4))
+        assert image_size(fitted.data) == (200, 100)
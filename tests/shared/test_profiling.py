@@ -0,0 +1,101 @@
+"""Tests for shared.profiling -- step/module timing and cProfile capture."""
+
+import json
+import threading
+from contextvars import copy_context
+
+import pandas as pd
+import pytest
+
+from shared.profiling import Profiler, current_profiler, profiled, track, use_profiler
+
+
+@profiled
+def _count(df):
+    return len(df)
+
+
+class TestProfiler:
+    def test_track_records_measurements(self):
+        profiler = Profiler()
+        with profiler.track("load", kind="step") as span:
+            sum(range(100_000))
+            span.rows = 42
+        (span,) = profiler.spans
+        assert (span.name, span.kind, span.rows, span.success) == ("load", "step", 42, True)
+        assert span.wall_seconds > 0
+        assert span.cpu_seconds >= 0
+        assert span.peak_rss_delta_mb >= 0
+
+    def test_failure_recorded_and_raised(self):
+        profiler = Profiler()
+        with pytest.raises(ValueError), profiler.track("boom"):
+            raise ValueError("x")
+        assert profiler.spans[0].success is False
+
+    def test_nested_spans_record_parent(self):
+        profiler = Profiler()
+        with use_profiler(profiler), track("step", kind="step"), track("inner"):
+            pass
+        spans = {s.name: s for s in profiler.spans}
+        assert spans["inner"].parent == "step"
+        assert spans["step"].parent == ""
+
+    def test_slowest_and_to_dict(self):
+        profiler = Profiler()
+        for name in ("a", "b"):
+            with profiler.track(name, kind="module"):
+                pass
+        profiler.spans[0].wall_seconds = 5.0
+        assert [s.name for s in profiler.slowest(1)] == ["a"]
+        report = profiler.to_dict()
+        assert set(report["totals_seconds"]) == {"module"}
+        assert len(report["spans"]) == 2
+
+    def test_merge_into_keeps_existing_keys(self, tmp_path):
+        path = tmp_path / "report.json"
+        path.write_text(json.dumps({"summary": {"ok": 1}}))
+        profiler = Profiler()
+        with profiler.track("x"):
+            pass
+        profiler.merge_into(path)
+        data = json.loads(path.read_text())
+        assert data["summary"] == {"ok": 1}
+        assert data["profile"]["spans"][0]["name"] == "x"
+
+
+class TestActiveProfiler:
+    def test_no_profiler_is_noop(self):
+        assert current_profiler() is None
+        with track("free") as span:
+            span.rows = 1
+        assert _count(pd.DataFrame({"a": [1, 2]})) == 2
+
+    def test_decorator_records_rows(self):
+        profiler = Profiler()
+        with use_profiler(profiler):
+            _count(pd.DataFrame({"a": range(7)}))
+        (span,) = profiler.spans
+        assert span.name == "test_profiling._count"
+        assert span.rows == 7
+
+    def test_copied_context_reaches_threads(self):
+        profiler = Profiler()
+        with use_profiler(profiler):
+            ctx = copy_context()
+        thread = threading.Thread(target=ctx.run, args=(_count, [1, 2, 3]))
+        thread.start()
+        thread.join()
+        assert [s.name for s in profiler.spans] == ["test_profiling._count"]
+
+
+class TestCProfile:
+    def test_matching_span_writes_stats(self, tmp_path):
+        profiler = Profiler(target="dctr.*", profile_dir=tmp_path)
+        with profiler.track("dctr.overlays", kind="module"):
+            sorted(range(1000), reverse=True)
+        with profiler.track("rege.status", kind="module"):
+            pass
+        assert (tmp_path / "dctr.overlays.prof").exists()
+        assert "function calls" in (tmp_path / "dctr.overlays.txt").read_text()
+        assert not (tmp_path / "rege.status.prof").exists()
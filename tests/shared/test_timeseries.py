@@ -0,0 +1,146 @@
+"""Tests for shared.timeseries -- MmmYY column families as dense arrays."""
+
+from __future__ import annotations
+
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from shared.context import PipelineContext
+from shared.timeseries import (
+    TimeSeriesBlock,
+    TimeSeriesBlocks,
+    family_block,
+    family_columns,
+    split_monthly_column,
+)
+
+
+@pytest.fixture
+def odd():
+    # Columns deliberately out of calendar order (alphabetical, as ODDs often are)
+    return pd.DataFrame(
+        {
+            "Acct Number": [1, 2, 3, 4],
+            "Apr25 Spend": [10.0, 0.0, None, 5.0],
+            "Feb25 Spend": [1.0, 2.0, None, 0.0],
+            "Mar25 Spend": [0.0, 3.0, None, "bad"],
+            "Feb25 Resp": ["TH-10", None, "NU 1-4", None],
+            "Mar25 Resp": [None, "NU 5+", None, None],
+            "Total Spend": [11.0, 5.0, 0.0, 5.0],
+        },
+        index=[10, 20, 30, 40],
+    )
+
+
+class TestColumns:
+    def test_split_monthly_column(self):
+        month, suffix = split_monthly_column("Jan25 Reg E Code")
+        assert (month.year, month.month, suffix) == (2025, 1, "Reg E Code")
+        assert split_monthly_column("Total Spend") is None
+        assert split_monthly_column("Abc25 Spend") is None
+
+    def test_family_columns_chronological(self, odd):
+        assert family_columns(odd.columns, "Spend") == ["Feb25 Spend", "Mar25 Spend", "Apr25 Spend"]
+
+
+class TestNumericBlock:
+    def test_parse(self, odd):
+        block = TimeSeriesBlock.from_frame(odd, "spend")
+        assert block.values.dtype == np.float32
+        assert block.values.shape == (4, 3)
+        assert block.tags == ["Feb25", "Mar25", "Apr25"]
+        assert np.isnan(block.values[3, 1])  # "bad" coerced
+
+    def test_window_and_sum(self, odd):
+        block = TimeSeriesBlock.from_frame(odd, "spend")
+        assert block.window(2).tags == ["Mar25", "Apr25"]
+        assert block.window(2, end="Mar25").tags == ["Feb25", "Mar25"]
+        assert block.since("Mar25").sum().tolist() == [10.0, 3.0, 0.0, 5.0]
+        assert block.select(["Feb25", "Apr25", "Dec99"]).tags == ["Feb25", "Apr25"]
+
+    def test_latest_skip_zero(self, odd):
+        latest = TimeSeriesBlock.from_frame(odd, "spend").latest(skip_zero=True)
+        assert latest.index.tolist() == [10, 20, 30, 40]
+        assert latest.tolist()[:2] == [10.0, 3.0]
+        assert np.isnan(latest[30])
+        assert latest[40] == 5.0
+
+    def test_rows(self, odd):
+        block = TimeSeriesBlock.from_frame(odd, "spend").rows(pd.Index([40, 20]))
+        assert block.index.tolist() == [40, 20]
+        assert block.values[1].tolist() == [2.0, 3.0, 0.0]
+        with pytest.raises(KeyError):
+            block.rows(pd.Index([99]))
+
+    def test_no_columns(self, odd):
+        block = TimeSeriesBlock.from_frame(odd, "swipes")
+        assert block.n_months == 0
+        assert block.sum().tolist() == [0.0] * 4
+        assert block.first().tolist() == [-1] * 4
+        assert block.latest().isna().all()
+
+
+class TestCategoricalBlock:
+    def test_codes_and_round_trip(self, odd):
+        block = TimeSeriesBlock.from_frame(odd, "resp")
+        assert block.values.dtype == np.int16
+        assert block.values[1, 0] == -1
+        pd.testing.assert_frame_equal(
+            block.to_frame(), odd[["Feb25 Resp", "Mar25 Resp"]].astype(object)
+        )
+
+    def test_first_response(self, odd):
+        block = TimeSeriesBlock.from_frame(odd, "resp")
+        first = block.first(block.isin(["TH-10", "NU 5+", "not-a-label"]))
+        assert first.tolist() == [0, 1, -1, -1]
+        assert block.any().tolist() == [True, True, True, False]
+
+    def test_explicit_columns_keep_order(self, odd):
+        block = TimeSeriesBlock.from_frame(
+            odd, "resp", columns=["Mar25 Resp", "Feb25 Resp"], categorical=True
+        )
+        assert block.tags == ["Mar25", "Feb25"]
+
+
+class TestBlocks:
+    def test_lazy_mapping(self, odd):
+        blocks = TimeSeriesBlocks(odd)
+        assert set(blocks) == {"spend", "resp"}
+        assert "swipes" not in blocks
+        assert blocks["spend"] is blocks["spend"]
+        with pytest.raises(KeyError):
+            blocks["swipes"]
+
+    def test_family_block_reuses_parent(self, odd):
+        blocks = TimeSeriesBlocks(odd)
+        subset = odd.loc[[20, 40]]
+        block = family_block(subset, "spend", blocks)
+        assert block.index.tolist() == [20, 40]
+        assert block.values.dtype == np.float32
+        assert blocks.block("spend") is blocks["spend"]
+        # Rows the parent does not cover fall back to parsing the frame
+        other = pd.DataFrame({"Jan25 Spend": [1.0]}, index=[999])
+        assert family_block(other, "spend", blocks).tags == ["Jan25"]
+
+    def test_family_block_dtype(self, odd):
+        odd = odd.assign(**{"Apr25 Spend": [10.01, 0.0, None, 16777217.0]})
+        blocks = TimeSeriesBlocks(odd)
+        block = family_block(odd.loc[[10, 40]], "spend", blocks, dtype=np.float64)
+        assert block.values.dtype == np.float64
+        assert block.latest(skip_zero=True).tolist() == [10.01, 16777217.0]
+        assert blocks.block("spend", np.float64) is not blocks["spend"]
+
+    def test_picklable(self, odd):
+        blocks = TimeSeriesBlocks(odd)
+        blocks["spend"]
+        clone = pickle.loads(pickle.dumps(blocks))
+        assert clone["spend"].tags == ["Feb25", "Mar25", "Apr25"]
+
+    def test_context_property_follows_data(self, odd):
+        ctx = PipelineContext(data=odd)
+        assert ctx.timeseries is ctx.timeseries
+        ctx.data = odd.drop(columns=["Feb25 Resp", "Mar25 Resp"])
+        assert set(ctx.timeseries) == {"spend"}
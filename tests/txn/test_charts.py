@@ -432,3 +432,32 @@ class TestCreateCharts:
         )
         charts = create_charts([empty], chart_config)
         assert len(charts) == 0
+
+
+class TestLazyCharts:
+    def test_specs_do_not_draw(self, spend_result):
+        from txn_analysis.charts import chart_specs
+
+        before = plt.get_fignums()
+        specs = chart_specs([spend_result], client_name="Test CU")
+        assert list(specs) == ["top_merchants_by_spend"]
+        assert plt.get_fignums() == before
+
+    def test_iter_chart_pngs_renders_one_at_a_time(self, spend_result, chart_config):
+        from txn_analysis.charts import chart_specs, iter_chart_pngs
+
+        before = plt.get_fignums()
+        specs = chart_specs([spend_result])
+        for name, png in iter_chart_pngs(specs, chart_config):
+            assert name == "top_merchants_by_spend"
+            assert png.startswith(b"\x89PNG")
+            assert plt.get_fignums() == before
+
+    def test_failing_chart_skipped(self, spend_result, chart_config):
+        from txn_analysis.charts import ChartSpec, iter_chart_pngs
+
+        def broken(result, config):
+            raise ValueError("bad data")
+
+        specs = {"broken": ChartSpec("broken", broken, (spend_result,))}
+        assert list(iter_chart_pngs(specs, chart_config)) == []
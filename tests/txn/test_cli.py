@@ -40,3 +40,15 @@ class TestCLI:
     def test_analyses_count_in_output(self, sample_csv_path, tmp_path):
         result = runner.invoke(app, [str(sample_csv_path), "--output-dir", str(tmp_path)])
         assert "38" in result.output
+
+
+class TestStartup:
+    def test_cli_import_skips_pipeline(self):
+        import subprocess
+        import sys
+
+        code = "import sys, txn_analysis.cli; print(' '.join(sys.modules))"
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+        loaded = set(out.stdout.split())
+        assert out.returncode == 0, out.stderr
+        assert not loaded & {"pandas", "matplotlib", "txn_analysis.analyses", "txn_analysis.charts"}
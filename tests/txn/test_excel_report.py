@@ -85,3 +85,31 @@ class TestWriteExcelReport:
         sheet_names = wb.sheetnames
         assert "OK" in sheet_names
         assert "bad" not in sheet_names
+
+
+class TestChartImages:
+    def test_excel_and_pptx_share_optimized_bytes(self, pipeline_result, tmp_path):
+        import io
+
+        from PIL import Image
+
+        from shared.images import ImagePipeline
+        from txn_analysis.exports.pptx_report import write_pptx_report
+
+        buf = io.BytesIO()
+        Image.new("RGB", (3600, 1800), "white").save(buf, format="PNG")
+        name = next(a.name for a in pipeline_result.analyses if not a.df.empty)
+        pipeline_result.chart_pngs = {name: buf.getvalue()}
+
+        images = ImagePipeline()
+        write_excel_report(pipeline_result, tmp_path / "r.xlsx", images=images)
+        write_pptx_report(
+            pipeline_result, tmp_path / "r.pptx", pipeline_result.chart_pngs, images=images
+        )
+        assert images.images == 1
+
+        ws = next(ws for ws in load_workbook(tmp_path / "r.xlsx") if ws._images)
+        img = ws._images[0]
+        # Slide-resolution bytes (11.6 x 5.8 in at 200 DPI), shown at 900x450 px.
+        assert (img.width, img.height) == (2320, 1160)
+        assert (img.anchor.ext.width, img.anchor.ext.height) == (900 * 9525, 450 * 9525)
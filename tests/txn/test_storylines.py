@@ -129,6 +129,19 @@ class TestWrapStorylineResult:
         assert ar.metadata["chart_count"] == 3
         assert ar.metadata["sheet_count"] == 1
 
+    def test_figures_closed(self):
+        import matplotlib.pyplot as plt
+
+        from txn_analysis.analyses.storyline_adapters import _wrap_storyline_result
+
+        fig, ax = plt.subplots()
+        ax.plot([1, 2], [3, 4])
+        result_dict = {"title": "T", "sections": [{"heading": "A", "figures": [fig]}]}
+        ar = _wrap_storyline_result("test", result_dict)
+        assert ar.metadata["storyline"]["sections"][0]["figures"] == []
+        assert ar.metadata["chart_count"] == 1
+        assert not plt.fignum_exists(fig.number)
+
     def test_wraps_empty_result(self):
         from txn_analysis.analyses.storyline_adapters import _wrap_storyline_result
 